@@ -35,7 +35,12 @@ setup(
         "finance-datareader",
         "plotly",
         "bs4",
+        "sqlalchemy>=2.0.0",
     ],
+    extras_require={
+        "databricks": ["databricks-sqlalchemy"],
+        "duckdb": ["duckdb", "duckdb-engine"],
+    },
     package_data={
         "spaceone": [
             "cost_analysis/template/*.html",
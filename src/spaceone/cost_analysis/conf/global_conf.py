@@ -42,9 +42,22 @@ WAREHOUSES = {
         "pool_timeout": 30,
         "transport_command_timeout": 120
     },
+    # "LOCAL": {
+    #     "url": "sqlite:////data/cost.db",  # or "duckdb:////data/cost.duckdb"
+    #     "aws": {"table": {"YEARLY": "", "MONTHLY": "", "DAILY": ""}},
+    #     "pool_size": 1,
+    #     "max_overflow": 5,
+    # },
     # "BIGQUERY": {},
 }
 
+# Cost Archive Settings (closed months are copied to Parquet files and analyzed with DuckDB)
+COST_ARCHIVE_ENABLED = False
+COST_ARCHIVE_PATH = None  # Shared storage mounted on every grpc, rest and worker pod (ReadWriteMany)
+COST_ARCHIVE_AFTER_MONTHS = 3  # Months after which a billed month is archived
+COST_ARCHIVE_BATCH_SIZE = 100000
+COST_ARCHIVE_HOUR = 18  # Hour (UTC)
+
 # Budget Settings
 BUDGET_UPDATE_DAY = 1  # Every 1st day of month
 BUDGET_UPDATE_HOUR = 0
@@ -59,6 +72,11 @@ DEFAULT_EXCHANGE_RATES = {
     "USD/JPY": 149.73205030286636,
     "JPY/USD": 0.006686848624246231,
 }
+EXCHANGE_RATE_FETCH_MODE = "BASE"  # BASE | VALIDATE (fetch every pair and compare)
+EXCHANGE_RATE_BASE_CURRENCY = "USD"
+EXCHANGE_RATE_VALIDATION_TOLERANCE = 0.01
+EXCHANGE_RATE_SYNC_HOUR = 23  # Hour (UTC)
+EXCHANGE_RATE_BACKFILL_DAYS = 365  # Day (when the exchange rate store is empty)
 
 
 # Cost Report Config Settings
@@ -131,6 +149,10 @@ CONNECTORS = {
     },
 }
 
+# Email Delivery Settings
+EMAIL_DELIVERY_MAX_RETRIES = 3
+EMAIL_DELIVERY_RETRY_BACKOFF = 60  # Seconds before the first retry (doubled on every retry)
+
 # Scheduler Settings
 QUEUES = {}
 SCHEDULERS = {}
@@ -140,12 +162,29 @@ TOKEN_INFO = {}
 
 # Job Settings
 JOB_TIMEOUT = 600
+JOB_TASK_STALL_TIMEOUT = 1800  # Seconds without heartbeat before a job task is retried
+JOB_TASK_MAX_RETRIES = 3
+JOB_TASK_HEARTBEAT_INTERVAL = 60  # Seconds between heartbeats of a running job task
+JOB_TASK_DISPATCH_LIMIT = 100  # Job tasks running at once across all domains
+JOB_TASK_DOMAIN_QUOTA = 10  # Job tasks running at once per domain
+JOB_TASK_DOMAIN_WEIGHTS = {}  # {domain_id: weight} for the share of dispatch limit (default = 1)
+JOB_TASK_DISPATCH_LOCK_TIMEOUT = 60  # Seconds a dispatcher holds the lock at most
+JOB_TASK_PLANNING_CONCURRENCY = 10  # Secrets whose tasks are planned in parallel
+JOB_SECRET_CACHE_TTL = 600  # Seconds secret data of a job is kept in worker memory
+JOB_SECRET_CACHE_SWEEP_INTERVAL = 60  # Seconds between sweeps of expired secret data
 DATA_SOURCE_SYNC_HOUR = 16  # Hour (UTC)
 COST_QUERY_CACHE_TIME = 4  # Day
+COST_DATA_PREFETCH_SIZE = 4  # Plugin responses received ahead of DB writes (0 = disabled)
 COST_REPORT_RUN_HOUR = 0  # Hour (UTC)
 COST_REPORT_RETRY_DAYS = 7  # Day
 UNIFIED_COST_RUN_HOUR = 0  # Hour (UTC)
 UNIFIED_COST_AGGREGATION_DAY = 15  # Day
+UNIFIED_COST_AGGREGATION_MODE = "WORKSPACE"  # WORKSPACE | DOMAIN
+UNIFIED_COST_INCREMENTAL_RUN = True  # Recompute only data sources synced since the last run
+UNIFIED_COST_CONCURRENCY = 1  # Number of workspaces aggregated in parallel
+UNIFIED_COST_INCREMENTAL_RUN_HOURLY = True  # Run incremental unified costs every hour, not only at the run hour
+UNIFIED_COST_EXCHANGE_RATE_REFRESH_DAYS = 7  # Day (exchange rates of an unconfirmed month are kept for incremental runs)
+UNIFIED_COST_RUN_TIMEOUT = 10800  # Seconds a run holds its month against overlapping incremental runs
 
 INSTALLED_DATA_SOURCE_PLUGINS = [
     # {
@@ -0,0 +1,217 @@
+import glob
+import logging
+import os
+import re
+import shutil
+from typing import Iterable
+
+import pandas as pd
+from sqlalchemy import table
+from sqlalchemy.pool import SingletonThreadPool
+from sqlalchemy.sql.elements import quoted_name
+
+from spaceone.core import config, utils
+
+from spaceone.cost_analysis.connector.warehouse_connector import (
+    WarehouseConnector,
+    _DATE_FIELDS,
+)
+from spaceone.cost_analysis.error import *
+
+__all__ = ["CostArchiveConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_PARTITION_VALUE_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+_DATASETS = {
+    "DAILY": "cost",
+    "MONTHLY": "monthly_cost",
+    "YEARLY": "monthly_cost",
+}
+
+
+class CostArchiveConnector(WarehouseConnector):
+    """Runs queries with DuckDB over the Parquet files of archived months.
+
+    Files are partitioned as <COST_ARCHIVE_PATH>/<dataset>/domain_id=<domain_id>/
+    data_source_id=<data_source_id>/billed_month=<billed_month>/part-<n>.parquet
+    """
+
+    warehouse_type = "COST_ARCHIVE"
+    package_extra = "duckdb"
+
+    def __init__(
+        self, *args, domain_id: str = None, data_source_id: str = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.archive_path = config.get_global("COST_ARCHIVE_PATH")
+        if not self.archive_path:
+            raise ERROR_CONFIGURATION(key="COST_ARCHIVE_PATH")
+
+        self.domain_id = self._check_partition_value(domain_id)
+        self.data_source_id = self._check_partition_value(data_source_id)
+
+    def export_costs(
+        self, table_type: str, billed_month: str, data_frames: Iterable[pd.DataFrame]
+    ) -> None:
+        partition_path = self._get_partition_path(table_type, billed_month)
+
+        # files are written aside and swapped in, so readers never see a partial month
+        tmp_path = os.path.join(self.archive_path, ".tmp", utils.random_string())
+        os.makedirs(tmp_path)
+
+        try:
+            with self.engine.connect() as conn:
+                duckdb_conn = conn.connection.driver_connection
+                for idx, data_frame in enumerate(data_frames):
+                    file_path = os.path.join(tmp_path, f"part-{idx}.parquet")
+                    duckdb_conn.register("archive_batch", data_frame)
+                    duckdb_conn.execute(
+                        f"COPY archive_batch TO '{self._escape(file_path)}' (FORMAT PARQUET)"
+                    )
+                    duckdb_conn.unregister("archive_batch")
+
+            if os.path.exists(partition_path):
+                shutil.rmtree(partition_path)
+
+            os.makedirs(os.path.dirname(partition_path), exist_ok=True)
+            os.rename(tmp_path, partition_path)
+        except Exception:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+    def has_costs(self, table_type: str, billed_months: list) -> bool:
+        # a month is readable only if its partition has files on this pod
+        for billed_month in billed_months:
+            partition_path = self._get_partition_path(table_type, billed_month)
+            if not glob.glob(os.path.join(glob.escape(partition_path), "*.parquet")):
+                return False
+
+        return True
+
+    def delete_costs(self, billed_month: str = None) -> None:
+        for table_type in ["DAILY", "MONTHLY"]:
+            if billed_month:
+                path = self._get_partition_path(table_type, billed_month)
+            else:
+                path = self._get_data_source_path(table_type)
+
+            shutil.rmtree(path, ignore_errors=True)
+
+    def merge_analyze_results(self, query: dict, responses: list) -> dict:
+        fields = query["fields"]
+        field_group = query.get("field_group", [])
+        sort = query.get("sort", [])
+        page = query.get("page", {})
+        page_limit = page.get("limit")
+
+        group_names = []
+        for group_option in query.get("group_by", []):
+            if isinstance(group_option, dict):
+                group_names.append(group_option.get("name"))
+            else:
+                group_names.append(group_option.rsplit(".", 1)[-1])
+
+        if query.get("granularity") in _DATE_FIELDS:
+            group_names.append("date")
+
+        merged_results = {}
+        for response in responses:
+            for result in response.get("results", []):
+                result.pop("_id", None)
+                group_key = tuple(result.get(name) for name in group_names)
+
+                if group_key not in merged_results:
+                    merged_results[group_key] = result
+                    continue
+
+                merged_result = merged_results[group_key]
+                for name, condition in fields.items():
+                    merged_result[name] = self._merge_value(
+                        condition.get("operator"),
+                        merged_result.get(name),
+                        result.get(name),
+                    )
+
+        results = list(merged_results.values())
+
+        if field_group:
+            results = self._make_field_group_results(
+                results, group_names, fields, field_group
+            )
+            results = self._sort_results(results, sort, fields)
+        else:
+            results = self._sort_results(results, sort, {})
+
+        if page_limit:
+            start = max(page.get("start", 1), 1)
+            results = results[start - 1 : start + page_limit]
+
+        response = {"results": results}
+        if page_limit:
+            response["more"] = len(results) > page_limit
+            response["results"] = results[:page_limit]
+
+        return response
+
+    @staticmethod
+    def _merge_value(operator: str, value, other_value):
+        if value is None:
+            return other_value
+        elif other_value is None:
+            return value
+        elif operator in ["sum", "count"]:
+            return value + other_value
+        elif operator == "max":
+            return max(value, other_value)
+        elif operator == "min":
+            return min(value, other_value)
+
+        raise ERROR_NOT_SUPPORT_QUERY_OPTION(query_option=f"fields.{operator}")
+
+    def _make_engine_url(self) -> str:
+        return "duckdb:///:memory:"
+
+    def _make_engine_options(self) -> dict:
+        # an in-memory DuckDB connection per thread, since it only reads files
+        return {"poolclass": SingletonThreadPool}
+
+    def _get_table(self, provider: str, table_type: str):
+        files_path = os.path.join(
+            self._get_data_source_path(table_type), "*", "*.parquet"
+        )
+
+        return table(
+            quoted_name(
+                f"read_parquet('{self._escape(files_path)}', hive_partitioning = true, "
+                f"hive_types_autocast = false, union_by_name = true)",
+                quote=False,
+            )
+        )
+
+    def _get_data_source_path(self, table_type: str) -> str:
+        return os.path.join(
+            self.archive_path,
+            _DATASETS[table_type],
+            f"domain_id={self.domain_id}",
+            f"data_source_id={self.data_source_id}",
+        )
+
+    def _get_partition_path(self, table_type: str, billed_month: str) -> str:
+        return os.path.join(
+            self._get_data_source_path(table_type),
+            f"billed_month={self._check_partition_value(billed_month)}",
+        )
+
+    @staticmethod
+    def _check_partition_value(value: str) -> str:
+        if not isinstance(value, str) or not _PARTITION_VALUE_PATTERN.match(value):
+            raise ERROR_INVALID_PARAMETER(
+                key="cost_archive", reason=f"Invalid partition value: {value}"
+            )
+        return value
+
+    @staticmethod
+    def _escape(path: str) -> str:
+        return path.replace("'", "''")
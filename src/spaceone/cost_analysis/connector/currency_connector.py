@@ -24,6 +24,78 @@ class CurrencyConnector(BaseConnector):
 
     def add_currency_map_date(
         self, currency_end_date: datetime, currency_start_date: datetime = None
+    ) -> Tuple[dict, datetime]:
+        fetch_mode = config.get_global("EXCHANGE_RATE_FETCH_MODE", "BASE")
+
+        if fetch_mode == "VALIDATE":
+            currency_map, currency_date = self._add_currency_map_date_by_pair(
+                currency_end_date, currency_start_date
+            )
+            self._validate_currency_map(
+                currency_map, currency_end_date, currency_start_date
+            )
+        else:
+            currency_map, currency_date = self._add_currency_map_date_by_base(
+                currency_end_date, currency_start_date
+            )
+
+        _LOGGER.debug(
+            f"[add_currency_map_date] get currency_map successfully for {currency_date} (fetch_mode: {fetch_mode})"
+        )
+        return currency_map, currency_date
+
+    def list_cross_exchange_rates(
+        self, currency_end_date: datetime, currency_start_date: datetime = None
+    ) -> list:
+        """Fetch base currency quotes from the live sources and derive every pair.
+
+        Raises when a base quote cannot be fetched, so the result is safe to
+        persist to the exchange rate store.
+        """
+        base_quotes, source = self._get_base_quotes(
+            currency_end_date, currency_start_date, live_only=True
+        )
+
+        exchange_rates = []
+        for quote_date, quotes in base_quotes.iterrows():
+            for from_currency in self.from_exchange_currencies:
+                for to_currency in self.from_exchange_currencies:
+                    if from_currency == to_currency:
+                        continue
+
+                    exchange_rates.append(
+                        {
+                            "pair": f"{from_currency}/{to_currency}",
+                            "date": quote_date.strftime("%Y-%m-%d"),
+                            "rate": float(quotes[to_currency] / quotes[from_currency]),
+                            "source": source,
+                        }
+                    )
+
+        return exchange_rates
+
+    def _add_currency_map_date_by_base(
+        self, currency_end_date: datetime, currency_start_date: datetime = None
+    ) -> Tuple[dict, datetime]:
+        base_quotes, _ = self._get_base_quotes(currency_end_date, currency_start_date)
+        currency_date = base_quotes.index[-1]
+        quotes = base_quotes.iloc[-1]
+
+        currency_map = self._initialize_currency_map()
+        for from_currency in self.from_exchange_currencies:
+            for to_currency in self.from_exchange_currencies:
+                if from_currency == to_currency:
+                    exchange_rate = 1.0
+                else:
+                    exchange_rate = float(quotes[to_currency] / quotes[from_currency])
+                currency_map[from_currency][
+                    f"{from_currency}/{to_currency}"
+                ] = exchange_rate
+
+        return currency_map, currency_date
+
+    def _add_currency_map_date_by_pair(
+        self, currency_end_date: datetime, currency_start_date: datetime = None
     ) -> Tuple[dict, datetime]:
         currency_map = self._initialize_currency_map()
         currency_date = currency_end_date
@@ -45,11 +117,82 @@ class CurrencyConnector(BaseConnector):
                     f"{from_currency}/{to_currency}"
                 ] = exchange_rate
 
-        _LOGGER.debug(
-            f"[add_currency_map_date] get currency_map successfully for {currency_date}"
-        )
         return currency_map, currency_date
 
+    def _validate_currency_map(
+        self,
+        currency_map: dict,
+        currency_end_date: datetime,
+        currency_start_date: datetime = None,
+    ) -> None:
+        tolerance = config.get_global("EXCHANGE_RATE_VALIDATION_TOLERANCE", 0.01)
+
+        try:
+            derived_currency_map, _ = self._add_currency_map_date_by_base(
+                currency_end_date, currency_start_date
+            )
+        except Exception as e:
+            _LOGGER.warning(f"[validate_currency_map] failed to derive currency map: {e}")
+            return None
+
+        for from_currency, rates in currency_map.items():
+            for pair, exchange_rate in rates.items():
+                derived_rate = derived_currency_map[from_currency][pair]
+                if exchange_rate and abs(derived_rate / exchange_rate - 1) > tolerance:
+                    _LOGGER.warning(
+                        f"[validate_currency_map] {pair} mismatch: fetched={exchange_rate}, derived={derived_rate}"
+                    )
+
+    def _get_base_quotes(
+        self,
+        currency_end_date: datetime,
+        currency_start_date: datetime = None,
+        live_only: bool = False,
+    ) -> Tuple[pd.DataFrame, str]:
+        """Return daily quotes of every currency per one unit of the base currency.
+
+        Cross rates are derived as quotes[to] / quotes[from], so only N - 1
+        pairs are fetched instead of N * (N - 1).
+        """
+        base_currency = config.get_global("EXCHANGE_RATE_BASE_CURRENCY", "USD")
+        currency_end_date, currency_start_date = self._get_date_range(
+            currency_end_date, currency_start_date
+        )
+
+        quote_series = {}
+        sources = set()
+        for quote_currency in self.from_exchange_currencies:
+            if quote_currency == base_currency:
+                continue
+
+            pair = f"{base_currency}/{quote_currency}"
+            if live_only:
+                df, source = self._fetch_exchange_rate_info(
+                    pair, currency_end_date, currency_start_date
+                )
+                sources.add(source)
+            else:
+                df = self._get_exchange_rate_info(
+                    pair, currency_end_date, currency_start_date
+                )
+
+            dates = pd.to_datetime(df["Date"], utc=True).dt.tz_localize(None)
+            series = pd.Series(df["Close"].values, index=dates.dt.normalize())
+            quote_series[quote_currency] = series[
+                ~series.index.duplicated(keep="last")
+            ]
+
+        # carry the last quote forward so that pairs with different holidays line up
+        base_quotes = pd.DataFrame(quote_series).sort_index().ffill().dropna()
+        if base_quotes.empty:
+            raise ValueError(
+                f"Base quotes are empty. ({currency_start_date} ~ {currency_end_date})"
+            )
+
+        base_quotes[base_currency] = 1.0
+
+        return base_quotes, "/".join(sorted(sources))
+
     def _initialize_currency_map(self):
         currency_map = {}
         for exchange_currency in self.from_exchange_currencies:
@@ -70,64 +213,115 @@ class CurrencyConnector(BaseConnector):
         response = requests.request(method="GET", url=url, headers=headers, timeout=3)
         return response.json()
 
+    def list_exchange_rates(
+        self,
+        pair: str,
+        currency_end_date: datetime,
+        currency_start_date: Union[datetime, None] = None,
+    ) -> list:
+        """Fetch daily close rates of a pair from the live sources only.
+
+        Unlike add_currency_map_date, this never falls back to
+        DEFAULT_EXCHANGE_RATES and raises when every live source fails, so the
+        result is safe to persist to the exchange rate store.
+        """
+        currency_end_date, currency_start_date = self._get_date_range(
+            currency_end_date, currency_start_date
+        )
+        df, source = self._fetch_exchange_rate_info(
+            pair, currency_end_date, currency_start_date
+        )
+
+        exchange_rates = []
+        for rate_date, rate in df.itertuples(index=False):
+            exchange_rates.append(
+                {
+                    "pair": pair,
+                    "date": pd.Timestamp(rate_date).strftime("%Y-%m-%d"),
+                    "rate": float(rate),
+                    "source": source,
+                }
+            )
+
+        return exchange_rates
+
     def _get_exchange_rate_info(
         self,
         pair: str,
         currency_end_date: datetime,
         currency_start_date: Union[datetime, None] = None,
     ):
-        df = None
+        currency_end_date, currency_start_date = self._get_date_range(
+            currency_end_date, currency_start_date
+        )
 
         try:
-            currency_end_date = currency_end_date.replace(
-                hour=23, minute=59, second=59, microsecond=59
+            df, source = self._fetch_exchange_rate_info(
+                pair, currency_end_date, currency_start_date
             )
+            return df
+        except Exception as e:
+            _LOGGER.warning(f"[get_exchange_rate_info] Error while fetching data from Yahoo Finance API. {e}")
+            _LOGGER.warning(f"[get_exchange_rate_info] Returning default rate_info DataFrame from global config.")
+
+            default_rates = config.get_global("DEFAULT_EXCHANGE_RATES", {})
+            dates = self.make_datetime_list(currency_start_date, currency_end_date)
+            rates = self.make_default_rates_list(pair, default_rates, len(dates))
 
-            if not currency_start_date:
-                currency_start_date = currency_end_date - relativedelta(days=15)
+            df = pd.DataFrame({
+                "Date": dates,
+                "Close": rates
+            })
+
+            return df.dropna().reset_index()[["Date", "Close"]]
+
+    def _fetch_exchange_rate_info(
+        self, pair: str, currency_end_date: datetime, currency_start_date: datetime
+    ) -> Tuple[pd.DataFrame, str]:
+        df = None
+
+        try:
             df = (
                 fdr.DataReader(pair, start=currency_start_date, end=currency_end_date)
                 .dropna()
                 .reset_index(names="Date")[["Date", "Close"]]
             )
-            return df
+            return df, "FinanceDataReader"
         except Exception as e:
             _LOGGER.warning(f"[get_exchange_rate_info] Failed {e}, {df} => trying Yahoo Finance API")
-            try:
-                response_json = self.http_datareader(
-                    pair, currency_end_date, currency_start_date
-                )
+            response_json = self.http_datareader(
+                pair, currency_end_date, currency_start_date
+            )
 
-                quotes = response_json["chart"]["result"][0]["indicators"]["quote"][0]
-                timestamps = response_json["chart"]["result"][0]["timestamp"]
+            quotes = response_json["chart"]["result"][0]["indicators"]["quote"][0]
+            timestamps = response_json["chart"]["result"][0]["timestamp"]
 
-                # convert bst to utc
-                converted_datetime = [
-                    datetime.fromtimestamp(ts, tz=timezone.utc) for ts in timestamps
-                ]
+            # convert bst to utc
+            converted_datetime = [
+                datetime.fromtimestamp(ts, tz=timezone.utc) for ts in timestamps
+            ]
 
-                df = pd.DataFrame(
-                    {
-                        "Date": converted_datetime,
-                        "Close": quotes["close"],
-                    }
-                )
+            df = pd.DataFrame(
+                {
+                    "Date": converted_datetime,
+                    "Close": quotes["close"],
+                }
+            )
 
-                return df.dropna().reset_index()[["Date", "Close"]]
-            except Exception as e2:
-                _LOGGER.warning(f"[get_exchange_rate_info] Error while fetching data from Yahoo Finance API. {e2}")
-                _LOGGER.warning(f"[get_exchange_rate_info] Returning default rate_info DataFrame from global config.")
+            return df.dropna().reset_index()[["Date", "Close"]], "YahooFinance"
 
-                default_rates = config.get_global("DEFAULT_EXCHANGE_RATES", {})
-                dates = self.make_datetime_list(currency_start_date, currency_end_date)
-                rates = self.make_default_rates_list(pair, default_rates, len(dates))
+    @staticmethod
+    def _get_date_range(
+        currency_end_date: datetime, currency_start_date: Union[datetime, None] = None
+    ) -> Tuple[datetime, datetime]:
+        currency_end_date = currency_end_date.replace(
+            hour=23, minute=59, second=59, microsecond=59
+        )
 
-                df = pd.DataFrame({
-                    "Date": dates,
-                    "Close": rates
-                })
+        if not currency_start_date:
+            currency_start_date = currency_end_date - relativedelta(days=15)
 
-                return df.dropna().reset_index()[["Date", "Close"]]
+        return currency_end_date, currency_start_date
 
     @staticmethod
     def make_datetime_list(start_date: datetime, end_date: datetime) -> list[datetime]:
@@ -0,0 +1,31 @@
+import logging
+
+from sqlalchemy.engine import URL
+
+from spaceone.cost_analysis.connector.warehouse_connector import WarehouseConnector
+
+__all__ = ["DatabricksConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DatabricksConnector(WarehouseConnector):
+    warehouse_type = "DATABRICKS"
+    package_extra = "databricks"
+
+    def _make_engine_url(self) -> URL:
+        return URL.create(
+            "databricks",
+            username="token",
+            password=self.warehouse_conf.get("access_token"),
+            host=self.warehouse_conf.get("server_hostname"),
+            query={"http_path": self.warehouse_conf.get("http_path")},
+        )
+
+    def _make_engine_options(self) -> dict:
+        options = super()._make_engine_options()
+
+        if timeout := self.warehouse_conf.get("transport_command_timeout"):
+            options["connect_args"] = {"_socket_timeout": timeout}
+
+        return options
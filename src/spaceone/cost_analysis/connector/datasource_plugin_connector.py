@@ -1,4 +1,9 @@
 import logging
+from typing import Generator, Tuple, Union
+
+import grpc
+
+from google.protobuf.json_format import MessageToDict
 
 from spaceone.core.connector import BaseConnector
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
@@ -12,6 +17,7 @@ class DataSourcePluginConnector(BaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.client = None
+        self.message_client = None
         self.secret_data = None
         self.options = None
         self.schema = None
@@ -27,6 +33,9 @@ class DataSourcePluginConnector(BaseConnector):
         self.client = self.locator.get_connector(
             "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
         )
+        self.message_client = self.locator.get_connector(
+            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN", return_type="message"
+        )
 
         self.secret_data = self.config.get("secret_data")
         self.options = self.config.get("options")
@@ -82,7 +91,9 @@ class DataSourcePluginConnector(BaseConnector):
 
         return self.client.dispatch("Cost.get_linked_accounts", params)
 
-    def get_cost_data(self, options, secret_data, schema, task_options, domain_id):
+    def get_cost_data(
+        self, options, secret_data, schema, task_options, domain_id
+    ) -> Tuple[Generator[dict, None, None], Union[grpc.Call, None]]:
         params = {
             "options": self.options or options,
             "secret_data": self.secret_data or secret_data,
@@ -90,4 +101,54 @@ class DataSourcePluginConnector(BaseConnector):
             "task_options": task_options,
             "domain_id": domain_id,
         }
-        return self.client.dispatch("Cost.get_data", params)
+        response_stream = self.message_client.dispatch("Cost.get_data", params)
+        return (
+            self._generate_costs_response(response_stream),
+            self._get_grpc_call(response_stream),
+        )
+
+    @staticmethod
+    def _get_grpc_call(response_stream) -> Union[grpc.Call, None]:
+        # the client interceptor of spaceone-core wraps the gRPC call in a generator,
+        # and only the call itself can be canceled while a reader waits on it
+        if isinstance(response_stream, grpc.Call):
+            return response_stream
+
+        if frame := getattr(response_stream, "gi_frame", None):
+            for value in frame.f_locals.values():
+                if isinstance(value, grpc.Call):
+                    return value
+
+        _LOGGER.warning(
+            "[get_cost_data] gRPC call of the response stream is not found, "
+            "the stream is not canceled when it is closed"
+        )
+        return None
+
+    def _generate_costs_response(
+        self, response_stream
+    ) -> Generator[dict, None, None]:
+        for costs_info in response_stream:
+            yield self._change_costs_message(costs_info)
+
+    def _change_costs_message(self, costs_info) -> dict:
+        return {
+            "results": [
+                self._change_cost_message(cost_info)
+                for cost_info in costs_info.results
+            ]
+        }
+
+    @staticmethod
+    def _change_cost_message(cost_info) -> dict:
+        # same output as MessageToDict, but only the Struct fields go through json_format
+        cost_data = {}
+        for field, value in cost_info.ListFields():
+            if field.message_type:
+                cost_data[field.name] = MessageToDict(
+                    value, preserving_proto_field_name=True
+                )
+            else:
+                cost_data[field.name] = value
+
+        return cost_data
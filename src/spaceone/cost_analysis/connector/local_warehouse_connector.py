@@ -0,0 +1,36 @@
+import logging
+
+from sqlalchemy.pool import StaticPool
+
+from spaceone.cost_analysis.connector.warehouse_connector import WarehouseConnector
+
+__all__ = ["LocalWarehouseConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_MEMORY_URLS = ["sqlite://", "sqlite:///:memory:", "duckdb:///:memory:"]
+
+
+class LocalWarehouseConnector(WarehouseConnector):
+    """Warehouse on a local SQLite or DuckDB database.
+
+    DuckDB requires the duckdb extra. (e.g. url = "duckdb:////data/cost.duckdb")
+    """
+
+    warehouse_type = "LOCAL"
+    package_extra = "duckdb"
+
+    def _make_engine_url(self) -> str:
+        return self.warehouse_conf.get("url", "sqlite://")
+
+    def _make_engine_options(self) -> dict:
+        url = self._make_engine_url()
+
+        # an in-memory database only lives as long as its single connection
+        if url in _MEMORY_URLS:
+            options = {"poolclass": StaticPool}
+            if url.startswith("sqlite"):
+                options["connect_args"] = {"check_same_thread": False}
+            return options
+
+        return super()._make_engine_options()
@@ -1,5 +1,6 @@
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -11,22 +12,24 @@ __all__ = ["SMTPConnector"]
 
 _LOGGER = logging.getLogger(__name__)
 
+# SMTP sessions are kept per worker thread and reused across messages
+_SMTP_SESSIONS = threading.local()
+
 
 class SMTPConnector(BaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.smtp = None
-        host = self.config.get("host")
-        port = self.config.get("port")
-        user = self.config.get("user")
-        password = self.config.get("password")
+        self.host = self.config.get("host")
+        self.port = self.config.get("port")
+        self.user = self.config.get("user")
+        self.password = self.config.get("password")
         self.from_email = self.config.get("from_email")
-        self.set_smtp(host, port, user, password)
+        self.smtp = self._get_smtp_session()
 
     def set_smtp(self, host, port, user, password):
         try:
             self.smtp = smtplib.SMTP(host, port)
-            self.smtp.connect(host, port)
             self.smtp.ehlo()
             self.smtp.starttls()
             self.smtp.login(user, password)
@@ -48,4 +51,45 @@ class SMTPConnector(BaseConnector):
         )
 
     def quit_smtp(self):
-        self.smtp.quit()
+        self._get_sessions().pop(self._get_session_key(), None)
+        self._close(self.smtp)
+        self.smtp = None
+
+    def _get_smtp_session(self) -> smtplib.SMTP:
+        sessions = self._get_sessions()
+        session_key = self._get_session_key()
+
+        smtp = sessions.get(session_key)
+        if smtp is not None and self._is_alive(smtp):
+            return smtp
+
+        self._close(smtp)
+        self.set_smtp(self.host, self.port, self.user, self.password)
+        sessions[session_key] = self.smtp
+        return self.smtp
+
+    def _get_session_key(self) -> tuple:
+        return self.host, self.port, self.user
+
+    @staticmethod
+    def _get_sessions() -> dict:
+        if not hasattr(_SMTP_SESSIONS, "sessions"):
+            _SMTP_SESSIONS.sessions = {}
+        return _SMTP_SESSIONS.sessions
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP) -> None:
+        if smtp is None:
+            return None
+
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
@@ -0,0 +1,589 @@
+import abc
+import logging
+import re
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Tuple, Union
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import (
+    and_,
+    column,
+    create_engine,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import NoSuchModuleError
+from sqlalchemy.sql.elements import quoted_name
+
+from spaceone.core import config
+from spaceone.core.connector import BaseConnector
+
+from spaceone.cost_analysis.error import *
+
+__all__ = ["WarehouseConnector", "WarehouseRecord"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# SQLAlchemy engines (and their connection pools) are shared per warehouse type
+_ENGINES = {}
+_ENGINE_LOCK = threading.Lock()
+
+_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_DATE_FIELDS = {
+    "DAILY": ("billed_date", "%Y-%m-%d"),
+    "MONTHLY": ("billed_month", "%Y-%m"),
+    "YEARLY": ("billed_year", "%Y"),
+}
+
+_AGGREGATE_FUNCTIONS = {
+    "sum": func.sum,
+    "average": func.avg,
+    "max": func.max,
+    "min": func.min,
+}
+
+
+class WarehouseRecord(dict):
+    def to_dict(self) -> dict:
+        return dict(self)
+
+
+class WarehouseConnector(BaseConnector, abc.ABC):
+    """Translates the SpaceONE query dialect to SQL against warehouse cost tables.
+
+    Each provider has YEARLY, MONTHLY and DAILY tables in WAREHOUSES config:
+        WAREHOUSES = {
+            "<warehouse_type>": {
+                "<provider>": {"catalog": "", "schema": "", "table": {"DAILY": "", ...}},
+                "pool_size": 1,
+                "max_overflow": 5,
+                "pool_recycle": 300,
+                "pool_timeout": 30,
+            }
+        }
+    """
+
+    warehouse_type = None
+    # optional dependencies of the SQLAlchemy dialect (e.g. pip install spaceone-cost-analysis[duckdb])
+    package_extra = None
+
+    def __init__(self, *args, warehouse_type: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.warehouse_type = warehouse_type or self.warehouse_type
+        self.warehouse_conf = config.get_global("WAREHOUSES", {}).get(
+            self.warehouse_type, {}
+        )
+        self.engine = self._get_engine()
+
+    def list_costs(self, provider: str, query: dict) -> Tuple[list, int]:
+        cost_table = self._get_table(provider, "DAILY")
+        where_clause = self._make_where_clause(query)
+        page = query.get("page", {})
+
+        count_stmt = select(func.count()).select_from(cost_table)
+        if where_clause is not None:
+            count_stmt = count_stmt.where(where_clause)
+
+        with self.engine.connect() as conn:
+            total_count = conn.execute(count_stmt).scalar() or 0
+
+            if query.get("count_only"):
+                return [], total_count
+
+            if only := query.get("only"):
+                stmt = select(*[self._get_column(key) for key in only])
+            else:
+                stmt = select(literal_column("*"))
+
+            stmt = stmt.select_from(cost_table)
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+
+            for condition in query.get("sort", []):
+                sort_column = self._get_column(condition["key"])
+                stmt = stmt.order_by(
+                    sort_column.desc() if condition.get("desc") else sort_column
+                )
+
+            if limit := page.get("limit"):
+                stmt = stmt.offset(max(page.get("start", 1), 1) - 1).limit(limit)
+
+            _LOGGER.debug(f"[list_costs] query: {stmt}")
+            rows = conn.execute(stmt).mappings().all()
+
+        return [WarehouseRecord(self._convert_row(row)) for row in rows], total_count
+
+    def stat_costs(self, provider: str, query: dict, table_type: str = "MONTHLY"):
+        cost_table = self._get_table(provider, table_type)
+        where_clause = self._make_where_clause(query)
+        page = query.get("page", {})
+
+        if distinct := query.get("distinct"):
+            distinct_column = self._get_column(distinct)
+            stmt = (
+                select(distinct_column.label("value"))
+                .distinct()
+                .select_from(cost_table)
+            )
+            if where_clause is not None:
+                stmt = stmt.where(where_clause)
+
+            values = [row["value"] for row in self._execute(stmt)]
+            values = sorted(values, key=lambda value: (value is None, value))
+
+            response = {}
+            if page.get("limit", 0) > 0:
+                start = max(page.get("start", 1), 1)
+                response["total_count"] = len(values)
+                values = values[start - 1 : start + page["limit"] - 1]
+
+            response["results"] = [self._convert_value(value) for value in values]
+            return response
+
+        if aggregate := query.get("aggregate"):
+            return self._stat_aggregate(cost_table, where_clause, aggregate, page)
+
+        raise ERROR_REQUIRED_PARAMETER(key="aggregate")
+
+    def analyze_costs(
+        self, provider: str, query: dict, table_type: str = "DAILY"
+    ) -> Union[dict, list]:
+        fields = query.get("fields")
+        if fields is None:
+            raise ERROR_REQUIRED_PARAMETER(key="fields")
+
+        for option in ["select", "lookup", "unwind", "add_fields"]:
+            if query.get(option):
+                raise ERROR_NOT_SUPPORT_QUERY_OPTION(query_option=option)
+
+        cost_table = self._get_table(provider, table_type)
+        date_field, date_field_format = _DATE_FIELDS[table_type]
+        field_group = query.get("field_group", [])
+        sort = query.get("sort", [])
+        page = query.get("page", {})
+        page_limit = page.get("limit")
+
+        date_filter = []
+        if start := query.get("start"):
+            start_value = self._parse_start_and_end_time("start", start)
+            date_filter.append(
+                {"k": date_field, "v": start_value.strftime(date_field_format), "o": "gte"}
+            )
+
+        if end := query.get("end"):
+            end_value = self._parse_start_and_end_time("end", end)
+            date_filter.append(
+                {"k": date_field, "v": end_value.strftime(date_field_format), "o": "lt"}
+            )
+
+        where_clause = self._make_where_clause(query, date_filter)
+
+        group_columns = {}
+        for group_option in query.get("group_by", []):
+            if isinstance(group_option, dict):
+                key, name = group_option.get("key"), group_option.get("name")
+            else:
+                key = name = group_option
+            group_columns[name] = self._get_column(key)
+
+        if query.get("granularity") in _DATE_FIELDS:
+            group_columns["date"] = self._get_column(date_field)
+
+        field_columns = {}
+        for name, condition in fields.items():
+            field_columns[name] = self._make_field_column(name, condition)
+
+        stmt = select(
+            *[group_column.label(name) for name, group_column in group_columns.items()],
+            *[field_column.label(name) for name, field_column in field_columns.items()],
+        ).select_from(cost_table)
+
+        if where_clause is not None:
+            stmt = stmt.where(where_clause)
+
+        if group_columns:
+            stmt = stmt.group_by(*group_columns.values())
+        else:
+            # no rows, no results as in MongoDB, rather than a row of nulls
+            stmt = stmt.having(func.count() > 0)
+
+        if not field_group:
+            labels = {**group_columns, **field_columns}
+            for condition in sort:
+                sort_column = labels.get(condition.get("key"))
+                if sort_column is not None:
+                    stmt = stmt.order_by(
+                        sort_column.desc() if condition.get("desc") else sort_column
+                    )
+
+            if page_limit:
+                stmt = stmt.offset(max(page.get("start", 1), 1) - 1).limit(
+                    page_limit + 1
+                )
+
+        _LOGGER.debug(f"[analyze_costs] query: {stmt}")
+        results = [self._convert_row(row) for row in self._execute(stmt)]
+
+        if field_group:
+            results = self._make_field_group_results(
+                results, list(group_columns.keys()), fields, field_group
+            )
+            results = self._sort_results(results, sort, fields)
+
+            if page_limit:
+                start = max(page.get("start", 1), 1)
+                results = results[start - 1 : start + page_limit]
+
+        if query.get("return_type") == "cursor":
+            return results
+
+        response = {"results": results}
+        if page_limit:
+            response["more"] = len(results) > page_limit
+            response["results"] = results[:page_limit]
+
+        return response
+
+    @abc.abstractmethod
+    def _make_engine_url(self) -> str:
+        pass
+
+    def _make_engine_options(self) -> dict:
+        return {
+            "pool_size": self.warehouse_conf.get("pool_size", 1),
+            "max_overflow": self.warehouse_conf.get("max_overflow", 5),
+            "pool_recycle": self.warehouse_conf.get("pool_recycle", 300),
+            "pool_timeout": self.warehouse_conf.get("pool_timeout", 30),
+            "pool_pre_ping": True,
+        }
+
+    def _get_engine(self) -> Engine:
+        with _ENGINE_LOCK:
+            if self.warehouse_type not in _ENGINES:
+                _LOGGER.debug(
+                    f"[_get_engine] create warehouse engine: {self.warehouse_type}"
+                )
+                # dialects are imported on the first engine, so drivers stay optional
+                try:
+                    _ENGINES[self.warehouse_type] = create_engine(
+                        self._make_engine_url(), **self._make_engine_options()
+                    )
+                except (ImportError, NoSuchModuleError) as e:
+                    _LOGGER.error(f"[_get_engine] failed to load warehouse driver: {e}")
+                    raise ERROR_WAREHOUSE_DRIVER_NOT_INSTALLED(
+                        warehouse_type=self.warehouse_type, extra=self.package_extra
+                    )
+
+            return _ENGINES[self.warehouse_type]
+
+    def _get_table(self, provider: str, table_type: str):
+        provider_conf = self.warehouse_conf.get(provider, {})
+        table_name = provider_conf.get("table", {}).get(table_type)
+
+        if not table_name:
+            raise ERROR_NOT_SUPPORT_QUERY_OPTION(
+                query_option=f"{self.warehouse_type}.{provider}.table.{table_type}"
+            )
+
+        schema = ".".join(
+            [
+                name
+                for name in [provider_conf.get("catalog"), provider_conf.get("schema")]
+                if name
+            ]
+        )
+
+        # table names come from the service config, so they are used as they are
+        return table(
+            quoted_name(table_name, quote=False),
+            schema=quoted_name(schema, quote=False) if schema else None,
+        )
+
+    @staticmethod
+    def _get_column(key: str):
+        if not isinstance(key, str) or not _KEY_PATTERN.match(key):
+            raise ERROR_INVALID_PARAMETER(
+                key=key, reason="Nested or invalid keys are not supported in warehouse."
+            )
+
+        return column(key)
+
+    def _make_field_column(self, name: str, condition: dict):
+        operator = condition.get("operator")
+        key = condition.get("key")
+
+        if operator is None:
+            raise ERROR_REQUIRED_PARAMETER(key="query.fields.operator")
+
+        if operator == "count":
+            return func.count()
+
+        if operator not in _AGGREGATE_FUNCTIONS:
+            raise ERROR_NOT_SUPPORT_QUERY_OPTION(query_option=f"fields.{name}.{operator}")
+
+        if key is None:
+            raise ERROR_REQUIRED_PARAMETER(key="query.fields.key")
+
+        return _AGGREGATE_FUNCTIONS[operator](self._get_column(key))
+
+    def _make_where_clause(self, query: dict, extra_filter: list = None):
+        conditions = [
+            self._make_condition(condition)
+            for condition in query.get("filter", []) + (extra_filter or [])
+        ]
+
+        if filter_or := query.get("filter_or", []):
+            conditions.append(
+                or_(*[self._make_condition(condition) for condition in filter_or])
+            )
+
+        if not conditions:
+            return None
+
+        return and_(*conditions)
+
+    def _make_condition(self, condition: dict):
+        key = condition.get("k", condition.get("key"))
+        value = condition.get("v", condition.get("value"))
+        operator = condition.get("o", condition.get("operator", "eq"))
+        target_column = self._get_column(key)
+
+        # conditions follow the MongoDB semantics of the same operators
+        if operator == "eq":
+            return target_column.is_(None) if value is None else target_column == value
+        elif operator == "not":
+            if value is None:
+                return target_column.is_not(None)
+            return or_(target_column != value, target_column.is_(None))
+        elif operator == "in":
+            return self._make_in_condition(target_column, value, is_not=False)
+        elif operator == "not_in":
+            return self._make_in_condition(target_column, value, is_not=True)
+        elif operator == "contain":
+            return target_column.contains(value, autoescape=True)
+        elif operator == "not_contain":
+            return or_(
+                ~target_column.contains(value, autoescape=True),
+                target_column.is_(None),
+            )
+        elif operator == "contain_in":
+            return or_(
+                *[target_column.contains(v, autoescape=True) for v in value]
+            )
+        elif operator == "not_contain_in":
+            return or_(
+                and_(*[~target_column.contains(v, autoescape=True) for v in value]),
+                target_column.is_(None),
+            )
+        elif operator == "exists":
+            return target_column.is_not(None) if value else target_column.is_(None)
+        elif operator == "gt":
+            return target_column > value
+        elif operator == "gte":
+            return target_column >= value
+        elif operator == "lt":
+            return target_column < value
+        elif operator == "lte":
+            return target_column <= value
+
+        raise ERROR_NOT_SUPPORT_QUERY_OPTION(query_option=f"filter.{key}.{operator}")
+
+    @staticmethod
+    def _make_in_condition(target_column, value, is_not: bool = False):
+        if not isinstance(value, list):
+            raise ERROR_OPERATOR_LIST_VALUE_TYPE(operator="in", condition=value)
+
+        values = [v for v in value if v is not None]
+        has_null = len(values) != len(value)
+
+        if is_not:
+            condition = or_(target_column.not_in(values), target_column.is_(None))
+            return and_(condition, target_column.is_not(None)) if has_null else condition
+        else:
+            condition = target_column.in_(values)
+            return or_(condition, target_column.is_(None)) if has_null else condition
+
+    def _stat_aggregate(self, cost_table, where_clause, aggregate: list, page: dict):
+        stmt = None
+        labels = {}
+        count_name = None
+
+        for stage in aggregate:
+            if "group" in stage:
+                if stmt is not None:
+                    raise ERROR_NOT_SUPPORT_QUERY_OPTION(query_option="aggregate.group")
+
+                group_columns = {
+                    key_option.get("name"): self._get_column(key_option.get("key"))
+                    for key_option in stage["group"].get("keys", [])
+                }
+                field_columns = {
+                    field_option.get("name"): self._make_field_column(
+                        field_option.get("name"), field_option
+                    )
+                    for field_option in stage["group"].get("fields", [])
+                }
+                labels = {**group_columns, **field_columns}
+
+                stmt = select(
+                    *[label_column.label(name) for name, label_column in labels.items()]
+                ).select_from(cost_table)
+
+                if where_clause is not None:
+                    stmt = stmt.where(where_clause)
+
+                if group_columns:
+                    stmt = stmt.group_by(*group_columns.values())
+
+            elif "sort" in stage and stmt is not None:
+                sort_options = stage["sort"]
+                if isinstance(sort_options, dict):
+                    sort_options = [sort_options]
+
+                for condition in sort_options:
+                    sort_column = labels.get(condition.get("key"))
+                    if sort_column is not None:
+                        stmt = stmt.order_by(
+                            sort_column.desc() if condition.get("desc") else sort_column
+                        )
+
+            elif "skip" in stage and stmt is not None:
+                stmt = stmt.offset(stage["skip"])
+            elif "limit" in stage and stmt is not None:
+                stmt = stmt.limit(stage["limit"])
+            elif "count" in stage and stmt is not None:
+                count_name = stage["count"].get("name", "total_count")
+            else:
+                raise ERROR_NOT_SUPPORT_QUERY_OPTION(
+                    query_option=f"aggregate.{list(stage.keys())}"
+                )
+
+        if stmt is None:
+            raise ERROR_REQUIRED_PARAMETER(key="aggregate.group")
+
+        response = {}
+        if count_name:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total_count = self._execute_scalar(count_stmt)
+            response["results"] = [{count_name: total_count}]
+            return response
+
+        if page.get("limit", 0) > 0:
+            start = max(page.get("start", 1), 1)
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            response["total_count"] = self._execute_scalar(count_stmt)
+            stmt = stmt.offset(start - 1).limit(page["limit"])
+
+        _LOGGER.debug(f"[stat_costs] query: {stmt}")
+        response["results"] = [self._convert_row(row) for row in self._execute(stmt)]
+        return response
+
+    def _execute(self, stmt) -> list:
+        with self.engine.connect() as conn:
+            return conn.execute(stmt).mappings().all()
+
+    def _execute_scalar(self, stmt):
+        with self.engine.connect() as conn:
+            return conn.execute(stmt).scalar() or 0
+
+    @staticmethod
+    def _make_field_group_results(
+        results: list, group_names: list, fields: dict, field_group: list
+    ) -> list:
+        # pivot rows like the field_group stage of MongoModel.analyze
+        key_names = [name for name in group_names if name not in field_group]
+        grouped_results = {}
+
+        for row in results:
+            group_key = tuple(row.get(name) for name in key_names)
+            if group_key not in grouped_results:
+                grouped_results[group_key] = {
+                    **{name: row.get(name) for name in key_names},
+                    **{name: [] for name in fields.keys()},
+                }
+
+            for name in fields.keys():
+                grouped_results[group_key][name].append(
+                    {
+                        "value": row.get(name),
+                        **{fg_key: row.get(fg_key) for fg_key in field_group},
+                    }
+                )
+
+        for grouped_result in grouped_results.values():
+            for name, condition in fields.items():
+                values = [
+                    field_value["value"]
+                    for field_value in grouped_result[name]
+                    if field_value["value"] is not None
+                ]
+                operator = condition.get("operator")
+
+                if operator in ["sum", "count"]:
+                    total = sum(values)
+                elif operator == "average":
+                    total = sum(values) / len(values) if values else None
+                elif operator == "max":
+                    total = max(values) if values else None
+                else:
+                    total = min(values) if values else None
+
+                grouped_result[f"_total_{name}"] = total
+
+        return list(grouped_results.values())
+
+    @staticmethod
+    def _sort_results(results: list, sort: list, fields: dict) -> list:
+        for condition in reversed(sort):
+            key = condition.get("key")
+            if key in fields:
+                key = f"_total_{key}"
+
+            results = sorted(
+                results,
+                key=lambda result: (result.get(key) is None, result.get(key)),
+                reverse=condition.get("desc", False),
+            )
+
+        return results
+
+    def _convert_row(self, row) -> dict:
+        return {key: self._convert_value(value) for key, value in dict(row).items()}
+
+    @staticmethod
+    def _convert_value(value):
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
+
+    @staticmethod
+    def _parse_start_and_end_time(key: str, value: Union[str, date]) -> date:
+        if isinstance(value, datetime):
+            return value.date()
+        elif isinstance(value, date):
+            return value
+
+        date_formats = {4: ("%Y", "YYYY"), 7: ("%Y-%m", "YYYY-MM")}
+        date_format, date_type = date_formats.get(len(value), ("%Y-%m-%d", "YYYY-MM-DD"))
+
+        try:
+            dt = datetime.strptime(value, date_format).date()
+        except Exception:
+            raise ERROR_INVALID_PARAMETER_TYPE(key=key, type=date_type)
+
+        # the end date is exclusive as in MongoModel.analyze
+        if key == "start":
+            return dt
+        elif date_type == "YYYY":
+            return dt + relativedelta(years=1)
+        elif date_type == "YYYY-MM":
+            return dt + relativedelta(months=1)
+        else:
+            return dt + relativedelta(days=1)
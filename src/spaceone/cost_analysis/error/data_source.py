@@ -20,3 +20,10 @@ class ERROR_DATA_SOURCE_STATE(ERROR_INVALID_ARGUMENT):
 class ERROR_NOT_ALLOW_SECRET_FILTER(ERROR_INVALID_ARGUMENT):
     _message = 'USE_SERVICE_ACCOUNT_SECRET type dose not allow secret filter. (data_source_id = {data_source_id})'
 
+
+class ERROR_NOT_SUPPORT_WAREHOUSE_TYPE(ERROR_INVALID_ARGUMENT):
+    _message = 'Warehouse type is not supported. (warehouse_type = {warehouse_type})'
+
+
+class ERROR_WAREHOUSE_DRIVER_NOT_INSTALLED(ERROR_CONFIGURATION):
+    _message = 'Warehouse driver is not installed. (warehouse_type = {warehouse_type}, extra = {extra})'
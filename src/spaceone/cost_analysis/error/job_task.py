@@ -3,3 +3,11 @@ from spaceone.core.error import *
 
 class ERROR_JOB_TASK(ERROR_UNKNOWN):
     _message = 'One or more job tasks have failed.'
+
+
+class ERROR_JOB_TASK_STALLED(ERROR_UNKNOWN):
+    _message = 'Job task has stopped responding. (job_task_id = {job_task_id})'
+
+
+class ERROR_JOB_TASK_CLAIM_LOST(ERROR_UNKNOWN):
+    _message = 'Job task is taken over by another worker. (job_task_id = {job_task_id})'
@@ -0,0 +1,66 @@
+import logging
+from datetime import datetime, timezone
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import HourlyScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CostArchiveScheduler(HourlyScheduler):
+    def __init__(self, queue, interval, minute=":00"):
+        super().__init__(queue, interval, minute)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+        self._cost_archive_enabled = config.get_global("COST_ARCHIVE_ENABLED", False)
+        self._cost_archive_hour = config.get_global("COST_ARCHIVE_HOUR", 18)
+
+        if self._cost_archive_enabled and not config.get_global("COST_ARCHIVE_PATH"):
+            raise ERROR_CONFIGURATION(key="COST_ARCHIVE_PATH")
+
+        if self._cost_archive_hour < 0 or self._cost_archive_hour > 23:
+            _LOGGER.warning(
+                f"Invalid COST_ARCHIVE_HOUR: {self._cost_archive_hour} hour (UTC). Must be between 0 and 23."
+            )
+            self._cost_archive_hour = 18
+
+    def create_task(self) -> list:
+        if (
+            self._cost_archive_enabled
+            and datetime.now(timezone.utc).hour == self._cost_archive_hour
+        ):
+            stp = {
+                "name": "cost_archive_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "CostArchiveService",
+                        "metadata": {"token": self._token},
+                        "method": "archive_costs_by_scheduler",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] archive_costs_by_scheduler => START"
+            )
+            return [stp]
+        else:
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] archive_costs_by_scheduler => SKIP"
+            )
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] cost_archive_hour: {self._cost_archive_hour} hour (UTC)"
+            )
+            return []
@@ -38,7 +38,21 @@ class DataSourceSyncScheduler(HourlyScheduler):
                     "metadata": {"token": self._token},
                     "method": "create_jobs_by_data_source",
                     "params": {"params": {"sync_hour": datetime.utcnow().hour}},
-                }
+                },
+                {
+                    "locator": "SERVICE",
+                    "name": "JobService",
+                    "metadata": {"token": self._token},
+                    "method": "retry_stalled_job_tasks",
+                    "params": {"params": {}},
+                },
+                {
+                    "locator": "SERVICE",
+                    "name": "JobService",
+                    "metadata": {"token": self._token},
+                    "method": "dispatch_job_tasks",
+                    "params": {"params": {}},
+                },
             ],
         }
 
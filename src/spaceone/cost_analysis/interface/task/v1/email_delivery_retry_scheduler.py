@@ -0,0 +1,43 @@
+import logging
+from datetime import datetime, timezone
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EmailDeliveryRetryScheduler(IntervalScheduler):
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+    def create_task(self) -> list:
+        stp = {
+            "name": "email_delivery_retry_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "EmailService",
+                    "metadata": {"token": self._token},
+                    "method": "retry_email_deliveries",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        print(
+            f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] retry_email_deliveries => START"
+        )
+        return [stp]
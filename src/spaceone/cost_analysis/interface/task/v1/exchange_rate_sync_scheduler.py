@@ -0,0 +1,59 @@
+import logging
+from datetime import datetime, timezone
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import HourlyScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ExchangeRateSyncScheduler(HourlyScheduler):
+    def __init__(self, queue, interval, minute=":00"):
+        super().__init__(queue, interval, minute)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+        self._exchange_rate_sync_hour = config.get_global("EXCHANGE_RATE_SYNC_HOUR", 23)
+
+        if self._exchange_rate_sync_hour < 0 or self._exchange_rate_sync_hour > 23:
+            _LOGGER.warning(
+                f"Invalid EXCHANGE_RATE_SYNC_HOUR: {self._exchange_rate_sync_hour} hour (UTC). Must be between 0 and 23."
+            )
+            self._exchange_rate_sync_hour = 23
+
+    def create_task(self) -> list:
+        if datetime.now(timezone.utc).hour == self._exchange_rate_sync_hour:
+            stp = {
+                "name": "exchange_rate_sync_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "ExchangeRateService",
+                        "metadata": {"token": self._token},
+                        "method": "sync_exchange_rates_by_scheduler",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] sync_exchange_rates_by_scheduler => START"
+            )
+            return [stp]
+        else:
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] sync_exchange_rates_by_scheduler => SKIP"
+            )
+            print(
+                f"{utils.datetime_to_iso8601(datetime.now(timezone.utc))} [INFO] [create_task] exchange_rate_sync_hour: {self._exchange_rate_sync_hour} hour (UTC)"
+            )
+            return []
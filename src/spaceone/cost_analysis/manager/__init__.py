@@ -39,3 +39,4 @@ from spaceone.cost_analysis.manager.cost_report_manager import CostReportManager
 from spaceone.cost_analysis.manager.cost_report_data_manager import (
     CostReportDataManager,
 )
+from spaceone.cost_analysis.manager.cost_archive_manager import CostArchiveManager
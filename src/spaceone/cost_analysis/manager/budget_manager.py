@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 
 from spaceone.core import config, queue
 from spaceone.core import utils
@@ -43,6 +44,43 @@ class BudgetManager(BaseManager):
         self.transaction.add_rollback(_rollback, budget_vo.to_dict())
         return budget_vo.update(params)
 
+    def set_plan_notified(self, budget_id: str, domain_id: str, threshold: float) -> None:
+        self.budget_model.objects(
+            budget_id=budget_id,
+            domain_id=domain_id,
+            notification__plans__match={"threshold": threshold, "unit": "PERCENT"},
+        ).update(set__notification__plans__S__notified=True)
+
+    def claim_plan_notification(
+        self, budget_id: str, domain_id: str, threshold: float, expired_at: datetime
+    ) -> bool:
+        # only one run queues the alerts of a plan, until they are delivered or the claim expires
+        result = self.budget_model._get_collection().update_one(
+            {
+                "budget_id": budget_id,
+                "domain_id": domain_id,
+                "notification.plans": {
+                    "$elemMatch": {
+                        "threshold": threshold,
+                        "unit": "PERCENT",
+                        "notified": {"$ne": True},
+                        "notifying_at": {"$not": {"$gte": expired_at}},
+                    }
+                },
+            },
+            {"$set": {"notification.plans.$.notifying_at": datetime.utcnow()}},
+        )
+        return result.modified_count > 0
+
+    def release_plan_notification(
+        self, budget_id: str, domain_id: str, threshold: float
+    ) -> None:
+        self.budget_model.objects(
+            budget_id=budget_id,
+            domain_id=domain_id,
+            notification__plans__match={"threshold": threshold, "unit": "PERCENT"},
+        ).update(set__notification__plans__S__notifying_at=None)
+
     @staticmethod
     def delete_budget_by_vo(budget_vo: Budget) -> None:
         budget_vo.delete()
@@ -120,3 +158,27 @@ class BudgetManager(BaseManager):
         _LOGGER.debug(f"[push_budget_update_job_task] task param: {params}")
 
         queue.put("cost_analysis_q", utils.dump_json(task))
+
+    @staticmethod
+    def push_budget_usage_alert_task(params: dict) -> None:
+        token = config.get_global("TOKEN")
+        task = {
+            "name": "send_budget_usage_alerts",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "BudgetService",
+                    "metadata": {"token": token},
+                    "method": "send_budget_usage_alerts",
+                    "params": {"params": params},
+                }
+            ],
+        }
+
+        _LOGGER.debug(
+            f"[push_budget_usage_alert_task] alerts: {len(params.get('alerts', []))}"
+        )
+
+        queue.put("cost_analysis_q", utils.dump_json(task))
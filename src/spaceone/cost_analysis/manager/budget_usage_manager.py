@@ -1,8 +1,9 @@
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Tuple
 
 from dateutil.rrule import rrule, MONTHLY
+from pymongo import UpdateOne
 
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
@@ -109,27 +110,148 @@ class BudgetUsageManager(BaseManager):
             )
 
         budget_vos, _ = self.budget_mgr.list_budgets(query_filter)
+        budget_vos = list(budget_vos)
 
-        for budget_vo in budget_vos:
-            self.update_cost_usage(budget_vo)
-            self.notify_budget_usage(budget_vo)
+        if not budget_vos:
+            return None
+
+        _LOGGER.info(
+            f"[update_budget_usage] Update Budget Usages: {len(budget_vos)} budgets (workspace_id: {workspace_id})"
+        )
+
+        budget_usage_maps = self._get_budget_usage_maps_from_unified_cost(
+            UnifiedCostManager(), domain_id, workspace_id, budget_vos
+        )
+        budget_usage_infos = self._update_budget_usages_by_month_map(
+            budget_vos, budget_usage_maps
+        )
+
+        self.notify_budget_usages(domain_id, budget_vos, budget_usage_infos)
 
     def notify_budget_usage(self, budget_vo: Budget) -> None:
-        budget_id = budget_vo.budget_id
-        notification = budget_vo.notification
+        current_month = datetime.now(timezone.utc).strftime("%Y-%m")
+        budget_usage_info = self._get_budget_usage_and_limit(budget_vo, current_month)
+
+        self.notify_budget_usages(
+            budget_vo.domain_id, [budget_vo], {budget_vo.budget_id: budget_usage_info}
+        )
 
-        plans = notification.plans or []
-        updated_plans = []
-        is_changed = False
+    def notify_budget_usages(
+        self, domain_id: str, budget_vos: list, budget_usage_infos: dict
+    ) -> None:
+        """Evaluate notification thresholds from already computed usages and
+        push the triggered alerts to a background stage, grouped by workspace.
+        A plan is claimed before its alerts are queued, so runs that overlap
+        never queue them twice. Plans are marked notified once an alert email
+        is delivered, and a claim whose emails are not sent expires in a day.
+        """
         current_month = datetime.now(timezone.utc).strftime("%Y-%m")
+        claim_expired_at = datetime.utcnow() - timedelta(days=1)
+
+        notifications_by_workspace = {}
+        for budget_vo in budget_vos:
+            total_budget_usage, budget_limit = budget_usage_infos.get(
+                budget_vo.budget_id, (0, 0)
+            )
+            thresholds = [
+                threshold
+                for threshold in self._get_notify_thresholds(
+                    budget_vo, budget_limit, current_month, claim_expired_at
+                )
+                if self.budget_mgr.claim_plan_notification(
+                    budget_vo.budget_id, domain_id, threshold, claim_expired_at
+                )
+            ]
+
+            if thresholds:
+                notifications_by_workspace.setdefault(budget_vo.workspace_id, []).append(
+                    {
+                        "budget_vo": budget_vo,
+                        "thresholds": thresholds,
+                        "total_budget_usage": total_budget_usage,
+                    }
+                )
+
+        for workspace_id, notifications in notifications_by_workspace.items():
+            alerted_budget_ids = set()
+            try:
+                alerts = self._make_budget_usage_alerts(
+                    domain_id, workspace_id, notifications
+                )
+                if alerts:
+                    self.budget_mgr.push_budget_usage_alert_task(
+                        {"domain_id": domain_id, "alerts": alerts}
+                    )
+                    alerted_budget_ids = {alert["budget_id"] for alert in alerts}
+            except Exception as e:
+                _LOGGER.error(
+                    f"[notify_budget_usages] Failed to notify message (workspace_id: {workspace_id}): {e}",
+                    exc_info=True,
+                )
+
+            # plans without queued alerts are evaluated again on the next run
+            for notification in notifications:
+                budget_id = notification["budget_vo"].budget_id
+                if budget_id not in alerted_budget_ids:
+                    for threshold in notification["thresholds"]:
+                        self.budget_mgr.release_plan_notification(
+                            budget_id, domain_id, threshold
+                        )
+
+    def send_budget_usage_alerts(self, domain_id: str, alerts: list) -> None:
+        budget_ids = list(set([alert["budget_id"] for alert in alerts]))
+        budget_vo_map = {
+            budget_vo.budget_id: budget_vo
+            for budget_vo in self.budget_mgr.filter_budgets(
+                budget_id=budget_ids, domain_id=domain_id
+            )
+        }
+
+        if not self.email_mgr:
+            self.email_mgr = EmailManager()
+
+        for alert in alerts:
+            budget_vo = budget_vo_map.get(alert["budget_id"])
+            if budget_vo is None:
+                continue
+
+            try:
+                self.email_mgr.send_budget_usage_alert_email(
+                    email=alert["email"],
+                    language=alert["language"],
+                    user_id=alert["user_id"],
+                    threshold=alert["threshold"],
+                    total_budget_usage=alert["total_budget_usage"],
+                    budget_percentage=alert["budget_percentage"],
+                    today_date=alert["today_date"],
+                    workspace_name=alert["workspace_name"],
+                    target_name=alert["target_name"],
+                    budget_vo=budget_vo,
+                    console_link=alert["console_link"],
+                )
+            except Exception as e:
+                _LOGGER.error(
+                    f"[send_budget_usage_alerts] Failed to send email: {alert['user_id']}, ({alert['budget_id']}): {e}"
+                )
+
+    @staticmethod
+    def _get_notify_thresholds(
+        budget_vo: Budget,
+        budget_limit: float,
+        current_month: str,
+        claim_expired_at: datetime,
+    ) -> list:
+        budget_id = budget_vo.budget_id
+        thresholds = []
 
         if current_month > budget_vo.end:
             _LOGGER.debug(
                 f"[notify_budget_usage] skip notification: budget is expired ({budget_id})"
             )
-            return
+            return thresholds
 
-        for plan in plans:
+        for plan in budget_vo.notification.plans or []:
+            plan_info = plan.to_dict()
 
             if plan.notified:
                 _LOGGER.debug(
@@ -137,64 +259,32 @@ class BudgetUsageManager(BaseManager):
                 )
                 continue
 
-            plan_info = plan.to_dict()
-            unit = plan_info["unit"]
-            threshold = plan_info["threshold"]
-
-            total_budget_usage, budget_limit = self._get_budget_usage_and_limit(
-                budget_vo, current_month
-            )
-
             if budget_limit == 0:
                 _LOGGER.debug(f"[notify_budget_usage] budget_limit is 0: {budget_id}")
                 continue
 
-            is_notify = False
-            budget_percentage = budget_vo.utilization_rate
-
-            if unit == "PERCENT":
-                if budget_vo.utilization_rate > threshold:
-                    is_notify = True
-                    is_changed = True
-
-            if is_notify:
+            threshold = plan_info["threshold"]
+            if plan.notifying_at and plan.notifying_at >= claim_expired_at:
                 _LOGGER.debug(
-                    f"[notify_budget_usage] notify event: {budget_id}, current month: {current_month} (plan: {plan.to_dict()})"
+                    f"[notify_budget_usage] skip notification: alert is being delivered {budget_id} (threshold: {threshold}%)"
                 )
-                try:
-                    self._notify_message(
-                        budget_vo,
-                        total_budget_usage,
-                        budget_percentage,
-                        threshold,
-                    )
-                    plan_info["notified"] = True
+                continue
 
-                except Exception as e:
-                    _LOGGER.error(
-                        f"[notify_budget_usage] Failed to notify message ({budget_id}): plan: {plan_info}, {e}",
-                        exc_info=True,
-                    )
-                    plan_info["notified"] = False
-                finally:
-                    updated_plans.append(plan_info)
+            if (
+                plan_info["unit"] == "PERCENT"
+                and budget_vo.utilization_rate > threshold
+            ):
+                _LOGGER.debug(
+                    f"[notify_budget_usage] notify event: {budget_id}, current month: {current_month} (plan: {plan_info})"
+                )
+                thresholds.append(threshold)
             else:
-                if unit == "PERCENT":
-                    _LOGGER.debug(
-                        f"[notify_budget_usage] skip notification: {budget_id} "
-                        f"(usage percent: {budget_percentage}%, threshold: {threshold}%)"
-                    )
-                else:
-                    _LOGGER.debug(
-                        f"[notify_budget_usage] skip notification: {budget_id} "
-                        f"(usage cost: {total_budget_usage}, threshold: {threshold})"
-                    )
-
-                updated_plans.append(plan_info)
+                _LOGGER.debug(
+                    f"[notify_budget_usage] skip notification: {budget_id} "
+                    f"(usage percent: {budget_vo.utilization_rate}%, threshold: {threshold}%)"
+                )
 
-        if is_changed:
-            notification.plans = updated_plans
-            budget_vo.update({"notification": notification.to_dict()})
+        return thresholds
 
     def delete_budget_usage_by_budget_vo(self, budget_vo: Budget) -> None:
         budget_usage_vos = self.filter_budget_usages(
@@ -202,69 +292,111 @@ class BudgetUsageManager(BaseManager):
         )
         budget_usage_vos.delete()
 
-    def _notify_message(
-        self,
-        budget_vo: Budget,
-        total_budget_usage: float,
-        budget_percentage: float,
-        threshold: int,
-    ) -> None:
-
-        if not self.email_mgr:
-            self.email_mgr = EmailManager()
-
+    def _make_budget_usage_alerts(
+        self, domain_id: str, workspace_id: str, notifications: list
+    ) -> list:
         identity_mgr = IdentityManager()
         today_date = datetime.now().strftime("%Y-%m-%d")
+        workspace_name = identity_mgr.get_workspace(workspace_id, domain_id)
+        console_domain = self._get_console_domain(domain_id)
 
-        workspace_name = identity_mgr.get_workspace(
-            budget_vo.workspace_id, budget_vo.domain_id
+        budget_vos = [notification["budget_vo"] for notification in notifications]
+        service_account_info_map, project_name_map = self._get_budget_target_info_maps(
+            identity_mgr, domain_id, workspace_id, budget_vos
+        )
+        user_ids_map, user_info_map = self._get_user_info_maps_from_recipients(
+            identity_mgr, domain_id, workspace_id, budget_vos, service_account_info_map
         )
 
-        if budget_vo.service_account_id:
-            service_account_info = identity_mgr.get_service_account(
-                budget_vo.service_account_id,
-                budget_vo.domain_id,
-                budget_vo.workspace_id,
-            )
-
-            target_name = service_account_info.get("name")
-        else:
-            project_info = identity_mgr.get_project(
-                budget_vo.project_id, budget_vo.domain_id
-            )
-            target_name = project_info.get("name")
-
-        user_info_map = self._get_user_info_map_from_recipients(identity_mgr, budget_vo)
+        alerts = []
+        for notification in notifications:
+            budget_vo = notification["budget_vo"]
 
-        console_link = self._get_console_budget_url(
-            budget_vo.domain_id,
-            budget_vo.workspace_id,
-            budget_vo.budget_id,
-        )
+            if budget_vo.service_account_id:
+                target_name = service_account_info_map.get(
+                    budget_vo.service_account_id, {}
+                ).get("name")
+            else:
+                target_name = project_name_map.get(budget_vo.project_id)
+
+            for threshold in notification["thresholds"]:
+                for user_id in user_ids_map.get(budget_vo.budget_id, []):
+                    user_info = user_info_map[user_id]
+                    alerts.append(
+                        {
+                            "budget_id": budget_vo.budget_id,
+                            "email": user_info["email"],
+                            "language": user_info["language"],
+                            "user_id": user_id,
+                            "threshold": threshold,
+                            "total_budget_usage": notification["total_budget_usage"],
+                            "budget_percentage": budget_vo.utilization_rate,
+                            "today_date": today_date,
+                            "workspace_name": workspace_name,
+                            "target_name": target_name,
+                            "console_link": f"{console_domain}/workspace/{workspace_id}/cost-explorer/budget/{budget_vo.budget_id}",
+                        }
+                    )
 
-        for user_id, user_info in user_info_map.items():
-            try:
-                email = user_info["email"]
-                language = user_info.get("language", "en")
+        return alerts
 
-                self.email_mgr.send_budget_usage_alert_email(
-                    email=email,
-                    language=language,
-                    user_id=user_id,
-                    threshold=threshold,
-                    total_budget_usage=total_budget_usage,
-                    budget_percentage=budget_percentage,
-                    today_date=today_date,
-                    workspace_name=workspace_name,
-                    target_name=target_name,
-                    budget_vo=budget_vo,
-                    console_link=console_link,
+    @staticmethod
+    def _get_budget_target_info_maps(
+        identity_mgr: IdentityManager,
+        domain_id: str,
+        workspace_id: str,
+        budget_vos: list,
+    ) -> Tuple[dict, dict]:
+        service_account_ids = set()
+        project_ids = set()
+        for budget_vo in budget_vos:
+            if budget_vo.service_account_id:
+                service_account_ids.add(budget_vo.service_account_id)
+            elif budget_vo.project_id:
+                project_ids.add(budget_vo.project_id)
+
+        service_account_info_map = {}
+        project_name_map = {}
+
+        if service_account_ids or project_ids:
+            query = {
+                "filter": [
+                    {"k": "domain_id", "v": domain_id, "o": "eq"},
+                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+                ],
+                "filter_or": [],
+            }
+            if service_account_ids:
+                query["filter_or"].append(
+                    {"k": "service_account_id", "v": list(service_account_ids), "o": "in"}
                 )
-            except Exception as e:
-                _LOGGER.error(
-                    f"[_notify_message] Failed to send email: {user_id}, {user_info}, ({budget_vo.budget_id}): {e}"
+            if project_ids:
+                query["filter_or"].append(
+                    {"k": "project_id", "v": list(project_ids), "o": "in"}
                 )
 
+            response = identity_mgr.list_service_accounts(query, domain_id)
+            for service_account_info in response.get("results", []):
+                service_account_info_map[
+                    service_account_info["service_account_id"]
+                ] = service_account_info
+
+        if project_ids:
+            response = identity_mgr.list_projects(
+                {
+                    "query": {
+                        "filter": [
+                            {"k": "project_id", "v": list(project_ids), "o": "in"}
+                        ]
+                    }
+                },
+                domain_id,
+            )
+            for project_info in response.get("results", []):
+                project_name_map[project_info["project_id"]] = project_info.get("name")
+
+        return service_account_info_map, project_name_map
+
     def filter_budget_usages(self, **conditions):
         return self.budget_usage_model.filter(**conditions)
 
@@ -289,86 +421,149 @@ class BudgetUsageManager(BaseManager):
             unified_cost_mgr, budget_vo
         )
 
-        total_usage_cost = 0
+        self._update_budget_usages_by_month_map(
+            [budget_vo], {budget_vo.budget_id: budget_usage_by_month_map}
+        )
+
+    def _update_budget_usages_by_month_map(
+        self, budget_vos: list, budget_usage_maps: dict
+    ) -> dict:
         current_month = datetime.now(timezone.utc).strftime("%Y-%m")
-        budget_usage_vos = self.budget_usage_model.filter(budget_id=budget_vo.budget_id)
+        updated_at = datetime.utcnow()
 
+        budget_usage_vos_map = {}
+        budget_usage_vos = self.budget_usage_model.filter(
+            budget_id=[budget_vo.budget_id for budget_vo in budget_vos]
+        ).only("budget_id", "date", "limit")
         for budget_usage_vo in budget_usage_vos:
-            if budget_usage_vo.date in budget_usage_by_month_map:
-                total_usage_cost += budget_usage_by_month_map[budget_usage_vo.date]
-                budget_usage_vo.update(
-                    {
-                        "cost": budget_usage_by_month_map[budget_usage_vo.date],
-                    }
+            budget_usage_vos_map.setdefault(budget_usage_vo.budget_id, []).append(
+                budget_usage_vo
+            )
+
+        budget_usage_operations = []
+        budget_operations = []
+        budget_usage_infos = {}
+        for budget_vo in budget_vos:
+            budget_usage_by_month_map = budget_usage_maps.get(budget_vo.budget_id, {})
+
+            total_usage_cost = 0
+            current_month_usage = (0, 0)
+            budget_utilization_rate = None
+            for budget_usage_vo in budget_usage_vos_map.get(budget_vo.budget_id, []):
+                cost = budget_usage_by_month_map.get(budget_usage_vo.date, 0)
+                total_usage_cost += cost
+                budget_usage_operations.append(
+                    UpdateOne(
+                        {"_id": budget_usage_vo.id},
+                        {"$set": {"cost": cost, "updated_at": updated_at}},
+                    )
                 )
-            else:
-                budget_usage_vo.update({"cost": 0})
 
-        if budget_vo.time_unit == "TOTAL":
-            budget_utilization_rate = round(total_usage_cost / budget_vo.limit * 100, 2)
-            self.budget_mgr.update_budget_by_vo(
-                {"utilization_rate": budget_utilization_rate}, budget_vo
-            )
-        else:
-            for budget_usage_vo in budget_usage_vos:
                 if budget_usage_vo.date == current_month:
+                    current_month_usage = (cost, budget_usage_vo.limit)
+                    if budget_vo.time_unit != "TOTAL" and budget_usage_vo.limit:
+                        budget_utilization_rate = round(
+                            cost / budget_usage_vo.limit * 100, 2
+                        )
+
+            if budget_vo.time_unit == "TOTAL":
+                budget_usage_infos[budget_vo.budget_id] = (
+                    round(total_usage_cost, 2),
+                    budget_vo.limit,
+                )
+                if budget_vo.limit:
                     budget_utilization_rate = round(
-                        budget_usage_vo.cost / budget_usage_vo.limit * 100, 2
+                        total_usage_cost / budget_vo.limit * 100, 2
                     )
-                    self.budget_mgr.update_budget_by_vo(
-                        {"utilization_rate": budget_utilization_rate}, budget_vo
+            else:
+                budget_usage_infos[budget_vo.budget_id] = (
+                    round(current_month_usage[0], 2),
+                    current_month_usage[1],
+                )
+
+            if budget_utilization_rate is not None:
+                budget_vo.utilization_rate = budget_utilization_rate
+                budget_operations.append(
+                    UpdateOne(
+                        {"_id": budget_vo.id},
+                        {
+                            "$set": {
+                                "utilization_rate": budget_utilization_rate,
+                                "updated_at": updated_at,
+                            }
+                        },
                     )
-                    break
+                )
+
+        if budget_usage_operations:
+            self.budget_usage_model._get_collection().bulk_write(
+                budget_usage_operations, ordered=False
+            )
+
+        if budget_operations:
+            Budget._get_collection().bulk_write(budget_operations, ordered=False)
+
+        return budget_usage_infos
 
     @staticmethod
-    def _get_user_info_map_from_recipients(
+    def _get_user_info_maps_from_recipients(
         identity_mgr: IdentityManager,
-        budget_vo: Budget,
-    ) -> dict:
-        user_info_map = {}
-
-        domain_id = budget_vo.domain_id
-        workspace_id = budget_vo.workspace_id
-        project_id = budget_vo.project_id
-        service_account_id = budget_vo.service_account_id
-        recipients = budget_vo.notification.recipients.to_dict()
-
-        user_ids = recipients.get("users", [])
-        role_types = recipients.get("role_types", [])
-        service_account_manager = recipients.get("service_account_manager", "DISABLED")
-        budget_manager_notification = recipients.get(
-            "budget_manager_notification", "ENABLED"
-        )
+        domain_id: str,
+        workspace_id: str,
+        budget_vos: list,
+        service_account_info_map: dict,
+    ) -> Tuple[dict, dict]:
+        """Resolve recipients of every budget with one role binding and one user lookup.
+
+        Returns a map of budget_id to user ids and a map of user id to email info.
+        """
+        recipient_map = {}
+        all_user_ids = set()
+        all_role_types = set()
 
-        if budget_manager_notification == "ENABLED":
-            budget_manager_id = budget_vo.budget_manager_id
-            if budget_manager_id:
-                user_ids.append(budget_manager_id)
+        for budget_vo in budget_vos:
+            recipients = budget_vo.notification.recipients.to_dict()
 
-        if service_account_manager == "ENABLED":
-            service_accounts_info = []
-            if service_account_id:
-                service_account_info = identity_mgr.get_service_account(
-                    service_account_id, domain_id, workspace_id
-                )
-                service_accounts_info.append(service_account_info)
+            user_ids = set(recipients.get("users", []))
+            role_types = set(recipients.get("role_types", []))
+            service_account_manager = recipients.get(
+                "service_account_manager", "DISABLED"
+            )
+            budget_manager_notification = recipients.get(
+                "budget_manager_notification", "ENABLED"
+            )
 
-            else:
-                query_filter = {
-                    "filter": [
-                        {"k": "domain_id", "v": domain_id, "o": "eq"},
-                        {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                        {"k": "project_id", "v": project_id, "o": "eq"},
-                    ]
-                }
-                response = identity_mgr.list_service_accounts(query_filter, domain_id)
-                service_accounts_info = response.get("results", [])
+            if budget_manager_notification == "ENABLED" and budget_vo.budget_manager_id:
+                user_ids.add(budget_vo.budget_manager_id)
+
+            if service_account_manager == "ENABLED":
+                for service_account_info in service_account_info_map.values():
+                    if budget_vo.service_account_id:
+                        if (
+                            service_account_info["service_account_id"]
+                            != budget_vo.service_account_id
+                        ):
+                            continue
+                    elif service_account_info.get("project_id") != budget_vo.project_id:
+                        continue
+
+                    if service_account_mgr_id := service_account_info.get(
+                        "service_account_mgr_id"
+                    ):
+                        user_ids.add(service_account_mgr_id)
+
+            recipient_map[budget_vo.budget_id] = (user_ids, role_types)
+            all_user_ids.update(user_ids)
+            all_role_types.update(role_types)
+
+        user_ids_map = {}
+        user_info_map = {}
 
-            for service_account_info in service_accounts_info:
-                if service_account_mgr_id := service_account_info.get(
-                    "service_account_mgr_id"
-                ):
-                    user_ids.append(service_account_mgr_id)
+        # a budget without any recipient notifies every user of its workspace
+        has_workspace_recipients = any(
+            not user_ids and not role_types
+            for user_ids, role_types in recipient_map.values()
+        )
 
         query = {
             "filter": [
@@ -378,50 +573,60 @@ class BudgetUsageManager(BaseManager):
             "filter_or": [],
         }
 
-        if user_ids:
-            user_ids = list(set(user_ids))
-            query["filter_or"].append({"k": "user_id", "v": user_ids, "o": "in"})
+        if not has_workspace_recipients:
+            if all_user_ids:
+                query["filter_or"].append(
+                    {"k": "user_id", "v": list(all_user_ids), "o": "in"}
+                )
 
-        if role_types:
-            query["filter_or"].append({"k": "role_type", "v": role_types, "o": "in"})
+            if all_role_types:
+                query["filter_or"].append(
+                    {"k": "role_type", "v": list(all_role_types), "o": "in"}
+                )
 
-        _LOGGER.debug(f"[_get_user_info_map_from_recipients] query: {query}")
+        _LOGGER.debug(f"[_get_user_info_maps_from_recipients] query: {query}")
 
         response = identity_mgr.list_role_bindings({"query": query}, domain_id)
-
-        users = [rb_info.get("user_id") for rb_info in response.get("results", [])]
-        rb_total_count = response.get("total_count", 0)
+        role_bindings_info = response.get("results", [])
 
         _LOGGER.debug(
-            f"[_get_user_info_map_from_recipients] total role bindings count: {rb_total_count}"
+            f"[_get_user_info_maps_from_recipients] total role bindings count: {response.get('total_count', 0)}"
         )
 
+        users = list(set([rb_info.get("user_id") for rb_info in role_bindings_info]))
         if users:
             response = identity_mgr.list_email_verified_users(domain_id, users)
-            users_info = response.get("results", [])
-            user_total_count = response.get("total_count", 0)
-
-            for user_info in users_info:
+            for user_info in response.get("results", []):
                 user_info_map[user_info["user_id"]] = {
                     "email": user_info["email"],
                     "language": user_info.get("language", "en"),
                 }
 
             _LOGGER.debug(
-                f"[_get_user_info_map_from_recipients] total users: {user_total_count}"
+                f"[_get_user_info_maps_from_recipients] total users: {response.get('total_count', 0)}"
             )
 
-        return user_info_map
+        for budget_id, (user_ids, role_types) in recipient_map.items():
+            budget_user_ids = set()
+            for rb_info in role_bindings_info:
+                user_id = rb_info.get("user_id")
+                if user_id not in user_info_map:
+                    continue
+
+                if not user_ids and not role_types:
+                    budget_user_ids.add(user_id)
+                elif user_id in user_ids or rb_info.get("role_type") in role_types:
+                    budget_user_ids.add(user_id)
+
+            user_ids_map[budget_id] = sorted(budget_user_ids)
 
-    def _get_console_budget_url(
-        self, domain_id: str, workspace_id: str, budget_id: str
-    ) -> str:
+        return user_ids_map, user_info_map
+
+    def _get_console_domain(self, domain_id: str) -> str:
         domain_name = self._get_domain_name(domain_id)
 
         console_domain = config.get_global("EMAIL_CONSOLE_DOMAIN")
-        console_domain = console_domain.format(domain_name=domain_name)
-
-        return f"{console_domain}/workspace/{workspace_id}/cost-explorer/budget/{budget_id}"
+        return console_domain.format(domain_name=domain_name)
 
     def _get_domain_name(self, domain_id: str) -> str:
         identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
@@ -498,6 +703,71 @@ class BudgetUsageManager(BaseManager):
 
         return round(total_budget_usage, 2), budget_limit
 
+    def _get_budget_usage_maps_from_unified_cost(
+        self,
+        unified_cost_mgr: UnifiedCostManager,
+        domain_id: str,
+        workspace_id: str,
+        budget_vos: list,
+    ) -> dict:
+        currencies = list(set([budget_vo.currency for budget_vo in budget_vos]))
+        query = {
+            "granularity": "MONTHLY",
+            "start": min([budget_vo.start for budget_vo in budget_vos]),
+            "end": max([budget_vo.end for budget_vo in budget_vos]),
+            "group_by": ["project_id", "service_account_id"],
+            "fields": {
+                currency: {"key": f"cost.{currency}", "operator": "sum"}
+                for currency in currencies
+            },
+            "filter": [
+                {"k": "domain_id", "v": domain_id, "o": "eq"},
+                {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+            ],
+        }
+        _LOGGER.debug(f"[_get_budget_usage_maps_from_unified_cost]: query: {query}")
+
+        result = unified_cost_mgr.analyze_unified_costs(query, domain_id)
+
+        # index each grouped row by every budget scope it can count towards
+        usage_maps = {"WORKSPACE": {}, "PROJECT": {}, "SERVICE_ACCOUNT": {}}
+        for unified_cost_usage_data in result.get("results", []):
+            date = unified_cost_usage_data.get("date")
+            if not date:
+                continue
+
+            scope_keys = [
+                ("WORKSPACE", None),
+                ("PROJECT", unified_cost_usage_data.get("project_id")),
+                ("SERVICE_ACCOUNT", unified_cost_usage_data.get("service_account_id")),
+            ]
+            for scope, scope_key in scope_keys:
+                month_map = usage_maps[scope].setdefault(scope_key, {})
+                cost_by_currency = month_map.setdefault(date, {})
+                for currency in currencies:
+                    cost_by_currency[currency] = cost_by_currency.get(
+                        currency, 0
+                    ) + (unified_cost_usage_data.get(currency) or 0)
+
+        budget_usage_maps = {}
+        for budget_vo in budget_vos:
+            if budget_vo.service_account_id:
+                month_map = usage_maps["SERVICE_ACCOUNT"].get(
+                    budget_vo.service_account_id, {}
+                )
+            elif budget_vo.project_id:
+                month_map = usage_maps["PROJECT"].get(budget_vo.project_id, {})
+            else:
+                month_map = usage_maps["WORKSPACE"].get(None, {})
+
+            budget_usage_maps[budget_vo.budget_id] = {
+                date: cost_by_currency[budget_vo.currency]
+                for date, cost_by_currency in month_map.items()
+                if budget_vo.start <= date <= budget_vo.end
+            }
+
+        return budget_usage_maps
+
     def _get_update_budget_usage_map_from_unified_cost(
         self, unified_cost_mgr: UnifiedCostManager, budget_vo: Budget
     ) -> dict:
@@ -77,6 +77,9 @@ class ConfigManager(BaseManager):
             "exchange_rate_mode": "AUTO",
             "custom_exchange_rate": {},
             "currency": "KRW",
+            "aggregation_mode": config.get_global(
+                "UNIFIED_COST_AGGREGATION_MODE", "WORKSPACE"
+            ),
         }
         return default_unified_cost_config
 
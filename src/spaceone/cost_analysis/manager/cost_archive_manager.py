@@ -0,0 +1,315 @@
+import copy
+import logging
+from datetime import date, datetime
+from typing import Union
+
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+from mongoengine import fields as mongo_fields
+
+from spaceone.core import cache, config, queue, utils
+from spaceone.core.manager import BaseManager
+
+from spaceone.cost_analysis.connector.cost_archive_connector import (
+    CostArchiveConnector,
+)
+from spaceone.cost_analysis.model.cost_archive.database import CostArchive
+from spaceone.cost_analysis.model.cost_model import Cost, MonthlyCost
+
+_LOGGER = logging.getLogger(__name__)
+
+_PARTITION_KEYS = ["domain_id", "data_source_id", "billed_month"]
+_MERGEABLE_OPERATORS = ["sum", "count", "max", "min"]
+
+
+class CostArchiveManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cost_archive_model = CostArchive
+        self.cost_model = Cost
+        self.monthly_cost_model = MonthlyCost
+        self.batch_size = config.get_global("COST_ARCHIVE_BATCH_SIZE", 100000)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        # archives are read by every pod, so they must be on shared storage
+        return bool(
+            config.get_global("COST_ARCHIVE_ENABLED", False)
+            and config.get_global("COST_ARCHIVE_PATH")
+        )
+
+    @staticmethod
+    def push_archive_costs_task(params: dict) -> None:
+        token = config.get_global("TOKEN")
+        task = {
+            "name": "archive_costs",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "CostArchiveService",
+                    "metadata": {"token": token},
+                    "method": "archive_costs",
+                    "params": {"params": params},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[push_archive_costs_task] task param: {params}")
+
+        queue.put("cost_analysis_q", utils.dump_json(task))
+
+    def archive_monthly_costs(
+        self, domain_id: str, data_source_id: str, billed_month: str
+    ) -> Union[CostArchive, None]:
+        conditions = {
+            "domain_id": domain_id,
+            "data_source_id": data_source_id,
+            "billed_month": billed_month,
+        }
+
+        cost_count = self.cost_model.filter(**conditions).count()
+        monthly_cost_count = self.monthly_cost_model.filter(**conditions).count()
+
+        if cost_count == 0 and monthly_cost_count == 0:
+            return None
+
+        archive_connector = CostArchiveConnector(
+            domain_id=domain_id, data_source_id=data_source_id
+        )
+        archive_connector.export_costs(
+            "DAILY", billed_month, self._iter_data_frames(self.cost_model, conditions)
+        )
+        archive_connector.export_costs(
+            "MONTHLY",
+            billed_month,
+            self._iter_data_frames(self.monthly_cost_model, conditions),
+        )
+
+        self.cost_archive_model.objects(**conditions).update_one(
+            upsert=True,
+            set__cost_count=cost_count,
+            set__monthly_cost_count=monthly_cost_count,
+            set__archived_at=datetime.utcnow(),
+        )
+        self._delete_archived_months_cache(domain_id, data_source_id)
+
+        _LOGGER.debug(
+            f"[archive_monthly_costs] archive costs: {data_source_id} {billed_month} "
+            f"(costs = {cost_count}, monthly costs = {monthly_cost_count})"
+        )
+
+        return self.cost_archive_model.get(**conditions)
+
+    def delete_cost_archives(
+        self,
+        domain_id: str,
+        data_source_id: str,
+        start: str = None,
+        end: str = None,
+        billed_months: list = None,
+    ) -> None:
+        conditions = {"domain_id": domain_id, "data_source_id": data_source_id}
+        if billed_months is not None:
+            conditions["billed_month"] = billed_months
+
+        cost_archive_vos = self.cost_archive_model.filter(**conditions)
+        if start:
+            cost_archive_vos = cost_archive_vos.filter(billed_month__gte=start)
+        if end:
+            cost_archive_vos = cost_archive_vos.filter(billed_month__lte=end)
+
+        if cost_archive_vos.count() == 0:
+            return None
+
+        archive_connector = CostArchiveConnector(
+            domain_id=domain_id, data_source_id=data_source_id
+        )
+
+        for cost_archive_vo in cost_archive_vos:
+            _LOGGER.debug(
+                f"[delete_cost_archives] delete archived costs: {data_source_id} {cost_archive_vo.billed_month}"
+            )
+            archive_connector.delete_costs(cost_archive_vo.billed_month)
+            cost_archive_vo.delete()
+
+        self._delete_archived_months_cache(domain_id, data_source_id)
+
+    @cache.cacheable(
+        key="cost-analysis:cost-archive:{domain_id}:{data_source_id}", expire=3600
+    )
+    def list_archived_months(self, domain_id: str, data_source_id: str) -> list:
+        cost_archive_vos = self.cost_archive_model.filter(
+            domain_id=domain_id, data_source_id=data_source_id
+        ).only("billed_month")
+        return [cost_archive_vo.billed_month for cost_archive_vo in cost_archive_vos]
+
+    def analyze_costs_with_archive(
+        self,
+        query: dict,
+        domain_id: str,
+        data_source_id: str,
+        table_type: str,
+        live_model: Union[Cost, MonthlyCost],
+    ) -> dict:
+        query_months = self._get_query_months(query)
+        archived_months = sorted(
+            set(self.list_archived_months(domain_id, data_source_id))
+            & set(query_months or [])
+        )
+
+        if not archived_months:
+            return live_model.analyze(**query)
+
+        try:
+            archive_connector = CostArchiveConnector(
+                domain_id=domain_id, data_source_id=data_source_id
+            )
+
+            if not archive_connector.has_costs(table_type, archived_months):
+                _LOGGER.warning(
+                    f"[analyze_costs_with_archive] archived costs are not found: "
+                    f"{data_source_id} {archived_months}"
+                )
+                return live_model.analyze(**query)
+
+            archive_query = self._add_billed_month_filter(query, archived_months, "in")
+
+            # every month of the query is archived, so nothing to merge
+            if len(archived_months) == len(query_months):
+                return archive_connector.analyze_costs(
+                    None, archive_query, table_type
+                )
+
+            if not self._is_mergeable_query(query):
+                return live_model.analyze(**query)
+
+            live_query = self._add_billed_month_filter(
+                query, archived_months, "not_in"
+            )
+            responses = [
+                archive_connector.analyze_costs(
+                    None, self._make_partial_query(archive_query), table_type
+                ),
+                live_model.analyze(**self._make_partial_query(live_query)),
+            ]
+            return archive_connector.merge_analyze_results(query, responses)
+
+        except Exception as e:
+            # unsupported options and unreadable archives are answered by MongoDB
+            _LOGGER.warning(f"[analyze_costs_with_archive] use live costs: {e}")
+            return live_model.analyze(**query)
+
+    def _iter_data_frames(self, model, conditions: dict):
+        columns = {
+            field.db_field: field
+            for name, field in model._fields.items()
+            if name != "id" and name not in _PARTITION_KEYS
+        }
+
+        cursor = model._get_collection().find(
+            conditions, projection={key: 1 for key in columns.keys()}
+        ).batch_size(self.batch_size)
+
+        docs = []
+        is_empty = True
+        for doc in cursor:
+            docs.append(doc)
+            if len(docs) >= self.batch_size:
+                yield self._make_data_frame(docs, columns)
+                docs = []
+                is_empty = False
+
+        # an empty month still gets a file, so its partition can be read
+        if docs or is_empty:
+            yield self._make_data_frame(docs, columns)
+
+    @staticmethod
+    def _make_data_frame(docs: list, columns: dict) -> pd.DataFrame:
+        # a fixed schema per model keeps every part file readable together
+        data = {}
+        for key, field in columns.items():
+            values = [doc.get(key) for doc in docs]
+
+            if isinstance(field, (mongo_fields.DictField, mongo_fields.ListField)):
+                data[key] = pd.Series(
+                    [utils.dump_json(value) if value else None for value in values],
+                    dtype="object",
+                )
+            elif isinstance(field, mongo_fields.FloatField):
+                data[key] = pd.Series(values, dtype="float64")
+            elif isinstance(field, mongo_fields.IntField):
+                data[key] = pd.Series(values, dtype="Int64")
+            elif isinstance(field, mongo_fields.DateTimeField):
+                data[key] = pd.Series(pd.to_datetime(values))
+            else:
+                data[key] = pd.Series(
+                    [None if value is None else str(value) for value in values],
+                    dtype="object",
+                )
+
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _is_mergeable_query(query: dict) -> bool:
+        for condition in query.get("fields", {}).values():
+            if condition.get("operator") not in _MERGEABLE_OPERATORS:
+                return False
+
+        return True
+
+    @staticmethod
+    def _make_partial_query(query: dict) -> dict:
+        partial_query = copy.deepcopy(query)
+        for key in ["sort", "page", "field_group"]:
+            partial_query.pop(key, None)
+        return partial_query
+
+    @staticmethod
+    def _add_billed_month_filter(
+        query: dict, billed_months: list, operator: str
+    ) -> dict:
+        changed_query = copy.deepcopy(query)
+        changed_query["filter"] = changed_query.get("filter", []) + [
+            {"k": "billed_month", "v": billed_months, "o": operator}
+        ]
+        return changed_query
+
+    @staticmethod
+    def _get_query_months(query: dict) -> Union[list, None]:
+        start = query.get("start")
+        end = query.get("end")
+        if not (start and end):
+            return None
+
+        start_month = CostArchiveManager._parse_date("start", start).replace(day=1)
+        end_date = CostArchiveManager._parse_date("end", end)
+
+        query_months = []
+        while start_month < end_date:
+            query_months.append(start_month.strftime("%Y-%m"))
+            start_month += relativedelta(months=1)
+
+        return query_months
+
+    @staticmethod
+    def _parse_date(key: str, value: Union[str, date]) -> date:
+        if isinstance(value, datetime):
+            return value.date()
+        elif isinstance(value, date):
+            return value
+
+        date_format, delta = {
+            4: ("%Y", relativedelta(years=1)),
+            7: ("%Y-%m", relativedelta(months=1)),
+        }.get(len(value), ("%Y-%m-%d", relativedelta(days=1)))
+
+        value = datetime.strptime(value, date_format).date()
+
+        # the end date is exclusive as in MongoModel.analyze
+        return value + delta if key == "end" else value
+
+    @staticmethod
+    def _delete_archived_months_cache(domain_id: str, data_source_id: str) -> None:
+        cache.delete_pattern(f"cost-analysis:cost-archive:{domain_id}:{data_source_id}")
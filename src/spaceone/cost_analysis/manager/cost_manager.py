@@ -7,7 +7,13 @@ from spaceone.core import cache, utils
 from spaceone.core.manager import BaseManager
 
 from spaceone.cost_analysis.error import *
+from spaceone.cost_analysis.connector.warehouse_connector import WarehouseConnector
+from spaceone.cost_analysis.connector.databricks_connector import DatabricksConnector
+from spaceone.cost_analysis.connector.local_warehouse_connector import (
+    LocalWarehouseConnector,
+)
 from spaceone.cost_analysis.model.cost_model import Cost, MonthlyCost, CostQueryHistory
+from spaceone.cost_analysis.model.data_source_model import DataSource
 from spaceone.cost_analysis.manager.data_source_rule_manager import (
     DataSourceRuleManager,
 )
@@ -16,9 +22,15 @@ from spaceone.cost_analysis.manager.data_source_account_manager import (
 )
 from spaceone.cost_analysis.manager.identity_manager import IdentityManager
 from spaceone.cost_analysis.manager.data_source_manager import DataSourceManager
+from spaceone.cost_analysis.manager.cost_archive_manager import CostArchiveManager
 
 _LOGGER = logging.getLogger(__name__)
 
+WAREHOUSE_CONNECTORS = {
+    "DATABRICKS": DatabricksConnector,
+    "LOCAL": LocalWarehouseConnector,
+}
+
 
 class CostManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -37,12 +49,53 @@ class CostManager(BaseManager):
         self.data_source_mgr: DataSourceManager = self.locator.get_manager(
             "DataSourceManager"
         )
+        self.cost_archive_mgr: CostArchiveManager = self.locator.get_manager(
+            "CostArchiveManager"
+        )
 
     def create_cost(self, params: dict, execute_rollback=True):
         def _rollback(vo: Cost):
             _LOGGER.info(f"[create_cost._rollback] " f"Delete cost : {vo.cost_id} ")
             vo.delete()
 
+        params = self._make_cost_data(params)
+
+        cost_vo: Cost = self.cost_model.create(params)
+
+        if execute_rollback:
+            self.transaction.add_rollback(_rollback, cost_vo)
+
+        return cost_vo
+
+    def create_costs(self, params_list: list) -> int:
+        # the insert of a page is not atomic, so job task costs carry their page to be
+        # deleted on resume when the page is not committed
+        cost_fields = self.cost_model._fields.keys()
+        cost_vos = []
+
+        for params in params_list:
+            params = self._make_cost_data(params)
+            create_data = {
+                key: self.cost_model._trim_value(value)
+                for key, value in params.items()
+                if key in cost_fields
+            }
+            create_data["cost_id"] = utils.generate_id("cost")
+            cost_vo = self.cost_model(**create_data)
+
+            try:
+                cost_vo.validate()
+            except Exception as e:
+                raise ERROR_DB_QUERY(reason=e)
+
+            cost_vos.append(cost_vo)
+
+        if cost_vos:
+            self.cost_model.objects.insert(cost_vos, load_bulk=False)
+
+        return len(cost_vos)
+
+    def _make_cost_data(self, params: dict) -> dict:
         if "region_code" in params and "provider" in params:
             params["region_key"] = f'{params["provider"]}.{params["region_code"]}'
 
@@ -61,14 +114,7 @@ class CostManager(BaseManager):
         if v_workspace_id:
             params["workspace_id"] = v_workspace_id
 
-        params = self.data_source_rule_mgr.change_cost_data(params, workspace_id)
-
-        cost_vo: Cost = self.cost_model.create(params)
-
-        if execute_rollback:
-            self.transaction.add_rollback(_rollback, cost_vo)
-
-        return cost_vo
+        return self.data_source_rule_mgr.change_cost_data(params, workspace_id)
 
     def create_monthly_cost(self, params):
         return self.monthly_cost_model.create(params)
@@ -98,6 +144,8 @@ class CostManager(BaseManager):
         )
         history_vos.delete()
 
+        self.cost_archive_mgr.delete_cost_archives(domain_id, data_source_id)
+
     def get_cost(
         self,
         cost_id: str,
@@ -128,17 +176,10 @@ class CostManager(BaseManager):
             )
 
             if data_source_vo.data_source_type == "WAREHOUSE":
-                warehouse_type = data_source_vo.warehouse_info["type"]
+                warehouse_connector = self._get_warehouse_connector(data_source_vo)
                 provider = data_source_vo.provider
 
-                if warehouse_type == "DATABRICKS":
-                    warehouse_cost_connector = DatabricksConnector(
-                        warehouse_type=warehouse_type
-                    )
-                else:
-                    raise ValueError(f"Unsupported warehouse_type: {warehouse_type}")
-
-                return warehouse_cost_connector.list_costs(provider, query)
+                return warehouse_connector.list_costs(provider, query)
 
         query = self.change_filter_v_workspace_id(query, domain_id, data_source_id)
         query = self._add_hint_to_query(query)
@@ -167,17 +208,12 @@ class CostManager(BaseManager):
             )
 
             if data_source_vo.data_source_type == "WAREHOUSE":
-                warehouse_type = data_source_vo.warehouse_info["type"]
+                warehouse_connector = self._get_warehouse_connector(data_source_vo)
                 provider = data_source_vo.provider
 
-                if warehouse_type == "DATABRICKS":
-                    warehouse_cost_connector = DatabricksConnector(
-                        warehouse_type=warehouse_type
-                    )
-                else:
-                    raise ValueError(f"Unsupported warehouse_type: {warehouse_type}")
-
-                return warehouse_cost_connector.stat_costs(provider, query)
+                return warehouse_connector.stat_costs(
+                    provider, query, table_type="MONTHLY"
+                )
 
         query = self._add_hint_to_query(query)
         _LOGGER.debug(f"[stat_monthly_costs] query: {query}")
@@ -198,23 +234,23 @@ class CostManager(BaseManager):
             )
 
             if data_source_vo.data_source_type == "WAREHOUSE":
-                warehouse_type = data_source_vo.warehouse_info["type"]
+                warehouse_connector = self._get_warehouse_connector(data_source_vo)
                 provider = data_source_vo.provider
 
-                if warehouse_type == "DATABRICKS":
-                    warehouse_cost_connector = DatabricksConnector(
-                        warehouse_type=warehouse_type
-                    )
-                else:
-                    raise ValueError(f"Unsupported warehouse_type: {warehouse_type}")
-
-                return warehouse_cost_connector.analyze_costs(provider, query)
+                return warehouse_connector.analyze_costs(
+                    provider, query, table_type="DAILY"
+                )
 
         query["target"] = target
         query["date_field"] = "billed_date"
         query["date_field_format"] = "%Y-%m-%d"
         _LOGGER.debug(f"[analyze_costs] query: {query}")
 
+        if data_source_id and self._is_archive_available(query):
+            return self.cost_archive_mgr.analyze_costs_with_archive(
+                query, domain_id, data_source_id, "DAILY", self.cost_model
+            )
+
         response = self.cost_model.analyze(**query)
         return response
 
@@ -229,17 +265,12 @@ class CostManager(BaseManager):
             )
 
             if data_source_vo.data_source_type == "WAREHOUSE":
-                warehouse_type = data_source_vo.warehouse_info["type"]
+                warehouse_connector = self._get_warehouse_connector(data_source_vo)
                 provider = data_source_vo.provider
 
-                if warehouse_type == "DATABRICKS":
-                    warehouse_cost_connector = DatabricksConnector(
-                        warehouse_type=warehouse_type
-                    )
-                else:
-                    raise ValueError(f"Unsupported warehouse_type: {warehouse_type}")
-
-                return warehouse_cost_connector.analyze_costs(provider, query)
+                return warehouse_connector.analyze_costs(
+                    provider, query, table_type="MONTHLY"
+                )
 
         # 공통 처리 로직
         query["target"] = target
@@ -247,6 +278,11 @@ class CostManager(BaseManager):
         query["date_field_format"] = "%Y-%m"
         _LOGGER.debug(f"[analyze_monthly_costs] query: {query}")
 
+        if data_source_id and self._is_archive_available(query):
+            return self.cost_archive_mgr.analyze_costs_with_archive(
+                query, domain_id, data_source_id, "MONTHLY", self.monthly_cost_model
+            )
+
         return self.monthly_cost_model.analyze(**query)
 
     def analyze_yearly_costs(
@@ -260,23 +296,23 @@ class CostManager(BaseManager):
             )
 
             if data_source_vo.data_source_type == "WAREHOUSE":
-                warehouse_type = data_source_vo.warehouse_info["type"]
+                warehouse_connector = self._get_warehouse_connector(data_source_vo)
                 provider = data_source_vo.provider
 
-                if warehouse_type == "DATABRICKS":
-                    warehouse_cost_connector = DatabricksConnector(
-                        warehouse_type=warehouse_type
-                    )
-                else:
-                    raise ValueError(f"Unsupported warehouse_type: {warehouse_type}")
-
-                return warehouse_cost_connector.analyze_costs(provider, query)
+                return warehouse_connector.analyze_costs(
+                    provider, query, table_type="YEARLY"
+                )
 
         query["target"] = target
         query["date_field"] = "billed_year"
         query["date_field_format"] = "%Y"
         _LOGGER.debug(f"[analyze_yearly_costs] query: {query}")
 
+        if data_source_id and self._is_archive_available(query):
+            return self.cost_archive_mgr.analyze_costs_with_archive(
+                query, domain_id, data_source_id, "YEARLY", self.monthly_cost_model
+            )
+
         return self.monthly_cost_model.analyze(**query)
 
     @cache.cacheable(
@@ -559,6 +595,21 @@ class CostManager(BaseManager):
         query["filter"] = change_filter
         return query
 
+    def _is_archive_available(self, query: dict) -> bool:
+        return (
+            self.cost_archive_mgr.is_enabled()
+            and query.get("return_type", "dict") != "cursor"
+        )
+
+    @staticmethod
+    def _get_warehouse_connector(data_source_vo: DataSource) -> WarehouseConnector:
+        warehouse_type = data_source_vo.warehouse_info["type"]
+
+        if warehouse_type not in WAREHOUSE_CONNECTORS:
+            raise ERROR_NOT_SUPPORT_WAREHOUSE_TYPE(warehouse_type=warehouse_type)
+
+        return WAREHOUSE_CONNECTORS[warehouse_type](warehouse_type=warehouse_type)
+
     def change_filter_v_workspace_id(
         self, query: dict, domain_id: str, data_source_id: str
     ) -> dict:
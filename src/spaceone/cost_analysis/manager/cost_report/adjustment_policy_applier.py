@@ -14,14 +14,67 @@ from spaceone.cost_analysis.model import CostReport
 
 _LOGGER = logging.getLogger(__name__)
 
+_EVALUABLE_OPERATORS = ["eq", "not", "in", "not_in"]
 
-class AdjustmentPolicyApplier:
-    def __init__(self, cost_report_vo: CostReport, data_source_ids, unified_cost: dict):
+
+class AdjustmentPolicySnapshot:
+    """Adjustment policies and currency maps of a cost report config.
+
+    It is loaded once per report run and shared by the applier of every report.
+    """
+
+    def __init__(self, cost_report_config_id: str, domain_id: str):
         self.policy_mgr = ReportAdjustmentPolicyManager()
         self.adjustment_mgr = ReportAdjustmentManager()
+        self.currency_mgr = CurrencyManager()
+
+        self.currency_maps = {}
+        self.policies = self._list_policies_with_adjustments(
+            cost_report_config_id, domain_id
+        )
+
+    def get_currency_map(self, currency_date: datetime) -> dict:
+        if currency_date not in self.currency_maps:
+            currency_map, _ = self.currency_mgr.get_currency_map_date(
+                currency_end_date=currency_date
+            )
+            self.currency_maps[currency_date] = currency_map
+
+        return self.currency_maps[currency_date]
+
+    def _list_policies_with_adjustments(
+        self, cost_report_config_id: str, domain_id: str
+    ) -> list:
+        policies = self.policy_mgr.list_sorted_policies_by_order(
+            cost_report_config_id=cost_report_config_id,
+            domain_id=domain_id,
+        )
+        if not policies:
+            return []
+
+        adjustments_map = self.adjustment_mgr.list_sorted_adjustments_by_policies(
+            [policy["report_adjustment_policy_id"] for policy in policies], domain_id
+        )
+
+        policies_with_adjustments = []
+        for policy in policies:
+            adjustments = adjustments_map.get(policy["report_adjustment_policy_id"])
+            if adjustments:
+                policies_with_adjustments.append((policy, adjustments))
+
+        return policies_with_adjustments
+
+
+class AdjustmentPolicyApplier:
+    def __init__(
+        self,
+        cost_report_vo: CostReport,
+        data_source_ids,
+        unified_cost: dict,
+        policy_snapshot: AdjustmentPolicySnapshot = None,
+    ):
         self.cost_report_data_mgr = CostReportDataManager()
         self.unified_cost_mgr = UnifiedCostManager()
-        self.currency_mgr = CurrencyManager()
 
         self.cost_report_vo = cost_report_vo
 
@@ -41,33 +94,22 @@ class AdjustmentPolicyApplier:
 
         self.data_source_ids = data_source_ids
 
-        self.policies = []
-        self.is_applied = self._check_applicable_policies()
+        self.policy_snapshot = policy_snapshot or AdjustmentPolicySnapshot(
+            self.config_id, self.domain_id
+        )
+        self.is_applied = len(self.policy_snapshot.policies) > 0
 
         self.currencies = config.get_global(
             "SUPPORTED_CURRENCIES", ["KRW", "USD", "JPY"]
         )
 
     def apply_policies(self) -> None:
-        policies = self.policy_mgr.list_sorted_policies_by_order(
-            cost_report_config_id=self.config_id,
-            domain_id=self.domain_id,
-        )
-
-        for policy in policies:
+        for policy, adjustments in self.policy_snapshot.policies:
             if not self._is_policy_applicable(policy):
                 continue
 
             _LOGGER.debug(f"Applying policy: {policy['report_adjustment_policy_id']}")
 
-            report_adjustment_policy_id = policy["report_adjustment_policy_id"]
-            adjustments = self.adjustment_mgr.list_sorted_adjustments_by_order(
-                report_adjustment_policy_id, self.domain_id
-            )
-
-            if not adjustments:
-                continue
-
             self._create_cost_report_data_for_all_methods(
                 adjustments, policy
             )
@@ -77,32 +119,100 @@ class AdjustmentPolicyApplier:
     def _create_cost_report_data_for_all_methods(
             self, adjustments: list, adjustment_policy: dict
     ):
-        currency_map, _ = self.currency_mgr.get_currency_map_date(
-            currency_end_date=self.currency_date
+        percent_adjusted_costs = self._calculate_percent_adjustment_costs(
+            adjustments, adjustment_policy
         )
 
-        for adjustment_info in adjustments:
-            query_filter = self._make_query_filter_with_adjustment(
-                adjustment_policy, adjustment_info
-            )
+        cost_reports_data = []
+        for idx, adjustment_info in enumerate(adjustments):
             value = adjustment_info.get("value")
             unit = adjustment_info.get("unit")
             currency = adjustment_info.get("currency")
             provider = adjustment_info.get("provider")
             product = adjustment_info.get("name")
 
-            adjusted_cost = self._calculate_adjustment_cost(
-                query_filter, unit, value, currency
-            )
+            if unit == "PERCENT":
+                adjusted_cost = percent_adjusted_costs.get(idx)
+            else:
+                adjusted_cost = self._calculate_adjustment_cost(
+                    {}, unit, value, currency
+                )
+
             if adjusted_cost:
-                cost_report_data = self._build_cost_report_data_dict(
-                    adjusted_cost,
-                    provider,
-                    product,
-                    adjustment_policy.get("report_adjustment_policy_id"),
+                cost_reports_data.append(
+                    self._build_cost_report_data_dict(
+                        adjusted_cost,
+                        provider,
+                        product,
+                        adjustment_policy.get("report_adjustment_policy_id"),
+                    )
                 )
 
-                self.cost_report_data_mgr.create_cost_report_data(cost_report_data)
+        # the queries exclude this policy's own data, so it is created at the end
+        self.cost_report_data_mgr.create_cost_reports_data(cost_reports_data)
+
+    def _calculate_percent_adjustment_costs(
+            self, adjustments: list, adjustment_policy: dict
+    ) -> dict:
+        percent_adjusted_costs = {}
+        batch_conditions = {}
+
+        for idx, adjustment_info in enumerate(adjustments):
+            if adjustment_info.get("unit") != "PERCENT":
+                continue
+
+            conditions = self._make_adjustment_conditions(adjustment_info)
+            if self._is_evaluable_conditions(conditions):
+                batch_conditions[idx] = conditions
+            else:
+                query_filter = self._make_query_filter_with_adjustment(
+                    adjustment_policy, adjustment_info
+                )
+                percent_adjusted_costs[idx] = self._calculate_adjustment_cost(
+                    query_filter, "PERCENT", adjustment_info.get("value"), None
+                )
+
+        if not batch_conditions:
+            return percent_adjusted_costs
+
+        # every adjustment of the policy is evaluated over one grouped query
+        group_by = sorted(
+            set(
+                condition["k"]
+                for conditions in batch_conditions.values()
+                for condition in conditions
+            )
+        )
+        query_filter = self._make_policy_query_filter(
+            adjustment_policy.get("report_adjustment_policy_id"), adjustment_policy
+        )
+        if group_by:
+            query_filter["group_by"] = group_by
+
+        _LOGGER.debug(
+            f"[calculate_percent_adjustment_costs] query_filter: {query_filter}"
+        )
+        response = self.cost_report_data_mgr.analyze_cost_reports_data(query_filter)
+        results = response.get("results", [])
+
+        for idx, conditions in batch_conditions.items():
+            value = adjustments[idx].get("value")
+            matched_results = [
+                result
+                for result in results
+                if self._match_conditions(result, conditions)
+            ]
+
+            adjusted_cost = {}
+            if matched_results:
+                for cur in self.currencies:
+                    adjusted_cost[cur] = sum(
+                        result.get(cur) or 0 for result in matched_results
+                    ) * (value / 100)
+
+            percent_adjusted_costs[idx] = adjusted_cost
+
+        return percent_adjusted_costs
 
     def _convert_fixed_value_to_adjusted_cost(self, value, currency, currency_map):
         adjusted_cost = {}
@@ -126,9 +236,7 @@ class AdjustmentPolicyApplier:
                 for cur in self.currencies:
                     adjusted_cost[cur] = results[0][cur] * (value / 100)
         elif unit == "FIXED":
-            currency_map, _ = self.currency_mgr.get_currency_map_date(
-                currency_end_date=self.currency_date,
-            )
+            currency_map = self.policy_snapshot.get_currency_map(self.currency_date)
             fixed_value = self.unified_cost_mgr.get_exchange_currency(
                 value, currency, currency_map
             )
@@ -168,20 +276,6 @@ class AdjustmentPolicyApplier:
             "report_adjustment_policy_id": report_adjustment_policy_id,
         }
 
-    def _check_applicable_policies(self) -> bool:
-        policies = self.policy_mgr.list_sorted_policies_by_order(
-            cost_report_config_id=self.config_id,
-            domain_id=self.domain_id,
-        )
-        for policy in policies:
-            report_adjustment_policy_id = policy["report_adjustment_policy_id"]
-            adjustments = self.adjustment_mgr.list_sorted_adjustments_by_order(
-                report_adjustment_policy_id, self.domain_id
-            )
-            if adjustments:
-                return True
-        return False
-
     @staticmethod
     def _extract_cost_by_currency(unified_cost):
         return {
@@ -216,8 +310,22 @@ class AdjustmentPolicyApplier:
     def _make_query_filter_with_adjustment(
             self, adjustment_policy_vo: dict, adjustment_info: dict
     ) -> dict:
-        provider = adjustment_info.get("provider")
+        query_filter = self._make_policy_query_filter(
+            adjustment_info["report_adjustment_policy_id"], adjustment_policy_vo
+        )
+        query_filter["filter"].extend(
+            self._make_adjustment_conditions(adjustment_info)
+        )
 
+        _LOGGER.debug(
+            f"[make_query_filter_with_adjustment] query_filter: {query_filter}"
+        )
+
+        return query_filter
+
+    def _make_policy_query_filter(
+            self, report_adjustment_policy_id: str, adjustment_policy_vo: dict
+    ) -> dict:
         query_filter = {
             "filter": [
                 {"k": "domain_id", "v": self.domain_id, "o": "eq"},
@@ -226,7 +334,7 @@ class AdjustmentPolicyApplier:
                 {"k": "report_month", "v": self.report_month, "o": "eq"},
                 {
                     "k": "report_adjustment_policy_id",
-                    "v": adjustment_info["report_adjustment_policy_id"],
+                    "v": report_adjustment_policy_id,
                     "o": "not",
                 },
             ],
@@ -262,14 +370,7 @@ class AdjustmentPolicyApplier:
                         {"k": "service_account_id", "v": service_account_ids, "o": "in"}
                     )
 
-        # step2 apply adjustment filter
-        if adj_filter := adjustment_info.get("adjustment_filter", []):
-            query_filter["filter"].extend(adj_filter)
-
-        if provider:
-            query_filter["filter"].append({"k": "provider", "v": provider, "o": "eq"})
-
-        # step3 fields
+        # step 2 fields
         currencies = self.currencies
         fields = {
             f"{currency}": {"key": f"cost.{currency}", "operator": "sum"}
@@ -277,8 +378,60 @@ class AdjustmentPolicyApplier:
         }
         query_filter["fields"].update(fields)
 
-        _LOGGER.debug(
-            f"[make_query_filter_with_adjustment] query_filter: {query_filter}"
-        )
-
         return query_filter
+
+    @staticmethod
+    def _make_adjustment_conditions(adjustment_info: dict) -> list:
+        conditions = []
+        provider = adjustment_info.get("provider")
+
+        if adj_filter := adjustment_info.get("adjustment_filter", []):
+            conditions.extend(adj_filter)
+
+        if provider:
+            conditions.append({"k": "provider", "v": provider, "o": "eq"})
+
+        return conditions
+
+    @staticmethod
+    def _is_evaluable_conditions(conditions: list) -> bool:
+        for condition in conditions:
+            if not isinstance(condition, dict):
+                return False
+
+            if set(condition.keys()) != {"k", "v", "o"}:
+                return False
+
+            if condition["o"] not in _EVALUABLE_OPERATORS:
+                return False
+
+            # grouped results are keyed by the last part of a nested key
+            if not isinstance(condition["k"], str) or "." in condition["k"]:
+                return False
+
+            if condition["o"] in ["in", "not_in"] and not isinstance(
+                condition["v"], list
+            ):
+                return False
+
+        return True
+
+    @staticmethod
+    def _match_conditions(result: dict, conditions: list) -> bool:
+        for condition in conditions:
+            key, value, operator = condition["k"], condition["v"], condition["o"]
+            field_value = result.get(key)
+
+            if operator == "eq":
+                is_matched = field_value == value
+            elif operator == "not":
+                is_matched = field_value != value
+            elif operator == "in":
+                is_matched = field_value in value
+            else:
+                is_matched = field_value not in value
+
+            if not is_matched:
+                return False
+
+        return True
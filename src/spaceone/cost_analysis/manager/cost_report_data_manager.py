@@ -1,7 +1,9 @@
 import logging
+from datetime import datetime
 from typing import Tuple
 from mongoengine import QuerySet
 
+from spaceone.core import utils
 from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.model.cost_report_data.database import CostReportData
 
@@ -25,6 +27,41 @@ class CostReportDataManager(BaseManager):
 
         return cost_report_data_vo
 
+    def create_cost_reports_data(self, params_list: list) -> int:
+        def _rollback(cost_report_data_ids: list):
+            _LOGGER.info(
+                f"[create_cost_reports_data._rollback] Delete cost report data : {len(cost_report_data_ids)}"
+            )
+            self.cost_report_data_model.filter(
+                cost_report_data_id=cost_report_data_ids
+            ).delete()
+
+        if not params_list:
+            return 0
+
+        created_at = datetime.utcnow()
+        cost_report_data_fields = self.cost_report_data_model._fields.keys()
+        cost_report_data_vos = []
+
+        for params in params_list:
+            create_data = {
+                key: value
+                for key, value in params.items()
+                if key in cost_report_data_fields
+            }
+            create_data["cost_report_data_id"] = utils.generate_id("crd")
+            create_data["created_at"] = created_at
+            cost_report_data_vos.append(self.cost_report_data_model(**create_data))
+
+        self.cost_report_data_model.objects.insert(
+            cost_report_data_vos, load_bulk=False
+        )
+        self.transaction.add_rollback(
+            _rollback, [vo.cost_report_data_id for vo in cost_report_data_vos]
+        )
+
+        return len(cost_report_data_vos)
+
     def update_cost_report_data_by_vo(
         self, params: dict, cost_report_data_vo: CostReportData
     ) -> CostReportData:
@@ -38,6 +75,43 @@ class CostReportDataManager(BaseManager):
         self.transaction.add_rollback(_rollback, cost_report_data_vo.to_dict())
         return cost_report_data_vo.update(params)
 
+    def confirm_cost_reports_data(
+        self, domain_id: str, cost_report_ids: list, report_month: str
+    ) -> int:
+        def _rollback(rollback_info: dict):
+            _LOGGER.info(
+                f"[confirm_cost_reports_data._rollback] Revert is_confirmed: {rollback_info['confirm_id']}"
+            )
+            self.cost_report_data_model._get_collection().update_many(
+                rollback_info, {"$set": {"is_confirmed": False, "confirm_id": None}}
+            )
+
+        # the data confirmed by this call is stamped, so the rollback reverts it
+        # by the stamp and never the data confirmed before
+        confirm_id = utils.generate_id("confirm")
+        result = self.cost_report_data_model._get_collection().update_many(
+            {
+                "domain_id": domain_id,
+                "cost_report_id": {"$in": cost_report_ids},
+                "report_month": report_month,
+                "is_confirmed": False,
+            },
+            {"$set": {"is_confirmed": True, "confirm_id": confirm_id}},
+        )
+        self.transaction.add_rollback(
+            _rollback,
+            {
+                "domain_id": domain_id,
+                "cost_report_id": {"$in": cost_report_ids},
+                "confirm_id": confirm_id,
+            },
+        )
+
+        _LOGGER.debug(
+            f"[confirm_cost_reports_data] confirm cost report data: {result.modified_count}"
+        )
+        return result.modified_count
+
     @staticmethod
     def delete_cost_report_data(cost_report_data_vo: CostReportData):
         cost_report_data_vo.delete()
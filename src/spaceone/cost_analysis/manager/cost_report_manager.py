@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Tuple
 from mongoengine import QuerySet
 
@@ -37,6 +38,48 @@ class CostReportManager(BaseManager):
 
         return cost_report_vo.update(params)
 
+    def update_cost_reports_status(self, conditions: dict, status: str) -> int:
+        def _rollback(old_status_map: dict):
+            for old_status, cost_report_ids in old_status_map.items():
+                _LOGGER.info(
+                    f"[update_cost_reports_status._rollback] Revert status to {old_status}: {cost_report_ids}"
+                )
+                self.cost_report_model.filter(cost_report_id=cost_report_ids).update(
+                    status=old_status, updated_at=datetime.utcnow()
+                )
+
+        cost_report_vos = self.cost_report_model.filter(**conditions)
+
+        # keep only ids per previous status instead of a full snapshot per report
+        old_status_map = {}
+        for cost_report_vo in cost_report_vos.only("cost_report_id", "status"):
+            old_status_map.setdefault(cost_report_vo.status, []).append(
+                cost_report_vo.cost_report_id
+            )
+
+        if not old_status_map:
+            return 0
+
+        # only the recorded reports are updated, so the rollback reverts exactly them
+        updated_ids = [
+            cost_report_id
+            for cost_report_ids in old_status_map.values()
+            for cost_report_id in cost_report_ids
+        ]
+
+        # bulk updates skip auto_now, so updated_at is set explicitly
+        self.cost_report_model.filter(cost_report_id=updated_ids).update(
+            status=status, updated_at=datetime.utcnow()
+        )
+        self.transaction.add_rollback(_rollback, old_status_map)
+
+        updated_count = len(updated_ids)
+
+        _LOGGER.debug(
+            f"[update_cost_reports_status] update status to {status}: {updated_count}"
+        )
+        return updated_count
+
     def get_cost_report(
         self, domain_id: str, cost_report_id: str, workspace_id: str = None
     ) -> CostReport:
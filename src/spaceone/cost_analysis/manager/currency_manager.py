@@ -1,25 +1,178 @@
+import copy
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Tuple, Union
 
-from typing import Tuple
+from mongoengine import QuerySet
 
+from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.connector.currency_connector import CurrencyConnector
+from spaceone.cost_analysis.model.exchange_rate.database import ExchangeRate
 
 _LOGGER = logging.getLogger(__name__)
 
+# dates read to find the latest complete currency map when the window has none
+LATEST_EXCHANGE_RATE_DATES = 30
+
 
 class CurrencyManager(BaseManager):
     def __init__(self, *args, today: datetime = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.currency_connector: CurrencyConnector = CurrencyConnector(today=today)
+        self.exchange_rate_model = ExchangeRate
         self.currency_mapper = {}
+        self.currencies = config.get_global(
+            "SUPPORTED_CURRENCIES", ["KRW", "USD", "JPY"]
+        )
 
     def get_currency_map_date(
         self, currency_end_date: datetime, currency_start_date: datetime = None
     ) -> Tuple[dict, datetime]:
-        currency_map, currency_date = self.currency_connector.add_currency_map_date(
-            currency_end_date=currency_end_date, currency_start_date=currency_start_date
+        if not currency_start_date:
+            currency_start_date = currency_end_date - timedelta(days=15)
+
+        end_date = currency_end_date.strftime("%Y-%m-%d")
+        start_date = currency_start_date.strftime("%Y-%m-%d")
+
+        currency_map_info = self._get_currency_map_from_store(start_date, end_date)
+
+        # runs never call the external sources, ExchangeRateSyncScheduler fills the store
+        if currency_map_info is None:
+            _LOGGER.warning(
+                f"[get_currency_map_date] exchange rates are not stored ({start_date} ~ {end_date}) => use the latest stored rates"
+            )
+            currency_map_info = self._get_latest_currency_map_from_store(end_date)
+
+        if currency_map_info is None:
+            _LOGGER.warning(
+                f"[get_currency_map_date] exchange rates are not stored (~ {end_date}) => use DEFAULT_EXCHANGE_RATES"
+            )
+            default_rates = config.get_global("DEFAULT_EXCHANGE_RATES", {})
+            return self._make_currency_map(default_rates), currency_end_date
+
+        currency_map, currency_date = currency_map_info
+        return copy.deepcopy(currency_map), datetime.strptime(
+            currency_date, "%Y-%m-%d"
+        )
+
+    def sync_exchange_rates(
+        self, currency_end_date: datetime, currency_start_date: datetime = None
+    ) -> int:
+        exchange_rates = []
+        if config.get_global("EXCHANGE_RATE_FETCH_MODE", "BASE") == "VALIDATE":
+            for pair in self._get_currency_pairs():
+                try:
+                    exchange_rates.extend(
+                        self.currency_connector.list_exchange_rates(
+                            pair, currency_end_date, currency_start_date
+                        )
+                    )
+                except Exception as e:
+                    _LOGGER.warning(
+                        f"[sync_exchange_rates] failed to fetch exchange rates ({pair}): {e}"
+                    )
+        else:
+            try:
+                exchange_rates = self.currency_connector.list_cross_exchange_rates(
+                    currency_end_date, currency_start_date
+                )
+            except Exception as e:
+                _LOGGER.warning(
+                    f"[sync_exchange_rates] failed to fetch base quotes: {e}"
+                )
+
+        for exchange_rate in exchange_rates:
+            self.exchange_rate_model.objects(
+                pair=exchange_rate["pair"], date=exchange_rate["date"]
+            ).update_one(
+                upsert=True,
+                set__rate=exchange_rate["rate"],
+                set__source=exchange_rate["source"],
+                set__updated_at=datetime.utcnow(),
+                set_on_insert__created_at=datetime.utcnow(),
+            )
+
+        _LOGGER.debug(
+            f"[sync_exchange_rates] upsert exchange rates: {len(exchange_rates)}"
+        )
+
+        if exchange_rates:
+            self.remove_exchange_rate_cache()
+
+        return len(exchange_rates)
+
+    def get_last_exchange_rate_date(self) -> Union[datetime, None]:
+        exchange_rate_vo = (
+            self.exchange_rate_model.objects.order_by("-date").only("date").first()
         )
+        if exchange_rate_vo:
+            return datetime.strptime(exchange_rate_vo.date, "%Y-%m-%d")
+        return None
+
+    @staticmethod
+    def remove_exchange_rate_cache() -> None:
+        cache.delete_pattern("cost-analysis:exchange-rate:*")
+
+    @cache.cacheable(
+        key="cost-analysis:exchange-rate:{start_date}:{end_date}", expire=3600 * 24
+    )
+    def _get_currency_map_from_store(
+        self, start_date: str, end_date: str
+    ) -> Union[Tuple[dict, str], None]:
+        pairs = self._get_currency_pairs()
+        exchange_rate_vos = self.exchange_rate_model.objects(
+            pair__in=pairs, date__gte=start_date, date__lte=end_date
+        ).only("pair", "date", "rate")
+
+        return self._find_complete_currency_map(exchange_rate_vos, pairs)
+
+    @cache.cacheable(key="cost-analysis:exchange-rate:latest:{end_date}", expire=3600)
+    def _get_latest_currency_map_from_store(
+        self, end_date: str
+    ) -> Union[Tuple[dict, str], None]:
+        pairs = self._get_currency_pairs()
+        exchange_rate_vos = (
+            self.exchange_rate_model.objects(pair__in=pairs, date__lte=end_date)
+            .order_by("-date")
+            .only("pair", "date", "rate")
+            .limit(len(pairs) * LATEST_EXCHANGE_RATE_DATES)
+        )
+
+        return self._find_complete_currency_map(exchange_rate_vos, pairs)
+
+    def _find_complete_currency_map(
+        self, exchange_rate_vos: QuerySet, pairs: list
+    ) -> Union[Tuple[dict, str], None]:
+        rates_by_date = {}
+        for exchange_rate_vo in exchange_rate_vos:
+            rates_by_date.setdefault(exchange_rate_vo.date, {})[
+                exchange_rate_vo.pair
+            ] = exchange_rate_vo.rate
+
+        # the latest date that has every pair, so the map is from a single day
+        for currency_date in sorted(rates_by_date.keys(), reverse=True):
+            rates = rates_by_date[currency_date]
+            if len(rates) == len(pairs):
+                return self._make_currency_map(rates), currency_date
+
+        return None
+
+    def _make_currency_map(self, rates: dict) -> dict:
+        currency_map = {}
+        for from_currency in self.currencies:
+            currency_map[from_currency] = {}
+            for to_currency in self.currencies:
+                pair = f"{from_currency}/{to_currency}"
+                currency_map[from_currency][pair] = (
+                    1.0 if from_currency == to_currency else rates[pair]
+                )
+        return currency_map
 
-        return currency_map, currency_date
+    def _get_currency_pairs(self) -> list:
+        return [
+            f"{from_currency}/{to_currency}"
+            for from_currency in self.currencies
+            for to_currency in self.currencies
+            if from_currency != to_currency
+        ]
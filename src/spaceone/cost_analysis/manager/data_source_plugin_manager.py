@@ -1,5 +1,12 @@
 import logging
+import queue
+import threading
+from typing import Generator, Iterator, Union
 
+import grpc
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_GRPC_CONNECTION
 from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.manager.plugin_manager import PluginManager
 from spaceone.cost_analysis.manager.data_source_rule_manager import (
@@ -27,6 +34,23 @@ class DataSourcePluginManager(BaseManager):
         _LOGGER.debug(f"[initialize] data source plugin endpoint: {endpoint}")
         self.dsp_connector.initialize(endpoint)
 
+    def initialize_by_plugin_info(self, plugin_info: dict, domain_id: str) -> str:
+        endpoint, _ = self.get_data_source_plugin_endpoint_with_cache(
+            plugin_info, domain_id
+        )
+
+        try:
+            self.initialize(endpoint)
+        except ERROR_GRPC_CONNECTION:
+            # the cached endpoint is stale when the plugin has been redeployed
+            self.delete_data_source_plugin_endpoint_cache(plugin_info, domain_id)
+            endpoint, _ = self.get_data_source_plugin_endpoint_with_cache(
+                plugin_info, domain_id
+            )
+            self.initialize(endpoint)
+
+        return endpoint
+
     def init_plugin(self, options, domain_id):
         plugin_info = self.dsp_connector.init(options, domain_id)
 
@@ -73,10 +97,67 @@ class DataSourcePluginManager(BaseManager):
         )
 
     def get_cost_data(self, options, secret_data, schema, task_options, domain_id):
-        return self.dsp_connector.get_cost_data(
+        response_stream, grpc_call = self.dsp_connector.get_cost_data(
             options, secret_data, schema, task_options, domain_id
         )
 
+        prefetch_size = config.get_global("COST_DATA_PREFETCH_SIZE", 4)
+        if prefetch_size > 0:
+            return self._prefetch_responses(response_stream, prefetch_size, grpc_call)
+        else:
+            return response_stream
+
+    @staticmethod
+    def _prefetch_responses(
+        response_stream: Iterator[dict],
+        prefetch_size: int,
+        grpc_call: Union[grpc.Call, None] = None,
+    ) -> Generator[dict, None, None]:
+        # a reader thread receives the next responses while the caller writes to DB,
+        # and the bounded buffer pauses it when the caller falls behind
+        buffer = queue.Queue(maxsize=prefetch_size)
+        stop_event = threading.Event()
+
+        def _put(item: tuple) -> bool:
+            while not stop_event.is_set():
+                try:
+                    buffer.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _read_responses() -> None:
+            try:
+                for response in response_stream:
+                    if not _put(("RESPONSE", response)):
+                        return None
+
+                _put(("END", None))
+            except Exception as e:
+                _put(("ERROR", e))
+
+        reader = threading.Thread(
+            target=_read_responses, name="cost-data-prefetch", daemon=True
+        )
+        reader.start()
+
+        try:
+            while True:
+                item_type, item = buffer.get()
+                if item_type == "END":
+                    break
+                elif item_type == "ERROR":
+                    raise item
+
+                yield item
+        finally:
+            stop_event.set()
+
+            # the reader blocked on the next response is released by canceling the call
+            if grpc_call:
+                grpc_call.cancel()
+
     def get_data_source_plugin_endpoint_by_vo(self, data_source_vo: DataSource):
         plugin_info = data_source_vo.plugin_info.to_dict()
         endpoint, updated_version = self.get_data_source_plugin_endpoint(
@@ -97,6 +178,29 @@ class DataSourcePluginManager(BaseManager):
         plugin_mgr: PluginManager = self.locator.get_manager("PluginManager")
         return plugin_mgr.get_plugin_endpoint(plugin_info, domain_id)
 
+    def get_data_source_plugin_endpoint_with_cache(
+        self, plugin_info: dict, domain_id: str
+    ) -> tuple:
+        plugin_mgr: PluginManager = self.locator.get_manager("PluginManager")
+        response = plugin_mgr.get_plugin_endpoint_with_cache(
+            plugin_info["plugin_id"],
+            plugin_info.get("version"),
+            plugin_info.get("upgrade_mode", "AUTO"),
+            domain_id,
+        )
+        return response["endpoint"], response.get("updated_version")
+
+    def delete_data_source_plugin_endpoint_cache(
+        self, plugin_info: dict, domain_id: str
+    ) -> None:
+        plugin_mgr: PluginManager = self.locator.get_manager("PluginManager")
+        plugin_mgr.delete_plugin_endpoint_cache(
+            plugin_info["plugin_id"],
+            plugin_info.get("version"),
+            plugin_info.get("upgrade_mode", "AUTO"),
+            domain_id,
+        )
+
     def upgrade_data_source_plugin_version(
         self, data_source_vo: DataSource, endpoint, updated_version
     ):
@@ -1,14 +1,20 @@
 import calendar
 import logging
 import os
-from typing import Union
+import re
+import smtplib
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Union
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from markupsafe import escape
 
-from spaceone.core import config, utils
+from spaceone.core import config, queue, utils
 from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.connector.smtp_connector import SMTPConnector
 from spaceone.cost_analysis.model import Budget
+from spaceone.cost_analysis.model.email_delivery.database import EmailDelivery
 
 from spaceone.cost_analysis.model.cost_report.database import CostReport
 
@@ -19,6 +25,15 @@ JINJA_ENV = Environment(
     loader=FileSystemLoader(searchpath=TEMPLATE_PATH), autoescape=select_autoescape()
 )
 
+# compile every email template once at import instead of on first use per process
+TEMPLATES = {
+    template_name: JINJA_ENV.get_template(template_name)
+    for template_name in JINJA_ENV.list_templates(extensions=["html"])
+}
+
+# per-recipient fields are rendered as placeholders and substituted afterwards
+RECIPIENT_FIELDS = ["user_name", "download_link"]
+
 LANGUAGE_MAPPER = {
     "default": {
         "cost_report": "Your cost report is ready for review.",
@@ -41,31 +56,39 @@ LANGUAGE_MAPPER = {
 class EmailManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.smtp_connector = SMTPConnector()
+        self.smtp_connector = None
+        self.email_delivery_model = EmailDelivery
 
     def send_cost_report_email(
         self,
         user_id: str,
         email: str,
-        cost_report_link: str,
         language: str,
         cost_report_vo: CostReport,
     ):
+        # download_link carries an access token, so it is made on delivery
         service_name = self._get_service_name()
         language_map_info = LANGUAGE_MAPPER.get(language, "default")
-        template = JINJA_ENV.get_template(f"cost_report_{language}.html")
-
-        email_contents = template.render(
-            user_name=user_id,
-            report_number=cost_report_vo.report_number,
-            name=cost_report_vo.name,
-            report_date=cost_report_vo.issue_date,
-            report_period=self.get_date_range_of_month(cost_report_vo.report_month),
-            download_link=cost_report_link,
-        )
         subject = f'[{service_name}] #{cost_report_vo.report_number} {language_map_info["cost_report"]}'
 
-        self.smtp_connector.send_email(email, subject, email_contents)
+        self.push_email(
+            email,
+            subject,
+            f"cost_report_{language}.html",
+            {
+                "report_number": cost_report_vo.report_number,
+                "name": cost_report_vo.name,
+                "report_date": cost_report_vo.issue_date,
+                "report_period": self.get_date_range_of_month(
+                    cost_report_vo.report_month
+                ),
+            },
+            {"user_name": user_id},
+            resource_type="CostReport",
+            resource_id=cost_report_vo.cost_report_id,
+            domain_id=cost_report_vo.domain_id,
+            language=language,
+        )
 
     def send_budget_usage_alert_email(
         self,
@@ -83,25 +106,236 @@ class EmailManager(BaseManager):
     ):
         service_name = self._get_service_name()
         language_map_info = LANGUAGE_MAPPER.get(language, "default")
-        template = JINJA_ENV.get_template(f"budget_usage_alert_{language}.html")
-
-        email_contents = template.render(
-            user_name=user_id,
-            workspace_name=workspace_name,
-            budget_name=budget_vo.name,
-            budget_target=target_name,
-            budget_amount=budget_vo.limit,
-            budget_cycle=budget_vo.time_unit,
-            actual_cost=total_budget_usage,
-            usage_rate=budget_percentage,
-            today_date=today_date,
-            budget_detail_link=console_link,
-            currency=budget_vo.currency,
+        subject = f"[{service_name}] {language_map_info['budget_usage_alert'].format(budget_name=budget_vo.name, threshold=threshold)}"
+
+        self.push_email(
+            email,
+            subject,
+            f"budget_usage_alert_{language}.html",
+            {
+                "workspace_name": workspace_name,
+                "budget_name": budget_vo.name,
+                "budget_target": target_name,
+                "budget_amount": budget_vo.limit,
+                "budget_cycle": budget_vo.time_unit,
+                "actual_cost": total_budget_usage,
+                "usage_rate": budget_percentage,
+                "today_date": today_date,
+                "budget_detail_link": console_link,
+                "currency": budget_vo.currency,
+            },
+            {"user_name": user_id},
+            resource_type="Budget",
+            resource_id=budget_vo.budget_id,
+            resource_key=self.make_budget_plan_key(threshold),
+            domain_id=budget_vo.domain_id,
+            language=language,
         )
 
-        subject = f"[{service_name}] {language_map_info['budget_usage_alert'].format(budget_name=budget_vo.name, threshold=threshold)}"
+    def push_email(
+        self,
+        to: str,
+        subject: str,
+        template_name: str,
+        template_context: dict,
+        recipient_info: dict,
+        resource_type: str = None,
+        resource_id: str = None,
+        domain_id: str = None,
+        resource_key: str = None,
+        language: str = None,
+    ) -> EmailDelivery:
+        email_delivery_vo = self.email_delivery_model.create(
+            {
+                "to": to,
+                "subject": subject,
+                "template_name": template_name,
+                "template_context": template_context,
+                "recipient_info": recipient_info,
+                "language": language,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "resource_key": resource_key,
+                "domain_id": domain_id,
+            }
+        )
+
+        self.push_email_delivery_task(
+            {"email_delivery_id": email_delivery_vo.email_delivery_id}
+        )
 
-        self.smtp_connector.send_email(email, subject, email_contents)
+        return email_delivery_vo
+
+    def get_email_delivery(self, email_delivery_id: str) -> EmailDelivery:
+        return self.email_delivery_model.get(email_delivery_id=email_delivery_id)
+
+    def deliver_email(
+        self,
+        email_delivery_id: str,
+        get_recipient_info: Callable[[EmailDelivery], dict] = None,
+    ) -> EmailDelivery:
+        email_delivery_vo = self.email_delivery_model.get(
+            email_delivery_id=email_delivery_id
+        )
+
+        if email_delivery_vo.status != "PENDING":
+            return email_delivery_vo
+
+        max_retries = config.get_global("EMAIL_DELIVERY_MAX_RETRIES", 3)
+        retry_backoff = config.get_global("EMAIL_DELIVERY_RETRY_BACKOFF", 60)
+        attempts = (email_delivery_vo.attempts or 0) + 1
+
+        try:
+            if self.smtp_connector is None:
+                self.smtp_connector = SMTPConnector()
+
+            contents = self._make_email_contents(
+                email_delivery_vo, get_recipient_info
+            )
+            self.smtp_connector.send_email(
+                email_delivery_vo.to, email_delivery_vo.subject, contents
+            )
+
+            return email_delivery_vo.update(
+                {
+                    "contents": None,
+                    "status": "SENT",
+                    "attempts": attempts,
+                    "error_message": None,
+                    "next_attempt_at": None,
+                    "sent_at": datetime.utcnow(),
+                }
+            )
+        except smtplib.SMTPRecipientsRefused as e:
+            error_message = str(e)
+        except Exception as e:
+            error_message = str(e)
+
+            # drop the pooled session so that the next attempt reconnects
+            if self.smtp_connector is not None:
+                self.smtp_connector.quit_smtp()
+                self.smtp_connector = None
+
+            if attempts <= max_retries:
+                # the worker is not held for the backoff, the scheduler pushes it again
+                next_attempt_at = datetime.utcnow() + timedelta(
+                    seconds=retry_backoff * (2 ** (attempts - 1))
+                )
+                _LOGGER.warning(
+                    f"[deliver_email] failed to send email ({email_delivery_id}), "
+                    f"attempts: {attempts}, next attempt at: {next_attempt_at}, {e}"
+                )
+
+                return email_delivery_vo.update(
+                    {
+                        "attempts": attempts,
+                        "error_message": error_message,
+                        "next_attempt_at": next_attempt_at,
+                    }
+                )
+
+        _LOGGER.error(
+            f"[deliver_email] failed to deliver email ({email_delivery_id}): {error_message}"
+        )
+
+        return email_delivery_vo.update(
+            {
+                "contents": None,
+                "status": "FAILED",
+                "attempts": attempts,
+                "error_message": error_message,
+                "next_attempt_at": None,
+            }
+        )
+
+    def _make_email_contents(
+        self,
+        email_delivery_vo: EmailDelivery,
+        get_recipient_info: Callable[[EmailDelivery], dict] = None,
+    ) -> str:
+        # deliveries queued before the body was rendered on delivery
+        if email_delivery_vo.template_name is None:
+            return email_delivery_vo.contents
+
+        recipient_info = dict(email_delivery_vo.recipient_info or {})
+        if get_recipient_info:
+            recipient_info.update(get_recipient_info(email_delivery_vo))
+
+        return self.render_template(
+            email_delivery_vo.template_name,
+            recipient_info,
+            **(email_delivery_vo.template_context or {}),
+        )
+
+    @staticmethod
+    def make_budget_plan_key(threshold: float) -> str:
+        return str(float(threshold))
+
+    def push_retry_email_deliveries(self) -> int:
+        pushed_count = 0
+        for email_delivery_vo in self.email_delivery_model.filter(
+            status="PENDING", next_attempt_at__lte=datetime.utcnow()
+        ):
+            # only one scheduler run pushes a retry, even if they overlap
+            if self.email_delivery_model.objects(
+                email_delivery_id=email_delivery_vo.email_delivery_id,
+                next_attempt_at=email_delivery_vo.next_attempt_at,
+            ).modify(set__next_attempt_at=None):
+                self.push_email_delivery_task(
+                    {"email_delivery_id": email_delivery_vo.email_delivery_id}
+                )
+                pushed_count += 1
+
+        if pushed_count > 0:
+            _LOGGER.debug(
+                f"[push_retry_email_deliveries] retry email deliveries: {pushed_count}"
+            )
+
+        return pushed_count
+
+    @staticmethod
+    def push_email_delivery_task(params: dict) -> None:
+        token = config.get_global("TOKEN")
+        task = {
+            "name": "deliver_email",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "EmailService",
+                    "metadata": {"token": token},
+                    "method": "deliver_email",
+                    "params": {"params": params},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[push_email_delivery_task] task param: {params}")
+
+        queue.put("cost_analysis_q", utils.dump_json(task))
+
+    @staticmethod
+    def render_template(template_name: str, recipient_info: dict, **context) -> str:
+        """Render the shared part of an email once and fill in recipient fields.
+
+        The body is cached per template and shared context, e.g. once per
+        (cost report, language), so every further recipient only costs the
+        placeholder substitution.
+        """
+        segments = _render_shared_template(
+            template_name, tuple(sorted(context.items()))
+        )
+        recipient_values = {
+            field: str(escape(recipient_info.get(field, "")))
+            for field in RECIPIENT_FIELDS
+        }
+
+        # segments alternate between shared text and recipient field names
+        return "".join(
+            recipient_values[segment] if index % 2 else segment
+            for index, segment in enumerate(segments)
+        )
 
     @staticmethod
     def _get_service_name():
@@ -112,3 +346,34 @@ class EmailManager(BaseManager):
         year, month = report_month.split("-")
         _, last_day = calendar.monthrange(int(year), int(month))
         return f"{year}-{month}-01 ~ {year}-{month}-{last_day}"
+
+
+def _make_placeholder(field: str) -> str:
+    return f"__RECIPIENT_{field.upper()}__"
+
+
+_PLACEHOLDER_PATTERN = re.compile(
+    "|".join(_make_placeholder(field) for field in RECIPIENT_FIELDS)
+)
+
+
+@lru_cache(maxsize=256)
+def _render_shared_template(template_name: str, context_items: tuple) -> tuple:
+    template: Template = TEMPLATES.get(template_name) or JINJA_ENV.get_template(
+        template_name
+    )
+    placeholders = {field: _make_placeholder(field) for field in RECIPIENT_FIELDS}
+    placeholder_fields = {
+        placeholder: field for field, placeholder in placeholders.items()
+    }
+    email_contents = template.render(**dict(context_items), **placeholders)
+
+    segments = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(email_contents):
+        segments.append(email_contents[position : match.start()])
+        segments.append(placeholder_fields[match.group()])
+        position = match.end()
+    segments.append(email_contents[position:])
+
+    return tuple(segments)
@@ -1,15 +1,20 @@
 import logging
-from datetime import datetime, timezone
-from typing import Union
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Tuple, Union
 
-from spaceone.core import queue, utils
+from mongoengine import NotUniqueError
+
+from spaceone.core import config, queue, utils
 from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.error import *
 from spaceone.cost_analysis.manager.job_manager import JobManager
-from spaceone.cost_analysis.model.job_task_model import JobTask
+from spaceone.cost_analysis.model.job_task_model import JobTask, JobTaskDispatchLock
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISPATCH_LOCK_ID = "job-task-dispatch"
+
 
 class JobTaskManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -17,6 +22,16 @@ class JobTaskManager(BaseManager):
 
         self.job_mgr: JobManager = self.locator.get_manager("JobManager")
         self.job_task_model: JobTask = self.locator.get_model("JobTask")
+        self.dispatch_lock_model: JobTaskDispatchLock = self.locator.get_model(
+            "JobTaskDispatchLock"
+        )
+        self.dispatch_limit = config.get_global("JOB_TASK_DISPATCH_LIMIT", 100)
+        self.domain_quota = config.get_global("JOB_TASK_DOMAIN_QUOTA", 10)
+        self.domain_weights = config.get_global("JOB_TASK_DOMAIN_WEIGHTS", {})
+        self.heartbeat_interval = config.get_global("JOB_TASK_HEARTBEAT_INTERVAL", 60)
+        self.dispatch_lock_timeout = config.get_global(
+            "JOB_TASK_DISPATCH_LOCK_TIMEOUT", 60
+        )
 
     def create_job_task(
         self,
@@ -27,6 +42,8 @@ class JobTaskManager(BaseManager):
         domain_id: str,
         task_options: dict,
         task_changed: Union[dict, None] = None,
+        secret_id: str = None,
+        priority: int = 0,
     ):
         data = {
             "resource_group": resource_group,
@@ -36,6 +53,8 @@ class JobTaskManager(BaseManager):
             "domain_id": domain_id,
             "options": task_options,
             "changed": task_changed,
+            "secret_id": secret_id,
+            "priority": priority,
         }
 
         _LOGGER.debug(f"[create_job_task] create job task: {data}")
@@ -61,6 +80,246 @@ class JobTaskManager(BaseManager):
     def stat_job_tasks(self, query):
         return self.job_task_model.stat(**query)
 
+    def list_stalled_job_tasks(self, stall_timeout: int) -> list:
+        stalled_at = datetime.utcnow() - timedelta(seconds=stall_timeout)
+
+        # dispatched tasks which no worker has started are also stalled
+        return (
+            list(
+                self.job_task_model.filter(
+                    status="IN_PROGRESS", heartbeat_at__lt=stalled_at
+                )
+            )
+            + list(
+                self.job_task_model.filter(
+                    status="IN_PROGRESS", heartbeat_at=None, updated_at__lt=stalled_at
+                )
+            )
+            + list(
+                self.job_task_model.filter(
+                    status="PENDING", dispatched_at__lt=stalled_at
+                )
+            )
+        )
+
+    def claim_job_task(
+        self, job_task_vo: JobTask, worker_id: str
+    ) -> Union[JobTask, None]:
+        # finished or canceled tasks are never run again by a duplicate message
+        if job_task_vo.status not in ["PENDING", "IN_PROGRESS"]:
+            return None
+
+        now = datetime.utcnow()
+        update_params = {
+            "set__status": "IN_PROGRESS",
+            "set__worker_id": worker_id,
+            "set__heartbeat_at": now,
+            "set__updated_at": now,
+        }
+
+        if job_task_vo.status == "PENDING":
+            update_params["set__started_at"] = now
+
+        # only one worker runs a task, even if it is pushed more than once
+        job_task_vo = self.job_task_model.objects(
+            job_task_id=job_task_vo.job_task_id,
+            status__in=["PENDING", "IN_PROGRESS"],
+            worker_id=None,
+        ).modify(new=True, **update_params)
+
+        if job_task_vo:
+            _LOGGER.debug(
+                f"[claim_job_task] start job task: {job_task_vo.job_task_id} (worker_id = {worker_id})"
+            )
+
+        return job_task_vo
+
+    def release_stalled_job_task(
+        self, job_task_vo: JobTask, is_retry: bool = True
+    ) -> Union[JobTask, None]:
+        now = datetime.utcnow()
+        update_params = {
+            "set__worker_id": None,
+            "set__heartbeat_at": now,
+            "set__updated_at": now,
+        }
+
+        if is_retry:
+            update_params["set__dispatched_at"] = now
+            update_params["inc__retry_count"] = 1
+
+        # the task is not released if its worker has sent a heartbeat in the meantime
+        job_task_vo = self.job_task_model.objects(
+            job_task_id=job_task_vo.job_task_id,
+            status=job_task_vo.status,
+            worker_id=job_task_vo.worker_id,
+            heartbeat_at=job_task_vo.heartbeat_at,
+            dispatched_at=job_task_vo.dispatched_at,
+        ).modify(new=True, **update_params)
+
+        if job_task_vo and is_retry:
+            _LOGGER.debug(
+                f"[release_stalled_job_task] retry stalled job task: {job_task_vo.job_task_id} "
+                f"(retry_count = {job_task_vo.retry_count})"
+            )
+
+        return job_task_vo
+
+    def start_heartbeat(
+        self, job_task_id: str, worker_id: str
+    ) -> Tuple[threading.Event, threading.Event]:
+        stop_event = threading.Event()
+        claim_lost_event = threading.Event()
+
+        def _send_heartbeat():
+            # a slow plugin response does not make the task look stalled
+            while not stop_event.wait(self.heartbeat_interval):
+                try:
+                    job_task_vo = self.job_task_model.objects(
+                        job_task_id=job_task_id,
+                        status="IN_PROGRESS",
+                        worker_id=worker_id,
+                    ).modify(set__heartbeat_at=datetime.utcnow())
+                except Exception as e:
+                    _LOGGER.error(f"[start_heartbeat] heartbeat error: {e}")
+                    continue
+
+                if job_task_vo is None:
+                    claim_lost_event.set()
+                    return
+
+        threading.Thread(target=_send_heartbeat, daemon=True).start()
+
+        return stop_event, claim_lost_event
+
+    def dispatch_job_tasks(self) -> int:
+        # dispatchers run one at a time, or they would all fill the same free slots
+        lock_owner = utils.random_string()
+        if not self._acquire_dispatch_lock(lock_owner):
+            _LOGGER.debug("[dispatch_job_tasks] dispatch is requested to the lock owner")
+            return 0
+
+        dispatched_count = 0
+        while True:
+            try:
+                dispatched_count += self._dispatch_job_tasks()
+            except Exception:
+                # the lock is not kept for a dispatcher which has already exited
+                self.dispatch_lock_model.objects(
+                    lock_id=_DISPATCH_LOCK_ID, owner=lock_owner
+                ).delete()
+                raise
+
+            if self._release_dispatch_lock(lock_owner):
+                return dispatched_count
+
+    def _dispatch_job_tasks(self) -> int:
+        running_counts = self._count_running_job_tasks()
+        available_count = self.dispatch_limit - sum(running_counts.values())
+
+        if available_count <= 0:
+            return 0
+
+        next_job_task_vos = {}
+        for domain_id in self.job_task_model.filter(
+            status="PENDING", dispatched_at=None
+        ).distinct("domain_id"):
+            if running_counts.get(domain_id, 0) < self.domain_quota:
+                job_task_vo = self._get_next_job_task(domain_id)
+                if job_task_vo:
+                    next_job_task_vos[domain_id] = job_task_vo
+
+        dispatched_count = 0
+        while available_count > 0 and next_job_task_vos:
+            # higher priority first, then the domain with the smallest weighted share
+            domain_id = min(
+                next_job_task_vos,
+                key=lambda key: (
+                    -next_job_task_vos[key].priority,
+                    running_counts.get(key, 0) / self._get_domain_weight(key),
+                    next_job_task_vos[key].created_at,
+                ),
+            )
+            job_task_vo = next_job_task_vos.pop(domain_id)
+
+            if self._claim_job_task(job_task_vo):
+                self.push_job_task_by_vo(job_task_vo)
+                running_counts[domain_id] = running_counts.get(domain_id, 0) + 1
+                available_count -= 1
+                dispatched_count += 1
+
+            if running_counts.get(domain_id, 0) < self.domain_quota:
+                job_task_vo = self._get_next_job_task(domain_id)
+                if job_task_vo:
+                    next_job_task_vos[domain_id] = job_task_vo
+
+        if dispatched_count > 0:
+            _LOGGER.debug(
+                f"[dispatch_job_tasks] dispatch job tasks: {dispatched_count} "
+                f"(running = {sum(running_counts.values())})"
+            )
+
+        return dispatched_count
+
+    def _acquire_dispatch_lock(self, lock_owner: str) -> bool:
+        while True:
+            now = datetime.utcnow()
+
+            try:
+                # the unique lock_id makes the upsert fail while another owner holds the lock
+                if self.dispatch_lock_model.objects(
+                    lock_id=_DISPATCH_LOCK_ID, expired_at__lt=now
+                ).modify(
+                    upsert=True,
+                    new=True,
+                    set__owner=lock_owner,
+                    set__is_requested=False,
+                    set__expired_at=now + timedelta(seconds=self.dispatch_lock_timeout),
+                ):
+                    return True
+            except NotUniqueError:
+                pass
+
+            # the owner dispatches once more for this request before it releases the lock
+            if self.dispatch_lock_model.objects(lock_id=_DISPATCH_LOCK_ID).modify(
+                set__is_requested=True
+            ):
+                return False
+
+    def _release_dispatch_lock(self, lock_owner: str) -> bool:
+        if self.dispatch_lock_model.objects(
+            lock_id=_DISPATCH_LOCK_ID, owner=lock_owner, is_requested=False
+        ).delete():
+            return True
+
+        # a dispatch was requested meanwhile, so the lock is kept for one more round
+        return not self.dispatch_lock_model.objects(
+            lock_id=_DISPATCH_LOCK_ID, owner=lock_owner, is_requested=True
+        ).modify(
+            set__is_requested=False,
+            set__expired_at=datetime.utcnow()
+            + timedelta(seconds=self.dispatch_lock_timeout),
+        )
+
+    def push_job_task_by_vo(self, job_task_vo: JobTask) -> None:
+        task_changed = None
+        if job_task_vo.changed:
+            task_changed = {
+                "start": job_task_vo.changed.start,
+                "end": job_task_vo.changed.end,
+                "filter": job_task_vo.changed.filter,
+            }
+
+        self.push_job_task(
+            {
+                "task_options": job_task_vo.options,
+                "task_changed": task_changed,
+                "secret_id": job_task_vo.secret_id,
+                "job_task_id": job_task_vo.job_task_id,
+                "domain_id": job_task_vo.domain_id,
+            }
+        )
+
     def push_job_task(self, params: dict) -> None:
         token = self.transaction.meta.get("token")
         task = {
@@ -82,20 +341,34 @@ class JobTaskManager(BaseManager):
 
         queue.put("cost_analysis_q", utils.dump_json(task))
 
-    @staticmethod
-    def change_in_progress_status(job_task_vo: JobTask):
-        _LOGGER.debug(
-            f"[change_in_progress_status] start job task: {job_task_vo.job_task_id}"
-        )
+    def update_sync_status(
+        self, job_task_vo: JobTask, created_count, page=None, worker_id=None
+    ):
+        update_params = {"created_count": job_task_vo.created_count + created_count}
 
-        return job_task_vo.update(
-            {"status": "IN_PROGRESS", "started_at": datetime.utcnow()}
-        )
+        if page is not None:
+            # pages up to this one are committed, so a retried task resumes after it
+            update_params["checkpoint"] = {
+                "page": page,
+                "created_count": update_params["created_count"],
+            }
 
-    def update_sync_status(self, job_task_vo: JobTask, created_count):
-        job_task_vo = job_task_vo.update(
-            {"created_count": job_task_vo.created_count + created_count}
-        )
+        if worker_id:
+            job_task_id = job_task_vo.job_task_id
+            now = datetime.utcnow()
+            job_task_vo = self.job_task_model.objects(
+                job_task_id=job_task_id, worker_id=worker_id
+            ).modify(
+                new=True,
+                set__heartbeat_at=now,
+                set__updated_at=now,
+                **{f"set__{key}": value for key, value in update_params.items()},
+            )
+
+            if job_task_vo is None:
+                raise ERROR_JOB_TASK_CLAIM_LOST(job_task_id=job_task_id)
+        else:
+            job_task_vo = job_task_vo.update(update_params)
 
         job_vo = self.job_mgr.get_job(job_task_vo.job_id, job_task_vo.domain_id)
         self.job_mgr.update_job_by_vo({}, job_vo)
@@ -130,6 +403,25 @@ class JobTaskManager(BaseManager):
         job_vo = self.job_mgr.get_job(job_task_vo.job_id, job_task_vo.domain_id)
         self.job_mgr.decrease_remained_tasks(job_vo)
 
+    def cancel_pending_job_task(self, job_task_vo: JobTask) -> bool:
+        # a duplicate message of a task which has already run must not cancel it
+        canceled_job_task_vo = self.job_task_model.objects(
+            job_task_id=job_task_vo.job_task_id, status="PENDING", worker_id=None
+        ).modify(
+            new=True, set__status="CANCELED", set__finished_at=datetime.utcnow()
+        )
+
+        if canceled_job_task_vo is None:
+            return False
+
+        _LOGGER.error(
+            f"[cancel_pending_job_task], job task canceled ({job_task_vo.job_task_id})"
+        )
+
+        job_vo = self.job_mgr.get_job(job_task_vo.job_id, job_task_vo.domain_id)
+        self.job_mgr.decrease_remained_tasks(job_vo)
+        return True
+
     def change_error_status(self, job_task_vo: JobTask, e, secret_type: str) -> None:
         if not isinstance(e, ERROR_BASE):
             e = ERROR_UNKNOWN(message=str(e))
@@ -153,3 +445,39 @@ class JobTaskManager(BaseManager):
 
         if secret_type != "USE_SERVICE_ACCOUNT_SECRET":
             self.job_mgr.change_error_status(job_vo, ERROR_JOB_TASK())
+
+    def _count_running_job_tasks(self) -> dict:
+        running_counts = {}
+        for job_task_vo in list(
+            self.job_task_model.filter(status="IN_PROGRESS").only("domain_id")
+        ) + list(
+            self.job_task_model.filter(
+                status="PENDING", dispatched_at__ne=None
+            ).only("domain_id")
+        ):
+            domain_id = job_task_vo.domain_id
+            running_counts[domain_id] = running_counts.get(domain_id, 0) + 1
+
+        return running_counts
+
+    def _get_next_job_task(self, domain_id: str) -> Union[JobTask, None]:
+        return (
+            self.job_task_model.filter(
+                domain_id=domain_id, status="PENDING", dispatched_at=None
+            )
+            .order_by("-priority", "created_at")
+            .first()
+        )
+
+    def _claim_job_task(self, job_task_vo: JobTask) -> bool:
+        # another worker may dispatch the same task at the same time
+        claimed_vo = self.job_task_model.objects(
+            job_task_id=job_task_vo.job_task_id,
+            status="PENDING",
+            dispatched_at=None,
+        ).modify(set__dispatched_at=datetime.utcnow())
+
+        return claimed_vo is not None
+
+    def _get_domain_weight(self, domain_id: str) -> float:
+        return max(float(self.domain_weights.get(domain_id, 1)), 0.1)
@@ -1,6 +1,6 @@
 import logging
 
-from spaceone.core import config
+from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 
@@ -29,3 +29,24 @@ class PluginManager(BaseManager):
         )
 
         return response["endpoint"], response.get("updated_version")
+
+    @cache.cacheable(
+        key="cost-analysis:plugin-endpoint:{domain_id}:{plugin_id}:{version}:{upgrade_mode}",
+        expire=300,
+    )
+    def get_plugin_endpoint_with_cache(
+        self, plugin_id: str, version: str, upgrade_mode: str, domain_id: str
+    ) -> dict:
+        endpoint, updated_version = self.get_plugin_endpoint(
+            {"plugin_id": plugin_id, "version": version, "upgrade_mode": upgrade_mode},
+            domain_id,
+        )
+        return {"endpoint": endpoint, "updated_version": updated_version}
+
+    @staticmethod
+    def delete_plugin_endpoint_cache(
+        plugin_id: str, version: str, upgrade_mode: str, domain_id: str
+    ) -> None:
+        cache.delete_pattern(
+            f"cost-analysis:plugin-endpoint:{domain_id}:{plugin_id}:{version}:{upgrade_mode}"
+        )
@@ -108,6 +108,39 @@ class ReportAdjustmentManager(BaseManager):
         sorted_adjustments = sorted(adjustments, key=lambda x: x.get("order", 9999))
         return sorted_adjustments
 
+    def list_sorted_adjustments_by_policies(
+        self, report_adjustment_policy_ids: list, domain_id: str
+    ) -> dict:
+        query = {
+            "filter": [
+                {
+                    "k": "report_adjustment_policy_id",
+                    "v": report_adjustment_policy_ids,
+                    "o": "in",
+                },
+                {"k": "domain_id", "v": domain_id, "o": "eq"},
+            ],
+            "order_by": ["order"],
+        }
+
+        adjustment_vos, _ = self.list_adjustments(query)
+
+        adjustments_map = {
+            policy_id: [] for policy_id in report_adjustment_policy_ids
+        }
+        for adjustment_vo in adjustment_vos:
+            adjustment = adjustment_vo.to_dict()
+            adjustments_map[adjustment["report_adjustment_policy_id"]].append(
+                adjustment
+            )
+
+        for policy_id, adjustments in adjustments_map.items():
+            adjustments_map[policy_id] = sorted(
+                adjustments, key=lambda x: x.get("order", 9999)
+            )
+
+        return adjustments_map
+
     def filter_adjustments(self, **conditions) -> QuerySet:
         return self.adjustment_model.objects.filter(**conditions)
 
@@ -1,4 +1,8 @@
+import copy
 import logging
+import threading
+import time
+from datetime import datetime, timedelta
 
 from spaceone.core import config
 from spaceone.core.error import ERROR_INTERNAL_API
@@ -9,6 +13,11 @@ from spaceone.core.auth.jwt.jwt_util import JWTUtil
 
 _LOGGER = logging.getLogger(__name__)
 
+# secrets of running jobs are kept only in the memory of this process
+_JOB_SECRET_CACHE = {}
+_JOB_SECRET_CACHE_LOCK = threading.Lock()
+_JOB_SECRET_CACHE_SWEEPER = None
+
 
 class SecretManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -96,3 +105,153 @@ class SecretManager(BaseManager):
             token=system_token,
         )
         return response["data"]
+
+    def get_secret_data_with_job_cache(
+        self, secret_id: str, domain_id: str, job_id: str
+    ) -> dict:
+        secret_data = self._get_job_secret_cache(job_id, "secret_data", secret_id)
+
+        if secret_data is None:
+            secret_data = self.get_secret_data(secret_id, domain_id)
+            self._set_job_secret_cache(job_id, "secret_data", {secret_id: secret_data})
+
+        return secret_data
+
+    def list_secret_infos_with_job_cache(
+        self, secret_ids: list, domain_id: str, job_id: str
+    ) -> dict:
+        """Get service_account_id and project_id of all secrets in a job with one query"""
+
+        secret_infos = {}
+        for secret_id in secret_ids:
+            secret_info = self._get_job_secret_cache(job_id, "secret_info", secret_id)
+            if secret_info is None:
+                break
+
+            secret_infos[secret_id] = secret_info
+        else:
+            return secret_infos
+
+        query = {
+            "filter": [{"k": "secret_id", "v": secret_ids, "o": "in"}],
+            "only": ["secret_id", "service_account_id", "project_id"],
+        }
+        response = self.list_secrets(query, domain_id)
+
+        secret_infos = {secret_id: {} for secret_id in secret_ids}
+        for secret_info in response.get("results", []):
+            secret_infos[secret_info["secret_id"]] = {
+                "service_account_id": secret_info.get("service_account_id"),
+                "project_id": secret_info.get("project_id"),
+            }
+
+        self._set_job_secret_cache(job_id, "secret_info", secret_infos)
+
+        return secret_infos
+
+    @staticmethod
+    def delete_job_secret_cache(job_id: str) -> None:
+        with _JOB_SECRET_CACHE_LOCK:
+            job_secret_cache = _JOB_SECRET_CACHE.pop(job_id, None)
+
+        if job_secret_cache:
+            _LOGGER.debug(f"[delete_job_secret_cache] delete secret cache: {job_id}")
+            SecretManager._zero_job_secret_cache(job_secret_cache)
+
+    @staticmethod
+    def delete_expired_job_secret_caches() -> None:
+        with _JOB_SECRET_CACHE_LOCK:
+            expired_job_secret_caches = SecretManager._pop_expired_job_secret_caches()
+
+        for expired_job_secret_cache in expired_job_secret_caches:
+            SecretManager._zero_job_secret_cache(expired_job_secret_cache)
+
+    @staticmethod
+    def list_cached_job_ids() -> list:
+        with _JOB_SECRET_CACHE_LOCK:
+            return list(_JOB_SECRET_CACHE.keys())
+
+    @staticmethod
+    def _get_job_secret_cache(job_id: str, cache_type: str, secret_id: str):
+        with _JOB_SECRET_CACHE_LOCK:
+            job_secret_cache = _JOB_SECRET_CACHE.get(job_id)
+            if job_secret_cache is None:
+                return None
+
+            value = job_secret_cache[cache_type].get(secret_id)
+            if value is not None:
+                SecretManager._refresh_job_secret_cache(job_secret_cache)
+
+            # callers get a copy, since the cached values are cleared in place
+            return copy.deepcopy(value)
+
+    @staticmethod
+    def _set_job_secret_cache(job_id: str, cache_type: str, values: dict) -> None:
+        with _JOB_SECRET_CACHE_LOCK:
+            job_secret_cache = _JOB_SECRET_CACHE.setdefault(
+                job_id, {"secret_data": {}, "secret_info": {}}
+            )
+            job_secret_cache[cache_type].update(copy.deepcopy(values))
+            SecretManager._refresh_job_secret_cache(job_secret_cache)
+
+            SecretManager._start_job_secret_cache_sweeper()
+
+    @staticmethod
+    def _refresh_job_secret_cache(job_secret_cache: dict) -> None:
+        # workers which never close the job drop its secrets after the ttl,
+        # counted from the last access so long running jobs keep them
+        cache_ttl = config.get_global("JOB_SECRET_CACHE_TTL", 600)
+        job_secret_cache["expired_at"] = datetime.utcnow() + timedelta(
+            seconds=cache_ttl
+        )
+
+    @staticmethod
+    def _start_job_secret_cache_sweeper() -> None:
+        # workers which never close the job drop its secrets even when they are idle
+        global _JOB_SECRET_CACHE_SWEEPER
+
+        if _JOB_SECRET_CACHE_SWEEPER and _JOB_SECRET_CACHE_SWEEPER.is_alive():
+            return
+
+        sweep_interval = config.get_global("JOB_SECRET_CACHE_SWEEP_INTERVAL", 60)
+
+        def _sweep():
+            global _JOB_SECRET_CACHE_SWEEPER
+
+            while True:
+                time.sleep(sweep_interval)
+                SecretManager.delete_expired_job_secret_caches()
+
+                with _JOB_SECRET_CACHE_LOCK:
+                    if not _JOB_SECRET_CACHE:
+                        _JOB_SECRET_CACHE_SWEEPER = None
+                        return
+
+        _JOB_SECRET_CACHE_SWEEPER = threading.Thread(target=_sweep, daemon=True)
+        _JOB_SECRET_CACHE_SWEEPER.start()
+
+    @staticmethod
+    def _pop_expired_job_secret_caches() -> list:
+        now = datetime.utcnow()
+        expired_job_ids = [
+            job_id
+            for job_id, job_secret_cache in _JOB_SECRET_CACHE.items()
+            if job_secret_cache["expired_at"] < now
+        ]
+
+        return [_JOB_SECRET_CACHE.pop(job_id) for job_id in expired_job_ids]
+
+    @staticmethod
+    def _zero_job_secret_cache(job_secret_cache: dict) -> None:
+        # clear every container in place, so no reference to the secret values remains
+        def _zero(value):
+            if isinstance(value, dict):
+                for item in value.values():
+                    _zero(item)
+                value.clear()
+            elif isinstance(value, list):
+                for item in value:
+                    _zero(item)
+                value.clear()
+
+        _zero(job_secret_cache)
@@ -64,6 +64,58 @@ class UnifiedCostJobManager(BaseManager):
             update_params["confirmed_at"] = datetime.utcnow()
         return unified_cost_job_vo.update(update_params)
 
+    @staticmethod
+    def update_generations_unified_cost_job(
+        unified_cost_job_vo: UnifiedCostJob,
+        generations: dict,
+        watermarks: dict,
+        exchange_date: str,
+        input_hash: str = None,
+    ):
+        return unified_cost_job_vo.update(
+            {
+                "generations": generations,
+                "watermarks": watermarks,
+                "exchange_date": exchange_date,
+                "input_hash": input_hash,
+            }
+        )
+
+    @staticmethod
+    def update_failed_workspaces_unified_cost_job(
+        unified_cost_job_vo: UnifiedCostJob, failed_workspaces: dict
+    ):
+        return unified_cost_job_vo.update(
+            {
+                "failed_workspaces": [
+                    {"workspace_id": workspace_id, "error_message": error_message}
+                    for workspace_id, error_message in failed_workspaces.items()
+                ]
+            }
+        )
+
+    def claim_unified_cost_job(
+        self,
+        unified_cost_job_vo: UnifiedCostJob,
+        expired_at: datetime,
+        force: bool = False,
+    ) -> bool:
+        conditions = {"_id": unified_cost_job_vo.id}
+
+        # incremental runs give way to a run of the month in progress until it expires
+        if not force:
+            conditions["running_at"] = {"$not": {"$gte": expired_at}}
+
+        result = self.unified_cost_job_model._get_collection().update_one(
+            conditions, {"$set": {"running_at": datetime.utcnow()}}
+        )
+        return result.matched_count > 0
+
+    def release_unified_cost_job(self, unified_cost_job_vo: UnifiedCostJob) -> None:
+        self.unified_cost_job_model.filter(
+            unified_cost_job_id=unified_cost_job_vo.unified_cost_job_id
+        ).update(running_at=None)
+
     def filter_unified_cost_jobs(self, **conditions):
         return self.unified_cost_job_model.filter(**conditions)
 
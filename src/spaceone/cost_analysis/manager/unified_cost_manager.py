@@ -2,6 +2,7 @@ import logging
 from datetime import datetime
 from typing import Tuple, Union
 
+import numpy as np
 from dateutil.relativedelta import relativedelta
 from mongoengine import QuerySet
 
@@ -12,7 +13,10 @@ from spaceone.core.manager import BaseManager
 from spaceone.cost_analysis.error import ERROR_INVALID_DATE_RANGE
 from spaceone.cost_analysis.manager import DataSourceAccountManager
 from spaceone.cost_analysis.manager.identity_manager import IdentityManager
-from spaceone.cost_analysis.model.unified_cost.database import UnifiedCost
+from spaceone.cost_analysis.model.unified_cost.database import (
+    UnifiedCost,
+    UnifiedCostJob,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +25,7 @@ class UnifiedCostManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.unified_cost_model = UnifiedCost
+        self.unified_cost_job_model = UnifiedCostJob
         self.ds_account_mgr = DataSourceAccountManager()
 
     def create_unified_cost(self, params: dict) -> UnifiedCost:
@@ -35,10 +40,70 @@ class UnifiedCostManager(BaseManager):
 
         return unified_cost_vo
 
+    def create_unified_costs(self, params_list: list) -> int:
+        def _rollback(unified_cost_ids: list):
+            _LOGGER.info(
+                f"[create_unified_costs._rollback] Delete unified_costs : {len(unified_cost_ids)}"
+            )
+            self.unified_cost_model.filter(unified_cost_id=unified_cost_ids).delete()
+
+        if not params_list:
+            return 0
+
+        created_at = datetime.utcnow()
+        unified_cost_fields = self.unified_cost_model._fields.keys()
+        unified_cost_vos = []
+
+        for params in params_list:
+            create_data = {
+                key: value
+                for key, value in params.items()
+                if key in unified_cost_fields
+            }
+            create_data["unified_cost_id"] = utils.generate_id("unified-cost")
+            create_data["created_at"] = created_at
+            unified_cost_vos.append(self.unified_cost_model(**create_data))
+
+        self.unified_cost_model.objects.insert(unified_cost_vos, load_bulk=False)
+        self.transaction.add_rollback(
+            _rollback, [vo.unified_cost_id for vo in unified_cost_vos]
+        )
+
+        return len(unified_cost_vos)
+
     @staticmethod
     def delete_unified_cost_by_vo(unified_cost_vo: UnifiedCost) -> None:
         unified_cost_vo.delete()
 
+    def delete_unified_costs_by_generation(
+        self, domain_id: str, billed_month: str, generation_ids: list
+    ) -> int:
+        return self.unified_cost_model.filter(
+            domain_id=domain_id,
+            billed_year=billed_month.split("-")[0],
+            billed_month=billed_month,
+            generation_id=generation_ids,
+        ).delete()
+
+    def delete_old_generation_unified_costs(
+        self,
+        domain_id: str,
+        billed_month: str,
+        generation_ids: list,
+        data_source_ids: list = None,
+    ) -> int:
+        conditions = {
+            "domain_id": domain_id,
+            "billed_year": billed_month.split("-")[0],
+            "billed_month": billed_month,
+        }
+
+        if data_source_ids is not None:
+            conditions["data_source_id"] = data_source_ids
+
+        unified_cost_vos = self.unified_cost_model.filter(**conditions)
+        return unified_cost_vos.filter(generation_id__nin=generation_ids).delete()
+
     def get_unified_cost(
         self,
         unified_cost_id: str,
@@ -49,6 +114,7 @@ class UnifiedCostManager(BaseManager):
         conditions = {
             "unified_cost_id": unified_cost_id,
             "domain_id": domain_id,
+            "generation_id": self.list_active_generation_ids(domain_id),
         }
 
         if workspace_id:
@@ -62,7 +128,8 @@ class UnifiedCostManager(BaseManager):
     def filter_unified_costs(self, **conditions) -> QuerySet:
         return self.unified_cost_model.filter(**conditions)
 
-    def list_unified_costs(self, query: dict) -> Tuple[QuerySet, int]:
+    def list_unified_costs(self, query: dict, domain_id: str) -> Tuple[QuerySet, int]:
+        query = self._add_active_generation_filter(query, domain_id)
         return self.unified_cost_model.query(**query)
 
     def analyze_unified_costs(
@@ -73,6 +140,7 @@ class UnifiedCostManager(BaseManager):
         query["date_field_format"] = "%Y-%m"
 
         query = self._change_filter_project_group_id(query, domain_id)
+        query = self._add_active_generation_filter(query, domain_id)
 
         _LOGGER.debug(f"[analyze_unified_costs] query: {query}")
 
@@ -86,6 +154,7 @@ class UnifiedCostManager(BaseManager):
         query["date_field_format"] = "%Y"
 
         query = self._change_filter_project_group_id(query, domain_id)
+        query = self._add_active_generation_filter(query, domain_id)
 
         _LOGGER.debug(f"[analyze_unified_costs] query: {query}")
 
@@ -188,9 +257,28 @@ class UnifiedCostManager(BaseManager):
         response = self.analyze_unified_costs(query, domain_id)
         return response.get("results", [])
 
-    def stat_unified_costs(self, query) -> dict:
+    def stat_unified_costs(self, query: dict, domain_id: str) -> dict:
+        query = self._add_active_generation_filter(query, domain_id)
         return self.unified_cost_model.stat(**query)
 
+    @cache.cacheable(
+        key="cost-analysis:unified-cost-generations:{domain_id}", expire=3600
+    )
+    def list_active_generation_ids(self, domain_id: str) -> list:
+        generation_ids = []
+        for unified_cost_job_vo in self.unified_cost_job_model.filter(
+            domain_id=domain_id
+        ).only("generations"):
+            generation_ids.extend((unified_cost_job_vo.generations or {}).values())
+
+        # unified costs created before generations were introduced have no generation_id
+        generation_ids.append(None)
+        return generation_ids
+
+    @staticmethod
+    def remove_active_generation_cache(domain_id: str):
+        cache.delete(f"cost-analysis:unified-cost-generations:{domain_id}")
+
     @staticmethod
     def remove_stat_cache(domain_id: str):
         cache.delete_pattern(f"cost-analysis:analyze-unified-costs:*:{domain_id}:*")
@@ -235,6 +323,42 @@ class UnifiedCostManager(BaseManager):
 
         return cost_info
 
+    @staticmethod
+    def make_exchange_rate_matrix(currency_map: dict) -> Tuple[list, np.ndarray]:
+        currencies = list(currency_map.keys())
+        rate_matrix = np.array(
+            [
+                [
+                    currency_map[from_currency][f"{from_currency}/{to_currency}"]
+                    for to_currency in currencies
+                ]
+                for from_currency in currencies
+            ],
+            dtype=np.float64,
+        )
+        return currencies, rate_matrix
+
+    @staticmethod
+    def get_exchange_currencies(
+        costs: list, origin_currencies: list, exchange_rate_matrix: Tuple[list, np.ndarray]
+    ) -> list:
+        currencies, rate_matrix = exchange_rate_matrix
+        if not costs:
+            return []
+
+        currency_index = {currency: idx for idx, currency in enumerate(currencies)}
+        origin_indices = np.fromiter(
+            (currency_index[currency] for currency in origin_currencies),
+            dtype=np.intp,
+            count=len(origin_currencies),
+        )
+        cost_array = np.asarray(costs, dtype=np.float64)
+
+        # (rows x currencies) = origin rate rows scaled by each row's cost
+        converted_costs = rate_matrix[origin_indices] * cost_array[:, np.newaxis]
+
+        return [dict(zip(currencies, values)) for values in converted_costs.tolist()]
+
     def _check_unified_cost_data_range(self, query: dict):
         start_str = query.get("start")
         end_str = query.get("end")
@@ -360,3 +484,12 @@ class UnifiedCostManager(BaseManager):
 
         query["filter"] = change_filter
         return query
+
+    def _add_active_generation_filter(self, query: dict, domain_id: str) -> dict:
+        # rows of staging or replaced generations must not be visible to readers
+        generation_ids = self.list_active_generation_ids(domain_id)
+
+        query["filter"] = query.get("filter", []) + [
+            {"k": "generation_id", "v": generation_ids, "o": "in"}
+        ]
+        return query
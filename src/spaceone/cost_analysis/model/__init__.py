@@ -6,7 +6,7 @@ from spaceone.cost_analysis.model.budget.database import Budget
 from spaceone.cost_analysis.model.budget_usage.database import BudgetUsage
 from spaceone.cost_analysis.model.cost_query_set_model import CostQuerySet
 from spaceone.cost_analysis.model.job_model import Job
-from spaceone.cost_analysis.model.job_task_model import JobTask
+from spaceone.cost_analysis.model.job_task_model import JobTask, JobTaskDispatchLock
 from spaceone.cost_analysis.model.cost_report_config.database import CostReportConfig
 from spaceone.cost_analysis.model.cost_report_data.database import CostReportData
 from spaceone.cost_analysis.model.cost_report.database import CostReport
@@ -18,3 +18,6 @@ from spaceone.cost_analysis.model.unified_cost.database import (
     UnifiedCost,
     UnifiedCostJob,
 )
+from spaceone.cost_analysis.model.exchange_rate.database import ExchangeRate
+from spaceone.cost_analysis.model.email_delivery.database import EmailDelivery
+from spaceone.cost_analysis.model.cost_archive.database import CostArchive
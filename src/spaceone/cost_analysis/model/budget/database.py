@@ -12,6 +12,7 @@ class Plan(EmbeddedDocument):
     threshold = FloatField(required=True)
     unit = StringField(max_length=20, required=True, choices=["PERCENT", "ACTUAL_COST"])
     notified = BooleanField(default=False)
+    notifying_at = DateTimeField(default=None, null=True)
 
     def to_dict(self):
         return dict(self.to_mongo())
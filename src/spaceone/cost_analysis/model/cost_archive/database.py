@@ -0,0 +1,25 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class CostArchive(MongoModel):
+    billed_month = StringField(max_length=7, required=True)
+    cost_count = IntField(default=0)
+    monthly_cost_count = IntField(default=0)
+    data_source_id = StringField(max_length=40, required=True)
+    domain_id = StringField(max_length=40, required=True)
+    archived_at = DateTimeField(auto_now=True)
+
+    meta = {
+        "updatable_fields": ["cost_count", "monthly_cost_count", "archived_at"],
+        "minimal_fields": ["billed_month", "data_source_id", "domain_id"],
+        "ordering": ["billed_month"],
+        "indexes": [
+            {
+                "fields": ["domain_id", "data_source_id", "billed_month"],
+                "name": "COMPOUND_INDEX_FOR_ARCHIVED_MONTH",
+                "unique": True,
+            },
+        ],
+    }
@@ -22,6 +22,7 @@ class Cost(MongoModel):
     data_source_id = StringField(max_length=40)
     job_id = StringField(max_length=40, default=None, null=True)
     job_task_id = StringField(max_length=40, default=None, null=True)
+    job_task_page = IntField(default=None, null=True)
     workspace_id = StringField(max_length=40, default=None, null=True)
     domain_id = StringField(max_length=40)
     billed_year = StringField(max_length=4, required=True)
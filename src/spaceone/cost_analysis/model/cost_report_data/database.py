@@ -11,6 +11,7 @@ class CostReportData(MongoModel):
     report_year = StringField(max_length=20)
     report_month = StringField(max_length=40)
     is_confirmed = BooleanField(default=False)
+    confirm_id = StringField(max_length=40, default=None, null=True)
     is_adjusted = BooleanField(default=False)
     provider = StringField(max_length=40)
     product = StringField(max_length=255)
@@ -35,6 +36,7 @@ class CostReportData(MongoModel):
     meta = {
         "updatable_fields": [
             "is_confirmed",
+            "confirm_id",
         ],
         "minimal_fields": [
             "cost_report_config_id",
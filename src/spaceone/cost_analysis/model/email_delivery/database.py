@@ -0,0 +1,52 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class EmailDelivery(MongoModel):
+    email_delivery_id = StringField(max_length=40, generate_id="email", unique=True)
+    to = StringField(max_length=255, required=True)
+    subject = StringField(required=True)
+    # the body is rendered on delivery, so links with tokens are never stored
+    template_name = StringField(max_length=255, default=None, null=True)
+    template_context = DictField(default={})
+    recipient_info = DictField(default={})
+    language = StringField(max_length=7, default=None, null=True)
+    contents = StringField(default=None, null=True)
+    status = StringField(
+        max_length=20, default="PENDING", choices=["PENDING", "SENT", "FAILED"]
+    )
+    attempts = IntField(default=0)
+    error_message = StringField(default=None, null=True)
+    resource_type = StringField(max_length=40, default=None, null=True)
+    resource_id = StringField(max_length=40, default=None, null=True)
+    resource_key = StringField(max_length=255, default=None, null=True)
+    domain_id = StringField(max_length=40, default=None, null=True)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+    next_attempt_at = DateTimeField(default=None, null=True)
+    sent_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [
+            "contents",
+            "status",
+            "attempts",
+            "error_message",
+            "updated_at",
+            "next_attempt_at",
+            "sent_at",
+        ],
+        "minimal_fields": ["email_delivery_id", "to", "status", "attempts"],
+        "ordering": ["-created_at"],
+        "indexes": [
+            "status",
+            "next_attempt_at",
+            "resource_id",
+            "domain_id",
+            {
+                "fields": ["created_at"],
+                "expireAfterSeconds": 2592000,
+            },
+        ],
+    }
@@ -0,0 +1,25 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class ExchangeRate(MongoModel):
+    pair = StringField(max_length=20, required=True, unique_with="date")
+    date = StringField(max_length=20, required=True)
+    rate = FloatField(required=True)
+    source = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+
+    meta = {
+        "updatable_fields": ["rate", "source", "updated_at"],
+        "minimal_fields": ["pair", "date", "rate"],
+        "ordering": ["-date"],
+        "indexes": [
+            {
+                "fields": ["pair", "-date"],
+                "name": "COMPOUND_INDEX_FOR_EXCHANGE_RATE",
+            },
+            "date",
+        ],
+    }
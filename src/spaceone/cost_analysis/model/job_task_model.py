@@ -14,6 +14,11 @@ class JobTask(MongoModel):
     options = DictField()
     changed = EmbeddedDocumentField(Changed)
     created_count = IntField(default=0)
+    checkpoint = DictField(default=None, null=True)
+    retry_count = IntField(default=0)
+    secret_id = StringField(max_length=40, default=None, null=True)
+    priority = IntField(default=0)
+    worker_id = StringField(max_length=40, default=None, null=True)
     error_code = StringField(max_length=254, default=None, null=True)
     error_message = StringField(default=None, null=True)
     resource_group = StringField(max_length=40, choices=["DOMAIN", "WORKSPACE"])
@@ -22,7 +27,9 @@ class JobTask(MongoModel):
     workspace_id = StringField(max_length=40, default=None, null=True)
     domain_id = StringField(max_length=40, required=True)
     created_at = DateTimeField(auto_now_add=True)
+    dispatched_at = DateTimeField(default=None, null=True)
     started_at = DateTimeField(default=None, null=True)
+    heartbeat_at = DateTimeField(default=None, null=True)
     updated_at = DateTimeField(auto_now=True)
     finished_at = DateTimeField(default=None, null=True)
 
@@ -30,6 +37,9 @@ class JobTask(MongoModel):
         "updatable_fields": [
             "status",
             "created_count",
+            "checkpoint",
+            "retry_count",
+            "dispatched_at",
             "error_code",
             "error_message",
             "started_at",
@@ -55,5 +65,27 @@ class JobTask(MongoModel):
             "workspace_id",
             "domain_id",
             "created_at",
+            {
+                "fields": [
+                    "status",
+                    "dispatched_at",
+                    "domain_id",
+                    "-priority",
+                    "created_at",
+                ],
+                "name": "COMPOUND_INDEX_FOR_DISPATCH",
+            },
         ],
     }
+
+
+class JobTaskDispatchLock(MongoModel):
+    lock_id = StringField(max_length=40, unique=True)
+    owner = StringField(max_length=40, required=True)
+    is_requested = BooleanField(default=False)
+    expired_at = DateTimeField(required=True)
+
+    meta = {
+        "updatable_fields": ["owner", "is_requested", "expired_at"],
+        "minimal_fields": ["lock_id", "owner", "expired_at"],
+    }
@@ -31,6 +31,7 @@ class UnifiedCost(MongoModel):
     project_id = StringField(max_length=40, default=None, null=True)
     workspace_id = StringField(max_length=40, default=None, null=True)
     domain_id = StringField(max_length=40)
+    generation_id = StringField(max_length=40, default=None, null=True)
     created_at = DateTimeField(auto_now_add=True)
 
     meta = {
@@ -73,23 +74,50 @@ class UnifiedCost(MongoModel):
                 ],
                 "name": "COMPOUND_INDEX_FOR_DELETE_UNIFIED_COST",
             },
+            {
+                "fields": [
+                    "domain_id",
+                    "billed_year",
+                    "billed_month",
+                    "generation_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_UNIFIED_COST_GENERATION",
+            },
         ],
     }
 
 
+class FailedWorkspace(EmbeddedDocument):
+    workspace_id = StringField(max_length=40, default=None, null=True)
+    error_message = StringField(default=None, null=True)
+
+
 class UnifiedCostJob(MongoModel):
     unified_cost_job_id = StringField(max_length=40, generate_id="ucj", unique=True)
     is_confirmed = BooleanField(null=True, default=None)
     billed_month = StringField(max_length=40, unique_with="domain_id")
+    generations = DictField(default={})
+    watermarks = DictField(default={})
+    exchange_date = StringField(max_length=40, default=None, null=True)
+    input_hash = StringField(max_length=64, default=None, null=True)
+    failed_workspaces = ListField(EmbeddedDocumentField(FailedWorkspace), default=[])
+    running_at = DateTimeField(default=None, null=True)
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
     confirmed_at = DateTimeField(null=True)
 
-    eta = {
+    meta = {
         "updatable_fields": [
             "confirmed_at",
             "is_confirmed",
+            "generations",
+            "watermarks",
+            "exchange_date",
+            "input_hash",
+            "failed_workspaces",
+            "running_at",
+            "updated_at",
         ],
         "minimal_fields": [],
         "ordering": ["-created_at"],
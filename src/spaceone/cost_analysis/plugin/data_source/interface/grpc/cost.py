@@ -2,6 +2,8 @@ from spaceone.core.pygrpc import BaseAPI
 from spaceone.api.cost_analysis.plugin import cost_pb2, cost_pb2_grpc
 from spaceone.cost_analysis.plugin.data_source.service.cost_service import CostService
 
+_STRUCT_FIELDS = ["tags", "additional_info", "data"]
+
 
 class Cost(BaseAPI, cost_pb2_grpc.CostServicer):
     pb2 = cost_pb2
@@ -17,4 +19,28 @@ class Cost(BaseAPI, cost_pb2_grpc.CostServicer):
         params, metadata = self.parse_request(request, context)
         cost_svc = CostService(metadata)
         for response in cost_svc.get_data(params):
-            yield self.dict_to_message(response)
+            if "columns" in response:
+                yield self._make_costs_info(response["columns"])
+            else:
+                yield self.dict_to_message(response)
+
+    def _make_costs_info(self, columns: dict):
+        # rows are added to the message directly instead of being parsed from dicts
+        costs_info = self.pb2.CostsInfo()
+        names = list(columns.keys())
+
+        for values in zip(*columns.values()):
+            cost_info = costs_info.results.add()
+            for name in _STRUCT_FIELDS:
+                # the dict fields default to {} as in CostsResponse
+                getattr(cost_info, name).SetInParent()
+
+            for name, value in zip(names, values):
+                if value is None:
+                    continue
+                elif name in _STRUCT_FIELDS:
+                    getattr(cost_info, name).update(value)
+                else:
+                    setattr(cost_info, name, value)
+
+        return costs_info
@@ -0,0 +1,73 @@
+import itertools
+from typing import Any, Callable, Generator, Iterable, Sequence
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+__all__ = ["get_checkpoint_page", "resume_pages", "skip_pages"]
+
+
+def get_checkpoint_page(task_options: dict) -> int:
+    """Get the number of responses committed before a task is retried
+
+    Args:
+        task_options (dict): task_options of Cost.get_data
+
+    Returns:
+        int: 0 if the task runs from the beginning
+    """
+
+    checkpoint = (task_options or {}).get("checkpoint") or {}
+    page = checkpoint.get("page", 0)
+
+    # numbers in task_options are received as floats, since they are sent as a Struct
+    if isinstance(page, float) and page.is_integer():
+        page = int(page)
+
+    if isinstance(page, bool) or not isinstance(page, int) or page < 0:
+        raise ERROR_INVALID_PARAMETER(
+            key="task_options.checkpoint.page", reason="Must be a non-negative integer."
+        )
+
+    return page
+
+
+def skip_pages(
+    responses: Iterable[dict], task_options: dict
+) -> Generator[dict, None, None]:
+    """Skip responses already committed by a previous run of the task
+
+    Responses must be made in the same order on every run. Skipped responses are
+    still made, so use resume_pages when making a response fetches its data.
+
+    Args:
+        responses (Iterable[dict]): responses of Cost.get_data
+        task_options (dict): task_options of Cost.get_data
+
+    Returns:
+        Generator[dict, None, None]
+    """
+
+    yield from itertools.islice(responses, get_checkpoint_page(task_options), None)
+
+
+def resume_pages(
+    page_keys: Sequence[Any],
+    fetch_page: Callable[[Any], dict],
+    task_options: dict,
+) -> Generator[dict, None, None]:
+    """Fetch only the pages not committed by a previous run of the task
+
+    A task is split into page keys (dates, files, API page tokens ...) which are listed
+    in the same order on every run, and each key is fetched as exactly one response.
+
+    Args:
+        page_keys (Sequence[Any]): keys of every page of the task
+        fetch_page (Callable): function to fetch the response of a page key
+        task_options (dict): task_options of Cost.get_data
+
+    Returns:
+        Generator[dict, None, None]
+    """
+
+    for page_key in page_keys[get_checkpoint_page(task_options) :]:
+        yield fetch_page(page_key)
@@ -0,0 +1,210 @@
+import csv
+import gzip
+import io
+import json
+from typing import Callable, Generator, IO, Iterable, Union
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+__all__ = [
+    "make_chunks",
+    "make_chunks_by_size",
+    "read_csv",
+    "read_parquet",
+    "make_cost_responses",
+    "make_cost_batch_responses",
+]
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024  # gRPC default message size is 4MB
+
+
+def make_chunks(
+    items: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[list, None, None]:
+    """Split items into lists of chunk_size without loading all items
+
+    Args:
+        items (Iterable): rows of any iterable (list, generator, file reader ...)
+        chunk_size (int): max number of rows in a chunk
+
+    Returns:
+        Generator[list, None, None]
+    """
+
+    _check_positive("chunk_size", chunk_size)
+
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def make_chunks_by_size(
+    items: Iterable,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    chunk_size: int = None,
+    get_size: Callable[[dict], int] = None,
+) -> Generator[list, None, None]:
+    """Split items into lists whose estimated size is under max_bytes
+
+    Args:
+        items (Iterable): rows of any iterable
+        max_bytes (int): max estimated bytes of a chunk (JSON length of rows by default)
+        chunk_size (int): max number of rows in a chunk (optional)
+        get_size (Callable): function to estimate bytes of a row (optional)
+
+    Returns:
+        Generator[list, None, None]
+    """
+
+    _check_positive("max_bytes", max_bytes)
+    if chunk_size is not None:
+        _check_positive("chunk_size", chunk_size)
+
+    get_size = get_size or _get_json_size
+
+    chunk = []
+    chunk_bytes = 0
+    for item in items:
+        item_bytes = get_size(item)
+
+        # a row larger than max_bytes is still emitted alone
+        if chunk and chunk_bytes + item_bytes > max_bytes:
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+
+        chunk.append(item)
+        chunk_bytes += item_bytes
+
+        if chunk_size and len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+
+    if chunk:
+        yield chunk
+
+
+def read_csv(
+    file: Union[str, IO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+    **reader_options,
+) -> Generator[list, None, None]:
+    """Read rows of a CSV billing export as chunks of dicts
+
+    Args:
+        file (str | IO): file path (.gz is decompressed), text or binary file object
+        chunk_size (int): max number of rows in a chunk
+        encoding (str): encoding of the file
+        **reader_options: options of csv.DictReader (delimiter, fieldnames ...)
+
+    Returns:
+        Generator[list, None, None]
+    """
+
+    if isinstance(file, str):
+        open_func = gzip.open if file.endswith(".gz") else open
+        with open_func(file, "rt", encoding=encoding, newline="") as csv_file:
+            yield from make_chunks(csv.DictReader(csv_file, **reader_options), chunk_size)
+
+    else:
+        if isinstance(file.read(0), bytes):
+            file = io.TextIOWrapper(file, encoding=encoding, newline="")
+
+        yield from make_chunks(csv.DictReader(file, **reader_options), chunk_size)
+
+
+def read_parquet(
+    file: Union[str, IO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    columns: list = None,
+) -> Generator[list, None, None]:
+    """Read rows of a Parquet billing export as chunks of dicts (requires pyarrow)
+
+    Args:
+        file (str | IO): file path or binary file object
+        chunk_size (int): max number of rows in a chunk
+        columns (list): columns to read (optional)
+
+    Returns:
+        Generator[list, None, None]
+    """
+
+    _check_positive("chunk_size", chunk_size)
+
+    # pyarrow is installed by plugins which read Parquet exports
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(file)
+    for record_batch in parquet_file.iter_batches(
+        batch_size=chunk_size, columns=columns
+    ):
+        yield record_batch.to_pylist()
+
+
+def make_cost_responses(
+    costs: Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_bytes: int = None,
+) -> Generator[dict, None, None]:
+    """Make responses of Cost.get_data from cost rows
+
+    Args:
+        costs (Iterable[dict]): cost rows
+        chunk_size (int): max number of rows in a response
+        max_bytes (int): max estimated bytes of a response (optional)
+
+    Returns:
+        Generator[CostsResponse, None, None]
+    """
+
+    if max_bytes:
+        chunks = make_chunks_by_size(costs, max_bytes, chunk_size)
+    else:
+        chunks = make_chunks(costs, chunk_size)
+
+    for chunk in chunks:
+        yield {"results": chunk}
+
+
+def make_cost_batch_responses(
+    costs: Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_bytes: int = None,
+) -> Generator[dict, None, None]:
+    """Make column-oriented responses of Cost.get_data from cost rows
+
+    Args:
+        costs (Iterable[dict]): cost rows
+        chunk_size (int): max number of rows in a response
+        max_bytes (int): max estimated bytes of a response (optional)
+
+    Returns:
+        Generator[CostsBatchResponse, None, None]
+    """
+
+    for response in make_cost_responses(costs, chunk_size, max_bytes):
+        rows = response["results"]
+
+        names = []
+        for row in rows:
+            names.extend(name for name in row.keys() if name not in names)
+
+        yield {"columns": {name: [row.get(name) for row in rows] for name in names}}
+
+
+def _get_json_size(item) -> int:
+    return len(json.dumps(item, separators=(",", ":"), default=str))
+
+
+def _check_positive(key: str, value: int) -> None:
+    if not isinstance(value, int) or value <= 0:
+        raise ERROR_INVALID_PARAMETER(key=key, reason="Must be a positive integer.")
@@ -13,6 +13,7 @@ __all__ = [
     "TasksResponse",
     "CostGetDataRequest",
     "CostsResponse",
+    "CostsBatchResponse",
     "CostGetLinkedAccountsRequest",
     "AccountsResponse",
 ]
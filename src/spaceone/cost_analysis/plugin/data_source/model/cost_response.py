@@ -1,7 +1,7 @@
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic import BaseModel
 
-__all__ = ["AccountsResponse", "CostsResponse"]
+__all__ = ["AccountsResponse", "CostsResponse", "CostsBatchResponse"]
 
 
 class Account(BaseModel):
@@ -30,3 +30,8 @@ class AccountsResponse(BaseModel):
 
 class CostsResponse(BaseModel):
     results: List[Cost]
+
+
+class CostsBatchResponse(BaseModel):
+    # column name -> values of every row, in the fields of Cost
+    columns: Dict[str, list]
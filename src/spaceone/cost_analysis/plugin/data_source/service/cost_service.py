@@ -1,16 +1,34 @@
 import logging
 from typing import Generator, Union
+from spaceone.core.error import ERROR_INVALID_PARAMETER
 from spaceone.core.service import BaseService, transaction
 from spaceone.core.service.utils import convert_model
 from spaceone.cost_analysis.plugin.data_source.model import (
     CostGetDataRequest,
     CostsResponse,
+    CostsBatchResponse,
     CostGetLinkedAccountsRequest,
     AccountsResponse,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_COST_FIELDS = {
+    "cost",
+    "usage_quantity",
+    "usage_unit",
+    "provider",
+    "region_code",
+    "product",
+    "usage_type",
+    "resource",
+    "tags",
+    "additional_info",
+    "data",
+    "billed_date",
+}
+_REQUIRED_COST_FIELDS = {"cost", "billed_date"}
+
 
 class CostService(BaseService):
     resource = "Cost"
@@ -42,7 +60,7 @@ class CostService(BaseService):
     @convert_model
     def get_data(
         self, params: CostGetDataRequest
-    ) -> Generator[Union[CostsResponse, dict], None, None]:
+    ) -> Generator[Union[CostsResponse, CostsBatchResponse, dict], None, None]:
         """Get external cost data
 
         Args:
@@ -55,7 +73,7 @@ class CostService(BaseService):
             }
 
         Returns:
-            Generator[CostsResponse, None, None]
+            Generator[CostsResponse | CostsBatchResponse, None, None]
             {
                 'cost': 'float',
                 'usage_quantity': 'float',
@@ -70,9 +88,33 @@ class CostService(BaseService):
                 'data': 'dict'
                 'billed_date': 'str'
             }
+
+            A plugin may yield {'columns': {'cost': [...], 'billed_date': [...], ...}}
+            instead of {'results': [...]}, so rows are not validated one by one.
         """
 
         func = self.get_plugin_method("get_data")
         response_iterator = func(params.dict())
         for response in response_iterator:
-            yield CostsResponse(**response)
+            if "columns" in response:
+                self._check_cost_columns(response["columns"])
+                yield CostsBatchResponse(**response)
+            else:
+                yield CostsResponse(**response)
+
+    @staticmethod
+    def _check_cost_columns(columns: dict) -> None:
+        if missing_fields := _REQUIRED_COST_FIELDS - set(columns.keys()):
+            raise ERROR_INVALID_PARAMETER(
+                key="columns", reason=f"Required columns: {sorted(missing_fields)}"
+            )
+
+        if unknown_fields := set(columns.keys()) - _COST_FIELDS:
+            raise ERROR_INVALID_PARAMETER(
+                key="columns", reason=f"Unknown columns: {sorted(unknown_fields)}"
+            )
+
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ERROR_INVALID_PARAMETER(
+                key="columns", reason="All columns must have the same length."
+            )
@@ -18,6 +18,8 @@ def data_source_init(params: dict) -> dict:
         PluginResponse: {
             'metadata': 'dict'
         }
+
+        metadata.task_checkpoint (bool): a retried task is resumed after its committed responses
     """
     pass
 
@@ -116,5 +118,20 @@ def cost_get_data(params: dict) -> Generator[dict, None, None]:
             'data': 'dict'
             'billed_date': 'str'
         }
+        or CostsBatchResponse: {
+            'columns': {'cost': 'list', 'billed_date': 'list', ...}
+        }
+
+        Responses can be made from a generator of cost rows with bounded memory:
+            yield from make_cost_responses(costs, chunk_size=1000)
+            (spaceone.cost_analysis.plugin.data_source.lib.chunk)
+
+        With metadata.task_checkpoint, task_options.checkpoint.page is the number of
+        responses already committed. The plugin must seek to that page instead of
+        fetching the committed pages again, e.g. with one response per page key:
+            yield from resume_pages(dates, fetch_costs_of_date, params['task_options'])
+            (spaceone.cost_analysis.plugin.data_source.lib.checkpoint)
+        skip_pages only skips responses after they are made, so it is used when making
+        a response does not fetch its data.
     """
     pass
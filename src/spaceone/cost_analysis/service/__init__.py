@@ -19,3 +19,6 @@ from spaceone.cost_analysis.service.unified_cost_service import UnifiedCostServi
 from spaceone.cost_analysis.service.report_adjustment_policy_service import (
     ReportAdjustmentPolicyService,
 )
+from spaceone.cost_analysis.service.exchange_rate_service import ExchangeRateService
+from spaceone.cost_analysis.service.email_service import EmailService
+from spaceone.cost_analysis.service.cost_archive_service import CostArchiveService
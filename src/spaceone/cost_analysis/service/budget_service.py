@@ -523,6 +523,23 @@ class BudgetService(BaseService):
                 f"[update_expired_budget_state] budget_id:{budget_vo.budget_id}({budget_vo.end}, {budget_vo.state})"
             )
 
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @check_required(["domain_id", "alerts"])
+    def send_budget_usage_alerts(self, params: dict) -> None:
+        """
+        Args:
+            params (dict): {
+                'domain_id': 'str',
+                'alerts': 'list',
+            }
+        Returns:
+            None
+        """
+
+        self.budget_usage_mgr.send_budget_usage_alerts(
+            params["domain_id"], params["alerts"]
+        )
+
     def create_budget_update_job(self, domain_id: str) -> None:
         self.budget_mgr.push_budget_job_task({"domain_id": domain_id})
 
@@ -729,6 +746,7 @@ class BudgetService(BaseService):
 
         for plan in plans:
             plan["notified"] = False
+            plan["notifying_at"] = None
 
         notification["plans"] = plans
         return notification
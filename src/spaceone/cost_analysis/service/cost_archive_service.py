@@ -0,0 +1,97 @@
+import logging
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+from spaceone.core import config
+from spaceone.core.service import *
+from spaceone.cost_analysis.manager.cost_archive_manager import CostArchiveManager
+from spaceone.cost_analysis.manager.data_source_manager import DataSourceManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@authentication_handler
+@authorization_handler
+@mutation_handler
+@event_handler
+class CostArchiveService(BaseService):
+    resource = "CostArchive"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cost_archive_mgr = CostArchiveManager()
+        self.data_source_mgr = DataSourceManager()
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def archive_costs_by_scheduler(self, params: dict) -> None:
+        """Push archive tasks of all data sources
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        if not self.cost_archive_mgr.is_enabled():
+            _LOGGER.debug("[archive_costs_by_scheduler] cost archive is disabled.")
+            return None
+
+        data_source_vos = self.data_source_mgr.filter_data_sources(
+            data_source_type__ne="WAREHOUSE"
+        ).only("data_source_id", "domain_id")
+
+        for data_source_vo in data_source_vos:
+            self.cost_archive_mgr.push_archive_costs_task(
+                {
+                    "data_source_id": data_source_vo.data_source_id,
+                    "domain_id": data_source_vo.domain_id,
+                }
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def archive_costs(self, params: dict) -> None:
+        """Archive closed billed months of a data source
+
+        Args:
+            params (dict): {
+                'data_source_id': 'str',    # required
+                'domain_id': 'str'          # required
+            }
+
+        Returns:
+            None
+        """
+
+        data_source_id = params["data_source_id"]
+        domain_id = params["domain_id"]
+
+        archived_months = self.cost_archive_mgr.list_archived_months(
+            domain_id, data_source_id
+        )
+
+        for billed_month in self._get_archivable_months():
+            if billed_month in archived_months:
+                continue
+
+            try:
+                self.cost_archive_mgr.archive_monthly_costs(
+                    domain_id, data_source_id, billed_month
+                )
+            except Exception as e:
+                _LOGGER.error(
+                    f"[archive_costs] archive costs error ({data_source_id} {billed_month}): {e}",
+                    exc_info=True,
+                )
+
+    @staticmethod
+    def _get_archivable_months() -> list:
+        archive_after_months = config.get_global("COST_ARCHIVE_AFTER_MONTHS", 3)
+        this_month = datetime.utcnow().date().replace(day=1)
+
+        # costs older than 12 months are deleted from the daily collection
+        return [
+            (this_month - relativedelta(months=months)).strftime("%Y-%m")
+            for months in range(12, archive_after_months - 1, -1)
+        ]
@@ -1,6 +1,7 @@
 import logging
 from typing import Union
 
+from spaceone.core import config
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
@@ -125,60 +126,114 @@ class CostReportDataService(BaseService):
         return self.cost_report_data_mgr.stat_cost_reports_data(query)
 
     def create_cost_report_data(self, cost_report_vo: CostReport, unified_cost: dict):
+        self.create_cost_reports_data([cost_report_vo], [unified_cost])
+
+    def create_cost_reports_data(
+        self, cost_report_vos: list, unified_costs: list
+    ) -> None:
+        """Create cost report data of every report of a config with one aggregation.
+
+        All reports must belong to the same cost report config and report month.
+        """
+        if not cost_report_vos:
+            return None
+
         cost_report_config_mgr = CostReportConfigManager()
 
-        domain_id = cost_report_vo.domain_id
-        workspace_id = cost_report_vo.workspace_id
-        cost_report_config_id = cost_report_vo.cost_report_config_id
-        cost_report_id = cost_report_vo.cost_report_id
-        report_month = cost_report_vo.report_month
-        issue_date = cost_report_vo.issue_date
-        workspace_name = self._get_workspace_name(domain_id, workspace_id)
-        is_confirmed = True if cost_report_vo.status == "DONE" else False
+        domain_id = cost_report_vos[0].domain_id
+        cost_report_config_id = cost_report_vos[0].cost_report_config_id
+        report_month = cost_report_vos[0].report_month
+        workspace_ids = list(
+            set([cost_report_vo.workspace_id for cost_report_vo in cost_report_vos])
+        )
 
         cost_report_config_vo = cost_report_config_mgr.get_cost_report_config(
             domain_id=domain_id, cost_report_config_id=cost_report_config_id
         )
         data_source_filter = cost_report_config_vo.data_source_filter or {}
 
-        data_source_ids = self._list_data_source_ids_from_data_source(
-            data_source_filter, workspace_id, domain_id
+        data_source_ids_map = self._get_data_source_ids_map(
+            data_source_filter, workspace_ids, domain_id
+        )
+        v_workspace_route_map = self._get_virtual_workspace_route_map(
+            domain_id, workspace_ids
         )
-        project_name_map = self._get_project_name_map(workspace_id, domain_id)
+        workspace_name_map = self._get_workspace_name_map(workspace_ids, domain_id)
+        project_name_map = self._get_project_name_map(workspace_ids, domain_id)
         service_account_name_map = self._get_service_account_name_map(
-            workspace_id, domain_id
+            workspace_ids, domain_id
+        )
+
+        results = self._aggregate_unified_cost_report_data(
+            domain_id,
+            workspace_ids + list(v_workspace_route_map.keys()),
+            list(set().union(*data_source_ids_map.values())),
+            report_month,
         )
 
-        self._aggregate_unified_cost_report_data(
-            domain_id=domain_id,
-            workspace_id=workspace_id,
-            cost_report_config_id=cost_report_config_id,
-            cost_report_id=cost_report_id,
-            workspace_name=workspace_name,
-            project_name_map=project_name_map,
-            service_account_name_map=service_account_name_map,
-            data_source_ids=data_source_ids,
-            report_month=report_month,
-            issue_date=issue_date,
-            is_confirmed=is_confirmed,
-            unified_cost=unified_cost,
+        # partition aggregated rows by the workspace of each report
+        results_map = {}
+        for aggregated_cost_report_data in results:
+            row_workspace_id = aggregated_cost_report_data.get("workspace_id")
+            workspace_id = v_workspace_route_map.get(row_workspace_id, row_workspace_id)
+
+            data_source_id = aggregated_cost_report_data.get("data_source_id")
+            if data_source_id not in data_source_ids_map.get(workspace_id, set()):
+                continue
+
+            results_map.setdefault(workspace_id, []).append(aggregated_cost_report_data)
+
+        cost_reports_data = []
+        for cost_report_vo, unified_cost in zip(cost_report_vos, unified_costs):
+            workspace_id = cost_report_vo.workspace_id
+            is_confirmed = True if cost_report_vo.status == "DONE" else False
+
+            for aggregated_cost_report_data in results_map.get(workspace_id, []):
+                cost_report_data = aggregated_cost_report_data.copy()
+                cost_report_data["cost"] = self._extract_cost_by_currency(
+                    cost_report_data
+                )
+                cost_report_data["issue_date"] = cost_report_vo.issue_date
+                cost_report_data["report_month"] = report_month
+                cost_report_data["report_year"] = cost_report_data.pop("billed_year")
+                cost_report_data["workspace_name"] = workspace_name_map.get(
+                    workspace_id, workspace_id
+                )
+                cost_report_data["project_name"] = project_name_map.get(
+                    cost_report_data.get("project_id"), ""
+                )
+                cost_report_data["service_account_name"] = (
+                    service_account_name_map.get(
+                        cost_report_data.get("service_account_id"), ""
+                    )
+                )
+
+                cost_report_data["cost_report_config_id"] = cost_report_config_id
+                cost_report_data["cost_report_id"] = cost_report_vo.cost_report_id
+                cost_report_data["workspace_id"] = workspace_id
+                cost_report_data["domain_id"] = domain_id
+                cost_report_data["is_confirmed"] = is_confirmed
+
+                cost_report_data["usage_type"] = unified_cost.get("usage_type")
+                cost_report_data["usage_unit"] = unified_cost.get("usage_unit")
+                cost_report_data["region_key"] = unified_cost.get("region_key")
+                cost_report_data["region_code"] = unified_cost.get("region_code")
+
+                cost_reports_data.append(cost_report_data)
+
+        count = self.cost_report_data_mgr.create_cost_reports_data(cost_reports_data)
+
+        _LOGGER.debug(
+            f"[create_cost_reports_data] create cost report data({report_month}) (reports = {len(cost_report_vos)}, count = {count})"
         )
 
     def _aggregate_unified_cost_report_data(
         self,
         domain_id: str,
-        workspace_id: str,
-        cost_report_config_id,
-        cost_report_id: str,
-        workspace_name: str,
-        project_name_map: dict,
-        service_account_name_map: dict,
+        workspace_ids: list,
         data_source_ids: list,
         report_month: str,
-        issue_date: str,
-        is_confirmed: bool = False,
-        unified_cost: dict = None,
-    ):
+    ) -> list:
         report_year = report_month.split("-")[0]
         currencies = ["KRW", "USD", "JPY"]
 
@@ -199,6 +254,7 @@ class CostReportDataService(BaseService):
                 {"k": "data_source_id", "v": data_source_ids, "o": "in"},
                 {"k": "billed_year", "v": report_year, "o": "eq"},
                 {"k": "billed_month", "v": report_month, "o": "eq"},
+                {"k": "workspace_id", "v": workspace_ids, "o": "in"},
             ],
         }
 
@@ -208,63 +264,34 @@ class CostReportDataService(BaseService):
         }
         query["fields"] = fields
 
-        v_workspace_ids = self._get_virtual_workspace_ids(domain_id, workspace_id)
-        if v_workspace_ids:
-            query["filter"].append(
-                {"k": "workspace_id", "v": [workspace_id] + v_workspace_ids, "o": "in"}
-            )
-        else:
-            query["filter"].append({"k": "workspace_id", "v": workspace_id, "o": "eq"})
-
         _LOGGER.debug(f"[aggregate_monthly_cost_report_data] query: {query}")
         response = self.unified_cost_mgr.analyze_unified_costs(query, domain_id)
+        return response.get("results", [])
 
-        results = response.get("results", [])
-        for aggregated_cost_report_data in results:
-            aggregated_cost_report_data["cost"] = self._extract_cost_by_currency(
-                aggregated_cost_report_data
-            )
-            aggregated_cost_report_data["issue_date"] = issue_date
-            aggregated_cost_report_data["report_month"] = report_month
-            aggregated_cost_report_data["report_year"] = (
-                aggregated_cost_report_data.pop("billed_year")
-            )
-            aggregated_cost_report_data["workspace_name"] = workspace_name
-            aggregated_cost_report_data["project_name"] = project_name_map.get(
-                aggregated_cost_report_data["project_id"], ""
-            )
-            aggregated_cost_report_data["service_account_name"] = (
-                service_account_name_map.get(
-                    aggregated_cost_report_data.get("service_account_id"), ""
-                )
-            )
-
-            aggregated_cost_report_data["cost_report_config_id"] = cost_report_config_id
-            aggregated_cost_report_data["cost_report_id"] = cost_report_id
-            aggregated_cost_report_data["workspace_id"] = workspace_id
-            aggregated_cost_report_data["domain_id"] = domain_id
-            aggregated_cost_report_data["is_confirmed"] = is_confirmed
-
-            aggregated_cost_report_data["usage_type"] = unified_cost.get("usage_type")
-            aggregated_cost_report_data["usage_unit"] = unified_cost.get("usage_unit")
-            aggregated_cost_report_data["region_key"] = unified_cost.get("region_key")
-            aggregated_cost_report_data["region_code"] = unified_cost.get("region_code")
-
-            self.cost_report_data_mgr.create_cost_report_data(
-                aggregated_cost_report_data
+    def _get_workspace_name_map(self, workspace_ids: list, domain_id: str) -> dict:
+        identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
+        workspace_name_map = {}
+
+        try:
+            response = identity_mgr.list_workspaces(
+                {
+                    "query": {
+                        "filter": [
+                            {"k": "workspace_id", "v": workspace_ids, "o": "in"},
+                        ]
+                    }
+                },
+                domain_id,
+                token=config.get_global("TOKEN"),
             )
+            for workspace in response.get("results", []):
+                workspace_name_map[workspace["workspace_id"]] = workspace["name"]
+        except Exception as e:
+            _LOGGER.error(f"[_get_workspace_name_map] API Error: {e}")
 
-        _LOGGER.debug(
-            f"[aggregate_monthly_cost_report] create cost report data({report_month}) (count = {len(results)})"
-        )
+        return workspace_name_map
 
-    def _get_workspace_name(self, domain_id: str, workspace_id: str) -> str:
-        identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
-        return identity_mgr.get_workspace(
-            domain_id=domain_id, workspace_id=workspace_id
-        )
-
-    def _get_project_name_map(self, workspace_id: str, domain_id: str) -> dict:
+    def _get_project_name_map(self, workspace_ids: list, domain_id: str) -> dict:
         identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
         project_name_map = {}
         response = identity_mgr.list_projects(
@@ -272,7 +299,7 @@ class CostReportDataService(BaseService):
                 "query": {
                     "filter": [
                         {"k": "domain_id", "v": domain_id, "o": "eq"},
-                        {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+                        {"k": "workspace_id", "v": workspace_ids, "o": "in"},
                     ]
                 }
             },
@@ -282,14 +309,16 @@ class CostReportDataService(BaseService):
             project_name_map[project["project_id"]] = project["name"]
         return project_name_map
 
-    def _get_service_account_name_map(self, workspace_id: str, domain_id: str) -> dict:
+    def _get_service_account_name_map(
+        self, workspace_ids: list, domain_id: str
+    ) -> dict:
         identity_mgr: IdentityManager = self.locator.get_manager("IdentityManager")
         service_account_name_map = {}
         service_accounts = identity_mgr.list_service_accounts(
             {
                 "filter": [
                     {"k": "domain_id", "v": domain_id, "o": "eq"},
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+                    {"k": "workspace_id", "v": workspace_ids, "o": "in"},
                 ]
             },
             domain_id,
@@ -301,15 +330,15 @@ class CostReportDataService(BaseService):
         return service_account_name_map
 
     @staticmethod
-    def _list_data_source_ids_from_data_source(
-        data_source_filter: dict, workspace_id: str, domain_id: str
-    ) -> list:
+    def _get_data_source_ids_map(
+        data_source_filter: dict, workspace_ids: list, domain_id: str
+    ) -> dict:
         data_source_mgr = DataSourceManager()
 
         query = {
             "filter": [
                 {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "workspace_id", "v": [workspace_id, "*"], "o": "in"},
+                {"k": "workspace_id", "v": workspace_ids + ["*"], "o": "in"},
             ]
         }
 
@@ -322,21 +351,36 @@ class CostReportDataService(BaseService):
             query["filter"].append(
                 {"k": "schedule.state", "v": data_source_state, "o": "eq"}
             )
-        _LOGGER.debug(f"[_list_data_source_ids_from_data_source] query: {query}")
+        _LOGGER.debug(f"[_get_data_source_ids_map] query: {query}")
 
+        data_source_ids_map = {workspace_id: set() for workspace_id in workspace_ids}
         data_source_vos, total_count = data_source_mgr.list_data_sources(query)
-        return [data_source_vo.data_source_id for data_source_vo in data_source_vos]
+        for data_source_vo in data_source_vos:
+            if data_source_vo.workspace_id == "*":
+                for data_source_ids in data_source_ids_map.values():
+                    data_source_ids.add(data_source_vo.data_source_id)
+            elif data_source_vo.workspace_id in data_source_ids_map:
+                data_source_ids_map[data_source_vo.workspace_id].add(
+                    data_source_vo.data_source_id
+                )
 
-    def _get_virtual_workspace_ids(self, domain_id: str, workspace_id: str) -> list:
-        v_workspace_ids = []
+        return data_source_ids_map
+
+    def _get_virtual_workspace_route_map(
+        self, domain_id: str, workspace_ids: list
+    ) -> dict:
+        v_workspace_route_map = {}
         ds_account_vos = self.ds_account_mgr.filter_data_source_accounts(
-            domain_id=domain_id, workspace_id=workspace_id
+            domain_id=domain_id, workspace_id=workspace_ids
         )
 
         for ds_account_vo in ds_account_vos:
-            v_workspace_ids.append(ds_account_vo.v_workspace_id)
+            if ds_account_vo.v_workspace_id:
+                v_workspace_route_map[ds_account_vo.v_workspace_id] = (
+                    ds_account_vo.workspace_id
+                )
 
-        return v_workspace_ids
+        return v_workspace_route_map
 
     @staticmethod
     def _extract_cost_by_currency(cost_data: dict) -> dict:
@@ -34,6 +34,7 @@ from spaceone.cost_analysis.service.cost_report_data_service import (
 )
 from spaceone.cost_analysis.manager.cost_report.adjustment_policy_applier import (
     AdjustmentPolicyApplier,
+    AdjustmentPolicySnapshot,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -327,23 +328,17 @@ class CostReportService(BaseService):
         report_month: str,
         cost_report_created_at: datetime,
     ):
-        cost_report_update_query = {
-            "filter": [
-                {"k": "cost_report_config_id", "v": cost_report_config_id, "o": "eq"},
-                {"k": "report_month", "v": report_month, "o": "eq"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "status", "v": "DONE", "o": "eq"},
-                {"k": "created_at", "v": cost_report_created_at, "o": "lt"},
-            ]
-        }
-
-        cost_reports_vos, total_count = self.cost_report_mgr.list_cost_reports(
-            cost_report_update_query
+        self.cost_report_mgr.update_cost_reports_status(
+            {
+                "cost_report_config_id": cost_report_config_id,
+                "report_month": report_month,
+                "domain_id": domain_id,
+                "status": "DONE",
+                "created_at__lt": cost_report_created_at,
+            },
+            "EXPIRED",
         )
 
-        for cost_report_vo in cost_reports_vos:
-            self.cost_report_mgr.update_cost_report_by_vo({"status": "EXPIRED"}, cost_report_vo)
-
     def _delete_old_cost_reports(
         self,
         report_month: str,
@@ -406,23 +401,13 @@ class CostReportService(BaseService):
 
         if verified_users_info:
             email_mgr = EmailManager()
-            sso_access_token = self._get_temporary_sso_access_token(
-                domain_id, workspace_id
-            )
             for user_info in verified_users_info:
                 try:
                     user_id = user_info["user_id"]
                     email = user_info.get("email", user_id)
 
-                    cost_report_link = self._get_console_cost_report_url(
-                        domain_id,
-                        cost_report_vo.cost_report_id,
-                        sso_access_token,
-                        language,
-                    )
-
                     email_mgr.send_cost_report_email(
-                        user_id, email, cost_report_link, language, cost_report_vo
+                        user_id, email, language, cost_report_vo
                     )
                 except Exception as e:
                     _LOGGER.error(
@@ -433,6 +418,19 @@ class CostReportService(BaseService):
             f"[send_cost_report] send cost report ({workspace_id}/{cost_report_vo.cost_report_id}) to {len(verified_users_info)} users"
         )
 
+    def get_cost_report_link(
+        self, cost_report_id: str, domain_id: str, language: str
+    ) -> str:
+        # the access token is granted per delivery and is not stored with the email
+        cost_report_vo = self.cost_report_mgr.get_cost_report(domain_id, cost_report_id)
+        sso_access_token = self._get_temporary_sso_access_token(
+            domain_id, cost_report_vo.workspace_id
+        )
+
+        return self._get_console_cost_report_url(
+            domain_id, cost_report_id, sso_access_token, language
+        )
+
     def get_email_verified_workspace_owner_users(
         self, domain_id: str, workspace_id: str, role_types: list = None
     ) -> list:
@@ -682,25 +680,38 @@ class CostReportService(BaseService):
 
         cost_report_config_id = None
         report_created_at = datetime.now(timezone.utc)
+        cost_report_vos = []
         for idx, report in enumerate(cost_reports, start=start_cost_report_number):
             report["report_number"] = self.generate_report_number(
                 report_month, report_issue_day, idx
             )
             cost_report_config_id = report["cost_report_config_id"]
 
-            cost_report_vo = self.cost_report_mgr.create_cost_report(report)
-            cost_report_data_svc.create_cost_report_data(cost_report_vo, report)
+            cost_report_vos.append(self.cost_report_mgr.create_cost_report(report))
 
+        # cost report data of every report is aggregated at once
+        cost_report_data_svc.create_cost_reports_data(cost_report_vos, cost_reports)
+
+        done_cost_report_vos = []
+        adjustment_policy_snapshot = None
+        for cost_report_vo, report in zip(cost_report_vos, cost_reports):
             if cost_report_vo.status == "ADJUSTING":
                 if self.is_within_adjustment_period:
                     _LOGGER.info(
                         f"[_persist_cost_reports_by_status] apply Adjustment Policy (cost_report_id={cost_report_vo.cost_report_id})"
                     )
 
+                    # policies and currency maps are loaded once for every report
+                    if adjustment_policy_snapshot is None:
+                        adjustment_policy_snapshot = AdjustmentPolicySnapshot(
+                            cost_report_config_id, domain_id
+                        )
+
                     adjustment_applier = AdjustmentPolicyApplier(
                         cost_report_vo,
                         data_source_ids,
                         report,
+                        adjustment_policy_snapshot,
                     )
 
                     if adjustment_applier.is_applied:
@@ -718,10 +729,14 @@ class CostReportService(BaseService):
                         )
 
                 if self.is_done_report:
-                    cost_report_vo = self._update_cost_report_done_status(cost_report_vo)
+                    done_cost_report_vos.append(cost_report_vo)
+
+        if done_cost_report_vos:
+            self._update_cost_reports_done_status(done_cost_report_vos, report_month)
 
-                    if not is_regenerate:
-                        self.send_cost_report(cost_report_vo)
+            if not is_regenerate:
+                for cost_report_vo in done_cost_report_vos:
+                    self.send_cost_report(cost_report_vo)
 
         if self._check_done_cost_report_exist(domain_id, cost_report_config_id, report_month):
             self._change_status_to_expired(domain_id, cost_report_config_id, report_month, report_created_at)
@@ -834,23 +849,20 @@ class CostReportService(BaseService):
                 cost_info[currency] = value or 0.0
         return cost_info
 
-    def _update_cost_report_done_status(self, cost_report_vo: CostReport) -> CostReport:
-        domain_id = cost_report_vo.domain_id
-        report_month = cost_report_vo.report_month
+    def _update_cost_reports_done_status(
+        self, cost_report_vos: list, report_month: str
+    ) -> None:
+        domain_id = cost_report_vos[0].domain_id
+        cost_report_ids = [
+            cost_report_vo.cost_report_id for cost_report_vo in cost_report_vos
+        ]
 
-        cost_report_vo = self.cost_report_mgr.update_cost_report_by_vo(
-            {"status": "DONE"}, cost_report_vo
+        self.cost_report_mgr.update_cost_reports_status(
+            {"domain_id": domain_id, "cost_report_id": cost_report_ids}, "DONE"
         )
-
-        adjusted_cost_data_vos = self.cost_report_data_mgr.filter_cost_reports_data(
-            domain_id=domain_id,
-            cost_report_id=cost_report_vo.cost_report_id,
-            report_month=report_month,
-            is_confirmed=False,
+        self.cost_report_data_mgr.confirm_cost_reports_data(
+            domain_id, cost_report_ids, report_month
         )
-        for adjusted_cost_data_vo in adjusted_cost_data_vos:
-            self.cost_report_data_mgr.update_cost_report_data_by_vo(
-                {"is_confirmed": True}, adjusted_cost_data_vo
-            )
 
-        return cost_report_vo
+        for cost_report_vo in cost_report_vos:
+            cost_report_vo.status = "DONE"
@@ -0,0 +1,78 @@
+import logging
+
+from spaceone.core.service import *
+from spaceone.cost_analysis.manager.budget_manager import BudgetManager
+from spaceone.cost_analysis.manager.email_manager import EmailManager
+from spaceone.cost_analysis.model.email_delivery.database import EmailDelivery
+from spaceone.cost_analysis.service.cost_report_serivce import CostReportService
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@authentication_handler
+@authorization_handler
+@mutation_handler
+@event_handler
+class EmailService(BaseService):
+    resource = "EmailDelivery"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.email_mgr = EmailManager()
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @check_required(["email_delivery_id"])
+    def deliver_email(self, params: dict) -> None:
+        """Deliver a queued email through the pooled SMTP session
+
+        Args:
+            params (dict): {
+                'email_delivery_id': 'str',     # required
+            }
+
+        Returns:
+            None
+        """
+
+        email_delivery_vo = self.email_mgr.deliver_email(
+            params["email_delivery_id"], self._get_recipient_info
+        )
+
+        # budget plans are marked notified from the outbox, so failed alerts are sent again
+        if (
+            email_delivery_vo.status == "SENT"
+            and email_delivery_vo.resource_type == "Budget"
+            and email_delivery_vo.resource_key
+        ):
+            BudgetManager().set_plan_notified(
+                email_delivery_vo.resource_id,
+                email_delivery_vo.domain_id,
+                float(email_delivery_vo.resource_key),
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def retry_email_deliveries(self, params: dict) -> None:
+        """Push the email deliveries whose next attempt is due
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        self.email_mgr.push_retry_email_deliveries()
+
+    @staticmethod
+    def _get_recipient_info(email_delivery_vo: EmailDelivery) -> dict:
+        if email_delivery_vo.resource_type != "CostReport":
+            return {}
+
+        cost_report_svc = CostReportService()
+        return {
+            "download_link": cost_report_svc.get_cost_report_link(
+                email_delivery_vo.resource_id,
+                email_delivery_vo.domain_id,
+                email_delivery_vo.language,
+            )
+        }
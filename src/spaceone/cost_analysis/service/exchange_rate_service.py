@@ -0,0 +1,51 @@
+import logging
+from datetime import datetime, timedelta
+
+from spaceone.core import config
+from spaceone.core.service import *
+from spaceone.cost_analysis.manager.currency_manager import CurrencyManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@authentication_handler
+@authorization_handler
+@mutation_handler
+@event_handler
+class ExchangeRateService(BaseService):
+    resource = "ExchangeRate"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.currency_mgr = CurrencyManager()
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def sync_exchange_rates_by_scheduler(self, params: dict) -> None:
+        """Sync exchange rates to the exchange rate store
+
+        Args:
+            params (dict): {
+                'backfill_days': 'int' (optional)
+            }
+
+        Returns:
+            None
+        """
+
+        backfill_days = params.get(
+            "backfill_days", config.get_global("EXCHANGE_RATE_BACKFILL_DAYS", 365)
+        )
+
+        end_date = datetime.utcnow()
+        last_date = self.currency_mgr.get_last_exchange_rate_date()
+
+        if last_date is None:
+            start_date = end_date - timedelta(days=backfill_days)
+        else:
+            # re-fetch the recent window to pick up late revisions of close rates
+            start_date = min(last_date, end_date) - timedelta(days=15)
+
+        _LOGGER.debug(
+            f"[sync_exchange_rates_by_scheduler] sync exchange rates: {start_date.date()} ~ {end_date.date()}"
+        )
+        self.currency_mgr.sync_exchange_rates(end_date, start_date)
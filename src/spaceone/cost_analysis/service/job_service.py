@@ -1,8 +1,9 @@
 import copy
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta, datetime
-from typing import Dict
+from typing import Dict, Tuple
 
 from dateutil.relativedelta import relativedelta
 
@@ -25,6 +26,7 @@ from spaceone.cost_analysis.manager.data_source_plugin_manager import (
 from spaceone.cost_analysis.manager.data_source_manager import DataSourceManager
 from spaceone.cost_analysis.manager.secret_manager import SecretManager
 from spaceone.cost_analysis.manager.budget_usage_manager import BudgetUsageManager
+from spaceone.cost_analysis.manager.cost_archive_manager import CostArchiveManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,6 +80,70 @@ class JobService(BaseService):
                         f"[create_jobs_by_data_source] sync error: {e}", exc_info=True
                     )
 
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def retry_stalled_job_tasks(self, params: dict) -> None:
+        """Push stalled job tasks again to resume them from their checkpoint
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        stall_timeout = config.get_global("JOB_TASK_STALL_TIMEOUT", 1800)
+        max_retries = config.get_global("JOB_TASK_MAX_RETRIES", 3)
+
+        for job_task_vo in self.job_task_mgr.list_stalled_job_tasks(stall_timeout):
+            try:
+                if job_task_vo.retry_count >= max_retries:
+                    # the stalled worker stops when it loses the task
+                    job_task_vo = self.job_task_mgr.release_stalled_job_task(
+                        job_task_vo, is_retry=False
+                    )
+                    if job_task_vo is None:
+                        continue
+
+                    data_source_vo = self.data_source_mgr.get_data_source(
+                        job_task_vo.data_source_id,
+                        job_task_vo.domain_id,
+                        job_task_vo.workspace_id,
+                    )
+                    self.job_task_mgr.change_error_status(
+                        job_task_vo,
+                        ERROR_JOB_TASK_STALLED(job_task_id=job_task_vo.job_task_id),
+                        data_source_vo.secret_type,
+                    )
+                    self._close_job(
+                        job_task_vo.job_id,
+                        job_task_vo.data_source_id,
+                        job_task_vo.domain_id,
+                        job_task_vo.workspace_id,
+                    )
+                    continue
+
+                job_task_vo = self.job_task_mgr.release_stalled_job_task(job_task_vo)
+                if job_task_vo:
+                    self.job_task_mgr.push_job_task_by_vo(job_task_vo)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[retry_stalled_job_tasks] retry error ({job_task_vo.job_task_id}): {e}",
+                    exc_info=True,
+                )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def dispatch_job_tasks(self, params: dict) -> None:
+        """Dispatch pending job tasks within the domain quotas
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        self.job_task_mgr.dispatch_job_tasks()
+
     @transaction(
         permission="cost-analysis:Job.write",
         role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
@@ -225,11 +291,35 @@ class JobService(BaseService):
         job_id = job_task_vo.job_id
 
         if self._is_job_failed(job_id, domain_id, job_task_vo.workspace_id):
-            self.job_task_mgr.change_canceled_status(job_task_vo)
+            self.job_task_mgr.cancel_pending_job_task(job_task_vo)
         else:
-            job_task_vo = self.job_task_mgr.change_in_progress_status(job_task_vo)
+            # the task is retried after its worker stopped
+            is_retry = job_task_vo.status == "IN_PROGRESS"
+            worker_id = utils.random_string()
+
+            claimed_job_task_vo = self.job_task_mgr.claim_job_task(
+                job_task_vo, worker_id
+            )
+            if claimed_job_task_vo is None:
+                _LOGGER.debug(
+                    f"[get_cost_data] job task is already run by another worker: {job_task_id}"
+                )
+                return None
+
+            job_task_vo = claimed_job_task_vo
+            stop_heartbeat, claim_lost = self.job_task_mgr.start_heartbeat(
+                job_task_id, worker_id
+            )
 
             try:
+                page, count = 0, 0
+                if is_retry:
+                    job_task_vo, page, count = self._prepare_job_task_resume(
+                        job_task_vo, data_source_vo, worker_id
+                    )
+                    if page > 0:
+                        task_options = dict(task_options, checkpoint={"page": page})
+
                 options = plugin_info.get("options", {})
                 schema_id = plugin_info.get("schema_id")
                 schema = None
@@ -239,14 +329,14 @@ class JobService(BaseService):
                 secret_type = data_source_vo.secret_type
                 options.update({"secret_type": secret_type})
 
-                secret_data = self._get_secret_data(secret_id, domain_id)
+                secret_data = self._get_secret_data(secret_id, domain_id, job_id)
 
                 if secret_type == "USE_SERVICE_ACCOUNT_SECRET":
                     (
                         service_account_id,
                         project_id,
                     ) = self._get_service_account_id_and_project_id(
-                        params.get("secret_id"), domain_id
+                        params.get("secret_id"), domain_id, job_id
                     )
                     cost_data_options.update(
                         {
@@ -255,17 +345,9 @@ class JobService(BaseService):
                         }
                     )
 
-                (
-                    endpoint,
-                    updated_version,
-                ) = self.ds_plugin_mgr.get_data_source_plugin_endpoint(
-                    plugin_info, domain_id
-                )
-
-                self.ds_plugin_mgr.initialize(endpoint)
+                self.ds_plugin_mgr.initialize_by_plugin_info(plugin_info, domain_id)
                 start_dt = datetime.utcnow()
 
-                count = 0
                 is_canceled = False
 
                 _LOGGER.debug(
@@ -276,12 +358,13 @@ class JobService(BaseService):
                     options, secret_data, schema, task_options, domain_id
                 ):
                     results = costs_data.get("results", [])
+                    cost_data_list = []
                     for cost_data in results:
-                        count += 1
-
                         self._check_cost_data(cost_data)
-                        self._create_cost_data(
-                            cost_data, job_task_vo, cost_data_options
+                        cost_data_list.append(
+                            self._make_cost_data(
+                                cost_data, job_task_vo, cost_data_options, page
+                            )
                         )
 
                         tag_keys = self._append_tag_keys(tag_keys, cost_data)
@@ -290,13 +373,20 @@ class JobService(BaseService):
                         )
                         data_keys = self._append_data_keys(data_keys, cost_data)
 
+                    # a task taken over after a lost heartbeat must not insert any more costs
+                    if claim_lost.is_set():
+                        raise ERROR_JOB_TASK_CLAIM_LOST(job_task_id=job_task_id)
+
+                    count += self.cost_mgr.create_costs(cost_data_list)
+                    page += 1
+
                     if self._is_job_failed(job_id, domain_id, job_task_vo.workspace_id):
                         self.job_task_mgr.change_canceled_status(job_task_vo)
                         is_canceled = True
                         break
                     else:
                         job_task_vo = self.job_task_mgr.update_sync_status(
-                            job_task_vo, len(results)
+                            job_task_vo, len(results), page, worker_id
                         )
 
                 if not is_canceled:
@@ -326,9 +416,17 @@ class JobService(BaseService):
                             job_task_vo, domain_id
                         )
 
+            except ERROR_JOB_TASK_CLAIM_LOST as e:
+                _LOGGER.warning(f"[get_cost_data] stop job task: {e.message}")
+                return None
+
             except Exception as e:
                 self.job_task_mgr.change_error_status(job_task_vo, e, secret_type)
 
+            finally:
+                stop_heartbeat.set()
+                self._delete_finished_job_secret_caches()
+
         self._close_job(
             job_id,
             data_source_id,
@@ -336,6 +434,9 @@ class JobService(BaseService):
             job_task_vo.workspace_id,
         )
 
+        # the finished task frees a slot of its domain
+        self._dispatch_job_tasks()
+
     def create_cost_job(self, data_source_vo: DataSource, job_options):
         tasks = []
         changed = []
@@ -371,46 +472,40 @@ class JobService(BaseService):
 
         start, last_synchronized_at = self._get_start_last_synchronized_at(params)
 
-        for secret_id in secret_ids:
-            try:
-                secret_data = self._get_secret_data(secret_id, domain_id)
-
-                linked_accounts = self._get_linked_accounts_from_data_source_vo(
-                    data_source_vo, options, secret_data, schema
-                )
-
-                (
-                    single_tasks,
-                    single_changed,
-                    single_synced_accounts,
-                ) = self.ds_plugin_mgr.get_tasks(
-                    options,
-                    secret_id,
-                    secret_data,
-                    start,
-                    last_synchronized_at,
-                    domain_id,
-                    schema,
-                    linked_accounts,
+        for secret_id, response in self._get_tasks_by_secret_ids(
+            data_source_vo,
+            secret_ids,
+            options,
+            schema,
+            start,
+            last_synchronized_at,
+        ).items():
+            if isinstance(response, Exception):
+                _LOGGER.error(
+                    f"[create_cost_job] get_tasks error: {response}",
+                    exc_info=response,
                 )
-                tasks.extend(single_tasks)
-                changed.extend(single_changed)
-                if single_synced_accounts:
-                    synced_accounts.extend(
-                        [
-                            {"account_id": single_synced_account["account_id"]}
-                            for single_synced_account in single_synced_accounts
-                        ]
-                    )
-
-            except Exception as e:
-                _LOGGER.error(f"[create_cost_job] get_tasks error: {e}", exc_info=True)
 
                 if secret_type == "MANUAL":
                     raise ERROR_GET_JOB_TASKS(
-                        secret_id=secret_id, data_source_id=data_source_id, reason=e
+                        secret_id=secret_id,
+                        data_source_id=data_source_id,
+                        reason=response,
                     )
 
+                continue
+
+            single_tasks, single_changed, single_synced_accounts = response
+            tasks.extend(single_tasks)
+            changed.extend(single_changed)
+            if single_synced_accounts:
+                synced_accounts.extend(
+                    [
+                        {"account_id": single_synced_account["account_id"]}
+                        for single_synced_account in single_synced_accounts
+                    ]
+                )
+
         for task in tasks:
             _LOGGER.debug(f'[sync] task options: {task["task_options"]}')
             _LOGGER.debug(f'[sync] task changed: {task.get("task_changed")}')
@@ -434,35 +529,29 @@ class JobService(BaseService):
             )
         else:
             if len(tasks) > 0:
+                # manual syncs are dispatched ahead of scheduled syncs
+                priority = 1 if job_vo.options.get("sync_mode") == "MANUAL" else 0
+
                 for task in tasks:
-                    job_task_vo = None
-                    task_options = task["task_options"]
-                    task_changed = task.get("task_changed")
                     try:
-                        job_task_vo = self.job_task_mgr.create_job_task(
+                        self.job_task_mgr.create_job_task(
                             job_vo.resource_group,
                             job_vo.job_id,
                             data_source_id,
                             job_vo.workspace_id,
                             domain_id,
-                            task_options,
-                            task_changed,
-                        )
-                        self.job_task_mgr.push_job_task(
-                            {
-                                "task_options": task_options,
-                                "task_changed": task_changed,
-                                "secret_id": task.get("secret_id"),
-                                "secret_data": task.get("secret_data", {}),
-                                "job_task_id": job_task_vo.job_task_id,
-                                "domain_id": domain_id,
-                            }
+                            task["task_options"],
+                            task.get("task_changed"),
+                            task.get("secret_id"),
+                            priority,
                         )
                     except Exception as e:
-                        if job_task_vo:
-                            self.job_task_mgr.change_error_status(
-                                job_task_vo, e, secret_type
-                            )
+                        _LOGGER.error(
+                            f"[create_cost_job] create job task error: {e}",
+                            exc_info=True,
+                        )
+
+                self._dispatch_job_tasks()
             else:
                 job_vo = self.job_mgr.change_success_status(job_vo)
                 self.data_source_mgr.update_data_source_by_vo(
@@ -471,6 +560,104 @@ class JobService(BaseService):
 
         return job_vo
 
+    def _get_tasks_by_secret_ids(
+        self,
+        data_source_vo: DataSource,
+        secret_ids: list,
+        options: dict,
+        schema: str,
+        start: str,
+        last_synchronized_at: str,
+    ) -> dict:
+        domain_id = data_source_vo.domain_id
+        concurrency = config.get_global("JOB_TASK_PLANNING_CONCURRENCY", 10)
+
+        # managers are created before threads start, since the transaction is thread local
+        secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
+
+        # responses are kept in the order of secret ids, with an exception on failure
+        responses = self._run_by_secret_ids(
+            lambda secret_id: (
+                secret_mgr.get_secret_data(secret_id, domain_id) if secret_id else {}
+            ),
+            secret_ids,
+            concurrency,
+        )
+        secret_data_map = {
+            secret_id: secret_data
+            for secret_id, secret_data in responses.items()
+            if not isinstance(secret_data, Exception)
+        }
+
+        linked_accounts = []
+        if self._check_use_account_routing(data_source_vo):
+            accounts_info_map = self._run_by_secret_ids(
+                lambda secret_id: self.ds_plugin_mgr.get_linked_accounts(
+                    options, secret_data_map[secret_id], domain_id, schema
+                ),
+                list(secret_data_map.keys()),
+                concurrency,
+            )
+            responses.update(accounts_info_map)
+
+            # accounts of all secrets are reconciled at once for the data source
+            linked_accounts = self._get_linked_accounts_from_data_source_vo(
+                data_source_vo,
+                [
+                    accounts_info
+                    for accounts_info in accounts_info_map.values()
+                    if not isinstance(accounts_info, Exception)
+                ],
+            )
+
+        responses.update(
+            self._run_by_secret_ids(
+                lambda secret_id: self.ds_plugin_mgr.get_tasks(
+                    options,
+                    secret_id,
+                    secret_data_map[secret_id],
+                    start,
+                    last_synchronized_at,
+                    domain_id,
+                    schema,
+                    linked_accounts,
+                ),
+                [
+                    secret_id
+                    for secret_id in secret_data_map.keys()
+                    if not isinstance(responses[secret_id], Exception)
+                ],
+                concurrency,
+            )
+        )
+
+        return responses
+
+    @staticmethod
+    def _run_by_secret_ids(func, secret_ids: list, concurrency: int) -> dict:
+        results = {secret_id: None for secret_id in secret_ids}
+
+        if concurrency > 1 and len(secret_ids) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(func, secret_id): secret_id
+                    for secret_id in secret_ids
+                }
+                for future in as_completed(futures):
+                    secret_id = futures[future]
+                    try:
+                        results[secret_id] = future.result()
+                    except Exception as e:
+                        results[secret_id] = e
+        else:
+            for secret_id in secret_ids:
+                try:
+                    results[secret_id] = func(secret_id)
+                except Exception as e:
+                    results[secret_id] = e
+
+        return results
+
     def _list_secret_ids_from_secret_type(
         self,
         data_source_vo: DataSource,
@@ -544,20 +731,31 @@ class JobService(BaseService):
 
         return _filter
 
-    def _get_service_account_id_and_project_id(self, secret_id, domain_id):
+    def _get_service_account_id_and_project_id(
+        self, secret_id: str, domain_id: str, job_id: str
+    ) -> Tuple[str, str]:
         service_account_id = None
         project_id = None
 
         secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
 
         if secret_id:
-            _query = {"filter": [{"k": "secret_id", "v": secret_id, "o": "eq"}]}
-            response = secret_mgr.list_secrets(_query, domain_id)
-            results = response.get("results", [])
-            if results:
-                secret_info = results[0]
-                service_account_id = secret_info.get("service_account_id")
-                project_id = secret_info.get("project_id")
+            # secrets of all tasks in the job are resolved by the first task
+            secret_ids = [
+                job_secret_id
+                for job_secret_id in self.job_task_mgr.filter_job_tasks(
+                    job_id=job_id, domain_id=domain_id
+                ).distinct("secret_id")
+                if job_secret_id
+            ]
+            if secret_id not in secret_ids:
+                secret_ids.append(secret_id)
+
+            secret_info = secret_mgr.list_secret_infos_with_job_cache(
+                secret_ids, domain_id, job_id
+            ).get(secret_id, {})
+            service_account_id = secret_info.get("service_account_id")
+            project_id = secret_info.get("project_id")
 
         return service_account_id, project_id
 
@@ -590,10 +788,16 @@ class JobService(BaseService):
                 data_keys.append(key)
         return data_keys
 
-    def _get_secret_data(self, secret_id: str, domain_id: str) -> dict:
+    def _get_secret_data(
+        self, secret_id: str, domain_id: str, job_id: str = None
+    ) -> dict:
         # todo: this method is internal method
         secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
-        if secret_id:
+        if secret_id and job_id:
+            secret_data = secret_mgr.get_secret_data_with_job_cache(
+                secret_id, domain_id, job_id
+            )
+        elif secret_id:
             secret_data = secret_mgr.get_secret_data(secret_id, domain_id)
         else:
             secret_data = {}
@@ -606,10 +810,11 @@ class JobService(BaseService):
             _LOGGER.error(f"[_check_cost_data] cost_data: {cost_data}")
             raise ERROR_REQUIRED_PARAMETER(key="plugin_cost_data.billed_date")
 
-    def _create_cost_data(self, cost_data, job_task_vo, cost_options):
+    def _make_cost_data(self, cost_data, job_task_vo, cost_options, page) -> dict:
         cost_data["cost"] = cost_data.get("cost", 0)
         cost_data["job_id"] = job_task_vo.job_id
         cost_data["job_task_id"] = job_task_vo.job_task_id
+        cost_data["job_task_page"] = page
         cost_data["data_source_id"] = job_task_vo.data_source_id
         cost_data["domain_id"] = job_task_vo.domain_id
         cost_data["billed_date"] = cost_data["billed_date"]
@@ -623,7 +828,67 @@ class JobService(BaseService):
         if job_task_vo.resource_group == "WORKSPACE":
             cost_data["workspace_id"] = job_task_vo.workspace_id
 
-        self.cost_mgr.create_cost(cost_data, execute_rollback=False)
+        return cost_data
+
+    def _prepare_job_task_resume(
+        self, job_task_vo: JobTask, data_source_vo: DataSource, worker_id: str
+    ) -> Tuple[JobTask, int, int]:
+        # job_id comes before job_task_id in the sync indexes of both tables
+        cost_vos = self.cost_mgr.filter_costs(
+            domain_id=job_task_vo.domain_id,
+            data_source_id=job_task_vo.data_source_id,
+            job_id=job_task_vo.job_id,
+            job_task_id=job_task_vo.job_task_id,
+        )
+
+        # monthly costs are aggregated again when the task ends
+        self.cost_mgr.filter_monthly_costs(
+            domain_id=job_task_vo.domain_id,
+            data_source_id=job_task_vo.data_source_id,
+            job_id=job_task_vo.job_id,
+            job_task_id=job_task_vo.job_task_id,
+        ).delete()
+
+        checkpoint = job_task_vo.checkpoint or {}
+        plugin_metadata = data_source_vo.plugin_info.metadata or {}
+
+        if checkpoint and plugin_metadata.get("task_checkpoint", False):
+            page = checkpoint["page"]
+            created_count = checkpoint["created_count"]
+
+            # the insert of a page is not atomic, so pages after the checkpoint are made again
+            cost_vos.filter(job_task_page__gte=page).delete()
+
+            if cost_vos.count() == created_count:
+                job_task_vo = self.job_task_mgr.update_sync_status(
+                    job_task_vo,
+                    created_count - job_task_vo.created_count,
+                    page,
+                    worker_id,
+                )
+
+                _LOGGER.debug(
+                    f"[_prepare_job_task_resume] resume job task: {job_task_vo.job_task_id} "
+                    f"(page = {page}, created_count = {created_count})"
+                )
+
+                return job_task_vo, page, created_count
+
+        _LOGGER.debug(
+            f"[_prepare_job_task_resume] restart job task: {job_task_vo.job_task_id} "
+            f"(delete costs = {cost_vos.count()})"
+        )
+        cost_vos.delete()
+        job_task_vo = self.job_task_mgr.update_sync_status(
+            job_task_vo, -job_task_vo.created_count, 0, worker_id
+        )
+        return job_task_vo, 0, 0
+
+    def _dispatch_job_tasks(self) -> None:
+        try:
+            self.job_task_mgr.dispatch_job_tasks()
+        except Exception as e:
+            _LOGGER.error(f"[_dispatch_job_tasks] dispatch error: {e}", exc_info=True)
 
     def _is_job_failed(
         self,
@@ -638,6 +903,17 @@ class JobService(BaseService):
         else:
             return False
 
+    def _delete_finished_job_secret_caches(self) -> None:
+        # only one worker closes a job, so the others drop its secrets after their tasks
+        SecretManager.delete_expired_job_secret_caches()
+
+        if job_ids := SecretManager.list_cached_job_ids():
+            for job_vo in self.job_mgr.filter_jobs(job_id=job_ids).only(
+                "job_id", "status"
+            ):
+                if job_vo.status != "IN_PROGRESS":
+                    SecretManager.delete_job_secret_cache(job_vo.job_id)
+
     def _close_job(
         self,
         job_id: str,
@@ -649,6 +925,8 @@ class JobService(BaseService):
         no_preload_cache = job_vo.options.get("no_preload_cache", False)
 
         if job_vo.remained_tasks == 0:
+            SecretManager.delete_job_secret_cache(job_id)
+
             if job_vo.status == "IN_PROGRESS":
                 try:
                     for changed_vo in job_vo.changed:
@@ -683,6 +961,7 @@ class JobService(BaseService):
                     raise e
 
                 try:
+                    self._delete_changed_cost_archives(job_vo)
                     self.cost_mgr.remove_stat_cache(domain_id, data_source_id)
 
                     if not no_preload_cache:
@@ -800,6 +1079,30 @@ class JobService(BaseService):
         )
         monthly_cost_vos.delete()
 
+    def _delete_changed_cost_archives(self, job_vo: Job) -> None:
+        # archived months are a copy of MongoDB, so months touched by this job are dropped
+        cost_archive_mgr: CostArchiveManager = self.locator.get_manager(
+            "CostArchiveManager"
+        )
+
+        billed_months = self.cost_mgr.filter_monthly_costs(
+            domain_id=job_vo.domain_id,
+            data_source_id=job_vo.data_source_id,
+            job_id=job_vo.job_id,
+        ).distinct("billed_month")
+
+        cost_archive_mgr.delete_cost_archives(
+            job_vo.domain_id, job_vo.data_source_id, billed_months=billed_months
+        )
+
+        for changed_vo in job_vo.changed:
+            cost_archive_mgr.delete_cost_archives(
+                job_vo.domain_id,
+                job_vo.data_source_id,
+                start=changed_vo.start,
+                end=changed_vo.end,
+            )
+
     def _distinct_job_id(
         self, data_source_id: str, domain_id: str, start: str, end: str = None
     ) -> list:
@@ -1192,28 +1495,25 @@ class JobService(BaseService):
     def _get_linked_accounts_from_data_source_vo(
         self,
         data_source_vo: DataSource,
-        options: dict,
-        secret_data: dict,
-        schema: dict = None,
+        accounts_infos: list,
     ) -> list:
         linked_accounts = []
 
-        use_account_routing = self._check_use_account_routing(data_source_vo)
-        if not use_account_routing:
-            return linked_accounts
-
         data_source_svc = self.locator.get_service("DataSourceService")
 
         data_source_id = data_source_vo.data_source_id
         domain_id = data_source_vo.domain_id
 
-        accounts_info = self.ds_plugin_mgr.get_linked_accounts(
-            options, secret_data, domain_id, schema
-        )
-
         # Create data source account
         data_source_svc.create_data_source_account_with_data_source_vo(
-            accounts_info, data_source_vo
+            {
+                "results": [
+                    account_info
+                    for accounts_info in accounts_infos
+                    for account_info in accounts_info.get("results", [])
+                ]
+            },
+            data_source_vo,
         )
 
         # Connect data source account by metadata account connect polices
@@ -1,17 +1,23 @@
 import calendar
 import copy
+import hashlib
+import json
 import logging
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
 from typing import Union, Tuple
 
-from spaceone.core import config
+from spaceone.core import config, utils
 from spaceone.core.error import ERROR_INVALID_PARAMETER
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
+from spaceone.core.transaction import LOCAL_STORAGE
 
 from spaceone.cost_analysis.manager import (
     DataSourceAccountManager,
+    DataSourceRuleManager,
     BudgetManager,
     BudgetUsageManager,
 )
@@ -20,16 +26,21 @@ from spaceone.cost_analysis.manager.cost_manager import CostManager
 from spaceone.cost_analysis.manager.currency_manager import CurrencyManager
 from spaceone.cost_analysis.manager.data_source_manager import DataSourceManager
 from spaceone.cost_analysis.manager.identity_manager import IdentityManager
+from spaceone.cost_analysis.manager.job_manager import JobManager
+from spaceone.cost_analysis.manager.job_task_manager import JobTaskManager
 from spaceone.cost_analysis.manager.unified_cost_job_manager import (
     UnifiedCostJobManager,
 )
 from spaceone.cost_analysis.manager.unified_cost_manager import UnifiedCostManager
+from spaceone.cost_analysis.model.job_model import Job
 from spaceone.cost_analysis.model.unified_cost.database import UnifiedCostJob
 from spaceone.cost_analysis.model.unified_cost.request import *
 from spaceone.cost_analysis.model.unified_cost.response import *
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIFIED_COST_BATCH_SIZE = 1000
+
 
 @authentication_handler
 @authorization_handler
@@ -73,7 +84,10 @@ class UnifiedCostService(BaseService):
                 unified_cost_config = config_mgr.get_unified_cost_config(domain_id)
                 unified_cost_run_hour = unified_cost_config.get("run_hour")
 
-                if current_hour == unified_cost_run_hour:
+                if (
+                    current_hour == unified_cost_run_hour
+                    or self._is_incremental_run_hourly(unified_cost_config)
+                ):
                     self.run_current_month_unified_costs(domain_id)
 
                     if not self._check_unified_cost_job_is_confirmed_with_month(
@@ -98,7 +112,8 @@ class UnifiedCostService(BaseService):
                 'domain_id': 'str',
                 "month": 'str', (optional),
                 "bank": 'str', (optional),
-                "exchange_date": 'str' (optional)
+                "exchange_date": 'str', (optional)
+                "incremental": 'bool' (optional)
             }
         """
         domain_id = params["domain_id"]
@@ -124,7 +139,9 @@ class UnifiedCostService(BaseService):
         )
 
         if not exchange_date:
-            exchange_date = self._get_exchange_date(
+            exchange_date = self._get_pinned_exchange_date(
+                params, unified_cost_job_vo, unified_cost_config, is_confirmed
+            ) or self._get_exchange_date(
                 unified_cost_config, aggregation_month, is_confirmed
             )
         if isinstance(exchange_date, str):
@@ -142,43 +159,183 @@ class UnifiedCostService(BaseService):
             currency_map = unified_cost_config["custom_exchange_rate"]
             exchange_source = unified_cost_config.get("exchange_source", "MANUAL")
 
-        workspace_ids = self._get_workspace_ids_with_none(domain_id)
+        aggregation_mode = unified_cost_config.get(
+            "aggregation_mode",
+            config.get_global("UNIFIED_COST_AGGREGATION_MODE", "WORKSPACE"),
+        )
+
+        exchange_date_str = exchange_date.strftime("%Y-%m-%d")
+        is_incremental = self._check_incremental_run(
+            params, unified_cost_job_vo, exchange_date_str, is_confirmed
+        )
+
+        workspace_name_map = self._get_workspace_name_map_with_none(domain_id)
+        workspace_ids = list(workspace_name_map.keys())
+
+        concurrency = self._get_concurrency(unified_cost_config)
+
+        generation_ids = {}
+        failed_workspaces = {}
+        is_swapped = False
+
+        run_timeout = config.get_global("UNIFIED_COST_RUN_TIMEOUT", 10800)
+        if not self.unified_cost_job_mgr.claim_unified_cost_job(
+            unified_cost_job_vo,
+            datetime.utcnow() - timedelta(seconds=run_timeout),
+            force=not is_incremental,
+        ):
+            _LOGGER.debug(
+                f"[run_unified_cost] skip incremental run, the month is running ({aggregation_month})"
+            )
+            return None
 
         try:
-            unified_cost_created_at = datetime.now(timezone.utc)
-            for workspace_id in workspace_ids:
+            name_maps = self._get_domain_name_maps(domain_id, workspace_name_map)
+            data_source_vos = name_maps["data_source_vos"]
+            data_source_ids = [vo.data_source_id for vo in data_source_vos]
+
+            changed_data_source_ids, watermarks = self._get_changed_data_source_ids(
+                unified_cost_job_vo, aggregation_month, data_source_vos
+            )
+
+            # names, workspaces, account mappings and rules are not tracked by sync jobs
+            input_hash = self._make_unified_cost_input_hash(domain_id, name_maps)
+            if is_incremental and unified_cost_job_vo.input_hash != input_hash:
+                _LOGGER.debug(
+                    f"[run_unified_cost] inputs are changed, run full recomputation ({aggregation_month})"
+                )
+                is_incremental = False
+
+            if is_incremental:
+                generations = dict(unified_cost_job_vo.generations)
+                removed_data_source_ids = [
+                    data_source_id
+                    for data_source_id in generations
+                    if data_source_id not in data_source_ids
+                ]
+                for data_source_id in removed_data_source_ids:
+                    del generations[data_source_id]
+
+                _LOGGER.debug(
+                    f"[run_unified_cost] incremental run ({aggregation_month}): changed data sources: {changed_data_source_ids}, removed data sources: {removed_data_source_ids}"
+                )
 
-                self.create_unified_cost_with_workspace(
+                if not changed_data_source_ids and not removed_data_source_ids:
+                    self.unified_cost_job_mgr.update_generations_unified_cost_job(
+                        unified_cost_job_vo,
+                        generations,
+                        watermarks,
+                        unified_cost_job_vo.exchange_date,
+                        input_hash,
+                    )
+                    return None
+
+                replaced_data_source_ids = (
+                    changed_data_source_ids + removed_data_source_ids
+                )
+            else:
+                generations = {}
+                changed_data_source_ids = data_source_ids
+                replaced_data_source_ids = None
+
+            # write every changed (data_source_id, billed_month) slice into a staging
+            # generation which becomes visible only after the generation pointers of
+            # the unified cost job are swapped
+            for data_source_id in changed_data_source_ids:
+                generation_ids[data_source_id] = utils.generate_id("generation")
+
+            name_maps = dict(
+                name_maps,
+                data_source_vos=[
+                    data_source_vo
+                    for data_source_vo in data_source_vos
+                    if data_source_vo.data_source_id in generation_ids
+                ],
+            )
+
+            if aggregation_mode == "DOMAIN":
+                self.create_unified_cost_with_domain(
                     exchange_source,
                     domain_id,
-                    workspace_id,
                     currency_map,
                     exchange_date,
                     aggregation_execution_date,
                     aggregation_month,
+                    name_maps,
+                    generation_ids,
                     is_confirmed,
                 )
-                self._delete_old_unified_costs(
+            else:
+                failed_workspaces = self._create_unified_cost_with_workspaces(
+                    workspace_ids,
+                    concurrency,
+                    exchange_source,
                     domain_id,
+                    currency_map,
+                    exchange_date,
+                    aggregation_execution_date,
                     aggregation_month,
+                    name_maps,
+                    generation_ids,
                     is_confirmed,
-                    unified_cost_created_at,
+                )
+
+            # keep the previous unified costs of failed workspaces
+            for workspace_id in failed_workspaces:
+                self._restore_failed_workspace_unified_costs(
+                    domain_id,
+                    aggregation_month,
                     workspace_id,
+                    generation_ids,
+                    unified_cost_job_vo.generations or {},
                 )
 
-                if workspace_id is not None:
+            self.unified_cost_job_mgr.update_failed_workspaces_unified_cost_job(
+                unified_cost_job_vo, failed_workspaces
+            )
+
+            generations.update(generation_ids)
+            self.unified_cost_job_mgr.update_generations_unified_cost_job(
+                unified_cost_job_vo,
+                generations,
+                watermarks,
+                exchange_date_str,
+                input_hash,
+            )
+            is_swapped = True
+            self.unified_cost_mgr.remove_active_generation_cache(domain_id)
+            self.unified_cost_mgr.remove_stat_cache(domain_id)
+
+            self._delete_old_unified_costs(
+                domain_id,
+                aggregation_month,
+                list(generations.values()),
+                replaced_data_source_ids,
+            )
+
+            for workspace_id in workspace_ids:
+                if workspace_id is not None and workspace_id not in failed_workspaces:
                     self.budget_usage_mgr.update_budget_usage(domain_id, workspace_id)
 
+            # a month with failed workspaces is not confirmed so that it is retried
             self.unified_cost_job_mgr.update_is_confirmed_unified_cost_job(
-                unified_cost_job_vo, is_confirmed
+                unified_cost_job_vo, is_confirmed and not failed_workspaces
             )
 
+            self.unified_cost_mgr.remove_active_generation_cache(domain_id)
             self.unified_cost_mgr.remove_stat_cache(domain_id)
         except Exception as e:
             _LOGGER.error(f"[run_unified_cost] error: {e}", exc_info=True)
+            if generation_ids and not is_swapped:
+                self.unified_cost_mgr.delete_unified_costs_by_generation(
+                    domain_id, aggregation_month, list(generation_ids.values())
+                )
+
             self.unified_cost_job_mgr.update_is_confirmed_unified_cost_job(
                 unified_cost_job_vo, False
             )
+        finally:
+            self.unified_cost_job_mgr.release_unified_cost_job(unified_cost_job_vo)
 
     @transaction(
         permission="cost-analysis:UnifiedCost.read",
@@ -296,7 +453,7 @@ class UnifiedCostService(BaseService):
         (
             cost_report_data_vos,
             total_count,
-        ) = self.unified_cost_mgr.list_unified_costs(query)
+        ) = self.unified_cost_mgr.list_unified_costs(query, params.domain_id)
 
         cost_reports_data_info = [
             cost_report_data_vo.to_dict()
@@ -373,10 +530,12 @@ class UnifiedCostService(BaseService):
         """
 
         query = params.query or {}
-        return self.unified_cost_mgr.stat_unified_costs(query)
+        return self.unified_cost_mgr.stat_unified_costs(query, params.domain_id)
 
     def run_current_month_unified_costs(self, domain_id: str) -> None:
-        self.unified_cost_mgr.push_unified_cost_job_task({"domain_id": domain_id})
+        self.unified_cost_mgr.push_unified_cost_job_task(
+            {"domain_id": domain_id, "incremental": True}
+        )
 
     def run_last_month_unified_costs(
         self,
@@ -385,7 +544,7 @@ class UnifiedCostService(BaseService):
     ) -> None:
 
         self.unified_cost_mgr.push_unified_cost_job_task(
-            {"domain_id": domain_id, "month": month}
+            {"domain_id": domain_id, "month": month, "incremental": True}
         )
 
     def create_unified_cost_with_workspace(
@@ -397,37 +556,311 @@ class UnifiedCostService(BaseService):
         exchange_date: datetime,
         aggregation_execution_date: datetime,
         aggregation_month: str,
+        name_maps: dict,
+        generation_ids: dict,
         is_confirmed: bool = False,
     ) -> None:
-        identity_mgr = IdentityManager(token=config.get_global("TOKEN"))
         workspace_ids = [workspace_id]
-        workspace_name = None
-        project_name_map = {}
-        service_account_name_map = {}
 
         if workspace_id:
-            workspace_name = identity_mgr.get_workspace(workspace_id, domain_id)
-            v_workspace_ids = self._get_virtual_workspace_ids_from_ds_account(
-                domain_id, workspace_id
-            )
+            v_workspace_ids = name_maps["v_workspace_ids_map"].get(workspace_id, [])
             if v_workspace_ids:
                 workspace_ids.extend(v_workspace_ids)
 
-            project_name_map = identity_mgr.get_project_name_map(
-                domain_id, workspace_id
+        data_source_currency_map, data_source_name_map, data_source_ids = (
+            self._get_data_source_currency_map(
+                workspace_id, name_maps["data_source_vos"]
             )
+        )
+
+        if not data_source_ids:
+            return None
 
-            service_account_name_map = identity_mgr.get_service_account_name_map(
-                domain_id, workspace_id
+        query = self._make_monthly_cost_query(
+            domain_id, aggregation_month, data_source_ids, workspace_ids
+        )
+
+        _LOGGER.debug(
+            f"[create_unified_cost_with_workspace] monthly_costs query: {query}"
+        )
+
+        cursor = self.cost_mgr.analyze_monthly_costs(query, domain_id)
+
+        base_data = self._make_unified_cost_base_data(
+            exchange_source,
+            domain_id,
+            exchange_date,
+            aggregation_execution_date,
+            is_confirmed,
+        )
+        exchange_rate_matrix = self.unified_cost_mgr.make_exchange_rate_matrix(
+            currency_map
+        )
+
+        unified_costs_data = []
+        row_count = 0
+        for row in cursor:
+            unified_costs_data.append(
+                self._make_unified_cost_data(
+                    row,
+                    workspace_id,
+                    base_data,
+                    name_maps,
+                    data_source_currency_map,
+                    data_source_name_map,
+                    generation_ids,
+                )
             )
 
-        data_source_currency_map, data_source_name_map, data_source_ids = (
-            self._get_data_source_currency_map(domain_id, workspace_id)
+            if len(unified_costs_data) >= _UNIFIED_COST_BATCH_SIZE:
+                row_count += self._create_unified_costs(
+                    unified_costs_data, exchange_rate_matrix
+                )
+                unified_costs_data = []
+
+        row_count += self._create_unified_costs(
+            unified_costs_data, exchange_rate_matrix
         )
 
-        unified_cost_billed_year = aggregation_month.split("-")[0]
+        _LOGGER.debug(
+            f"[create_unified_cost_with_workspace] create count: {row_count} (workspace_id: {workspace_id})"
+        )
+
+    def create_unified_cost_with_domain(
+        self,
+        exchange_source: str,
+        domain_id: str,
+        currency_map: dict,
+        exchange_date: datetime,
+        aggregation_execution_date: datetime,
+        aggregation_month: str,
+        name_maps: dict,
+        generation_ids: dict,
+        is_confirmed: bool = False,
+    ) -> None:
+        workspace_name_map = name_maps["workspace_name_map"]
+
+        # route monthly costs of virtual workspaces to their linked workspace
+        v_workspace_route_map = {}
+        for workspace_id, v_workspace_ids in name_maps["v_workspace_ids_map"].items():
+            for v_workspace_id in v_workspace_ids:
+                v_workspace_route_map[v_workspace_id] = workspace_id
+
+        data_source_currency_map = {}
+        data_source_name_map = {}
+        data_source_workspace_map = {}
+        for data_source_vo in name_maps["data_source_vos"]:
+            data_source_id = data_source_vo.data_source_id
+            data_source_workspace_map[data_source_id] = data_source_vo.workspace_id
+            data_source_currency_map[data_source_id] = data_source_vo.plugin_info[
+                "metadata"
+            ]["currency"]
+            data_source_name_map[data_source_id] = data_source_vo.name
+
+        if not data_source_workspace_map:
+            return None
+
+        query = self._make_monthly_cost_query(
+            domain_id, aggregation_month, list(data_source_workspace_map.keys())
+        )
 
-        query = {
+        _LOGGER.debug(f"[create_unified_cost_with_domain] monthly_costs query: {query}")
+
+        cursor = self.cost_mgr.analyze_monthly_costs(query, domain_id)
+
+        base_data = self._make_unified_cost_base_data(
+            exchange_source,
+            domain_id,
+            exchange_date,
+            aggregation_execution_date,
+            is_confirmed,
+        )
+        exchange_rate_matrix = self.unified_cost_mgr.make_exchange_rate_matrix(
+            currency_map
+        )
+
+        unified_costs_data = []
+        row_count = 0
+        for row in cursor:
+            row_workspace_id = row.get("_id", {}).get("workspace_id")
+
+            if row_workspace_id in workspace_name_map:
+                workspace_id = row_workspace_id
+            elif row_workspace_id in v_workspace_route_map:
+                workspace_id = v_workspace_route_map[row_workspace_id]
+            else:
+                continue
+
+            data_source_id = row.get("_id", {}).get("data_source_id")
+            allowed_workspace_ids = ["*", workspace_id] if workspace_id else ["*"]
+            if data_source_workspace_map.get(data_source_id) not in allowed_workspace_ids:
+                continue
+
+            unified_costs_data.append(
+                self._make_unified_cost_data(
+                    row,
+                    workspace_id,
+                    base_data,
+                    name_maps,
+                    data_source_currency_map,
+                    data_source_name_map,
+                    generation_ids,
+                )
+            )
+
+            if len(unified_costs_data) >= _UNIFIED_COST_BATCH_SIZE:
+                row_count += self._create_unified_costs(
+                    unified_costs_data, exchange_rate_matrix
+                )
+                unified_costs_data = []
+
+        row_count += self._create_unified_costs(
+            unified_costs_data, exchange_rate_matrix
+        )
+
+        _LOGGER.debug(
+            f"[create_unified_cost_with_domain] create count: {row_count} (domain_id: {domain_id})"
+        )
+
+    def _create_unified_cost_with_workspaces(
+        self,
+        workspace_ids: list,
+        concurrency: int,
+        exchange_source: str,
+        domain_id: str,
+        currency_map: dict,
+        exchange_date: datetime,
+        aggregation_execution_date: datetime,
+        aggregation_month: str,
+        name_maps: dict,
+        generation_ids: dict,
+        is_confirmed: bool = False,
+    ) -> dict:
+        failed_workspaces = {}
+
+        # transactions are thread local, so pool threads share the one of this run
+        # to keep its token metadata and rollbacks
+        transaction = self.transaction
+
+        def _create_unified_cost(workspace_id: Union[str, None]) -> None:
+            self.create_unified_cost_with_workspace(
+                exchange_source,
+                domain_id,
+                workspace_id,
+                currency_map,
+                exchange_date,
+                aggregation_execution_date,
+                aggregation_month,
+                name_maps,
+                generation_ids,
+                is_confirmed,
+            )
+
+        def _create_unified_cost_in_thread(workspace_id: Union[str, None]) -> None:
+            thread_id = str(threading.current_thread().ident)
+            setattr(LOCAL_STORAGE, thread_id, transaction)
+            try:
+                _create_unified_cost(workspace_id)
+            finally:
+                delattr(LOCAL_STORAGE, thread_id)
+
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(
+                        _create_unified_cost_in_thread, workspace_id
+                    ): workspace_id
+                    for workspace_id in workspace_ids
+                }
+                for future in as_completed(futures):
+                    workspace_id = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        _LOGGER.error(
+                            f"[_create_unified_cost_with_workspaces] workspace_id: {workspace_id}, error: {e}",
+                            exc_info=True,
+                        )
+                        failed_workspaces[workspace_id] = str(e)
+        else:
+            for workspace_id in workspace_ids:
+                try:
+                    _create_unified_cost(workspace_id)
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[_create_unified_cost_with_workspaces] workspace_id: {workspace_id}, error: {e}",
+                        exc_info=True,
+                    )
+                    failed_workspaces[workspace_id] = str(e)
+
+        return failed_workspaces
+
+    def _restore_failed_workspace_unified_costs(
+        self,
+        domain_id: str,
+        aggregation_month: str,
+        workspace_id: Union[str, None],
+        generation_ids: dict,
+        old_generations: dict,
+    ) -> None:
+        conditions = {
+            "domain_id": domain_id,
+            "billed_year": aggregation_month.split("-")[0],
+            "billed_month": aggregation_month,
+            "workspace_id": workspace_id,
+        }
+
+        self.unified_cost_mgr.filter_unified_costs(
+            generation_id=list(generation_ids.values()), **conditions
+        ).delete()
+
+        # previous rows are copied, not moved, so they stay visible until the swap
+        # and the copies become visible with it. data sources without a generation
+        # yet keep the rows created before generations (generation_id: None)
+        for data_source_id, generation_id in generation_ids.items():
+            old_generation_id = old_generations.get(data_source_id)
+
+            unified_costs_data = []
+            for unified_cost_data in self.unified_cost_mgr.filter_unified_costs(
+                data_source_id=data_source_id,
+                generation_id=old_generation_id,
+                **conditions,
+            ).as_pymongo():
+                unified_cost_data.pop("_id", None)
+                unified_cost_data["generation_id"] = generation_id
+                unified_costs_data.append(unified_cost_data)
+
+                if len(unified_costs_data) >= _UNIFIED_COST_BATCH_SIZE:
+                    self.unified_cost_mgr.create_unified_costs(unified_costs_data)
+                    unified_costs_data = []
+
+            self.unified_cost_mgr.create_unified_costs(unified_costs_data)
+
+        _LOGGER.debug(
+            f"[_restore_failed_workspace_unified_costs] keep previous unified costs (workspace_id: {workspace_id})"
+        )
+
+    @staticmethod
+    def _make_monthly_cost_query(
+        domain_id: str,
+        aggregation_month: str,
+        data_source_ids: list,
+        workspace_ids: list = None,
+    ) -> dict:
+        query_filter = [
+            {"k": "domain_id", "v": domain_id, "o": "eq"},
+            {"k": "data_source_id", "v": data_source_ids, "o": "in"},
+            {"k": "billed_month", "v": aggregation_month, "o": "eq"},
+        ]
+
+        if workspace_ids is not None:
+            query_filter.append({"k": "workspace_id", "v": workspace_ids, "o": "in"})
+
+        query_filter.append(
+            {"k": "billed_year", "v": aggregation_month.split("-")[0], "o": "eq"}
+        )
+
+        return {
             "group_by": [
                 "billed_year",
                 "workspace_id",
@@ -449,89 +882,102 @@ class UnifiedCostService(BaseService):
             },
             "start": aggregation_month,
             "end": aggregation_month,
-            "filter": [
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "data_source_id", "v": data_source_ids, "o": "in"},
-                {"k": "billed_month", "v": aggregation_month, "o": "eq"},
-                {"k": "workspace_id", "v": workspace_ids, "o": "in"},
-                {"k": "billed_year", "v": unified_cost_billed_year, "o": "eq"},
-            ],
+            "filter": query_filter,
             "return_type": "cursor",
         }
 
-        _LOGGER.debug(
-            f"[create_unified_cost_with_workspace] monthly_costs query: {query}"
-        )
+    @staticmethod
+    def _make_unified_cost_base_data(
+        exchange_source: str,
+        domain_id: str,
+        exchange_date: datetime,
+        aggregation_execution_date: datetime,
+        is_confirmed: bool,
+    ) -> dict:
+        return {
+            "domain_id": domain_id,
+            "exchange_date": exchange_date.strftime("%Y-%m-%d"),
+            "exchange_source": exchange_source,
+            "is_confirmed": is_confirmed,
+            "aggregation_date": aggregation_execution_date.strftime("%Y-%m-%d"),
+        }
 
-        # todo : use cursor
-        cursor = self.cost_mgr.analyze_monthly_costs(query, domain_id)
+    def _create_unified_costs(
+        self, unified_costs_data: list, exchange_rate_matrix: tuple
+    ) -> int:
+        converted_costs = self.unified_cost_mgr.get_exchange_currencies(
+            [unified_cost_data["cost"] for unified_cost_data in unified_costs_data],
+            [unified_cost_data["currency"] for unified_cost_data in unified_costs_data],
+            exchange_rate_matrix,
+        )
+        for unified_cost_data, cost in zip(unified_costs_data, converted_costs):
+            unified_cost_data["cost"] = cost
 
-        exchange_date_str = exchange_date.strftime("%Y-%m-%d")
-        aggregation_execution_date_str = aggregation_execution_date.strftime("%Y-%m-%d")
+        return self.unified_cost_mgr.create_unified_costs(unified_costs_data)
 
-        row_count = 0
-        for row in cursor:
-            aggregated_unified_cost_data = copy.deepcopy(row)
+    def _make_unified_cost_data(
+        self,
+        row: dict,
+        workspace_id: Union[str, None],
+        base_data: dict,
+        name_maps: dict,
+        data_source_currency_map: dict,
+        data_source_name_map: dict,
+        generation_ids: dict,
+    ) -> dict:
+        aggregated_unified_cost_data = copy.deepcopy(row)
+
+        for key, value in row.get("_id", {}).items():
+            aggregated_unified_cost_data[key] = value
+
+        # set data source name and currency
+        data_source_id = aggregated_unified_cost_data["data_source_id"]
+        unified_cost_origin_currency = data_source_currency_map.get(
+            data_source_id, "USD"
+        )
+        aggregated_unified_cost_data["data_source_name"] = data_source_name_map.get(
+            data_source_id, data_source_id
+        )
+        aggregated_unified_cost_data["currency"] = unified_cost_origin_currency
 
-            for key, value in row.get("_id", {}).items():
-                aggregated_unified_cost_data[key] = value
+        # cost is converted per batch in _create_unified_costs
+        aggregated_unified_cost_data["cost"] = aggregated_unified_cost_data.get(
+            "cost", 0
+        )
 
-            # set data source name and currency
-            data_source_id = aggregated_unified_cost_data["data_source_id"]
-            unified_cost_origin_currency = data_source_currency_map.get(
-                data_source_id, "USD"
-            )
-            aggregated_unified_cost_data["data_source_name"] = data_source_name_map.get(
-                data_source_id, data_source_id
+        # set workspace name
+        aggregated_unified_cost_data["workspace_id"] = workspace_id
+        if workspace_id:
+            aggregated_unified_cost_data["workspace_name"] = name_maps[
+                "workspace_name_map"
+            ].get(workspace_id, workspace_id)
+
+            # set project name
+            project_name_map = name_maps["project_name_maps"].get(workspace_id, {})
+            project_id = aggregated_unified_cost_data.get("project_id", None)
+            aggregated_unified_cost_data["project_name"] = project_name_map.get(
+                project_id, project_id
             )
-            aggregated_unified_cost_data["currency"] = unified_cost_origin_currency
 
-            # set cost
-            _single_cost = aggregated_unified_cost_data.get("cost", 0)
-            aggregated_unified_cost_data["cost"] = (
-                self.unified_cost_mgr.get_exchange_currency(
-                    _single_cost, unified_cost_origin_currency, currency_map
-                )
+            # set service account name
+            service_account_name_map = name_maps["service_account_name_maps"].get(
+                workspace_id, {}
             )
-
-            # set domain id
-            aggregated_unified_cost_data["domain_id"] = domain_id
-
-            # set workspace name
-            aggregated_unified_cost_data["workspace_id"] = workspace_id
-            if workspace_id:
-                aggregated_unified_cost_data["workspace_name"] = workspace_name
-                # set project name
-                project_id = aggregated_unified_cost_data.get("project_id", None)
-                aggregated_unified_cost_data["project_name"] = project_name_map.get(
-                    project_id, project_id
-                )
-
-                # set service account name
-                service_account_id = aggregated_unified_cost_data.get(
-                    "service_account_id"
-                )
-                aggregated_unified_cost_data["service_account_name"] = (
-                    service_account_name_map.get(service_account_id)
-                )
-
-            aggregated_unified_cost_data["exchange_date"] = exchange_date_str
-            aggregated_unified_cost_data["exchange_source"] = exchange_source
-
-            aggregated_unified_cost_data["is_confirmed"] = is_confirmed
-            aggregated_unified_cost_data["aggregation_date"] = (
-                aggregation_execution_date_str
+            service_account_id = aggregated_unified_cost_data.get("service_account_id")
+            aggregated_unified_cost_data["service_account_name"] = (
+                service_account_name_map.get(service_account_id)
             )
 
-            self.unified_cost_mgr.create_unified_cost(aggregated_unified_cost_data)
-            row_count += 1
-
-        _LOGGER.debug(
-            f"[create_unified_cost_with_workspace] create count: {row_count} (workspace_id: {workspace_id})"
+        aggregated_unified_cost_data.update(base_data)
+        aggregated_unified_cost_data["generation_id"] = generation_ids.get(
+            data_source_id
         )
 
+        return aggregated_unified_cost_data
+
+    @staticmethod
     def _get_data_source_currency_map(
-        self, domain_id: str, workspace_id: Union[str, None]
+        workspace_id: Union[str, None], data_source_vos: list
     ) -> Tuple[dict, dict, list]:
         data_source_currency_map = {}
         data_source_name_map = {}
@@ -540,18 +986,11 @@ class UnifiedCostService(BaseService):
         if workspace_id:
             workspace_ids.append(workspace_id)
 
-        query = {
-            "filter": [
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "workspace_id", "v": workspace_ids, "o": "in"},
-            ]
-        }
-
-        _LOGGER.debug(f"[get_data_source_currency_map] query: {query}")
-
-        data_source_vos, _ = self.data_source_mgr.list_data_sources(query)
         data_source_ids = []
         for data_source_vo in data_source_vos:
+            if data_source_vo.workspace_id not in workspace_ids:
+                continue
+
             data_source_currency_map[data_source_vo.data_source_id] = (
                 data_source_vo.plugin_info["metadata"]["currency"]
             )
@@ -560,58 +999,256 @@ class UnifiedCostService(BaseService):
 
         return data_source_currency_map, data_source_name_map, data_source_ids
 
-    def _get_virtual_workspace_ids_from_ds_account(
-        self, domain_id: str, workspace_id: Union[str, None]
-    ) -> list:
-        v_workspace_ids = []
-        ds_account_vos = self.ds_account_mgr.filter_data_source_accounts(
-            domain_id=domain_id, workspace_id=workspace_id
+    def _get_domain_name_maps(self, domain_id: str, workspace_name_map: dict) -> dict:
+        identity_mgr = IdentityManager(token=config.get_global("TOKEN"))
+
+        project_name_maps = {}
+        response = identity_mgr.list_projects(
+            {"query": {"filter": [{"k": "domain_id", "v": domain_id, "o": "eq"}]}},
+            domain_id,
         )
+        for project in response.get("results", []):
+            project_name_maps.setdefault(project.get("workspace_id"), {})[
+                project["project_id"]
+            ] = project["name"]
+
+        service_account_name_maps = {}
+        response = identity_mgr.list_service_accounts(
+            {"filter": [{"k": "domain_id", "v": domain_id, "o": "eq"}]}, domain_id
+        )
+        for service_account in response.get("results", []):
+            service_account_name_maps.setdefault(
+                service_account.get("workspace_id"), {}
+            )[service_account["service_account_id"]] = service_account["name"]
 
+        v_workspace_ids_map = {}
+        ds_account_vos = self.ds_account_mgr.filter_data_source_accounts(
+            domain_id=domain_id
+        )
         for ds_account_vo in ds_account_vos:
-            v_workspace_ids.append(ds_account_vo.v_workspace_id)
+            if ds_account_vo.workspace_id:
+                v_workspace_ids_map.setdefault(ds_account_vo.workspace_id, []).append(
+                    ds_account_vo.v_workspace_id
+                )
+
+        query = {"filter": [{"k": "domain_id", "v": domain_id, "o": "eq"}]}
+
+        _LOGGER.debug(f"[_get_domain_name_maps] data source query: {query}")
+
+        data_source_vos, _ = self.data_source_mgr.list_data_sources(query)
 
-        return v_workspace_ids
+        return {
+            "workspace_name_map": workspace_name_map,
+            "project_name_maps": project_name_maps,
+            "service_account_name_maps": service_account_name_maps,
+            "v_workspace_ids_map": v_workspace_ids_map,
+            "data_source_vos": list(data_source_vos),
+        }
+
+    @staticmethod
+    def _make_unified_cost_input_hash(domain_id: str, name_maps: dict) -> str:
+        ds_account_mgr = DataSourceAccountManager()
+        ds_rule_mgr = DataSourceRuleManager()
+
+        ds_accounts = [
+            [
+                ds_account_vo.data_source_id,
+                ds_account_vo.account_id,
+                ds_account_vo.workspace_id,
+                ds_account_vo.v_workspace_id,
+            ]
+            for ds_account_vo in ds_account_mgr.filter_data_source_accounts(
+                domain_id=domain_id
+            ).only("data_source_id", "account_id", "workspace_id", "v_workspace_id")
+        ]
+
+        ds_rules = []
+        for ds_rule_vo in ds_rule_mgr.filter_data_source_rules(domain_id=domain_id):
+            ds_rule_info = ds_rule_vo.to_mongo().to_dict()
+            for key in ["_id", "data_source", "created_at"]:
+                ds_rule_info.pop(key, None)
+            ds_rules.append(ds_rule_info)
+
+        # None is a key of the workspace name map, so maps are hashed as sorted items
+        inputs = {
+            "workspace_names": sorted(
+                name_maps["workspace_name_map"].items(), key=str
+            ),
+            "project_names": sorted(
+                name_maps["project_name_maps"].items(), key=str
+            ),
+            "service_account_names": sorted(
+                name_maps["service_account_name_maps"].items(), key=str
+            ),
+            "data_source_accounts": sorted(ds_accounts, key=str),
+            "data_source_rules": sorted(ds_rules, key=str),
+        }
+
+        return hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
 
     def _delete_old_unified_costs(
         self,
         domain_id: str,
         unified_cost_month: str,
-        is_confirmed: bool,
-        created_at: datetime,
-        workspace_id: Union[str, None],
-    ):
-        query_filter = {"filter": []}
-
-        if workspace_id:
-            query_filter["filter"].append(
-                {"key": "workspace_id", "value": workspace_id, "operator": "eq"}
-            )
-        query_filter["filter"].extend(
-            [
-                {
-                    "key": "billed_year",
-                    "value": unified_cost_month.split("-")[0],
-                    "operator": "eq",
-                },
-                {"key": "billed_month", "value": unified_cost_month, "operator": "eq"},
-                {"key": "domain_id", "value": domain_id, "operator": "eq"},
-                {"key": "created_at", "value": created_at, "operator": "lt"},
-            ]
+        generation_ids: list,
+        data_source_ids: list = None,
+    ) -> None:
+        deleted_count = self.unified_cost_mgr.delete_old_generation_unified_costs(
+            domain_id, unified_cost_month, generation_ids, data_source_ids
         )
 
         _LOGGER.debug(
-            f"[delete_old_unified_costs] delete query filter conditions: {query_filter}"
+            f"[delete_old_unified_costs] delete count: {deleted_count} ({unified_cost_month})(data_source_ids: {data_source_ids})"
         )
 
-        unified_cost_vos, total_count = self.unified_cost_mgr.list_unified_costs(
-            query=query_filter
+    @staticmethod
+    def _check_incremental_run(
+        params: dict,
+        unified_cost_job_vo: UnifiedCostJob,
+        exchange_date: str,
+        is_confirmed: bool,
+    ) -> bool:
+        if not params.get("incremental", False):
+            return False
+
+        if not config.get_global("UNIFIED_COST_INCREMENTAL_RUN", True):
+            return False
+
+        if not unified_cost_job_vo.generations:
+            return False
+
+        # rows carry is_confirmed, so the run which confirms the month writes every row
+        if is_confirmed and not unified_cost_job_vo.is_confirmed:
+            return False
+
+        # changed exchange rates require a full recomputation
+        return unified_cost_job_vo.exchange_date == exchange_date
+
+    @staticmethod
+    def _get_concurrency(unified_cost_config: dict) -> int:
+        default_concurrency = config.get_global("UNIFIED_COST_CONCURRENCY", 1)
+        concurrency = unified_cost_config.get("concurrency", default_concurrency)
+
+        try:
+            concurrency = int(concurrency)
+        except (TypeError, ValueError):
+            concurrency = 0
+
+        if concurrency < 1:
+            _LOGGER.warning(
+                f"[_get_concurrency] invalid concurrency: {unified_cost_config.get('concurrency')}, "
+                f"use default: {default_concurrency}"
+            )
+            return max(int(default_concurrency), 1)
+
+        return concurrency
+
+    @staticmethod
+    def _is_incremental_run_hourly(unified_cost_config: dict) -> bool:
+        # incremental runs are cheap when nothing is synced, so they pick up the
+        # synced data sources within an hour instead of at the next run hour
+        if not config.get_global("UNIFIED_COST_INCREMENTAL_RUN", True):
+            return False
+
+        return unified_cost_config.get(
+            "incremental_run_hourly",
+            config.get_global("UNIFIED_COST_INCREMENTAL_RUN_HOURLY", True),
         )
 
-        _LOGGER.debug(
-            f"[delete_old_unified_costs] delete count: {total_count} ({unified_cost_month})({workspace_id}, is_confirmed: {is_confirmed})"
+    @staticmethod
+    def _get_pinned_exchange_date(
+        params: dict,
+        unified_cost_job_vo: UnifiedCostJob,
+        unified_cost_config: dict,
+        is_confirmed: bool,
+    ) -> Union[datetime, None]:
+        # the exchange rates of an unconfirmed month are kept until they are refreshed,
+        # otherwise every daily rate sync would force a full recomputation
+        if is_confirmed or not params.get("incremental", False):
+            return None
+
+        if not unified_cost_job_vo.exchange_date or not unified_cost_job_vo.generations:
+            return None
+
+        refresh_days = unified_cost_config.get(
+            "exchange_rate_refresh_days",
+            config.get_global("UNIFIED_COST_EXCHANGE_RATE_REFRESH_DAYS", 7),
+        )
+        pinned_exchange_date = datetime.strptime(
+            unified_cost_job_vo.exchange_date, "%Y-%m-%d"
         )
-        unified_cost_vos.delete()
+
+        if datetime.utcnow() - pinned_exchange_date >= timedelta(
+            days=int(refresh_days)
+        ):
+            return None
+
+        return pinned_exchange_date
+
+    def _get_changed_data_source_ids(
+        self,
+        unified_cost_job_vo: UnifiedCostJob,
+        aggregation_month: str,
+        data_source_vos: list,
+    ) -> Tuple[list, dict]:
+        job_mgr = JobManager()
+        generations = unified_cost_job_vo.generations or {}
+        watermarks = dict(unified_cost_job_vo.watermarks or {})
+        changed_data_source_ids = []
+
+        for data_source_vo in data_source_vos:
+            data_source_id = data_source_vo.data_source_id
+            watermark = watermarks.get(data_source_id)
+
+            conditions = {
+                "data_source_id": data_source_id,
+                "domain_id": unified_cost_job_vo.domain_id,
+                "status": "SUCCESS",
+            }
+
+            if watermark:
+                conditions["finished_at__gt"] = watermark
+
+            job_vos = job_mgr.filter_jobs(**conditions).order_by("-finished_at")
+            latest_job_vo = job_vos.first()
+
+            if data_source_id not in generations:
+                changed_data_source_ids.append(data_source_id)
+            elif latest_job_vo:
+                for job_vo in job_vos:
+                    if self._check_month_changed_by_job(job_vo, aggregation_month):
+                        changed_data_source_ids.append(data_source_id)
+                        break
+
+            if latest_job_vo:
+                watermarks[data_source_id] = latest_job_vo.finished_at
+
+        return changed_data_source_ids, watermarks
+
+    @staticmethod
+    def _check_month_changed_by_job(job_vo: Job, aggregation_month: str) -> bool:
+        job_task_mgr = JobTaskManager()
+        changed_vos = list(job_vo.changed or [])
+
+        job_task_vos = job_task_mgr.filter_job_tasks(
+            job_id=job_vo.job_id, domain_id=job_vo.domain_id
+        ).only("changed")
+        for job_task_vo in job_task_vos:
+            if job_task_vo.changed:
+                changed_vos.append(job_task_vo.changed)
+
+        if not changed_vos:
+            return True
+
+        for changed_vo in changed_vos:
+            if changed_vo.start[:7] <= aggregation_month and (
+                changed_vo.end is None or aggregation_month <= changed_vo.end[:7]
+            ):
+                return True
+
+        return False
 
     def _check_unified_cost_job_is_confirmed_with_month(
         self, domain_id: str, current_month: str
@@ -701,8 +1338,8 @@ class UnifiedCostService(BaseService):
             return int(min(current_day, last_day))
 
     @staticmethod
-    def _get_workspace_ids_with_none(domain_id: str) -> list:
-        workspace_ids = [None]
+    def _get_workspace_name_map_with_none(domain_id: str) -> dict:
+        workspace_name_map = {None: None}
 
         identity_mgr = IdentityManager()
         system_token = config.get_global("TOKEN")
@@ -713,9 +1350,9 @@ class UnifiedCostService(BaseService):
             token=system_token,
         )
         for workspace in response.get("results", []):
-            workspace_ids.append(workspace["workspace_id"])
+            workspace_name_map[workspace["workspace_id"]] = workspace["name"]
 
-        return workspace_ids
+        return workspace_name_map
 
     def _get_is_confirmed_with_aggregation_month(
         self, aggregation_month: str, unified_cost_config: dict
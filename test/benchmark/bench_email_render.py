@@ -0,0 +1,53 @@
+"""Micro-benchmark of rendering a cost report email per recipient.
+
+Run it from the repository root:
+
+    python test/benchmark/bench_email_render.py [RECIPIENTS]
+"""
+
+import sys
+import timeit
+
+# scripts are not run by pytest, so the bootstrap of test/conftest.py is imported here
+import spaceone.cost_analysis.service
+from spaceone.cost_analysis.manager.email_manager import EmailManager, TEMPLATES
+
+_TEMPLATE_NAME = "cost_report_en.html"
+_CONTEXT = {
+    "report_number": "CostReport_2024-01_0001",
+    "name": "Monthly Cost Report",
+    "report_date": "2024-02-01",
+    "report_period": "2024-01-01 ~ 2024-01-31",
+}
+
+
+def _get_recipient_info(index: int) -> dict:
+    return {
+        "user_name": f"user-{index}@example.com",
+        "download_link": f"https://console.example.com/cost-report?sso_access_token={index}",
+    }
+
+
+def render_full(recipients: int) -> None:
+    template = TEMPLATES[_TEMPLATE_NAME]
+    for index in range(recipients):
+        template.render(**_CONTEXT, **_get_recipient_info(index))
+
+
+def render_shared(recipients: int) -> None:
+    for index in range(recipients):
+        EmailManager.render_template(
+            _TEMPLATE_NAME, _get_recipient_info(index), **_CONTEXT
+        )
+
+
+def main() -> None:
+    recipients = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    for name, render in [("full render", render_full), ("shared render", render_shared)]:
+        elapsed = min(timeit.repeat(lambda: render(recipients), number=1, repeat=5))
+        print(f"{name}: {elapsed / recipients * 1e6:.1f} us per recipient")
+
+
+if __name__ == "__main__":
+    main()
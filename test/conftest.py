@@ -0,0 +1,2 @@
+# services are loaded first as in the server, since managers and services import each other
+import spaceone.cost_analysis.service
@@ -0,0 +1,158 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+from spaceone.core import config
+
+from spaceone.cost_analysis.connector.currency_connector import CurrencyConnector
+
+# USD is the base currency, and JPY has no quote on 2024-01-03
+_BASE_QUOTES = {
+    "USD/KRW": {"2024-01-02": 1300.0, "2024-01-03": 1310.0, "2024-01-04": 1320.0},
+    "USD/JPY": {"2024-01-02": 140.0, "2024-01-04": 145.0},
+}
+
+
+def _make_rate_info(rates: dict) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Date": [datetime.strptime(date, "%Y-%m-%d") for date in rates],
+            "Close": list(rates.values()),
+        }
+    )
+
+
+class TestCurrencyConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+
+    def setUp(self):
+        self.connector = CurrencyConnector()
+
+        patcher = patch.object(
+            self.connector,
+            "_fetch_exchange_rate_info",
+            side_effect=self._fetch_exchange_rate_info,
+        )
+        self.fetch_exchange_rate_info = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.addCleanup(config.set_global_force, EXCHANGE_RATE_FETCH_MODE="BASE")
+
+    @staticmethod
+    def _fetch_exchange_rate_info(pair: str, *args) -> tuple:
+        if pair in _BASE_QUOTES:
+            return _make_rate_info(_BASE_QUOTES[pair]), "FinanceDataReader"
+
+        # every other pair is fetched only in VALIDATE mode
+        from_currency, to_currency = pair.split("/")
+        rates = {
+            date: _BASE_QUOTES.get(f"USD/{to_currency}", {}).get(date, 1.0)
+            / _BASE_QUOTES.get(f"USD/{from_currency}", {}).get(date, 1.0)
+            for date in _BASE_QUOTES["USD/JPY"]
+        }
+        if pair == "KRW/JPY":
+            # the fetched rate of a pair is off from its derived rate
+            rates = {date: rate * 1.1 for date, rate in rates.items()}
+
+        return _make_rate_info(rates), "FinanceDataReader"
+
+    def _list_cross_exchange_rates(self) -> dict:
+        exchange_rates = self.connector.list_cross_exchange_rates(
+            datetime(2024, 1, 4), datetime(2024, 1, 1)
+        )
+        return {
+            (exchange_rate["pair"], exchange_rate["date"]): exchange_rate
+            for exchange_rate in exchange_rates
+        }
+
+    def test_fetch_only_base_pairs(self):
+        self._list_cross_exchange_rates()
+
+        self.assertCountEqual(
+            [call.args[0] for call in self.fetch_exchange_rate_info.call_args_list],
+            ["USD/KRW", "USD/JPY"],
+        )
+
+    def test_list_derived_pairs(self):
+        exchange_rates = self._list_cross_exchange_rates()
+
+        # every pair but the same currency, for each date of the base quotes
+        self.assertEqual(len(exchange_rates), 6 * 3)
+        self.assertAlmostEqual(
+            exchange_rates[("USD/KRW", "2024-01-02")]["rate"], 1300.0
+        )
+        self.assertAlmostEqual(
+            exchange_rates[("KRW/JPY", "2024-01-04")]["rate"], 145.0 / 1320.0
+        )
+        self.assertAlmostEqual(
+            exchange_rates[("JPY/KRW", "2024-01-02")]["rate"], 1300.0 / 140.0
+        )
+        self.assertEqual(
+            {exchange_rate["source"] for exchange_rate in exchange_rates.values()},
+            {"FinanceDataReader"},
+        )
+
+    def test_inverse_pairs(self):
+        exchange_rates = self._list_cross_exchange_rates()
+
+        for (pair, date), exchange_rate in exchange_rates.items():
+            from_currency, to_currency = pair.split("/")
+            inverse_rate = exchange_rates[(f"{to_currency}/{from_currency}", date)]
+            with self.subTest(pair=pair, date=date):
+                self.assertAlmostEqual(
+                    exchange_rate["rate"] * inverse_rate["rate"], 1.0
+                )
+
+    def test_carry_forward_missing_base_quote(self):
+        exchange_rates = self._list_cross_exchange_rates()
+
+        # JPY has no quote on 2024-01-03, so the quote of 2024-01-02 is used
+        self.assertAlmostEqual(exchange_rates[("USD/JPY", "2024-01-03")]["rate"], 140.0)
+        self.assertAlmostEqual(
+            exchange_rates[("KRW/JPY", "2024-01-03")]["rate"], 140.0 / 1310.0
+        )
+
+    def test_drop_dates_before_first_base_quote(self):
+        with patch.dict(
+            _BASE_QUOTES,
+            {"USD/JPY": {"2024-01-03": 142.0, "2024-01-04": 145.0}},
+        ):
+            exchange_rates = self._list_cross_exchange_rates()
+
+        # a cross rate cannot be derived before every base has a quote
+        self.assertEqual(
+            sorted({date for _, date in exchange_rates}),
+            ["2024-01-03", "2024-01-04"],
+        )
+
+    def test_add_currency_map_date_by_base(self):
+        currency_map, currency_date = self.connector.add_currency_map_date(
+            datetime(2024, 1, 4), datetime(2024, 1, 1)
+        )
+
+        self.assertEqual(currency_date, pd.Timestamp(2024, 1, 4))
+        self.assertEqual(currency_map["KRW"]["KRW/KRW"], 1.0)
+        self.assertAlmostEqual(currency_map["KRW"]["KRW/USD"], 1 / 1320.0)
+        self.assertAlmostEqual(currency_map["JPY"]["JPY/KRW"], 1320.0 / 145.0)
+
+    def test_validate_mode(self):
+        config.set_global_force(EXCHANGE_RATE_FETCH_MODE="VALIDATE")
+
+        with self.assertLogs(
+            "spaceone.cost_analysis.connector.currency_connector", level="WARNING"
+        ) as logs:
+            currency_map, _ = self.connector.add_currency_map_date(
+                datetime(2024, 1, 4), datetime(2024, 1, 1)
+            )
+
+        # the fetched rates are used, and only the pair off from its derived rate is warned
+        self.assertAlmostEqual(currency_map["KRW"]["KRW/JPY"], 145.0 / 1320.0 * 1.1)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("KRW/JPY mismatch", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import unittest
+
+from sqlalchemy import Column, Float, MetaData, String, Table, insert
+from spaceone.core import config
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+from spaceone.cost_analysis.connector.local_warehouse_connector import (
+    LocalWarehouseConnector,
+)
+from spaceone.cost_analysis.connector.warehouse_connector import WarehouseConnector
+from spaceone.cost_analysis.error import (
+    ERROR_NOT_SUPPORT_QUERY_OPTION,
+    ERROR_WAREHOUSE_DRIVER_NOT_INSTALLED,
+)
+
+_COSTS = [
+    {"provider": "aws", "product": "EC2", "billed_month": "2024-01", "cost": 10.0},
+    {"provider": "aws", "product": "S3", "billed_month": "2024-01", "cost": 2.0},
+    {"provider": "aws", "product": "EC2", "billed_month": "2024-02", "cost": 5.0},
+    {"provider": "gcp", "product": "GCE", "billed_month": "2024-01", "cost": 7.0},
+    {"provider": None, "product": "Support", "billed_month": "2024-02", "cost": 1.0},
+]
+
+
+class TestWarehouseConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        config.set_global_force(
+            WAREHOUSES={
+                "LOCAL": {
+                    "url": "sqlite://",
+                    "aws": {"table": {"MONTHLY": "monthly_cost"}},
+                },
+                "UNKNOWN": {"url": "unknowndb://"},
+            }
+        )
+
+        cls.connector = LocalWarehouseConnector(warehouse_type="LOCAL")
+
+        metadata = MetaData()
+        monthly_cost = Table(
+            "monthly_cost",
+            metadata,
+            Column("provider", String),
+            Column("product", String),
+            Column("billed_month", String),
+            Column("cost", Float),
+        )
+        metadata.create_all(cls.connector.engine)
+
+        with cls.connector.engine.begin() as conn:
+            conn.execute(insert(monthly_cost), _COSTS)
+
+    @classmethod
+    def tearDownClass(cls):
+        config.set_global_force(WAREHOUSES={})
+
+    def _analyze(self, query: dict) -> dict:
+        return self.connector.analyze_costs("aws", query, "MONTHLY")
+
+    def _get_products(self, filter_query: list) -> list:
+        response = self._analyze(
+            {
+                "group_by": ["product"],
+                "fields": {"cost": {"key": "cost", "operator": "sum"}},
+                "filter": filter_query,
+                "sort": [{"key": "product"}],
+            }
+        )
+        return [result["product"] for result in response["results"]]
+
+    def test_filter_in_with_none(self):
+        self.assertEqual(
+            self._get_products([{"k": "provider", "v": ["gcp", None], "o": "in"}]),
+            ["GCE", "Support"],
+        )
+
+    def test_filter_not_in(self):
+        # null values are not in any list, as in MongoDB
+        self.assertEqual(
+            self._get_products([{"k": "provider", "v": ["aws"], "o": "not_in"}]),
+            ["GCE", "Support"],
+        )
+        self.assertEqual(
+            self._get_products([{"k": "provider", "v": ["aws", None], "o": "not_in"}]),
+            ["GCE"],
+        )
+
+    def test_group_by(self):
+        response = self._analyze(
+            {
+                "group_by": [{"key": "provider", "name": "vendor"}],
+                "fields": {
+                    "cost": {"key": "cost", "operator": "sum"},
+                    "count": {"operator": "count"},
+                },
+                "filter": [{"k": "provider", "v": True, "o": "exists"}],
+                "sort": [{"key": "cost", "desc": True}],
+            }
+        )
+
+        self.assertEqual(
+            response["results"],
+            [
+                {"vendor": "aws", "cost": 17.0, "count": 3},
+                {"vendor": "gcp", "cost": 7.0, "count": 1},
+            ],
+        )
+
+    def test_field_group(self):
+        response = self._analyze(
+            {
+                "granularity": "MONTHLY",
+                "group_by": ["provider"],
+                "fields": {"cost": {"key": "cost", "operator": "sum"}},
+                "field_group": ["date"],
+                "filter": [{"k": "provider", "v": "aws", "o": "eq"}],
+            }
+        )
+
+        self.assertEqual(len(response["results"]), 1)
+        result = response["results"][0]
+        self.assertEqual(result["provider"], "aws")
+        self.assertEqual(result["_total_cost"], 17.0)
+        self.assertEqual(
+            sorted(result["cost"], key=lambda value: value["date"]),
+            [{"date": "2024-01", "value": 12.0}, {"date": "2024-02", "value": 5.0}],
+        )
+
+    def test_sort_and_page(self):
+        query = {
+            "group_by": ["product"],
+            "fields": {"cost": {"key": "cost", "operator": "sum"}},
+            "sort": [{"key": "cost", "desc": True}],
+            "page": {"start": 2, "limit": 2},
+        }
+
+        response = self._analyze(query)
+        self.assertTrue(response["more"])
+        self.assertEqual(
+            [result["product"] for result in response["results"]], ["GCE", "S3"]
+        )
+
+        query["page"] = {"start": 4, "limit": 2}
+        response = self._analyze(query)
+        self.assertFalse(response["more"])
+        self.assertEqual(
+            [result["product"] for result in response["results"]], ["Support"]
+        )
+
+    def test_unsupported_options(self):
+        fields = {"cost": {"key": "cost", "operator": "sum"}}
+
+        with self.assertRaises(ERROR_NOT_SUPPORT_QUERY_OPTION):
+            self._analyze({"fields": fields, "select": {"cost": "cost"}})
+
+        with self.assertRaises(ERROR_NOT_SUPPORT_QUERY_OPTION):
+            self._analyze({"fields": {"products": {"key": "product", "operator": "push"}}})
+
+        with self.assertRaises(ERROR_NOT_SUPPORT_QUERY_OPTION):
+            self._analyze(
+                {"fields": fields, "filter": [{"k": "product", "v": "^E", "o": "regex"}]}
+            )
+
+        with self.assertRaises(ERROR_NOT_SUPPORT_QUERY_OPTION):
+            self.connector.analyze_costs("aws", {"fields": fields}, "DAILY")
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            self._analyze({"fields": fields, "group_by": ["tags.team"]})
+
+    def test_abstract_connector(self):
+        with self.assertRaises(TypeError):
+            WarehouseConnector(warehouse_type="LOCAL")
+
+    def test_driver_not_installed(self):
+        with self.assertRaises(ERROR_WAREHOUSE_DRIVER_NOT_INSTALLED):
+            LocalWarehouseConnector(warehouse_type="UNKNOWN")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.manager.cost_report.adjustment_policy_applier import (
+    AdjustmentPolicyApplier,
+    AdjustmentPolicySnapshot,
+)
+from spaceone.cost_analysis.manager.unified_cost_manager import UnifiedCostManager
+from spaceone.cost_analysis.model.cost_report_data.database import CostReportData
+
+_POLICY = {"report_adjustment_policy_id": "rap-1", "scope": "WORKSPACE"}
+
+_CURRENCY_MAP = {
+    "KRW": {"KRW/KRW": 1.0, "KRW/USD": 0.00075, "KRW/JPY": 0.11},
+    "USD": {"USD/KRW": 1330.0, "USD/USD": 1.0, "USD/JPY": 150.0},
+    "JPY": {"JPY/KRW": 9.0, "JPY/USD": 0.0067, "JPY/JPY": 1.0},
+}
+
+
+def _make_cost_report_vo(cost_report_id: str) -> MagicMock:
+    return MagicMock(
+        cost_report_id=cost_report_id,
+        cost_report_config_id="crc-1",
+        report_month="2024-01",
+        currency_date="2024-01-31",
+        issue_date="2024-02-10",
+        workspace_id="workspace-1",
+        project_id=None,
+        service_account_id=None,
+        domain_id="domain-1",
+    )
+
+
+def _make_adjustment(adjustment_filter: list, provider: str = None) -> dict:
+    return {
+        "report_adjustment_policy_id": "rap-1",
+        "unit": "PERCENT",
+        "value": 10.0,
+        "provider": provider,
+        "adjustment_filter": adjustment_filter,
+    }
+
+
+class TestAdjustmentPolicyApplier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        CostReportData._load_default_meta()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.policy_snapshot = AdjustmentPolicySnapshot("crc-1", "domain-1")
+        self.policy_snapshot.currency_mgr = MagicMock()
+        self.policy_snapshot.currency_mgr.get_currency_map_date.return_value = (
+            _CURRENCY_MAP,
+            datetime(2024, 1, 31),
+        )
+        self.applier = self._make_applier("cr-1")
+
+        # product or region_code is missing in some rows, as in the reports of any data source
+        for provider, product, region_code, usd in [
+            ("aws", "EC2", "ap-northeast-2", 100.0),
+            ("aws", "S3", None, 40.0),
+            ("aws", None, "us-east-1", 50.0),
+            ("google", "GCE", "asia-northeast3", 30.0),
+            ("google", None, None, 20.0),
+            (None, "Support", None, 7.0),
+        ]:
+            cost_report_data = {
+                "cost": {"KRW": usd * 1330.0, "USD": usd, "JPY": usd * 150.0},
+                "report_month": "2024-01",
+                "cost_report_id": "cr-1",
+                "cost_report_config_id": "crc-1",
+                "workspace_id": "workspace-1",
+                "domain_id": "domain-1",
+            }
+            for key, value in [
+                ("provider", provider),
+                ("product", product),
+                ("region_code", region_code),
+            ]:
+                if value is not None:
+                    cost_report_data[key] = value
+
+            CostReportData.create(cost_report_data)
+
+    def tearDown(self):
+        CostReportData.objects.delete()
+
+    def _make_applier(self, cost_report_id: str) -> AdjustmentPolicyApplier:
+        return AdjustmentPolicyApplier(
+            _make_cost_report_vo(cost_report_id), [], {}, self.policy_snapshot
+        )
+
+    def _calculate_per_adjustment(self, adjustments: list) -> dict:
+        # the query of each adjustment as before the adjustments were batched
+        costs = {}
+        for idx, adjustment_info in enumerate(adjustments):
+            adjusted_cost = self.applier._calculate_adjustment_cost(
+                self.applier._make_query_filter_with_adjustment(
+                    _POLICY, adjustment_info
+                ),
+                "PERCENT",
+                adjustment_info["value"],
+                None,
+            )
+
+            # MongoDB has no result to group when no row matches, but mongomock sums zeros
+            if not any(adjusted_cost.values()):
+                adjusted_cost = {}
+
+            costs[idx] = adjusted_cost
+
+        return costs
+
+    def _assert_same_as_per_adjustment(self, adjustments: list) -> dict:
+        with patch.object(
+            self.applier.cost_report_data_mgr,
+            "analyze_cost_reports_data",
+            wraps=self.applier.cost_report_data_mgr.analyze_cost_reports_data,
+        ) as analyze_cost_reports_data:
+            batched_costs = self.applier._calculate_percent_adjustment_costs(
+                adjustments, _POLICY
+            )
+
+        expected_costs = self._calculate_per_adjustment(adjustments)
+
+        self.assertEqual(batched_costs.keys(), expected_costs.keys())
+        for idx, expected_cost in expected_costs.items():
+            with self.subTest(adjustment=adjustments[idx]):
+                self.assertEqual(batched_costs[idx].keys(), expected_cost.keys())
+                for currency, cost in expected_cost.items():
+                    self.assertAlmostEqual(batched_costs[idx][currency], cost)
+
+        return {
+            "costs": batched_costs,
+            "query_count": analyze_cost_reports_data.call_count,
+        }
+
+    def test_not_with_missing_field(self):
+        result = self._assert_same_as_per_adjustment(
+            [
+                _make_adjustment([{"k": "product", "v": "EC2", "o": "not"}]),
+                _make_adjustment([{"k": "product", "v": None, "o": "not"}]),
+                _make_adjustment([{"k": "region_code", "v": None, "o": "eq"}]),
+                _make_adjustment([], provider="google"),
+            ]
+        )
+
+        # rows without a product are not EC2, as in MongoDB
+        self.assertAlmostEqual(result["costs"][0]["USD"], 14.7)
+        self.assertEqual(result["query_count"], 1)
+
+    def test_in_with_none(self):
+        result = self._assert_same_as_per_adjustment(
+            [
+                _make_adjustment([{"k": "product", "v": ["S3", None], "o": "in"}]),
+                _make_adjustment(
+                    [{"k": "region_code", "v": [None], "o": "not_in"}], provider="aws"
+                ),
+                _make_adjustment([{"k": "product", "v": ["Unknown"], "o": "in"}]),
+            ]
+        )
+
+        self.assertAlmostEqual(result["costs"][0]["USD"], 11.0)
+        self.assertEqual(result["costs"][2], {})
+        self.assertEqual(result["query_count"], 1)
+
+    def test_evaluable_and_fallback_adjustments(self):
+        result = self._assert_same_as_per_adjustment(
+            [
+                _make_adjustment([{"k": "product", "v": "EC2", "o": "eq"}]),
+                # operators and nested keys out of the grouped results use their own query
+                _make_adjustment([{"k": "product", "v": "E", "o": "contain"}]),
+                _make_adjustment([{"k": "cost.USD", "v": 40.0, "o": "gte"}]),
+                _make_adjustment([], provider="aws"),
+            ]
+        )
+
+        self.assertEqual(result["query_count"], 3)
+
+    def test_fixed_adjustments_share_currency_map(self):
+        fixed_adjustment = {
+            "report_adjustment_policy_id": "rap-1",
+            "unit": "FIXED",
+            "value": 100.0,
+            "currency": "USD",
+            "provider": "aws",
+            "name": "Support Fee",
+        }
+        expected_cost = UnifiedCostManager.get_exchange_currency(
+            100.0, "USD", _CURRENCY_MAP
+        )
+
+        for cost_report_id in ["cr-1", "cr-2"]:
+            applier = self._make_applier(cost_report_id)
+            applier._create_cost_report_data_for_all_methods(
+                [fixed_adjustment, _make_adjustment([], provider="aws")], _POLICY
+            )
+
+            fixed_data_vo = CostReportData.objects(
+                cost_report_id=cost_report_id,
+                report_adjustment_policy_id="rap-1",
+                product="Support Fee",
+            ).first()
+            self.assertEqual(fixed_data_vo.cost, expected_cost)
+
+        # the currency map is loaded once for every report of the run
+        self.policy_snapshot.currency_mgr.get_currency_map_date.assert_called_once_with(
+            currency_end_date=datetime(2024, 1, 31)
+        )
+
+        percent_data_vo = CostReportData.objects(
+            cost_report_id="cr-1", report_adjustment_policy_id="rap-1", product=None
+        ).first()
+        self.assertAlmostEqual(percent_data_vo.cost["USD"], 19.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
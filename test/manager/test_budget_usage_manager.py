@@ -0,0 +1,203 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.manager.budget_usage_manager import BudgetUsageManager
+from spaceone.cost_analysis.model.budget.database import Budget
+
+_ROLE_BINDINGS = [
+    {"user_id": "user-a", "role_type": "WORKSPACE_OWNER"},
+    {"user_id": "user-b", "role_type": "WORKSPACE_MEMBER"},
+    {"user_id": "user-c", "role_type": "WORKSPACE_MEMBER"},
+]
+
+
+def _make_budget_vo(budget_id: str, recipients: dict, budget_manager_id: str = None):
+    budget_vo = MagicMock()
+    budget_vo.budget_id = budget_id
+    budget_vo.budget_manager_id = budget_manager_id
+    budget_vo.service_account_id = None
+    budget_vo.project_id = None
+    budget_vo.notification.recipients.to_dict.return_value = recipients
+    return budget_vo
+
+
+class TestBudgetUsageManager(unittest.TestCase):
+    def setUp(self):
+        self.identity_mgr = MagicMock()
+        self.identity_mgr.list_role_bindings.return_value = {
+            "results": _ROLE_BINDINGS,
+            "total_count": len(_ROLE_BINDINGS),
+        }
+        self.identity_mgr.list_email_verified_users.side_effect = (
+            lambda domain_id, user_ids: {
+                "results": [
+                    {"user_id": user_id, "email": f"{user_id}@example.com"}
+                    for user_id in user_ids
+                ]
+            }
+        )
+
+    def _get_user_ids_map(self, budget_vos: list) -> dict:
+        user_ids_map, user_info_map = (
+            BudgetUsageManager._get_user_info_maps_from_recipients(
+                self.identity_mgr, "domain-1", "workspace-1", budget_vos, {}
+            )
+        )
+        self.assertEqual(user_info_map["user-a"]["language"], "en")
+        return user_ids_map
+
+    def test_recipients_of_budgets(self):
+        user_ids_map = self._get_user_ids_map(
+            [
+                _make_budget_vo(
+                    "budget-1", {"role_types": ["WORKSPACE_OWNER"]}, "user-c"
+                ),
+                _make_budget_vo(
+                    "budget-2",
+                    {"users": ["user-b"], "budget_manager_notification": "DISABLED"},
+                    "user-c",
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            user_ids_map, {"budget-1": ["user-a", "user-c"], "budget-2": ["user-b"]}
+        )
+
+        query = self.identity_mgr.list_role_bindings.call_args[0][0]["query"]
+        self.assertEqual(len(query["filter_or"]), 2)
+
+    def test_budget_without_recipients_notifies_workspace_users(self):
+        # the same as the recipients of a single budget before the batch lookup
+        user_ids_map = self._get_user_ids_map(
+            [
+                _make_budget_vo("budget-1", {"budget_manager_notification": "DISABLED"}),
+                _make_budget_vo("budget-2", {"users": ["user-b"]}),
+            ]
+        )
+
+        self.assertEqual(
+            user_ids_map,
+            {"budget-1": ["user-a", "user-b", "user-c"], "budget-2": ["user-b"]},
+        )
+
+        query = self.identity_mgr.list_role_bindings.call_args[0][0]["query"]
+        self.assertEqual(query["filter_or"], [])
+
+    def test_notify_thresholds_are_not_marked_when_queued(self):
+        claim_expired_at = datetime.utcnow() - timedelta(days=1)
+        plans = []
+        for threshold, notified in [(50.0, True), (70.0, False), (80.0, False)]:
+            plan = MagicMock()
+            plan.notified = notified
+            plan.notifying_at = datetime.utcnow() if threshold == 70.0 else None
+            plan.to_dict.return_value = {
+                "threshold": threshold,
+                "unit": "PERCENT",
+                "notified": notified,
+            }
+            plans.append(plan)
+
+        budget_vo = _make_budget_vo("budget-1", {})
+        budget_vo.end = "2024-12"
+        budget_vo.utilization_rate = 90.0
+        budget_vo.notification.plans = plans
+
+        # the alert of 70% is still being delivered
+        thresholds = BudgetUsageManager._get_notify_thresholds(
+            budget_vo, 100.0, "2024-06", claim_expired_at
+        )
+
+        self.assertEqual(thresholds, [80.0])
+        self.assertEqual(
+            [plan.to_dict()["notified"] for plan in plans], [True, False, False]
+        )
+
+
+class TestBudgetUsageNotification(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    @patch("spaceone.cost_analysis.manager.budget_usage_manager.NotificationManager")
+    def setUp(self, *args):
+        self.budget_usage_mgr = BudgetUsageManager()
+        self.budget_vo = Budget.create(
+            {
+                "limit": 100,
+                "start": "2024-01",
+                "end": "2999-12",
+                "notification": {
+                    "state": "ENABLED",
+                    "plans": [
+                        {"threshold": 50, "unit": "PERCENT"},
+                        {"threshold": 80, "unit": "PERCENT"},
+                    ],
+                },
+                "utilization_rate": 90.0,
+                "workspace_id": "workspace-1",
+                "domain_id": "domain-1",
+            }
+        )
+
+    def tearDown(self):
+        Budget.objects.delete()
+
+    def _notify_budget_usages(self, make_alerts) -> MagicMock:
+        budget_vo = Budget.get(budget_id=self.budget_vo.budget_id)
+        with patch.object(
+            self.budget_usage_mgr, "_make_budget_usage_alerts", side_effect=make_alerts
+        ), patch.object(
+            self.budget_usage_mgr.budget_mgr, "push_budget_usage_alert_task"
+        ) as push_budget_usage_alert_task:
+            self.budget_usage_mgr.notify_budget_usages(
+                "domain-1", [budget_vo], {budget_vo.budget_id: (90.0, 100.0)}
+            )
+
+        return push_budget_usage_alert_task
+
+    @staticmethod
+    def _make_alerts(domain_id: str, workspace_id: str, notifications: list) -> list:
+        return [
+            {"budget_id": notification["budget_vo"].budget_id, "threshold": threshold}
+            for notification in notifications
+            for threshold in notification["thresholds"]
+        ]
+
+    def test_notify_budget_usages_twice(self):
+        # jobs finishing close together notify before the alerts are delivered
+        first_push = self._notify_budget_usages(self._make_alerts)
+        second_push = self._notify_budget_usages(self._make_alerts)
+
+        self.assertEqual(first_push.call_count, 1)
+        self.assertEqual(
+            [alert["threshold"] for alert in first_push.call_args[0][0]["alerts"]],
+            [50.0, 80.0],
+        )
+        second_push.assert_not_called()
+
+    def test_notify_budget_usages_after_failure(self):
+        def _fail_to_make_alerts(*args):
+            raise Exception("identity is not available")
+
+        first_push = self._notify_budget_usages(_fail_to_make_alerts)
+        second_push = self._notify_budget_usages(self._make_alerts)
+
+        first_push.assert_not_called()
+        self.assertEqual(second_push.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.connector.cost_archive_connector import (
+    CostArchiveConnector,
+)
+from spaceone.cost_analysis.manager.cost_archive_manager import CostArchiveManager
+from spaceone.cost_analysis.model.cost_archive.database import CostArchive
+from spaceone.cost_analysis.model.cost_model import Cost, MonthlyCost
+
+
+class TestCostArchiveManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.archive_path = tempfile.mkdtemp()
+        config.set_global_force(COST_ARCHIVE_ENABLED=True, COST_ARCHIVE_PATH=self.archive_path)
+
+        patcher = patch("spaceone.core.cache.delete_pattern")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cost_archive_mgr = CostArchiveManager()
+
+    def tearDown(self):
+        Cost.objects.delete()
+        MonthlyCost.objects.delete()
+        CostArchive.objects.delete()
+        shutil.rmtree(self.archive_path, ignore_errors=True)
+        config.set_global_force(COST_ARCHIVE_ENABLED=False, COST_ARCHIVE_PATH=None)
+
+    def test_get_query_months(self):
+        get_query_months = CostArchiveManager._get_query_months
+
+        self.assertIsNone(get_query_months({"start": "2024-01"}))
+        self.assertEqual(
+            get_query_months({"start": "2024-01", "end": "2024-03"}),
+            ["2024-01", "2024-02", "2024-03"],
+        )
+        self.assertEqual(
+            get_query_months({"start": "2024-01-15", "end": "2024-02-01"}),
+            ["2024-01", "2024-02"],
+        )
+        self.assertEqual(
+            get_query_months({"start": "2024-01-15", "end": "2024-01-31"}),
+            ["2024-01"],
+        )
+        self.assertEqual(len(get_query_months({"start": "2024", "end": "2024"})), 12)
+
+    def test_merge_analyze_results(self):
+        connector = CostArchiveConnector(domain_id="domain-1", data_source_id="ds-1")
+        query = {
+            "group_by": ["provider"],
+            "fields": {
+                "cost": {"key": "cost", "operator": "sum"},
+                "count": {"operator": "count"},
+                "max_cost": {"key": "cost", "operator": "max"},
+                "min_cost": {"key": "cost", "operator": "min"},
+            },
+            "sort": [{"key": "cost", "desc": True}],
+            "page": {"limit": 1},
+        }
+        responses = [
+            {
+                "results": [
+                    {"provider": "aws", "cost": 10, "count": 2, "max_cost": 7, "min_cost": 3},
+                    {"provider": "gcp", "cost": 5, "count": 1, "max_cost": 5, "min_cost": 5},
+                ]
+            },
+            {
+                "results": [
+                    {"provider": "gcp", "cost": 20, "count": 2, "max_cost": 15, "min_cost": 5},
+                    {"provider": "azure", "cost": 1, "count": 1, "max_cost": 1, "min_cost": 1},
+                ]
+            },
+        ]
+
+        response = connector.merge_analyze_results(query, responses)
+
+        self.assertTrue(response["more"])
+        self.assertEqual(
+            response["results"],
+            [{"provider": "gcp", "cost": 25, "count": 3, "max_cost": 15, "min_cost": 5}],
+        )
+
+    def test_merge_analyze_results_with_field_group(self):
+        connector = CostArchiveConnector(domain_id="domain-1", data_source_id="ds-1")
+        query = {
+            "granularity": "MONTHLY",
+            "group_by": ["provider"],
+            "fields": {"cost": {"key": "cost", "operator": "sum"}},
+            "field_group": ["date"],
+        }
+        responses = [
+            {"results": [{"provider": "aws", "date": "2024-01", "cost": 1}]},
+            {
+                "results": [
+                    {"provider": "aws", "date": "2024-02", "cost": 2},
+                    {"provider": "aws", "date": "2024-01", "cost": 3},
+                ]
+            },
+        ]
+
+        response = connector.merge_analyze_results(query, responses)
+
+        self.assertEqual(len(response["results"]), 1)
+        result = response["results"][0]
+        self.assertEqual(result["provider"], "aws")
+        self.assertEqual(
+            sorted(result["cost"], key=lambda value: value["date"]),
+            [{"date": "2024-01", "value": 4}, {"date": "2024-02", "value": 2}],
+        )
+
+    def test_export_and_analyze_costs(self):
+        for billed_month, day_costs in [("2024-01", [1.5, 2.5]), ("2024-02", [4.0])]:
+            for day, cost in enumerate(day_costs, start=1):
+                for provider in ["aws", "gcp"]:
+                    Cost.create(
+                        {
+                            "cost": cost,
+                            "provider": provider,
+                            "data_source_id": "ds-1",
+                            "domain_id": "domain-1",
+                            "billed_year": billed_month[:4],
+                            "billed_month": billed_month,
+                            "billed_date": f"{billed_month}-{day:02d}",
+                        }
+                    )
+
+        self.cost_archive_mgr.archive_monthly_costs("domain-1", "ds-1", "2024-01")
+        self.cost_archive_mgr.archive_monthly_costs("domain-1", "ds-1", "2024-02")
+
+        query = {
+            "granularity": "MONTHLY",
+            "start": "2024-01",
+            "end": "2024-02",
+            "group_by": ["provider"],
+            "fields": {"cost": {"key": "cost", "operator": "sum"}},
+            "sort": [{"key": "provider"}, {"key": "date"}],
+            "filter": [{"k": "domain_id", "v": "domain-1", "o": "eq"}],
+        }
+
+        with patch.object(
+            self.cost_archive_mgr, "list_archived_months", return_value=["2024-01", "2024-02"]
+        ), patch.object(Cost, "analyze", wraps=Cost.analyze) as live_analyze:
+            response = self.cost_archive_mgr.analyze_costs_with_archive(
+                query, "domain-1", "ds-1", "DAILY", Cost
+            )
+            live_analyze.assert_not_called()
+
+        # the date of the daily table is billed_date, as in MongoModel.analyze
+        results = [
+            (result["provider"], result["date"], result["cost"])
+            for result in response["results"]
+        ]
+        self.assertEqual(
+            results,
+            [
+                ("aws", "2024-01-01", 1.5),
+                ("aws", "2024-01-02", 2.5),
+                ("aws", "2024-02-01", 4.0),
+                ("gcp", "2024-01-01", 1.5),
+                ("gcp", "2024-01-02", 2.5),
+                ("gcp", "2024-02-01", 4.0),
+            ],
+        )
+
+    def test_analyze_costs_without_archive_files(self):
+        query = {
+            "granularity": "MONTHLY",
+            "start": "2024-01",
+            "end": "2024-01",
+            "fields": {"cost": {"key": "cost", "operator": "sum"}},
+        }
+
+        # the index is shared but the files are not on this pod
+        with patch.object(
+            self.cost_archive_mgr, "list_archived_months", return_value=["2024-01"]
+        ), patch.object(Cost, "analyze", return_value={"results": []}) as live_analyze:
+            response = self.cost_archive_mgr.analyze_costs_with_archive(
+                query, "domain-1", "ds-1", "DAILY", Cost
+            )
+
+        live_analyze.assert_called_once_with(**query)
+        self.assertEqual(response, {"results": []})
+
+    def test_analyze_costs_with_unreadable_archive(self):
+        query = {
+            "granularity": "MONTHLY",
+            "start": "2024-01",
+            "end": "2024-01",
+            "fields": {"cost": {"key": "cost", "operator": "sum"}},
+        }
+
+        with patch.object(
+            self.cost_archive_mgr, "list_archived_months", return_value=["2024-01"]
+        ), patch.object(
+            CostArchiveConnector, "has_costs", return_value=True
+        ), patch.object(
+            CostArchiveConnector, "analyze_costs", side_effect=OSError("No files found")
+        ), patch.object(Cost, "analyze", return_value={"results": []}) as live_analyze:
+            self.cost_archive_mgr.analyze_costs_with_archive(
+                query, "domain-1", "ds-1", "DAILY", Cost
+            )
+
+        live_analyze.assert_called_once_with(**query)
+
+    def test_is_enabled_without_archive_path(self):
+        self.assertTrue(CostArchiveManager.is_enabled())
+
+        config.set_global_force(COST_ARCHIVE_PATH=None)
+        self.assertFalse(CostArchiveManager.is_enabled())
+
+    def test_export_empty_month(self):
+        conditions = {"domain_id": "domain-1", "data_source_id": "ds-1", "billed_month": "2024-01"}
+        connector = CostArchiveConnector(domain_id="domain-1", data_source_id="ds-1")
+
+        connector.export_costs(
+            "DAILY", "2024-01", self.cost_archive_mgr._iter_data_frames(Cost, conditions)
+        )
+
+        self.assertTrue(connector.has_costs("DAILY", ["2024-01"]))
+        self.assertFalse(connector.has_costs("DAILY", ["2024-01", "2024-02"]))
+
+        response = connector.analyze_costs(
+            None, {"fields": {"cost": {"key": "cost", "operator": "sum"}}}, "DAILY"
+        )
+        self.assertEqual(response["results"], [])
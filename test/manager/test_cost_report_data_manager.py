@@ -0,0 +1,142 @@
+import threading
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.manager.cost_report_data_manager import (
+    CostReportDataManager,
+)
+from spaceone.cost_analysis.model.cost_report_data.database import CostReportData
+
+
+def _make_cost_report_data(cost_report_id: str, usd: float, **kwargs) -> dict:
+    return {
+        "cost": {"USD": usd},
+        "report_month": "2024-01",
+        "cost_report_id": cost_report_id,
+        "cost_report_config_id": "crc-1",
+        "workspace_id": "workspace-1",
+        "domain_id": "domain-1",
+        **kwargs,
+    }
+
+
+class TestCostReportDataManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.transaction = create_transaction(
+            thread_id=str(threading.current_thread().ident)
+        )
+        self.cost_report_data_mgr = CostReportDataManager()
+
+    def tearDown(self):
+        delete_transaction()
+        CostReportData.objects.delete()
+
+    def test_create_cost_reports_data(self):
+        count = self.cost_report_data_mgr.create_cost_reports_data(
+            [
+                _make_cost_report_data("cr-1", 10.0, unknown_field="ignored"),
+                _make_cost_report_data("cr-1", 20.0),
+            ]
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(CostReportData.objects(cost_report_id="cr-1").count(), 2)
+        self.assertEqual(self.cost_report_data_mgr.create_cost_reports_data([]), 0)
+
+    def test_rollback_create_cost_reports_data(self):
+        CostReportData.create(_make_cost_report_data("cr-1", 5.0))
+
+        self.cost_report_data_mgr.create_cost_reports_data(
+            [
+                _make_cost_report_data("cr-1", 10.0),
+                _make_cost_report_data("cr-2", 20.0),
+            ]
+        )
+        self.transaction.execute_rollback()
+
+        # only the data created in the transaction is deleted
+        self.assertEqual([vo.cost["USD"] for vo in CostReportData.objects.all()], [5.0])
+
+    def test_rollback_confirm_cost_reports_data(self):
+        for cost_report_id, usd, is_confirmed in [
+            ("cr-1", 10.0, True),
+            ("cr-1", 20.0, False),
+            ("cr-2", 30.0, False),
+            ("cr-3", 40.0, False),
+        ]:
+            CostReportData.create(
+                _make_cost_report_data(cost_report_id, usd, is_confirmed=is_confirmed)
+            )
+
+        count = self.cost_report_data_mgr.confirm_cost_reports_data(
+            "domain-1", ["cr-1", "cr-2"], "2024-01"
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self._get_confirmed_costs(), [10.0, 20.0, 30.0])
+
+        self.transaction.execute_rollback()
+
+        # the data confirmed before the call stays confirmed
+        self.assertEqual(self._get_confirmed_costs(), [10.0])
+
+    def test_confirm_confirmed_cost_reports_data(self):
+        CostReportData.create(_make_cost_report_data("cr-1", 10.0, is_confirmed=True))
+
+        count = self.cost_report_data_mgr.confirm_cost_reports_data(
+            "domain-1", ["cr-1"], "2024-01"
+        )
+        self.transaction.execute_rollback()
+
+        self.assertEqual(count, 0)
+        self.assertEqual(self._get_confirmed_costs(), [10.0])
+
+    def test_rollback_only_confirmation_of_the_call(self):
+        CostReportData.create(_make_cost_report_data("cr-1", 10.0))
+        self.cost_report_data_mgr.confirm_cost_reports_data(
+            "domain-1", ["cr-1"], "2024-01"
+        )
+        confirm_id = CostReportData.objects.get(cost_report_id="cr-1").confirm_id
+
+        # the data of the report is made again and confirmed in another transaction
+        self.transaction = create_transaction(
+            thread_id=str(threading.current_thread().ident)
+        )
+        CostReportData.create(_make_cost_report_data("cr-1", 20.0))
+        count = self.cost_report_data_mgr.confirm_cost_reports_data(
+            "domain-1", ["cr-1"], "2024-01"
+        )
+        self.transaction.execute_rollback()
+
+        self.assertEqual(count, 1)
+        self.assertIsNotNone(confirm_id)
+        self.assertEqual(self._get_confirmed_costs(), [10.0])
+        self.assertEqual(
+            CostReportData.objects.get(is_confirmed=False).confirm_id, None
+        )
+
+    @staticmethod
+    def _get_confirmed_costs() -> list:
+        return sorted(
+            cost_report_data_vo.cost["USD"]
+            for cost_report_data_vo in CostReportData.objects(is_confirmed=True)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
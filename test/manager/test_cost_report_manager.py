@@ -0,0 +1,105 @@
+import threading
+import unittest
+from datetime import datetime
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.manager.cost_report_manager import CostReportManager
+from spaceone.cost_analysis.model.cost_report.database import CostReport
+
+
+class TestCostReportManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.transaction = create_transaction(
+            thread_id=str(threading.current_thread().ident)
+        )
+        self.cost_report_mgr = CostReportManager()
+
+        for cost_report_id, status in [
+            ("cr-1", "IN_PROGRESS"),
+            ("cr-2", "ADJUSTING"),
+            ("cr-3", "DONE"),
+            ("cr-4", "IN_PROGRESS"),
+        ]:
+            CostReport.create(
+                {
+                    "cost_report_id": cost_report_id,
+                    "status": status,
+                    "currency": "USD",
+                    "report_month": "2024-01",
+                    "cost_report_config_id": "crc-1",
+                    "workspace_id": "workspace-1",
+                    "domain_id": "domain-1",
+                }
+            )
+
+    def tearDown(self):
+        delete_transaction()
+        CostReport.objects.delete()
+
+    @staticmethod
+    def _get_status_map() -> dict:
+        return {
+            cost_report_vo.cost_report_id: cost_report_vo.status
+            for cost_report_vo in CostReport.objects.all()
+        }
+
+    def test_update_cost_reports_status(self):
+        updated_before = datetime.utcnow()
+        count = self.cost_report_mgr.update_cost_reports_status(
+            {"domain_id": "domain-1", "cost_report_id": ["cr-1", "cr-2", "cr-3"]},
+            "DONE",
+        )
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            self._get_status_map(),
+            {"cr-1": "DONE", "cr-2": "DONE", "cr-3": "DONE", "cr-4": "IN_PROGRESS"},
+        )
+        self.assertGreaterEqual(
+            CostReport.objects.get(cost_report_id="cr-1").updated_at,
+            updated_before.replace(microsecond=0),
+        )
+
+        self.assertEqual(
+            self.cost_report_mgr.update_cost_reports_status(
+                {"domain_id": "domain-2"}, "DONE"
+            ),
+            0,
+        )
+
+    def test_rollback_update_cost_reports_status(self):
+        self.cost_report_mgr.update_cost_reports_status(
+            {"domain_id": "domain-1", "cost_report_id": ["cr-1", "cr-2", "cr-3"]},
+            "EXPIRED",
+        )
+        self.transaction.execute_rollback()
+
+        # each report gets back its own previous status
+        self.assertEqual(
+            self._get_status_map(),
+            {
+                "cr-1": "IN_PROGRESS",
+                "cr-2": "ADJUSTING",
+                "cr-3": "DONE",
+                "cr-4": "IN_PROGRESS",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
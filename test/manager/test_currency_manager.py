@@ -0,0 +1,121 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.manager.currency_manager import CurrencyManager
+from spaceone.cost_analysis.model.exchange_rate.database import ExchangeRate
+
+
+class TestCurrencyManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        # the currency maps are read from the database instead of the cache
+        patcher = patch("spaceone.core.cache.is_set", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.currency_mgr = CurrencyManager()
+        self.currency_mgr.currency_connector = MagicMock()
+
+    def tearDown(self):
+        ExchangeRate.objects.delete()
+
+    def _store_exchange_rates(self, date: str, usd_krw: float) -> None:
+        rates = {
+            "USD/KRW": usd_krw,
+            "KRW/USD": 1 / usd_krw,
+            "USD/JPY": 150.0,
+            "JPY/USD": 1 / 150.0,
+            "KRW/JPY": 150.0 / usd_krw,
+            "JPY/KRW": usd_krw / 150.0,
+        }
+        for pair, rate in rates.items():
+            ExchangeRate(pair=pair, date=date, rate=rate, source="test").save()
+
+    def test_use_latest_stored_rates_without_rates_of_window(self):
+        self._store_exchange_rates("2024-01-01", 1300.0)
+        self._store_exchange_rates("2024-01-05", 1350.0)
+        self._store_exchange_rates("2024-03-01", 1400.0)
+
+        currency_map, currency_date = self.currency_mgr.get_currency_map_date(
+            datetime(2024, 2, 29)
+        )
+
+        self.assertEqual(currency_date, datetime(2024, 1, 5))
+        self.assertEqual(currency_map["USD"]["USD/KRW"], 1350.0)
+        self.assertEqual(currency_map["USD"]["USD/USD"], 1.0)
+
+        # the external sources are called only by ExchangeRateSyncScheduler
+        self.assertEqual(self.currency_mgr.currency_connector.mock_calls, [])
+
+    def test_read_only_latest_dates_of_stored_rates(self):
+        self._store_exchange_rates("2024-01-01", 1300.0)
+        self._store_exchange_rates("2024-01-05", 1350.0)
+        ExchangeRate(pair="USD/KRW", date="2024-01-10", rate=1400.0).save()
+
+        with patch(
+            "spaceone.cost_analysis.manager.currency_manager.LATEST_EXCHANGE_RATE_DATES",
+            2,
+        ):
+            # 12 rows of the partial date and the latest complete date are read
+            self.assertEqual(
+                self.currency_mgr._get_latest_currency_map_from_store("2024-02-29")[1],
+                "2024-01-05",
+            )
+
+        with patch(
+            "spaceone.cost_analysis.manager.currency_manager.LATEST_EXCHANGE_RATE_DATES",
+            1,
+        ):
+            self.assertIsNone(
+                self.currency_mgr._get_latest_currency_map_from_store("2024-02-29")
+            )
+
+    def test_remove_exchange_rate_cache_after_sync(self):
+        config.set_global_force(EXCHANGE_RATE_FETCH_MODE="BASE")
+        self.currency_mgr.currency_connector.list_cross_exchange_rates.return_value = [
+            {"pair": "USD/KRW", "date": "2024-01-01", "rate": 1300.0, "source": "test"}
+        ]
+
+        with patch("spaceone.core.cache.delete_pattern") as cache_delete_pattern:
+            self.currency_mgr.sync_exchange_rates(datetime(2024, 1, 1))
+
+        cache_delete_pattern.assert_called_once_with("cost-analysis:exchange-rate:*")
+        self.assertEqual(ExchangeRate.objects.count(), 1)
+
+    def test_use_default_rates_without_stored_rates(self):
+        default_rates = {
+            "KRW/USD": 0.00075,
+            "USD/KRW": 1330.0,
+            "KRW/JPY": 0.11,
+            "JPY/KRW": 9.0,
+            "USD/JPY": 150.0,
+            "JPY/USD": 0.0067,
+        }
+        config.set_global_force(DEFAULT_EXCHANGE_RATES=default_rates)
+
+        currency_map, currency_date = self.currency_mgr.get_currency_map_date(
+            datetime(2024, 2, 29)
+        )
+
+        self.assertEqual(currency_date, datetime(2024, 2, 29))
+        self.assertEqual(currency_map["USD"]["USD/KRW"], 1330.0)
+        self.assertEqual(self.currency_mgr.currency_connector.mock_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
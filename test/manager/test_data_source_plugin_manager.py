@@ -0,0 +1,228 @@
+import fnmatch
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest.mock import patch
+
+import grpc
+from spaceone.core import config
+from spaceone.core.error import ERROR_GRPC_CONNECTION
+from spaceone.core.pygrpc.client import _ClientInterceptor
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.connector.datasource_plugin_connector import (
+    DataSourcePluginConnector,
+)
+from spaceone.cost_analysis.manager.data_source_plugin_manager import (
+    DataSourcePluginManager,
+)
+from spaceone.cost_analysis.manager.plugin_manager import PluginManager
+
+_METHOD = "/test.Cost/get_data"
+
+_PLUGIN_INFO = {"plugin_id": "plugin-1", "version": "1.0", "upgrade_mode": "AUTO"}
+
+
+def _start_blocking_server() -> Tuple[grpc.Server, int]:
+    """Start a server which sends one response and then waits until it is canceled."""
+
+    def _get_data(request, context):
+        yield b"page-0"
+        while context.is_active():
+            time.sleep(0.01)
+
+    server = grpc.server(ThreadPoolExecutor(max_workers=2))
+    server.add_generic_rpc_handlers(
+        [
+            grpc.method_handlers_generic_handler(
+                "test.Cost",
+                {"get_data": grpc.unary_stream_rpc_method_handler(_get_data)},
+            )
+        ]
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, port
+
+
+class _BlockingCall:
+    """A server stream which sends one response and then waits until it is canceled."""
+
+    def __init__(self):
+        self.canceled = threading.Event()
+        self.is_finished = threading.Event()
+
+    def __iter__(self):
+        try:
+            yield {"results": [1]}
+            self.canceled.wait(5)
+            raise grpc.RpcError("canceled")
+        finally:
+            self.is_finished.set()
+
+    def cancel(self):
+        self.canceled.set()
+        return True
+
+
+class TestDataSourcePluginManager(unittest.TestCase):
+    def test_prefetch_responses(self):
+        responses = [{"results": [i]} for i in range(10)]
+
+        self.assertEqual(
+            list(DataSourcePluginManager._prefetch_responses(iter(responses), 2)),
+            responses,
+        )
+
+    def test_cancel_grpc_call_when_closed(self):
+        grpc_call = _BlockingCall()
+        response_stream = DataSourcePluginManager._prefetch_responses(
+            iter(grpc_call), 2, grpc_call
+        )
+
+        self.assertEqual(next(response_stream), {"results": [1]})
+
+        # the caller stops reading, e.g. when the job is canceled
+        started_at = time.time()
+        response_stream.close()
+
+        self.assertTrue(grpc_call.is_finished.wait(1))
+        self.assertLess(time.time() - started_at, 1)
+
+    def test_cancel_grpc_call_of_core_client(self):
+        server, port = _start_blocking_server()
+        self.addCleanup(server.stop, None)
+
+        # the same interceptor as the plugin client of spaceone-core
+        channel = grpc.intercept_channel(
+            grpc.insecure_channel(f"localhost:{port}"),
+            _ClientInterceptor({}, "test", {}),
+        )
+        self.addCleanup(channel.close)
+        get_data = channel.unary_stream(_METHOD)
+
+        response_stream = get_data(b"")
+        grpc_call = DataSourcePluginConnector._get_grpc_call(response_stream)
+        self.assertIsInstance(grpc_call, grpc.Call)
+
+        prefetch_stream = DataSourcePluginManager._prefetch_responses(
+            response_stream, 2, grpc_call
+        )
+        self.assertEqual(next(prefetch_stream), b"page-0")
+
+        started_at = time.time()
+        prefetch_stream.close()
+
+        self.assertEqual(grpc_call.code(), grpc.StatusCode.CANCELLED)
+        self.assertLess(time.time() - started_at, 1)
+
+    def test_get_grpc_call_without_call(self):
+        with self.assertLogs(
+            "spaceone.cost_analysis.connector.datasource_plugin_connector", "WARNING"
+        ):
+            self.assertIsNone(DataSourcePluginConnector._get_grpc_call(iter([])))
+
+
+class TestDataSourcePluginEndpointCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+
+    def setUp(self):
+        create_transaction()
+        self.addCleanup(delete_transaction)
+
+        # an in-memory cache in place of the cache backend of the server
+        self.cache = {}
+        for attribute, side_effect in [
+            ("is_set", lambda alias="default": True),
+            ("get", lambda key, alias="default": self.cache.get(key)),
+            ("set", self._set_cache),
+            ("delete_pattern", self._delete_cache_pattern),
+        ]:
+            patcher = patch(f"spaceone.core.cache.{attribute}", side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for target in [PluginManager, DataSourcePluginConnector]:
+            patcher = patch.object(target, "__init__", return_value=None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # the plugin is redeployed at a new endpoint after the first lookup
+        patcher = patch.object(
+            PluginManager,
+            "get_plugin_endpoint",
+            side_effect=[("endpoint-old", None), ("endpoint-new", None)],
+        )
+        self.get_plugin_endpoint = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.dsp_mgr = DataSourcePluginManager()
+
+    def _set_cache(self, key, value, expire=None, alias="default"):
+        self.cache[key] = value
+
+    def _delete_cache_pattern(self, pattern, alias="default"):
+        for key in fnmatch.filter(list(self.cache), pattern):
+            del self.cache[key]
+
+    def _initialize_by_plugin_info(self, initialize) -> Tuple[str, list]:
+        with patch.object(
+            self.dsp_mgr.dsp_connector, "initialize", side_effect=initialize
+        ) as dsp_initialize:
+            endpoint = self.dsp_mgr.initialize_by_plugin_info(_PLUGIN_INFO, "domain-1")
+
+        return endpoint, [call.args[0] for call in dsp_initialize.call_args_list]
+
+    @staticmethod
+    def _connect(endpoint: str) -> None:
+        if endpoint != "endpoint-new":
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message="unavailable")
+
+    def test_use_cached_endpoint(self):
+        self.cache["cost-analysis:plugin-endpoint:domain-1:plugin-1:1.0:AUTO"] = {
+            "endpoint": "endpoint-new",
+            "updated_version": None,
+        }
+
+        endpoint, initialized_endpoints = self._initialize_by_plugin_info(self._connect)
+
+        self.assertEqual(endpoint, "endpoint-new")
+        self.assertEqual(initialized_endpoints, ["endpoint-new"])
+        self.get_plugin_endpoint.assert_not_called()
+
+    def test_retry_once_with_new_endpoint(self):
+        endpoint, initialized_endpoints = self._initialize_by_plugin_info(self._connect)
+
+        # the stale endpoint is removed from the cache and looked up again
+        self.assertEqual(endpoint, "endpoint-new")
+        self.assertEqual(initialized_endpoints, ["endpoint-old", "endpoint-new"])
+        self.assertEqual(self.get_plugin_endpoint.call_count, 2)
+        self.assertEqual(
+            self.cache,
+            {
+                "cost-analysis:plugin-endpoint:domain-1:plugin-1:1.0:AUTO": {
+                    "endpoint": "endpoint-new",
+                    "updated_version": None,
+                }
+            },
+        )
+
+    def test_raise_when_retry_fails(self):
+        def _initialize(endpoint: str) -> None:
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message="unavailable")
+
+        with self.assertRaises(ERROR_GRPC_CONNECTION), patch.object(
+            self.dsp_mgr.dsp_connector, "initialize", side_effect=_initialize
+        ) as dsp_initialize:
+            self.dsp_mgr.initialize_by_plugin_info(_PLUGIN_INFO, "domain-1")
+
+        self.assertEqual(dsp_initialize.call_count, 2)
+        self.assertEqual(self.get_plugin_endpoint.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
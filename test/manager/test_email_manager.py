@@ -0,0 +1,232 @@
+import smtplib
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.manager.budget_manager import BudgetManager
+from spaceone.cost_analysis.manager.email_manager import EmailManager, TEMPLATES
+from spaceone.cost_analysis.model.budget.database import Budget
+from spaceone.cost_analysis.model.email_delivery.database import EmailDelivery
+
+_COST_REPORT_TEMPLATE = (
+    "cost_report_en.html",
+    {
+        "report_number": "CostReport_2024-01_0001",
+        "name": "Monthly Cost Report",
+        "report_date": "2024-02-01",
+        "report_period": "2024-01-01 ~ 2024-01-31",
+    },
+    {"user_name": "user-1"},
+)
+
+
+class TestEmailManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        patcher = patch.object(EmailManager, "push_email_delivery_task")
+        self.push_email_delivery_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.email_mgr = EmailManager()
+        self.email_mgr.smtp_connector = MagicMock()
+        self.email_delivery_vo = self.email_mgr.push_email(
+            "user@example.com", "subject", *_COST_REPORT_TEMPLATE
+        )
+        self.push_email_delivery_task.reset_mock()
+
+    def tearDown(self):
+        EmailDelivery.objects.delete()
+        Budget.objects.delete()
+
+    def _deliver_email(self) -> EmailDelivery:
+        return self.email_mgr.deliver_email(self.email_delivery_vo.email_delivery_id)
+
+    def _make_retry_due(self) -> None:
+        EmailDelivery.objects(
+            email_delivery_id=self.email_delivery_vo.email_delivery_id
+        ).update(set__next_attempt_at=datetime.utcnow() - timedelta(seconds=1))
+
+    def test_deliver_email(self):
+        email_delivery_vo = self._deliver_email()
+
+        self.assertEqual(email_delivery_vo.status, "SENT")
+        self.assertEqual(email_delivery_vo.attempts, 1)
+        self.assertIsNotNone(email_delivery_vo.sent_at)
+
+    def test_retry_email_delivery_later(self):
+        self.email_mgr.smtp_connector.send_email.side_effect = smtplib.SMTPServerDisconnected()
+
+        started_at = datetime.utcnow()
+        email_delivery_vo = self._deliver_email()
+
+        # the failed attempt is scheduled, not retried in the worker
+        self.assertEqual(email_delivery_vo.status, "PENDING")
+        self.assertEqual(email_delivery_vo.attempts, 1)
+        self.assertGreater(
+            email_delivery_vo.next_attempt_at, started_at + timedelta(seconds=59)
+        )
+        self.assertEqual(self.email_mgr.push_retry_email_deliveries(), 0)
+
+        self._make_retry_due()
+        self.assertEqual(self.email_mgr.push_retry_email_deliveries(), 1)
+        self.assertEqual(self.email_mgr.push_retry_email_deliveries(), 0)
+        self.push_email_delivery_task.assert_called_once_with(
+            {"email_delivery_id": email_delivery_vo.email_delivery_id}
+        )
+
+        self.email_mgr.smtp_connector = MagicMock()
+        email_delivery_vo = self._deliver_email()
+
+        self.assertEqual(email_delivery_vo.status, "SENT")
+        self.assertEqual(email_delivery_vo.attempts, 2)
+        self.assertIsNone(email_delivery_vo.next_attempt_at)
+
+    def test_fail_email_delivery_after_max_retries(self):
+        max_retries = config.get_global("EMAIL_DELIVERY_MAX_RETRIES", 3)
+        self.email_mgr.smtp_connector = None
+
+        with patch(
+            "spaceone.cost_analysis.manager.email_manager.SMTPConnector"
+        ) as smtp_connector_class:
+            smtp_connector_class.return_value.send_email.side_effect = (
+                smtplib.SMTPServerDisconnected()
+            )
+
+            for _ in range(max_retries + 1):
+                email_delivery_vo = self._deliver_email()
+
+        self.assertEqual(email_delivery_vo.status, "FAILED")
+        self.assertEqual(email_delivery_vo.attempts, max_retries + 1)
+        self.assertIsNone(email_delivery_vo.next_attempt_at)
+
+    def test_fail_email_delivery_to_refused_recipient(self):
+        self.email_mgr.smtp_connector.send_email.side_effect = (
+            smtplib.SMTPRecipientsRefused({"user@example.com": (550, b"unknown")})
+        )
+
+        email_delivery_vo = self._deliver_email()
+
+        self.assertEqual(email_delivery_vo.status, "FAILED")
+        self.assertEqual(email_delivery_vo.attempts, 1)
+
+    def test_mark_budget_plan_notified_after_delivery(self):
+        budget_vo = Budget.create(
+            {
+                "limit": 100,
+                "start": "2024-01",
+                "end": "2024-12",
+                "notification": {
+                    "state": "ENABLED",
+                    "plans": [
+                        {"threshold": 50, "unit": "PERCENT"},
+                        {"threshold": 80, "unit": "PERCENT"},
+                    ],
+                },
+                "domain_id": "domain-1",
+            }
+        )
+        email_delivery_vo = self.email_mgr.push_email(
+            "user@example.com",
+            "subject",
+            *_COST_REPORT_TEMPLATE,
+            resource_type="Budget",
+            resource_id=budget_vo.budget_id,
+            resource_key=EmailManager.make_budget_plan_key(80),
+            domain_id="domain-1",
+        )
+
+        self.email_mgr.deliver_email(email_delivery_vo.email_delivery_id)
+        self.assertEqual(email_delivery_vo.reload().status, "SENT")
+
+        BudgetManager().set_plan_notified(budget_vo.budget_id, "domain-1", 80.0)
+        budget_vo.reload()
+        self.assertEqual(
+            [plan.notified for plan in budget_vo.notification.plans], [False, True]
+        )
+
+    def test_render_template_is_identical_to_full_render(self):
+        recipient_info = {
+            "user_name": 'user-<a>&"b"',
+            "download_link": "https://console.example.com/?a=1&b=<2>",
+        }
+        contexts = {
+            "cost_report": {
+                "report_number": "CostReport_2024-01_0001",
+                "name": "<Monthly> & Report",
+                "report_date": "2024-02-01",
+                "report_period": "2024-01-01 ~ 2024-01-31",
+            },
+            "budget_usage_alert": {
+                "workspace_name": "workspace-1",
+                "budget_name": "Budget <1>",
+                "budget_target": None,
+                "budget_amount": 1000.0,
+                "budget_cycle": "MONTHLY",
+                "actual_cost": 812.5,
+                "usage_rate": 81.25,
+                "today_date": "2024-01-20",
+                "budget_detail_link": "https://console.example.com/budget?id=1&w=2",
+                "currency": "USD",
+            },
+        }
+
+        for template_name, template in TEMPLATES.items():
+            context = contexts[template_name.rsplit("_", 1)[0]]
+            with self.subTest(template_name=template_name):
+                self.assertEqual(
+                    EmailManager.render_template(
+                        template_name, recipient_info, **context
+                    ),
+                    template.render(**context, **recipient_info),
+                )
+
+    def test_render_email_on_delivery(self):
+        get_recipient_info = MagicMock(
+            return_value={"download_link": "https://console.example.com/?token=secret"}
+        )
+
+        email_delivery_vo = self.email_mgr.deliver_email(
+            self.email_delivery_vo.email_delivery_id, get_recipient_info
+        )
+
+        contents = self.email_mgr.smtp_connector.send_email.call_args[0][2]
+        self.assertIn("user-1", contents)
+        self.assertIn("token=secret", contents)
+
+        # neither the body nor the link with the token is stored
+        email_delivery_vo.reload()
+        self.assertIsNone(email_delivery_vo.contents)
+        self.assertNotIn("secret", str(email_delivery_vo.to_mongo()))
+
+    def test_clear_contents_of_queued_email(self):
+        # emails queued before the body was rendered on delivery
+        EmailDelivery.objects(
+            email_delivery_id=self.email_delivery_vo.email_delivery_id
+        ).update(set__template_name=None, set__contents="<p>token=secret</p>")
+
+        email_delivery_vo = self._deliver_email()
+
+        self.assertEqual(
+            self.email_mgr.smtp_connector.send_email.call_args[0][2],
+            "<p>token=secret</p>",
+        )
+        self.assertEqual(email_delivery_vo.status, "SENT")
+        self.assertIsNone(email_delivery_vo.contents)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.cost_analysis.error.job_task import ERROR_JOB_TASK_CLAIM_LOST
+from spaceone.cost_analysis.manager.job_task_manager import JobTaskManager
+from spaceone.cost_analysis.model.job_task_model import JobTask, JobTaskDispatchLock
+
+
+class TestJobTaskManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        JobTaskDispatchLock._create_index()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.job_task_mgr = JobTaskManager()
+        self.job_task_mgr.job_mgr = MagicMock()
+        self.job_task_vo = self.job_task_mgr.create_job_task(
+            "DOMAIN", "job-1", "ds-1", None, "domain-1", {}
+        )
+
+    def tearDown(self):
+        JobTask.objects.delete()
+        JobTaskDispatchLock.objects.delete()
+
+    def test_claim_job_task_once(self):
+        job_task_vo = self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+
+        self.assertEqual(job_task_vo.status, "IN_PROGRESS")
+        self.assertEqual(job_task_vo.worker_id, "worker-1")
+        self.assertIsNotNone(job_task_vo.started_at)
+        self.assertIsNone(
+            self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-2")
+        )
+
+    def test_claim_finished_job_task(self):
+        for status in ["SUCCESS", "FAILURE", "CANCELED"]:
+            JobTask.objects(job_task_id=self.job_task_vo.job_task_id).update(
+                set__status=status, set__worker_id=None
+            )
+            self.job_task_vo.reload()
+
+            with self.subTest(status=status):
+                self.assertIsNone(
+                    self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+                )
+
+    def test_cancel_pending_job_task(self):
+        self.assertTrue(self.job_task_mgr.cancel_pending_job_task(self.job_task_vo))
+        self.job_task_vo.reload()
+        self.assertEqual(self.job_task_vo.status, "CANCELED")
+
+        # a duplicate message does not decrease the remained tasks again
+        self.assertFalse(self.job_task_mgr.cancel_pending_job_task(self.job_task_vo))
+        self.job_task_mgr.job_mgr.decrease_remained_tasks.assert_called_once()
+
+    def test_cancel_claimed_job_task(self):
+        self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+
+        self.assertFalse(self.job_task_mgr.cancel_pending_job_task(self.job_task_vo))
+        self.job_task_mgr.job_mgr.decrease_remained_tasks.assert_not_called()
+
+    def test_take_over_stalled_job_task(self):
+        job_task_vo = self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+        JobTask.objects(job_task_id=job_task_vo.job_task_id).update(
+            set__heartbeat_at=datetime.utcnow() - timedelta(hours=1)
+        )
+
+        stalled_job_task_vos = self.job_task_mgr.list_stalled_job_tasks(1800)
+        self.assertEqual(len(stalled_job_task_vos), 1)
+
+        released_job_task_vo = self.job_task_mgr.release_stalled_job_task(
+            stalled_job_task_vos[0]
+        )
+        self.assertEqual(released_job_task_vo.retry_count, 1)
+        self.assertEqual(self.job_task_mgr.list_stalled_job_tasks(1800), [])
+
+        # the stalled worker can not write its progress any more
+        with self.assertRaises(ERROR_JOB_TASK_CLAIM_LOST):
+            self.job_task_mgr.update_sync_status(job_task_vo, 10, 1, "worker-1")
+
+        job_task_vo = self.job_task_mgr.claim_job_task(
+            released_job_task_vo, "worker-2"
+        )
+        job_task_vo = self.job_task_mgr.update_sync_status(
+            job_task_vo, 10, 1, "worker-2"
+        )
+        self.assertEqual(job_task_vo.checkpoint, {"page": 1, "created_count": 10})
+
+    def test_release_job_task_after_heartbeat(self):
+        job_task_vo = self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+
+        # datetimes are stored in milliseconds, so the heartbeat must come later
+        time.sleep(0.01)
+        self.job_task_mgr.update_sync_status(job_task_vo, 10, 1, "worker-1")
+
+        # the stalled task read before the heartbeat is not released
+        self.assertIsNone(self.job_task_mgr.release_stalled_job_task(job_task_vo))
+
+    def test_heartbeat_detects_lost_claim(self):
+        self.job_task_mgr.heartbeat_interval = 0.01
+        job_task_vo = self.job_task_mgr.claim_job_task(self.job_task_vo, "worker-1")
+        stop_heartbeat, claim_lost = self.job_task_mgr.start_heartbeat(
+            job_task_vo.job_task_id, "worker-1"
+        )
+
+        try:
+            time.sleep(0.05)
+            self.assertFalse(claim_lost.is_set())
+
+            self.job_task_mgr.release_stalled_job_task(
+                JobTask.objects.get(job_task_id=job_task_vo.job_task_id)
+            )
+            self.assertTrue(claim_lost.wait(1))
+        finally:
+            stop_heartbeat.set()
+
+
+    def test_dispatch_lock(self):
+        self.assertTrue(self.job_task_mgr._acquire_dispatch_lock("dispatcher-1"))
+        self.assertFalse(self.job_task_mgr._acquire_dispatch_lock("dispatcher-2"))
+
+        # the request of dispatcher-2 keeps the lock for one more round
+        self.assertFalse(self.job_task_mgr._release_dispatch_lock("dispatcher-1"))
+        self.assertTrue(self.job_task_mgr._release_dispatch_lock("dispatcher-1"))
+        self.assertTrue(self.job_task_mgr._acquire_dispatch_lock("dispatcher-2"))
+
+    def test_take_over_expired_dispatch_lock(self):
+        self.job_task_mgr.dispatch_lock_timeout = -1
+        self.assertTrue(self.job_task_mgr._acquire_dispatch_lock("dispatcher-1"))
+        self.assertTrue(self.job_task_mgr._acquire_dispatch_lock("dispatcher-2"))
+
+        # the expired owner does not release the lock of the new owner
+        self.assertTrue(self.job_task_mgr._release_dispatch_lock("dispatcher-1"))
+        self.assertEqual(JobTaskDispatchLock.objects.get().owner, "dispatcher-2")
+
+    def test_dispatch_job_tasks_while_locked(self):
+        self.job_task_mgr.push_job_task_by_vo = MagicMock()
+        self.job_task_mgr._acquire_dispatch_lock("dispatcher-1")
+
+        self.assertEqual(self.job_task_mgr.dispatch_job_tasks(), 0)
+        self.job_task_mgr.push_job_task_by_vo.assert_not_called()
+        self.assertTrue(JobTaskDispatchLock.objects.get().is_requested)
+
+        self.job_task_mgr._release_dispatch_lock("dispatcher-1")
+        self.job_task_mgr._release_dispatch_lock("dispatcher-1")
+
+        self.assertEqual(self.job_task_mgr.dispatch_job_tasks(), 1)
+        self.job_task_mgr.push_job_task_by_vo.assert_called_once()
+        self.assertEqual(JobTaskDispatchLock.objects.count(), 0)
+
+    def test_release_dispatch_lock_on_error(self):
+        def _request_dispatch():
+            # another dispatcher requests a dispatch while the lock is held
+            self.assertFalse(self.job_task_mgr._acquire_dispatch_lock("dispatcher-2"))
+            raise Exception("dispatch error")
+
+        self.job_task_mgr._dispatch_job_tasks = MagicMock(side_effect=_request_dispatch)
+
+        with self.assertRaises(Exception):
+            self.job_task_mgr.dispatch_job_tasks()
+
+        self.assertEqual(JobTaskDispatchLock.objects.count(), 0)
+        self.assertTrue(self.job_task_mgr._acquire_dispatch_lock("dispatcher-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from spaceone.core import config
+
+from spaceone.cost_analysis.manager import secret_manager
+from spaceone.cost_analysis.manager.secret_manager import SecretManager
+
+
+class TestSecretManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+
+    def setUp(self):
+        # a sweeper of an earlier test may still be waiting for its interval
+        secret_manager._JOB_SECRET_CACHE_SWEEPER = None
+
+    def tearDown(self):
+        SecretManager.delete_job_secret_cache("job-1")
+        config.set_global_force(
+            JOB_SECRET_CACHE_TTL=600, JOB_SECRET_CACHE_SWEEP_INTERVAL=60
+        )
+
+    def test_delete_job_secret_cache(self):
+        secret_data = {"access_key": "secret"}
+        SecretManager._set_job_secret_cache(
+            "job-1", "secret_data", {"secret-1": secret_data}
+        )
+
+        cached_secret_data = secret_manager._JOB_SECRET_CACHE["job-1"]["secret_data"]
+        fetched_secret_data = SecretManager._get_job_secret_cache(
+            "job-1", "secret_data", "secret-1"
+        )
+        self.assertEqual(fetched_secret_data, {"access_key": "secret"})
+
+        SecretManager.delete_job_secret_cache("job-1")
+
+        self.assertEqual(SecretManager.list_cached_job_ids(), [])
+        self.assertEqual(cached_secret_data, {})
+
+        # secrets which are already handed out are not cleared under their users
+        self.assertEqual(secret_data, {"access_key": "secret"})
+        self.assertEqual(fetched_secret_data, {"access_key": "secret"})
+
+    def test_sweep_expired_job_secret_cache_without_access(self):
+        config.set_global_force(
+            JOB_SECRET_CACHE_TTL=0, JOB_SECRET_CACHE_SWEEP_INTERVAL=0.01
+        )
+        SecretManager._set_job_secret_cache(
+            "job-1", "secret_data", {"secret-1": {"access_key": "secret"}}
+        )
+        cached_secret_data = secret_manager._JOB_SECRET_CACHE["job-1"]["secret_data"]
+
+        # the cache is swept by the timer, not by the next access
+        for _ in range(100):
+            if secret_manager._JOB_SECRET_CACHE_SWEEPER is None:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(SecretManager.list_cached_job_ids(), [])
+        self.assertEqual(cached_secret_data, {})
+        self.assertIsNone(secret_manager._JOB_SECRET_CACHE_SWEEPER)
+
+    def test_refresh_job_secret_cache_on_read(self):
+        config.set_global_force(JOB_SECRET_CACHE_TTL=600)
+        SecretManager._set_job_secret_cache(
+            "job-1", "secret_data", {"secret-1": {"access_key": "secret"}}
+        )
+        job_secret_cache = secret_manager._JOB_SECRET_CACHE["job-1"]
+        job_secret_cache["expired_at"] = datetime.utcnow() + timedelta(seconds=1)
+
+        SecretManager._get_job_secret_cache("job-1", "secret_data", "secret-1")
+
+        self.assertGreater(
+            job_secret_cache["expired_at"], datetime.utcnow() + timedelta(seconds=60)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.error import ERROR_NOT_FOUND
+
+from spaceone.cost_analysis.manager.unified_cost_manager import UnifiedCostManager
+from spaceone.cost_analysis.model.unified_cost.database import (
+    UnifiedCost,
+    UnifiedCostJob,
+)
+
+# JPY/KRW has no rate in the source and is stored as zero
+_CURRENCY_MAP = {
+    "KRW": {"KRW/KRW": 1.0, "KRW/USD": 0.00075, "KRW/JPY": 0.11},
+    "USD": {"USD/KRW": 1330.0, "USD/USD": 1.0, "USD/JPY": 150.0},
+    "JPY": {"JPY/KRW": 0.0, "JPY/USD": 0.0067, "JPY/JPY": 1.0},
+}
+
+
+class TestUnifiedCostManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        # the generations are read from the database instead of the cache
+        patcher = patch("spaceone.core.cache.is_set", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        for domain_id, generations in [
+            ("domain-1", {"ds-1": "generation-1", "ds-2": "generation-2"}),
+            ("domain-2", {"ds-3": "generation-3"}),
+        ]:
+            UnifiedCostJob.create(
+                {
+                    "billed_month": "2024-01",
+                    "generations": generations,
+                    "domain_id": domain_id,
+                }
+            )
+
+        self.unified_cost_mgr = UnifiedCostManager()
+
+    def tearDown(self):
+        UnifiedCost.objects.delete()
+        UnifiedCostJob.objects.delete()
+
+    def _get_generation_condition(self, query: dict, domain_id: str) -> dict:
+        query = self.unified_cost_mgr._add_active_generation_filter(query, domain_id)
+        return query["filter"][-1]
+
+    def test_active_generation_filter_of_domain(self):
+        condition = self._get_generation_condition(
+            {"filter": [{"k": "domain_id", "v": "domain-1", "o": "eq"}]}, "domain-1"
+        )
+
+        self.assertEqual(condition["k"], "generation_id")
+        self.assertEqual(condition["o"], "in")
+        self.assertCountEqual(condition["v"], ["generation-1", "generation-2", None])
+
+        condition = self._get_generation_condition({}, "domain-2")
+        self.assertCountEqual(condition["v"], ["generation-3", None])
+
+    def test_get_unified_cost_of_active_generation(self):
+        for generation_id in ["generation-1", "generation-4", None]:
+            UnifiedCost.create(
+                {
+                    "unified_cost_id": f"unified-cost-{generation_id}",
+                    "cost": {"KRW": 1000.0},
+                    "billed_month": "2024-01",
+                    "billed_year": "2024",
+                    "data_source_id": "ds-1",
+                    "domain_id": "domain-1",
+                    "generation_id": generation_id,
+                }
+            )
+
+        for unified_cost_id in ["unified-cost-generation-1", "unified-cost-None"]:
+            unified_cost_vo = self.unified_cost_mgr.get_unified_cost(
+                unified_cost_id, "domain-1"
+            )
+            self.assertEqual(unified_cost_vo.unified_cost_id, unified_cost_id)
+
+        # rows of a staging or replaced generation are hidden as in list and analyze
+        with self.assertRaises(ERROR_NOT_FOUND):
+            self.unified_cost_mgr.get_unified_cost(
+                "unified-cost-generation-4", "domain-1"
+            )
+
+    def test_remove_active_generation_cache(self):
+        with patch("spaceone.core.cache.delete") as cache_delete:
+            UnifiedCostManager.remove_active_generation_cache("domain-1")
+
+        cache_delete.assert_called_once_with(
+            "cost-analysis:unified-cost-generations:domain-1"
+        )
+
+    def test_exchange_currencies_same_as_per_row(self):
+        costs = [10.0, 0.0, -3.5, 1234.5678, 7]
+        origin_currencies = ["USD", "KRW", "JPY", "JPY", "USD"]
+
+        converted_costs = UnifiedCostManager.get_exchange_currencies(
+            costs,
+            origin_currencies,
+            UnifiedCostManager.make_exchange_rate_matrix(_CURRENCY_MAP),
+        )
+
+        self.assertEqual(len(converted_costs), len(costs))
+        for cost, currency, converted_cost in zip(
+            costs, origin_currencies, converted_costs
+        ):
+            expected_cost = UnifiedCostManager.get_exchange_currency(
+                cost, currency, _CURRENCY_MAP
+            )
+            with self.subTest(cost=cost, currency=currency):
+                self.assertEqual(list(converted_cost), list(expected_cost))
+                for convert_currency, value in expected_cost.items():
+                    self.assertAlmostEqual(converted_cost[convert_currency], value)
+                    self.assertIsInstance(converted_cost[convert_currency], float)
+
+        # a zero rate converts to zero as in the per-row conversion
+        self.assertEqual(converted_costs[2]["KRW"], 0.0)
+
+    def test_exchange_currencies_of_unsupported_currency(self):
+        exchange_rate_matrix = UnifiedCostManager.make_exchange_rate_matrix(
+            _CURRENCY_MAP
+        )
+
+        # an unsupported currency fails the batch as it failed the row before
+        with self.assertRaises(KeyError):
+            UnifiedCostManager.get_exchange_currency(10.0, "EUR", _CURRENCY_MAP)
+        with self.assertRaises(KeyError):
+            UnifiedCostManager.get_exchange_currencies(
+                [1.0, 10.0], ["USD", "EUR"], exchange_rate_matrix
+            )
+
+        self.assertEqual(
+            UnifiedCostManager.get_exchange_currencies([], [], exchange_rate_matrix),
+            [],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from google.protobuf.json_format import MessageToDict
+from spaceone.api.cost_analysis.plugin import cost_pb2
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.core.pygrpc.message_type import change_struct_type
+
+from spaceone.cost_analysis.plugin.data_source.lib.checkpoint import (
+    get_checkpoint_page,
+    resume_pages,
+    skip_pages,
+)
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_get_checkpoint_page_through_struct(self):
+        # the core sends task_options as a Struct, and the plugin server converts it with MessageToDict
+        request = cost_pb2.GetDataRequest(
+            task_options=change_struct_type({"checkpoint": {"page": 3}})
+        )
+        task_options = MessageToDict(request, preserving_proto_field_name=True)[
+            "task_options"
+        ]
+
+        self.assertEqual(task_options["checkpoint"]["page"], 3.0)
+        self.assertEqual(get_checkpoint_page(task_options), 3)
+        self.assertIsInstance(get_checkpoint_page(task_options), int)
+
+    def test_get_checkpoint_page_without_checkpoint(self):
+        self.assertEqual(get_checkpoint_page(None), 0)
+        self.assertEqual(get_checkpoint_page({}), 0)
+        self.assertEqual(get_checkpoint_page({"checkpoint": None}), 0)
+
+    def test_get_checkpoint_page_invalid(self):
+        for page in [-1, 1.5, "2", True]:
+            with self.assertRaises(ERROR_INVALID_PARAMETER):
+                get_checkpoint_page({"checkpoint": {"page": page}})
+
+    def test_skip_pages(self):
+        responses = ({"results": [{"page": page}]} for page in range(5))
+
+        self.assertEqual(
+            [
+                response["results"][0]["page"]
+                for response in skip_pages(responses, {"checkpoint": {"page": 2.0}})
+            ],
+            [2, 3, 4],
+        )
+
+    def test_resume_pages(self):
+        fetched_keys = []
+
+        def _fetch_page(page_key: str) -> dict:
+            fetched_keys.append(page_key)
+            return {"results": [{"billed_date": page_key}]}
+
+        page_keys = ["2026-09-01", "2026-09-02", "2026-09-03"]
+        responses = list(
+            resume_pages(page_keys, _fetch_page, {"checkpoint": {"page": 2.0}})
+        )
+
+        # committed pages are never fetched again
+        self.assertEqual(fetched_keys, ["2026-09-03"])
+        self.assertEqual(responses, [{"results": [{"billed_date": "2026-09-03"}]}])
+
+        fetched_keys.clear()
+        list(resume_pages(page_keys, _fetch_page, {}))
+        self.assertEqual(fetched_keys, page_keys)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+from spaceone.cost_analysis.plugin.data_source.lib.chunk import (
+    make_chunks,
+    make_chunks_by_size,
+    make_cost_batch_responses,
+    read_csv,
+)
+
+_CSV = "\ufeffprovider,cost\naws,1.5\ngcp,2\nazure,3\n"
+
+
+class TestChunk(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+
+    def _assert_csv_rows(self, chunks: list) -> None:
+        self.assertEqual(
+            chunks,
+            [
+                [{"provider": "aws", "cost": "1.5"}, {"provider": "gcp", "cost": "2"}],
+                [{"provider": "azure", "cost": "3"}],
+            ],
+        )
+
+    def test_make_chunks(self):
+        self.assertEqual(list(make_chunks(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(make_chunks([], 2)), [])
+
+        for chunk_size in [0, -1, 1.5]:
+            with self.assertRaises(ERROR_INVALID_PARAMETER):
+                list(make_chunks([1], chunk_size))
+
+    def test_make_chunks_by_size(self):
+        chunks = make_chunks_by_size(
+            ["a" * 3, "b" * 3, "c" * 5, "d"], max_bytes=6, get_size=len
+        )
+
+        self.assertEqual(list(chunks), [["aaa", "bbb"], ["ccccc", "d"]])
+
+    def test_make_chunks_by_size_with_oversize_row(self):
+        rows = ["a", "b" * 10, "c", "d"]
+
+        self.assertEqual(
+            list(make_chunks_by_size(rows, max_bytes=4, get_size=len)),
+            [["a"], ["b" * 10], ["c", "d"]],
+        )
+
+        # the first row of a chunk is emitted alone as well
+        self.assertEqual(
+            list(make_chunks_by_size(["b" * 10, "c"], max_bytes=4, get_size=len)),
+            [["b" * 10], ["c"]],
+        )
+
+    def test_make_chunks_by_size_with_chunk_size(self):
+        chunks = make_chunks_by_size(
+            [{"cost": cost} for cost in range(5)], max_bytes=1024, chunk_size=2
+        )
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+    def test_read_csv_file(self):
+        csv_path = os.path.join(self.tmp_dir, "costs.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as csv_file:
+            csv_file.write(_CSV)
+
+        self._assert_csv_rows(list(read_csv(csv_path, chunk_size=2)))
+
+    def test_read_csv_gzip_file(self):
+        csv_path = os.path.join(self.tmp_dir, "costs.csv.gz")
+        with gzip.open(csv_path, "wt", encoding="utf-8", newline="") as csv_file:
+            csv_file.write(_CSV)
+
+        self._assert_csv_rows(list(read_csv(csv_path, chunk_size=2)))
+
+    def test_read_csv_binary_file_object(self):
+        self._assert_csv_rows(
+            list(read_csv(io.BytesIO(_CSV.encode("utf-8")), chunk_size=2))
+        )
+
+        with gzip.open(io.BytesIO(gzip.compress(_CSV.encode("utf-8")))) as gz_file:
+            self._assert_csv_rows(list(read_csv(gz_file, chunk_size=2)))
+
+    def test_read_csv_text_file_object(self):
+        self._assert_csv_rows(list(read_csv(io.StringIO(_CSV.lstrip("\ufeff")), 2)))
+
+    def test_make_cost_batch_responses_with_missing_keys(self):
+        costs = [
+            {"cost": 1.0, "provider": "aws"},
+            {"cost": 2.0, "tags": {"team": "a"}},
+            {"provider": "gcp"},
+        ]
+
+        self.assertEqual(
+            list(make_cost_batch_responses(costs, chunk_size=2)),
+            [
+                {
+                    "columns": {
+                        "cost": [1.0, 2.0],
+                        "provider": ["aws", None],
+                        "tags": [None, {"team": "a"}],
+                    }
+                },
+                {"columns": {"provider": ["gcp"]}},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
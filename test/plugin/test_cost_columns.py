@@ -0,0 +1,124 @@
+import unittest
+from unittest.mock import patch
+
+from google.protobuf.json_format import MessageToDict, ParseDict
+from spaceone.api.cost_analysis.plugin import cost_pb2
+from spaceone.core import config
+
+# the gRPC interface of the plugin makes its server when it is imported
+config.init_conf(package="spaceone.cost_analysis")
+
+from spaceone.cost_analysis.connector.datasource_plugin_connector import (
+    DataSourcePluginConnector,
+)
+from spaceone.cost_analysis.plugin.data_source.interface.grpc.cost import Cost
+from spaceone.cost_analysis.plugin.data_source.lib.chunk import (
+    make_cost_batch_responses,
+)
+from spaceone.cost_analysis.plugin.data_source.model import (
+    CostsBatchResponse,
+    CostsResponse,
+)
+from spaceone.cost_analysis.plugin.data_source.service.cost_service import (
+    CostService,
+)
+
+# rows of a plugin, with missing, empty and zero values and nested dict fields
+_COSTS = [
+    {
+        "cost": 1.5,
+        "usage_quantity": 24,
+        "usage_unit": "Hrs",
+        "provider": "aws",
+        "region_code": "ap-northeast-2",
+        "product": "AmazonEC2",
+        "usage_type": "BoxUsage:t3.micro",
+        "resource": "i-1234",
+        "tags": {"Name": "web", "Team": {"owner": "ops", "ids": [1, 2.5]}},
+        "additional_info": {"Instance Type": "t3.micro"},
+        "data": {"Discount": -0.5, "Flag": True, "Empty": None},
+        "billed_date": "2024-01-01",
+    },
+    {"cost": 0.0, "billed_date": "2024-01-01"},
+    {
+        "cost": 12345678.123456789,
+        "usage_quantity": 0,
+        "usage_unit": "",
+        "provider": "google_cloud",
+        "product": "Compute Engine",
+        "tags": {},
+        "billed_date": "2024-01-31",
+    },
+    {
+        "cost": -3,
+        "region_code": None,
+        "data": {"Unicode": "비용"},
+        "billed_date": "2024-01-02",
+    },
+]
+
+
+class TestCostColumns(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(DataSourcePluginConnector, "__init__", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.connector = DataSourcePluginConnector()
+        self.cost_api = Cost.__new__(Cost)
+
+    @staticmethod
+    def _get_costs_by_rows(costs: list) -> list:
+        # the plugin parses the response of rows, and the core converts it by MessageToDict
+        costs_info = ParseDict(
+            CostsResponse(results=costs).dict(), cost_pb2.CostsInfo()
+        )
+        return MessageToDict(costs_info, preserving_proto_field_name=True)["results"]
+
+    def _get_costs_by_columns(self, costs: list, chunk_size: int) -> list:
+        results = []
+        for response in make_cost_batch_responses(costs, chunk_size):
+            CostService._check_cost_columns(response["columns"])
+            columns = CostsBatchResponse(**response).dict()["columns"]
+
+            # the message is sent and received over the wire
+            costs_info = cost_pb2.CostsInfo.FromString(
+                self.cost_api._make_costs_info(columns).SerializeToString()
+            )
+            results.extend(self.connector._change_costs_message(costs_info)["results"])
+
+        return results
+
+    def test_same_costs_as_rows(self):
+        for chunk_size in [1, 3, len(_COSTS)]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    self._get_costs_by_columns(_COSTS, chunk_size),
+                    self._get_costs_by_rows(_COSTS),
+                )
+
+    def test_round_trip_of_columns(self):
+        costs = self._get_costs_by_columns(_COSTS, len(_COSTS))
+
+        self.assertEqual(costs[0]["tags"], _COSTS[0]["tags"])
+        self.assertEqual(costs[0]["usage_quantity"], 24.0)
+        self.assertEqual(costs[2]["cost"], 12345678.123456789)
+        self.assertEqual(costs[3]["data"], {"Unicode": "비용"})
+
+        # the dict fields default to empty as in the rows
+        self.assertEqual(costs[1]["tags"], {})
+        self.assertNotIn("cost", costs[1])
+
+    def test_change_cost_message_same_as_message_to_dict(self):
+        costs_info = ParseDict(
+            CostsResponse(results=_COSTS).dict(), cost_pb2.CostsInfo()
+        )
+
+        self.assertEqual(
+            self.connector._change_costs_message(costs_info),
+            MessageToDict(costs_info, preserving_proto_field_name=True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.manager.cost_report_config_manager import (
+    CostReportConfigManager,
+)
+from spaceone.cost_analysis.manager.data_source_manager import DataSourceManager
+from spaceone.cost_analysis.model.cost_report_data.database import CostReportData
+from spaceone.cost_analysis.model.data_source_account.database import (
+    DataSourceAccount,
+)
+from spaceone.cost_analysis.service.cost_report_data_service import (
+    CostReportDataService,
+)
+
+# ds-1 is shared by all workspaces, ds-2 and ds-3 belong to a workspace
+_DATA_SOURCE_VOS = [
+    MagicMock(data_source_id="ds-1", workspace_id="*"),
+    MagicMock(data_source_id="ds-2", workspace_id="workspace-1"),
+    MagicMock(data_source_id="ds-3", workspace_id="workspace-2"),
+]
+
+
+def _make_cost_report_vo(
+    cost_report_id: str, workspace_id: str, status: str = "IN_PROGRESS"
+) -> MagicMock:
+    return MagicMock(
+        cost_report_id=cost_report_id,
+        cost_report_config_id="crc-1",
+        report_month="2024-01",
+        issue_date="2024-02-10",
+        status=status,
+        workspace_id=workspace_id,
+        domain_id="domain-1",
+    )
+
+
+def _make_aggregated_row(workspace_id: str, data_source_id: str, usd: float) -> dict:
+    return {
+        "billed_year": "2024",
+        "workspace_id": workspace_id,
+        "project_id": "project-1",
+        "service_account_id": "sa-1",
+        "data_source_id": data_source_id,
+        "product": "EC2",
+        "provider": "aws",
+        "cost_KRW": usd * 1330.0,
+        "cost_USD": usd,
+        "cost_JPY": usd * 150.0,
+    }
+
+
+class TestCostReportDataService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        create_transaction()
+        self.cost_report_data_svc = CostReportDataService()
+
+        # costs of a linked account are stored in its virtual workspace
+        self.v_workspace_id = DataSourceAccount.create(
+            {
+                "account_id": "account-1",
+                "data_source_id": "ds-1",
+                "workspace_id": "workspace-1",
+                "domain_id": "domain-1",
+            }
+        ).v_workspace_id
+
+        for target, attribute, value in [
+            (DataSourceManager, "list_data_sources", (_DATA_SOURCE_VOS, 3)),
+            (
+                CostReportConfigManager,
+                "get_cost_report_config",
+                MagicMock(data_source_filter={}),
+            ),
+        ]:
+            patcher = patch.object(target, attribute, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for method_name, name_map in [
+            ("_get_workspace_name_map", {"workspace-1": "Workspace 1"}),
+            ("_get_project_name_map", {"project-1": "Project 1"}),
+            ("_get_service_account_name_map", {"sa-1": "Account 1"}),
+        ]:
+            patcher = patch.object(
+                self.cost_report_data_svc, method_name, return_value=name_map
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        delete_transaction()
+        CostReportData.objects.delete()
+        DataSourceAccount.objects.delete()
+
+    def _create_cost_reports_data(self, cost_report_vos: list, rows: list) -> MagicMock:
+        with patch.object(
+            self.cost_report_data_svc,
+            "_aggregate_unified_cost_report_data",
+            return_value=rows,
+        ) as aggregate_unified_cost_report_data:
+            self.cost_report_data_svc.create_cost_reports_data(
+                cost_report_vos, [{"usage_type": "Usage"}] * len(cost_report_vos)
+            )
+
+        return aggregate_unified_cost_report_data
+
+    @staticmethod
+    def _get_usd_costs(cost_report_id: str) -> list:
+        return sorted(
+            cost_report_data_vo.cost["USD"]
+            for cost_report_data_vo in CostReportData.objects(
+                cost_report_id=cost_report_id
+            )
+        )
+
+    def test_split_aggregated_rows_by_workspace(self):
+        aggregate_unified_cost_report_data = self._create_cost_reports_data(
+            [
+                _make_cost_report_vo("cr-1", "workspace-1"),
+                _make_cost_report_vo("cr-2", "workspace-2"),
+            ],
+            [
+                _make_aggregated_row("workspace-1", "ds-2", 10.0),
+                _make_aggregated_row(self.v_workspace_id, "ds-1", 20.0),
+                _make_aggregated_row("workspace-2", "ds-1", 30.0),
+                # data sources of another workspace are not in the report
+                _make_aggregated_row("workspace-2", "ds-2", 40.0),
+                _make_aggregated_row("workspace-1", "ds-3", 50.0),
+            ],
+        )
+
+        # the virtual workspace is aggregated together with the workspaces of the reports
+        workspace_ids = aggregate_unified_cost_report_data.call_args[0][1]
+        self.assertCountEqual(
+            workspace_ids, ["workspace-1", "workspace-2", self.v_workspace_id]
+        )
+
+        self.assertEqual(self._get_usd_costs("cr-1"), [10.0, 20.0])
+        self.assertEqual(self._get_usd_costs("cr-2"), [30.0])
+
+        cost_report_data_vo = CostReportData.objects(
+            cost_report_id="cr-1", data_source_id="ds-1"
+        ).first()
+        self.assertEqual(cost_report_data_vo.workspace_id, "workspace-1")
+        self.assertEqual(cost_report_data_vo.workspace_name, "Workspace 1")
+        self.assertEqual(cost_report_data_vo.project_name, "Project 1")
+        self.assertEqual(cost_report_data_vo.report_year, "2024")
+        self.assertEqual(cost_report_data_vo.usage_type, "Usage")
+
+    def test_reports_of_same_workspace(self):
+        self._create_cost_reports_data(
+            [
+                _make_cost_report_vo("cr-1", "workspace-1"),
+                _make_cost_report_vo("cr-2", "workspace-1", status="DONE"),
+            ],
+            [
+                _make_aggregated_row("workspace-1", "ds-2", 10.0),
+                _make_aggregated_row(self.v_workspace_id, "ds-1", 20.0),
+            ],
+        )
+
+        for cost_report_id, is_confirmed in [("cr-1", False), ("cr-2", True)]:
+            cost_report_data_vos = CostReportData.objects(cost_report_id=cost_report_id)
+            self.assertEqual(self._get_usd_costs(cost_report_id), [10.0, 20.0])
+            self.assertEqual(
+                {vo.is_confirmed for vo in cost_report_data_vos}, {is_confirmed}
+            )
+
+        self.assertEqual(
+            len(set(CostReportData.objects.distinct("cost_report_data_id"))), 4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.manager.budget_usage_manager import BudgetUsageManager
+from spaceone.cost_analysis.manager.data_source_plugin_manager import (
+    DataSourcePluginManager,
+)
+from spaceone.cost_analysis.model.cost_model import Cost
+from spaceone.cost_analysis.model.job_task_model import JobTask
+from spaceone.cost_analysis.service.job_service import JobService
+
+
+class TestJobService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    @patch.object(DataSourcePluginManager, "__init__", return_value=None)
+    @patch.object(BudgetUsageManager, "__init__", return_value=None)
+    def setUp(self, *args):
+        create_transaction()
+        self.job_svc = JobService()
+        self.job_svc.job_task_mgr.job_mgr = MagicMock()
+
+        job_task_vo = self.job_svc.job_task_mgr.create_job_task(
+            "DOMAIN", "job-1", "ds-1", None, "domain-1", {}
+        )
+        self.job_task_vo = self.job_svc.job_task_mgr.claim_job_task(
+            job_task_vo, "worker-1"
+        )
+
+        self.data_source_vo = MagicMock()
+        self.data_source_vo.plugin_info.metadata = {"task_checkpoint": True}
+
+    def tearDown(self):
+        delete_transaction()
+        Cost.objects.delete()
+        JobTask.objects.delete()
+
+    def _create_costs(self, page_counts: dict) -> None:
+        for page, count in page_counts.items():
+            for _ in range(count):
+                Cost.create(
+                    {
+                        "cost": 1.0,
+                        "data_source_id": "ds-1",
+                        "job_id": "job-1",
+                        "job_task_id": self.job_task_vo.job_task_id,
+                        "job_task_page": page,
+                        "domain_id": "domain-1",
+                        "billed_year": "2026",
+                        "billed_month": "2026-09",
+                        "billed_date": "2026-09-01",
+                    }
+                )
+
+        self.job_task_vo = self.job_task_vo.update(
+            {"created_count": sum(page_counts.values())}
+        )
+
+    def test_resume_job_task_with_partial_page(self):
+        # two pages are committed, and the third page is inserted in part
+        self._create_costs({0: 2, 1: 2, 2: 1})
+        self.job_task_vo = self.job_task_vo.update(
+            {"checkpoint": {"page": 2, "created_count": 4}}
+        )
+
+        job_task_vo, page, count = self.job_svc._prepare_job_task_resume(
+            self.job_task_vo, self.data_source_vo, "worker-1"
+        )
+
+        self.assertEqual((page, count), (2, 4))
+        self.assertEqual(job_task_vo.created_count, 4)
+        self.assertEqual(job_task_vo.checkpoint, {"page": 2, "created_count": 4})
+        self.assertEqual(Cost.objects(job_task_page__gte=2).count(), 0)
+        self.assertEqual(Cost.objects.count(), 4)
+
+    def test_restart_job_task_with_unknown_costs(self):
+        # costs without their page cannot be matched to the checkpoint
+        self._create_costs({0: 2, None: 1})
+        self.job_task_vo = self.job_task_vo.update(
+            {"checkpoint": {"page": 1, "created_count": 2}}
+        )
+
+        job_task_vo, page, count = self.job_svc._prepare_job_task_resume(
+            self.job_task_vo, self.data_source_vo, "worker-1"
+        )
+
+        self.assertEqual((page, count), (0, 0))
+        self.assertEqual(job_task_vo.created_count, 0)
+        self.assertEqual(Cost.objects.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
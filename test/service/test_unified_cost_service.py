@@ -0,0 +1,638 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.cost_analysis.manager.budget_usage_manager import BudgetUsageManager
+from spaceone.cost_analysis.manager.config_manager import ConfigManager
+from spaceone.cost_analysis.manager.currency_manager import CurrencyManager
+from spaceone.cost_analysis.manager.identity_manager import IdentityManager
+from spaceone.cost_analysis.model.cost_model import MonthlyCost
+from spaceone.cost_analysis.model.job_model import Job
+from spaceone.cost_analysis.model.data_source_account.database import (
+    DataSourceAccount,
+)
+from spaceone.cost_analysis.model.unified_cost.database import (
+    UnifiedCost,
+    UnifiedCostJob,
+)
+from spaceone.cost_analysis.service.unified_cost_service import UnifiedCostService
+
+_CURRENCY_MAP = {
+    "KRW": {"KRW/KRW": 1.0, "KRW/USD": 0.00075},
+    "USD": {"USD/KRW": 1330.0, "USD/USD": 1.0},
+}
+
+# ds-1 is shared by all workspaces, and ds-2 belongs to workspace-1
+_DATA_SOURCE_VOS = [
+    MagicMock(
+        data_source_id="ds-1",
+        workspace_id="*",
+        plugin_info={"metadata": {"currency": "USD"}},
+    ),
+    MagicMock(
+        data_source_id="ds-2",
+        workspace_id="workspace-1",
+        plugin_info={"metadata": {"currency": "KRW"}},
+    ),
+]
+for _data_source_vo in _DATA_SOURCE_VOS:
+    _data_source_vo.name = f"Data Source {_data_source_vo.data_source_id[-1]}"
+
+
+class TestUnifiedCostService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.cost_analysis")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        MonthlyCost._load_default_meta()
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        self.rate_dates = [datetime(2026, 9, 15)]
+        self.ds_account_vo = DataSourceAccount.create(
+            {
+                "account_id": "account-1",
+                "data_source_id": "ds-1",
+                "workspace_id": "workspace-1",
+                "domain_id": "domain-1",
+            }
+        )
+
+    def tearDown(self):
+        DataSourceAccount.objects.delete()
+        Job.objects.delete()
+        MonthlyCost.objects.delete()
+        UnifiedCost.objects.delete()
+        UnifiedCostJob.objects.delete()
+
+    @staticmethod
+    def _make_name_maps(workspace_name: str = "Workspace 1") -> dict:
+        return {
+            "workspace_name_map": {None: None, "workspace-1": workspace_name},
+            "project_name_maps": {"workspace-1": {"project-1": "Project 1"}},
+            "service_account_name_maps": {None: {"sa-1": "Account 1"}},
+        }
+
+    def _make_input_hash(self, name_maps: dict) -> str:
+        return UnifiedCostService._make_unified_cost_input_hash("domain-1", name_maps)
+
+    def test_input_hash_is_stable(self):
+        self.assertEqual(
+            self._make_input_hash(self._make_name_maps()),
+            self._make_input_hash(self._make_name_maps()),
+        )
+
+    def test_input_hash_of_changed_names(self):
+        input_hash = self._make_input_hash(self._make_name_maps())
+
+        self.assertNotEqual(
+            input_hash, self._make_input_hash(self._make_name_maps("Renamed"))
+        )
+
+        name_maps = self._make_name_maps()
+        name_maps["workspace_name_map"]["workspace-2"] = "Workspace 2"
+        self.assertNotEqual(input_hash, self._make_input_hash(name_maps))
+
+    def test_input_hash_of_changed_account_mapping(self):
+        input_hash = self._make_input_hash(self._make_name_maps())
+
+        self.ds_account_vo.update({"workspace_id": "workspace-2"})
+        self.assertNotEqual(input_hash, self._make_input_hash(self._make_name_maps()))
+
+    @staticmethod
+    def _create_unified_cost(generation_id: str, workspace_id: str) -> UnifiedCost:
+        return UnifiedCost.create(
+            {
+                "unified_cost_id": f"unified-cost-{generation_id}-{workspace_id}",
+                "cost": {"KRW": 1000.0},
+                "billed_month": "2026-09",
+                "billed_year": "2026",
+                "data_source_id": "ds-1",
+                "workspace_id": workspace_id,
+                "domain_id": "domain-1",
+                "generation_id": generation_id,
+            }
+        )
+
+    @patch.object(BudgetUsageManager, "__init__", return_value=None)
+    def test_restore_failed_workspace_unified_costs(self, *args):
+        self._create_unified_cost("gen-old", "workspace-1")
+        self._create_unified_cost("gen-old", "workspace-2")
+        self._create_unified_cost("gen-new", "workspace-1")
+
+        create_transaction()
+        try:
+            UnifiedCostService()._restore_failed_workspace_unified_costs(
+                "domain-1",
+                "2026-09",
+                "workspace-1",
+                {"ds-1": "gen-new"},
+                {"ds-1": "gen-old"},
+            )
+        finally:
+            delete_transaction()
+
+        # rows of the active generation stay in place until the swap
+        self.assertEqual(UnifiedCost.objects(generation_id="gen-old").count(), 2)
+
+        unified_cost_vos = UnifiedCost.objects(generation_id="gen-new")
+        self.assertEqual(unified_cost_vos.count(), 1)
+        self.assertEqual(unified_cost_vos[0].workspace_id, "workspace-1")
+        self.assertEqual(unified_cost_vos[0].cost, {"KRW": 1000.0})
+        self.assertNotEqual(
+            unified_cost_vos[0].unified_cost_id, "unified-cost-gen-old-workspace-1"
+        )
+
+    @patch.object(BudgetUsageManager, "__init__", return_value=None)
+    def test_restore_failed_workspace_unified_costs_without_generation(self, *args):
+        # rows created before generations have no generation_id
+        self._create_unified_cost(None, "workspace-1")
+        self._create_unified_cost(None, "workspace-2")
+
+        create_transaction()
+        try:
+            UnifiedCostService()._restore_failed_workspace_unified_costs(
+                "domain-1", "2026-09", "workspace-1", {"ds-1": "gen-new"}, {}
+            )
+        finally:
+            delete_transaction()
+
+        self.assertEqual(UnifiedCost.objects(generation_id=None).count(), 2)
+
+        unified_cost_vos = UnifiedCost.objects(generation_id="gen-new")
+        self.assertEqual(unified_cost_vos.count(), 1)
+        self.assertEqual(unified_cost_vos[0].workspace_id, "workspace-1")
+        self.assertEqual(unified_cost_vos[0].cost, {"KRW": 1000.0})
+
+    def test_get_concurrency(self):
+        for concurrency, expected in [
+            (4, 4),
+            ("4", 4),
+            ("four", 1),
+            (0, 1),
+            (None, 1),
+        ]:
+            with self.subTest(concurrency=concurrency):
+                self.assertEqual(
+                    UnifiedCostService._get_concurrency({"concurrency": concurrency}),
+                    expected,
+                )
+
+        self.assertEqual(UnifiedCostService._get_concurrency({}), 1)
+
+    @patch.object(BudgetUsageManager, "__init__", return_value=None)
+    def test_create_unified_cost_with_workspaces_in_transaction(self, *args):
+        transaction = create_transaction(
+            meta={"token": "token"}, thread_id=str(threading.current_thread().ident)
+        )
+        unified_cost_svc = UnifiedCostService()
+        thread_ids = []
+
+        def _create_unified_cost_with_workspace(*args):
+            thread_ids.append(threading.current_thread().ident)
+            self.assertIs(unified_cost_svc.transaction, transaction)
+            unified_cost_svc.transaction.add_rollback(lambda: None)
+
+        try:
+            with patch.object(
+                unified_cost_svc,
+                "create_unified_cost_with_workspace",
+                side_effect=_create_unified_cost_with_workspace,
+            ):
+                failed_workspaces = (
+                    unified_cost_svc._create_unified_cost_with_workspaces(
+                        ["workspace-1", "workspace-2"],
+                        2,
+                        "Google",
+                        "domain-1",
+                        {},
+                        None,
+                        None,
+                        "2026-09",
+                        {},
+                        {},
+                    )
+                )
+        finally:
+            delete_transaction()
+
+        self.assertEqual(failed_workspaces, {})
+        self.assertNotIn(threading.current_thread().ident, thread_ids)
+        self.assertEqual(len(transaction._rollbacks), 2)
+
+    def _create_monthly_costs(self, month: str = "2026-09") -> None:
+        v_workspace_id = self.ds_account_vo.v_workspace_id
+        for workspace_id, data_source_id, cost in [
+            ("workspace-1", "ds-1", 10.0),
+            # costs of a linked account belong to the workspace of the account
+            (v_workspace_id, "ds-1", 20.0),
+            ("workspace-1", "ds-2", 1330.0),
+            # data sources of another workspace are not aggregated
+            ("workspace-2", "ds-2", 2660.0),
+            ("workspace-2", "ds-1", 30.0),
+            (None, "ds-1", 40.0),
+            # workspaces which are not enabled are not aggregated
+            ("workspace-3", "ds-1", 50.0),
+        ]:
+            MonthlyCost.create(
+                {
+                    "cost": cost,
+                    "provider": "aws",
+                    "product": "EC2",
+                    "project_id": "project-1",
+                    "service_account_id": "sa-1",
+                    "data_source_id": data_source_id,
+                    "workspace_id": workspace_id,
+                    "domain_id": "domain-1",
+                    "billed_year": month[:4],
+                    "billed_month": month,
+                }
+            )
+
+    def _make_domain_name_maps(self) -> dict:
+        return {
+            "workspace_name_map": {
+                None: None,
+                "workspace-1": "Workspace 1",
+                "workspace-2": "Workspace 2",
+            },
+            "project_name_maps": {"workspace-1": {"project-1": "Project 1"}},
+            "service_account_name_maps": {"workspace-1": {"sa-1": "Account 1"}},
+            "v_workspace_ids_map": {"workspace-1": [self.ds_account_vo.v_workspace_id]},
+            "data_source_vos": _DATA_SOURCE_VOS,
+        }
+
+    def _list_unified_costs(self, month: str = "2026-09") -> list:
+        # the unified costs are visible with the generations of the job
+        generations = UnifiedCostJob.objects.get(billed_month=month).generations
+        for unified_cost_vo in UnifiedCost.objects.all():
+            self.assertEqual(
+                unified_cost_vo.generation_id,
+                generations[unified_cost_vo.data_source_id],
+            )
+
+        return sorted(
+            (
+                unified_cost_vo.workspace_id or "",
+                unified_cost_vo.workspace_name or "",
+                unified_cost_vo.project_name or "",
+                unified_cost_vo.service_account_name or "",
+                unified_cost_vo.data_source_id,
+                unified_cost_vo.data_source_name,
+                unified_cost_vo.currency,
+                round(unified_cost_vo.cost["USD"], 6),
+            )
+            for unified_cost_vo in UnifiedCost.objects.all()
+        )
+
+    def _get_currency_map_date(self, currency_end_date: datetime) -> tuple:
+        # the latest rates stored by ExchangeRateSyncScheduler until the end date
+        currency_end_date = currency_end_date.replace(tzinfo=None)
+        return _CURRENCY_MAP, max(
+            rate_date for rate_date in self.rate_dates if rate_date <= currency_end_date
+        )
+
+    def _run_unified_cost(self, aggregation_mode: str, params: dict = None) -> dict:
+        create_transaction(thread_id=str(threading.current_thread().ident))
+        with patch.object(BudgetUsageManager, "__init__", return_value=None):
+            unified_cost_svc = UnifiedCostService()
+        unified_cost_svc.budget_usage_mgr = MagicMock()
+
+        patchers = [
+            patch.object(ConfigManager, "__init__", return_value=None),
+            patch.object(
+                ConfigManager,
+                "get_unified_cost_config",
+                return_value={"aggregation_mode": aggregation_mode},
+            ),
+            patch.object(
+                CurrencyManager,
+                "get_currency_map_date",
+                side_effect=self._get_currency_map_date,
+            ),
+            patch.object(
+                unified_cost_svc,
+                "_get_workspace_name_map_with_none",
+                return_value=self._make_domain_name_maps()["workspace_name_map"],
+            ),
+            patch.object(
+                unified_cost_svc,
+                "_get_domain_name_maps",
+                return_value=self._make_domain_name_maps(),
+            ),
+            patch.object(
+                unified_cost_svc.unified_cost_mgr, "remove_active_generation_cache"
+            ),
+            patch.object(unified_cost_svc.unified_cost_mgr, "remove_stat_cache"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+
+        try:
+            with patch.object(
+                unified_cost_svc,
+                "create_unified_cost_with_domain",
+                wraps=unified_cost_svc.create_unified_cost_with_domain,
+            ) as create_unified_cost_with_domain, patch.object(
+                unified_cost_svc,
+                "create_unified_cost_with_workspace",
+                wraps=unified_cost_svc.create_unified_cost_with_workspace,
+            ) as create_unified_cost_with_workspace:
+                UnifiedCostService.run_unified_cost.__wrapped__(
+                    unified_cost_svc,
+                    params or {"domain_id": "domain-1", "month": "2026-09"},
+                )
+        finally:
+            for patcher in patchers:
+                patcher.stop()
+            delete_transaction()
+
+        return {
+            "domain_call_count": create_unified_cost_with_domain.call_count,
+            "workspace_call_count": create_unified_cost_with_workspace.call_count,
+            "budget_usage_mgr": unified_cost_svc.budget_usage_mgr,
+        }
+
+    def test_route_monthly_costs_by_domain(self):
+        self._create_monthly_costs()
+
+        result = self._run_unified_cost("DOMAIN")
+
+        # the monthly costs of the domain are read once
+        self.assertEqual(result["domain_call_count"], 1)
+        self.assertEqual(result["workspace_call_count"], 0)
+
+        unified_costs = self._list_unified_costs()
+        self.assertEqual(
+            unified_costs,
+            [
+                ("", "", "", "", "ds-1", "Data Source 1", "USD", 40.0),
+                (
+                    "workspace-1",
+                    "Workspace 1",
+                    "Project 1",
+                    "Account 1",
+                    "ds-1",
+                    "Data Source 1",
+                    "USD",
+                    10.0,
+                ),
+                (
+                    "workspace-1",
+                    "Workspace 1",
+                    "Project 1",
+                    "Account 1",
+                    "ds-1",
+                    "Data Source 1",
+                    "USD",
+                    20.0,
+                ),
+                (
+                    "workspace-1",
+                    "Workspace 1",
+                    "Project 1",
+                    "Account 1",
+                    "ds-2",
+                    "Data Source 2",
+                    "KRW",
+                    0.9975,
+                ),
+                (
+                    "workspace-2",
+                    "Workspace 2",
+                    "project-1",
+                    "",
+                    "ds-1",
+                    "Data Source 1",
+                    "USD",
+                    30.0,
+                ),
+            ],
+        )
+
+        # the budget usages of the workspaces are updated as in the workspace mode
+        self.assertCountEqual(
+            [
+                call.args
+                for call in result[
+                    "budget_usage_mgr"
+                ].update_budget_usage.call_args_list
+            ],
+            [("domain-1", "workspace-1"), ("domain-1", "workspace-2")],
+        )
+
+    def test_same_unified_costs_by_domain_and_workspace(self):
+        self._create_monthly_costs()
+
+        result = self._run_unified_cost("WORKSPACE")
+        workspace_unified_costs = self._list_unified_costs()
+        UnifiedCost.objects.delete()
+        UnifiedCostJob.objects.delete()
+
+        # every enabled workspace and the domain itself are aggregated one by one
+        self.assertEqual(result["domain_call_count"], 0)
+        self.assertEqual(result["workspace_call_count"], 3)
+
+        self._run_unified_cost("DOMAIN")
+
+        self.assertEqual(len(workspace_unified_costs), 5)
+        self.assertEqual(self._list_unified_costs(), workspace_unified_costs)
+
+    def test_get_domain_name_maps(self):
+        identity_mgr = MagicMock()
+        identity_mgr.list_projects.return_value = {
+            "results": [
+                {
+                    "project_id": "project-1",
+                    "name": "P1",
+                    "workspace_id": "workspace-1",
+                },
+                {
+                    "project_id": "project-2",
+                    "name": "P2",
+                    "workspace_id": "workspace-2",
+                },
+            ]
+        }
+        identity_mgr.list_service_accounts.return_value = {
+            "results": [
+                {
+                    "service_account_id": "sa-1",
+                    "name": "A1",
+                    "workspace_id": "workspace-1",
+                }
+            ]
+        }
+
+        with patch.object(BudgetUsageManager, "__init__", return_value=None), patch(
+            "spaceone.cost_analysis.service.unified_cost_service.IdentityManager",
+            return_value=identity_mgr,
+        ):
+            create_transaction()
+            try:
+                unified_cost_svc = UnifiedCostService()
+                with patch.object(
+                    unified_cost_svc.data_source_mgr,
+                    "list_data_sources",
+                    return_value=(iter(_DATA_SOURCE_VOS), 2),
+                ):
+                    name_maps = unified_cost_svc._get_domain_name_maps(
+                        "domain-1", {None: None}
+                    )
+            finally:
+                delete_transaction()
+
+        self.assertEqual(
+            name_maps["project_name_maps"],
+            {"workspace-1": {"project-1": "P1"}, "workspace-2": {"project-2": "P2"}},
+        )
+        self.assertEqual(
+            name_maps["service_account_name_maps"], {"workspace-1": {"sa-1": "A1"}}
+        )
+        self.assertEqual(
+            name_maps["v_workspace_ids_map"],
+            {"workspace-1": [self.ds_account_vo.v_workspace_id]},
+        )
+        self.assertEqual(name_maps["data_source_vos"], _DATA_SOURCE_VOS)
+
+    def _run_scheduled_unified_cost(self) -> dict:
+        create_transaction(thread_id=str(threading.current_thread().ident))
+        with patch.object(BudgetUsageManager, "__init__", return_value=None):
+            unified_cost_svc = UnifiedCostService()
+
+        try:
+            with patch.object(
+                ConfigManager, "__init__", return_value=None
+            ), patch.object(
+                ConfigManager,
+                "get_unified_cost_config",
+                return_value={"run_hour": 0, "aggregation_mode": "DOMAIN"},
+            ), patch(
+                "spaceone.cost_analysis.service.unified_cost_service.IdentityManager"
+            ) as identity_mgr_cls, patch.object(
+                unified_cost_svc.unified_cost_mgr, "push_unified_cost_job_task"
+            ) as push_unified_cost_job_task:
+                identity_mgr_cls.return_value.list_enabled_domain_ids.return_value = [
+                    "domain-1"
+                ]
+                UnifiedCostService.run_unified_cost_by_scheduler.__wrapped__(
+                    unified_cost_svc, {"current_hour": 12}
+                )
+        finally:
+            delete_transaction()
+
+        # the run of the current month is queued out of the run hour, and a worker runs it
+        params = push_unified_cost_job_task.call_args_list[0].args[0]
+        self.assertEqual(params, {"domain_id": "domain-1", "incremental": True})
+
+        return self._run_unified_cost("DOMAIN", params)
+
+    def test_incremental_scheduled_runs_across_rate_sync(self):
+        month = datetime.utcnow().strftime("%Y-%m")
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        self._create_monthly_costs(month)
+        self.rate_dates = [today - timedelta(days=1)]
+
+        result = self._run_scheduled_unified_cost()
+        self.assertEqual(result["domain_call_count"], 1)
+
+        unified_costs = self._list_unified_costs(month)
+        unified_cost_job_vo = UnifiedCostJob.objects.get(billed_month=month)
+        generations = dict(unified_cost_job_vo.generations)
+        exchange_date = unified_cost_job_vo.exchange_date
+
+        # ExchangeRateSyncScheduler stores the rates of a new date between the runs
+        self.rate_dates.append(today)
+
+        result = self._run_scheduled_unified_cost()
+
+        # nothing is synced, so the unified costs are kept with the rates of the month
+        unified_cost_job_vo.reload()
+        self.assertEqual(result["domain_call_count"], 0)
+        self.assertEqual(unified_cost_job_vo.generations, generations)
+        self.assertEqual(unified_cost_job_vo.exchange_date, exchange_date)
+
+        Job.create(
+            {
+                "status": "SUCCESS",
+                "data_source_id": "ds-2",
+                "domain_id": "domain-1",
+                "finished_at": datetime.utcnow(),
+            }
+        )
+
+        result = self._run_scheduled_unified_cost()
+
+        # only the synced data source is recomputed, still with the kept rates
+        unified_cost_job_vo.reload()
+        self.assertEqual(result["domain_call_count"], 1)
+        self.assertEqual(unified_cost_job_vo.generations["ds-1"], generations["ds-1"])
+        self.assertNotEqual(
+            unified_cost_job_vo.generations["ds-2"], generations["ds-2"]
+        )
+        self.assertEqual(unified_cost_job_vo.exchange_date, exchange_date)
+        self.assertEqual(self._list_unified_costs(month), unified_costs)
+
+    def test_refresh_pinned_exchange_date(self):
+        unified_cost_job_vo = UnifiedCostJob.create(
+            {
+                "billed_month": "2026-10",
+                "generations": {"ds-1": "generation-1"},
+                "exchange_date": (datetime.utcnow() - timedelta(days=3)).strftime(
+                    "%Y-%m-%d"
+                ),
+                "domain_id": "domain-1",
+            }
+        )
+
+        for params, unified_cost_config, is_confirmed, is_pinned in [
+            ({"incremental": True}, {}, False, True),
+            ({"incremental": True}, {"exchange_rate_refresh_days": 2}, False, False),
+            ({"incremental": True}, {}, True, False),
+            ({}, {}, False, False),
+        ]:
+            with self.subTest(
+                params=params, config=unified_cost_config, is_confirmed=is_confirmed
+            ):
+                pinned_exchange_date = UnifiedCostService._get_pinned_exchange_date(
+                    params, unified_cost_job_vo, unified_cost_config, is_confirmed
+                )
+                self.assertEqual(pinned_exchange_date is not None, is_pinned)
+
+    def test_skip_incremental_run_of_running_month(self):
+        self._create_monthly_costs()
+        UnifiedCostJob.create(
+            {
+                "billed_month": "2026-09",
+                "generations": {"ds-1": "generation-1"},
+                "exchange_date": "2026-09-15",
+                "is_confirmed": True,
+                "running_at": datetime.utcnow(),
+                "domain_id": "domain-1",
+            }
+        )
+
+        result = self._run_unified_cost(
+            "DOMAIN", {"domain_id": "domain-1", "month": "2026-09", "incremental": True}
+        )
+        self.assertEqual(result["domain_call_count"], 0)
+
+        # a full run is not skipped, and the month is released after the run
+        result = self._run_unified_cost("DOMAIN")
+        self.assertEqual(result["domain_call_count"], 1)
+        self.assertIsNone(UnifiedCostJob.objects.get(billed_month="2026-09").running_at)
+
+
+if __name__ == "__main__":
+    unittest.main()